@@ -1,13 +1,9 @@
-# Django imports
-from django.utils import timezone
-from django.db.models import Q
-
 # Third party imports
 from rest_framework import authentication
 from rest_framework.exceptions import AuthenticationFailed
 
 # Module imports
-from plane.db.models import APIToken
+from plane.utils.api_token_cache import get_api_token, record_api_token_usage
 
 
 class APIKeyAuthentication(authentication.BaseAuthentication):
@@ -23,18 +19,12 @@ class APIKeyAuthentication(authentication.BaseAuthentication):
         return request.headers.get(self.auth_header_name)
 
     def validate_api_token(self, token):
-        try:
-            api_token = APIToken.objects.get(
-                Q(Q(expired_at__gt=timezone.now()) | Q(expired_at__isnull=True)),
-                token=token,
-                is_active=True,
-            )
-        except APIToken.DoesNotExist:
+        api_token = get_api_token(token)
+        if api_token is None:
             raise AuthenticationFailed("Given API token is not valid")
 
-        # save api token last used
-        api_token.last_used = timezone.now()
-        api_token.save(update_fields=["last_used"])
+        # record the api token last used, written to the token in bulk
+        record_api_token_usage(api_token)
         return (api_token.user, api_token.token)
 
     def authenticate(self, request):
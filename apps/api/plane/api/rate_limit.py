@@ -1,13 +1,91 @@
 # python imports
+import hashlib
+import math
 import os
 
+# Django imports
+from django.conf import settings
+
 # Third party imports
 from rest_framework.throttling import SimpleRateThrottle
 
-
-class ApiKeyRateThrottle(SimpleRateThrottle):
-    scope = "api_key"
-    rate = os.environ.get("API_KEY_RATE_LIMIT", "60/minute")
+# Module imports
+from plane.settings.redis import redis_instance
+from plane.utils.exception_logger import log_exception
+
+# Sliding window counters, every quota keeps the counts of the current and the
+# previous fixed windows in a hash. The previous window is weighted by its part
+# still inside the sliding window. All the quotas of a request are checked and
+# counted atomically, the request is counted only when every quota allows it.
+# Returns the allowed flag, the lowest remaining count and the latest reset time
+SLIDING_WINDOW_SCRIPT = """
+local time = redis.call("TIME")
+local now = tonumber(time[1]) + tonumber(time[2]) / 1000000
+local allowed = 1
+local remaining = nil
+local reset = 0
+local windows = {}
+
+for index, key in ipairs(KEYS) do
+    local limit = tonumber(ARGV[index * 2 - 1])
+    local window = tonumber(ARGV[index * 2])
+    local current = math.floor(now / window)
+    local weight = ((current + 1) * window - now) / window
+    local current_count = tonumber(redis.call("HGET", key, current) or "0")
+    local previous_count = tonumber(redis.call("HGET", key, current - 1) or "0")
+    local count = math.floor(previous_count * weight) + current_count
+
+    if count >= limit then
+        allowed = 0
+    end
+    windows[index] = {key, window, current, limit - count}
+    reset = math.max(reset, (current + 1) * window)
+end
+
+for _, quota in ipairs(windows) do
+    local quota_remaining = quota[4]
+    if allowed == 1 then
+        redis.call("HINCRBY", quota[1], quota[3], 1)
+        redis.call("HDEL", quota[1], quota[3] - 2)
+        redis.call("EXPIRE", quota[1], quota[2] * 2)
+        quota_remaining = quota_remaining - 1
+    end
+    if remaining == nil or quota_remaining < remaining then
+        remaining = quota_remaining
+    end
+end
+
+return {allowed, math.max(0, remaining), reset, tostring(now)}
+"""
+
+_sliding_window_script = None
+
+
+def sliding_window(quotas):
+    """
+    Check and count the request against the quotas, a list of the keys with
+    their number of requests and window duration, in one round trip
+    """
+    global _sliding_window_script
+    if _sliding_window_script is None:
+        _sliding_window_script = redis_instance().register_script(SLIDING_WINDOW_SCRIPT)
+
+    keys = [key for key, _, _ in quotas]
+    args = []
+    for _, num_requests, duration in quotas:
+        args.extend([num_requests, duration])
+
+    allowed, remaining, reset, now = _sliding_window_script(keys=keys, args=args)
+    return bool(allowed), int(remaining), int(reset), float(now)
+
+
+class SlidingWindowRateThrottle(SimpleRateThrottle):
+    """
+    Rate throttle counted by an atomic redis script. The requests of a token
+    are limited by the rate of the scope, the workspace quota shared by all the
+    tokens of the workspace and the rate of the endpoint set by the
+    `endpoint_rate` of the view
+    """
 
     def get_cache_key(self, request, view):
         # Retrieve the API key from the request header
@@ -15,73 +93,63 @@ class ApiKeyRateThrottle(SimpleRateThrottle):
         if not api_key:
             return None  # Allow the request if there's no API key
 
-        # Use the API key as part of the cache key
-        return f"{self.scope}:{api_key}"
+        # The tokens are not stored in the keys
+        return f"throttle:{self.scope}:{hashlib.sha256(api_key.encode()).hexdigest()}"
 
-    def allow_request(self, request, view):
-        allowed = super().allow_request(request, view)
+    def get_quotas(self, request, view):
+        """Return the keys, the number of requests and the durations of the quotas"""
+        key = self.get_cache_key(request, view)
+        if key is None:
+            return []
 
-        if allowed:
-            now = self.timer()
-            # Calculate the remaining limit and reset time
-            history = self.cache.get(self.key, [])
+        quotas = [(key, self.num_requests, self.duration)]
 
-            # Remove old histories
-            while history and history[-1] <= now - self.duration:
-                history.pop()
+        # The workspace quota is shared by all the tokens of the workspace
+        slug = getattr(view, "kwargs", {}).get("slug")
+        if settings.API_WORKSPACE_RATE_LIMIT and slug:
+            num_requests, duration = self.parse_rate(settings.API_WORKSPACE_RATE_LIMIT)
+            quotas.append((f"throttle:workspace:{slug}", num_requests, duration))
 
-            # Calculate the requests
-            num_requests = len(history)
+        # The expensive endpoints can set a lower rate for every token
+        endpoint_rate = getattr(view, "endpoint_rate", None)
+        if endpoint_rate:
+            num_requests, duration = self.parse_rate(endpoint_rate)
+            quotas.append((f"{key}:{view.__class__.__name__}", num_requests, duration))
 
-            # Check available requests
-            available = self.num_requests - num_requests
+        return quotas
 
-            # Unix timestamp for when the rate limit will reset
-            reset_time = int(now + self.duration)
+    def allow_request(self, request, view):
+        if self.rate is None:
+            return True
 
-            # Add headers
-            request.META["X-RateLimit-Remaining"] = max(0, available)
-            request.META["X-RateLimit-Reset"] = reset_time
+        quotas = self.get_quotas(request, view)
+        if not quotas:
+            return True
 
-        return allowed
+        try:
+            allowed, remaining, reset, now = sliding_window(quotas)
+        except Exception as e:
+            # Allow the requests when the counters are not available
+            log_exception(e)
+            return True
 
+        self.wait_time = max(0, math.ceil(reset - now))
 
-class ServiceTokenRateThrottle(SimpleRateThrottle):
-    scope = "service_token"
-    rate = "300/minute"
+        # Add headers
+        request.META["X-RateLimit-Remaining"] = remaining
+        request.META["X-RateLimit-Reset"] = reset
 
-    def get_cache_key(self, request, view):
-        # Retrieve the API key from the request header
-        api_key = request.headers.get("X-Api-Key")
-        if not api_key:
-            return None  # Allow the request if there's no API key
-
-        # Use the API key as part of the cache key
-        return f"{self.scope}:{api_key}"
-
-    def allow_request(self, request, view):
-        allowed = super().allow_request(request, view)
-
-        if allowed:
-            now = self.timer()
-            # Calculate the remaining limit and reset time
-            history = self.cache.get(self.key, [])
-
-            # Remove old histories
-            while history and history[-1] <= now - self.duration:
-                history.pop()
+        return allowed
 
-            # Calculate the requests
-            num_requests = len(history)
+    def wait(self):
+        return getattr(self, "wait_time", None)
 
-            # Check available requests
-            available = self.num_requests - num_requests
 
-            # Unix timestamp for when the rate limit will reset
-            reset_time = int(now + self.duration)
+class ApiKeyRateThrottle(SlidingWindowRateThrottle):
+    scope = "api_key"
+    rate = os.environ.get("API_KEY_RATE_LIMIT", "60/minute")
 
-            # Add headers
-            request.META["X-RateLimit-Remaining"] = max(0, available)
-            request.META["X-RateLimit-Reset"] = reset_time
 
-        return allowed
+class ServiceTokenRateThrottle(SlidingWindowRateThrottle):
+    scope = "service_token"
+    rate = "300/minute"
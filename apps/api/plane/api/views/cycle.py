@@ -49,6 +49,7 @@ from plane.db.models import (
 )
 from plane.utils.analytics_plot import burndown_plot
 from plane.utils.host import base_host
+from plane.utils.progress_snapshot import invalidate_progress_snapshots
 from .base import BaseAPIView
 from plane.bgtasks.webhook_task import model_activity
 from plane.utils.openapi.decorators import cycle_docs
@@ -555,7 +556,11 @@ class CycleDetailAPIEndpoint(BaseAPIView):
                     },
                     status=status.HTTP_409_CONFLICT,
                 )
+            dates = (cycle.start_date, cycle.end_date)
             serializer.save()
+            if (cycle.start_date, cycle.end_date) != dates:
+                # The burndown of the snapshots follows the dates of the cycle
+                invalidate_progress_snapshots(project_id)
 
             # Send the model activity
             model_activity.delay(
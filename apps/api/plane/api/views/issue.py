@@ -18,7 +18,6 @@ from django.db.models import (
     Q,
     Value,
     When,
-    Subquery,
 )
 from django.utils import timezone
 from django.conf import settings
@@ -67,13 +66,13 @@ from plane.db.models import (
     Label,
     Project,
     ProjectMember,
-    CycleIssue,
     Workspace,
 )
 from plane.settings.storage import S3Storage
 from plane.bgtasks.storage_metadata_task import get_asset_object_metadata
 from .base import BaseAPIView
 from plane.utils.host import base_host
+from plane.utils.issue_list_projection import issue_count_annotations
 from plane.bgtasks.webhook_task import model_activity
 from plane.app.permissions import ROLE
 from plane.utils.openapi import (
@@ -145,6 +144,7 @@ from plane.utils.openapi import (
 )
 from plane.bgtasks.work_item_link_task import crawl_work_item_link_title
 
+
 def user_has_issue_permission(
     user_id, project_id, issue=None, allowed_roles=None, allow_creator=True
 ):
@@ -321,30 +321,8 @@ class IssueListCreateAPIEndpoint(BaseAPIView):
 
         order_by_param = request.GET.get("order_by", "-created_at")
 
-        issue_queryset = (
-            self.get_queryset()
-            .annotate(
-                cycle_id=Subquery(
-                    CycleIssue.objects.filter(
-                        issue=OuterRef("id"), deleted_at__isnull=True
-                    ).values("cycle_id")[:1]
-                )
-            )
-            .annotate(
-                link_count=IssueLink.objects.filter(issue=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
-            .annotate(
-                attachment_count=FileAsset.objects.filter(
-                    issue_id=OuterRef("id"),
-                    entity_type=FileAsset.EntityTypeContext.ISSUE_ATTACHMENT,
-                )
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
+        issue_queryset = self.get_queryset().annotate(
+            **issue_count_annotations("cycle_id", "link_count", "attachment_count")
         )
 
         total_issue_queryset = Issue.issue_objects.filter(
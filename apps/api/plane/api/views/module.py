@@ -38,6 +38,7 @@ from plane.db.models import (
 from .base import BaseAPIView
 from plane.bgtasks.webhook_task import model_activity
 from plane.utils.host import base_host
+from plane.utils.progress_snapshot import invalidate_progress_snapshots
 from plane.utils.openapi import (
     module_docs,
     module_issue_docs,
@@ -441,7 +442,11 @@ class ModuleDetailAPIEndpoint(BaseAPIView):
                     },
                     status=status.HTTP_409_CONFLICT,
                 )
+            dates = (module.start_date, module.target_date)
             serializer.save()
+            if (module.start_date, module.target_date) != dates:
+                # The burndown of the snapshots follows the dates of the module
+                invalidate_progress_snapshots(project_id)
 
             # Send the model activity
             model_activity.delay(
@@ -9,7 +9,9 @@ from drf_spectacular.utils import OpenApiResponse, OpenApiExample, OpenApiReques
 # Module imports
 from plane.api.serializers import StateSerializer
 from plane.app.permissions import ProjectEntityPermission
+from plane.bgtasks.analytics_rollup_task import refresh_relation_rollups
 from plane.db.models import Issue, State
+from plane.utils.group_count_cache import invalidate_group_counts
 from .base import BaseAPIView
 from plane.utils.openapi import (
     state_docs,
@@ -280,6 +282,7 @@ class StateDetailAPIEndpoint(BaseAPIView):
         state = State.objects.get(
             workspace__slug=slug, project_id=project_id, pk=state_id
         )
+        group = state.group
         serializer = StateSerializer(state, data=request.data, partial=True)
         if serializer.is_valid():
             if (
@@ -302,5 +305,10 @@ class StateDetailAPIEndpoint(BaseAPIView):
                     status=status.HTTP_409_CONFLICT,
                 )
             serializer.save()
+            if state.group != group:
+                # The issues of the state move to the new group
+                refresh_relation_rollups.delay("state", str(state.id))
+                # The group counts and the progress snapshots are stale
+                invalidate_group_counts(project_id)
             return Response(serializer.data, status=status.HTTP_200_OK)
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
@@ -1,4 +1,4 @@
-from plane.db.models import WorkspaceMember, ProjectMember
+from plane.utils.member_role_cache import get_member_role
 from functools import wraps
 from rest_framework.response import Response
 from rest_framework import status
@@ -31,22 +31,12 @@ def allow_permission(allowed_roles, level="PROJECT", creator=False, model=None):
 
             # Check role permissions
             if level == "WORKSPACE":
-                if WorkspaceMember.objects.filter(
-                    member=request.user,
-                    workspace__slug=kwargs["slug"],
-                    role__in=allowed_role_values,
-                    is_active=True,
-                ).exists():
-                    return view_func(instance, request, *args, **kwargs)
+                role = get_member_role(request, kwargs["slug"])
             else:
-                if ProjectMember.objects.filter(
-                    member=request.user,
-                    workspace__slug=kwargs["slug"],
-                    project_id=kwargs["project_id"],
-                    role__in=allowed_role_values,
-                    is_active=True,
-                ).exists():
-                    return view_func(instance, request, *args, **kwargs)
+                role = get_member_role(request, kwargs["slug"], kwargs["project_id"])
+
+            if role in allowed_role_values:
+                return view_func(instance, request, *args, **kwargs)
 
             # Return permission denied if no conditions are met
             return Response(
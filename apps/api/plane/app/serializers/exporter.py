@@ -20,6 +20,8 @@ class ExporterHistorySerializer(BaseSerializer):
             "initiated_by",
             "initiated_by_detail",
             "token",
+            "total_issues",
+            "exported_issues",
             "created_by",
             "updated_by",
         ]
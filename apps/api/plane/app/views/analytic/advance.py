@@ -1,6 +1,7 @@
 from rest_framework.response import Response
 from rest_framework import status
 from typing import Dict, List, Any
+from django.conf import settings
 from django.db.models import QuerySet, Q, Count
 from django.http import HttpRequest
 from django.db.models.functions import TruncMonth
@@ -18,6 +19,15 @@ from plane.db.models import (
     Workspace,
     ProjectMember,
 )
+from plane.utils.analytics_rollup import (
+    build_rollup_chart,
+    get_analytics_rollup_range,
+    get_chart_dimension,
+    get_issue_rollups,
+    get_rollup_monthly_stats,
+    get_rollup_project_stats,
+    get_rollup_work_items_stats,
+)
 from plane.utils.build_chart import build_analytics_chart
 from plane.utils.date_utils import (
     get_analytics_filters,
@@ -109,6 +119,16 @@ class AdvanceAnalyticsEndpoint(AdvanceAnalyticsBaseView):
         }
 
     def get_work_items_stats(self) -> Dict[str, Dict[str, int]]:
+        if settings.ENABLE_ANALYTICS_ROLLUP:
+            return get_rollup_work_items_stats(
+                get_issue_rollups(
+                    self.filters,
+                    date_range=get_analytics_rollup_range(
+                        self.filters["analytics_date_range"]
+                    ),
+                )
+            )
+
         base_queryset = Issue.issue_objects.filter(**self.filters["base_filters"])
 
         return {
@@ -170,6 +190,9 @@ class AdvanceAnalyticsStatsEndpoint(AdvanceAnalyticsBaseView):
         )
 
     def get_work_items_stats(self) -> Dict[str, Dict[str, int]]:
+        if settings.ENABLE_ANALYTICS_ROLLUP:
+            return get_rollup_project_stats(get_issue_rollups(self.filters))
+
         base_queryset = Issue.issue_objects.filter(**self.filters["base_filters"])
         return (
             base_queryset.values("project_id", "project__name")
@@ -271,15 +294,22 @@ class AdvanceAnalyticsChartEndpoint(AdvanceAnalyticsBaseView):
             )
 
         # Annotate by month and count
-        monthly_stats = (
-            queryset.annotate(month=TruncMonth("created_at"))
-            .values("month")
-            .annotate(
-                created_count=Count("id"),
-                completed_count=Count("id", filter=Q(state__group="completed")),
+        if settings.ENABLE_ANALYTICS_ROLLUP:
+            monthly_stats = get_rollup_monthly_stats(
+                get_issue_rollups(
+                    self.filters, date_range=self.filters["chart_period_range"]
+                )
+            )
+        else:
+            monthly_stats = (
+                queryset.annotate(month=TruncMonth("created_at"))
+                .values("month")
+                .annotate(
+                    created_count=Count("id"),
+                    completed_count=Count("id", filter=Q(state__group="completed")),
+                )
+                .order_by("month")
             )
-            .order_by("month")
-        )
 
         # Create dictionary of month -> counts
         stats_dict = {
@@ -335,6 +365,18 @@ class AdvanceAnalyticsChartEndpoint(AdvanceAnalyticsBaseView):
             return Response(self.project_chart(), status=status.HTTP_200_OK)
 
         elif type == "custom-work-items":
+            dimension = get_chart_dimension(x_axis, group_by)
+            if settings.ENABLE_ANALYTICS_ROLLUP and dimension is not None:
+                rollups = get_issue_rollups(
+                    self.filters,
+                    dimension=dimension,
+                    date_range=self.filters["chart_period_range"],
+                )
+                return Response(
+                    build_rollup_chart(rollups, x_axis, group_by),
+                    status=status.HTTP_200_OK,
+                )
+
             queryset = (
                 Issue.issue_objects.filter(**self.filters["base_filters"])
                 .select_related("workspace", "state", "parent")
@@ -1,6 +1,7 @@
 from rest_framework.response import Response
 from rest_framework import status
 from typing import Dict, Any
+from django.conf import settings
 from django.db.models import QuerySet, Q, Count
 from django.http import HttpRequest
 from django.db.models.functions import TruncMonth
@@ -19,6 +20,15 @@ from plane.db.models import (
 from django.db import models
 from django.db.models import F, Case, When, Value
 from django.db.models.functions import Concat
+from plane.utils.analytics_rollup import (
+    build_rollup_chart,
+    get_analytics_rollup_range,
+    get_chart_dimension,
+    get_issue_rollups,
+    get_rollup_assignee_stats,
+    get_rollup_monthly_stats,
+    get_rollup_work_items_stats,
+)
 from plane.utils.build_chart import build_analytics_chart
 from plane.utils.date_utils import (
     get_analytics_filters,
@@ -36,6 +46,16 @@ class ProjectAdvanceAnalyticsBaseView(BaseAPIView):
             project_ids=self.request.GET.get("project_ids", None),
         )
 
+    def get_rollup_scope(
+        self, project_id, cycle_id=None, module_id=None
+    ) -> Dict[str, Any]:
+        # The work items of a cycle or a module are read from its rollups
+        if cycle_id is not None:
+            return {"dimension": "cycle", "dimension_id": cycle_id}
+        if module_id is not None:
+            return {"dimension": "module", "dimension_id": module_id}
+        return {"project_id": project_id}
+
 
 class ProjectAdvanceAnalyticsEndpoint(ProjectAdvanceAnalyticsBaseView):
     def get_filtered_counts(self, queryset: QuerySet) -> Dict[str, int]:
@@ -61,6 +81,17 @@ class ProjectAdvanceAnalyticsEndpoint(ProjectAdvanceAnalyticsBaseView):
         """
         Returns work item stats for the workspace, or filtered by cycle_id or module_id if provided.
         """
+        if settings.ENABLE_ANALYTICS_ROLLUP:
+            return get_rollup_work_items_stats(
+                get_issue_rollups(
+                    self.filters,
+                    **self.get_rollup_scope(project_id, cycle_id, module_id),
+                    date_range=get_analytics_rollup_range(
+                        self.filters["analytics_date_range"]
+                    ),
+                )
+            )
+
         base_queryset = None
         if cycle_id is not None:
             cycle_issues = CycleIssue.objects.filter(
@@ -135,6 +166,14 @@ class ProjectAdvanceAnalyticsStatsEndpoint(ProjectAdvanceAnalyticsBaseView):
     def get_work_items_stats(
         self, project_id, cycle_id=None, module_id=None
     ) -> Dict[str, Dict[str, int]]:
+        # The assignees of a cycle or a module span two dimensions of the rollups
+        if settings.ENABLE_ANALYTICS_ROLLUP and cycle_id is None and module_id is None:
+            return get_rollup_assignee_stats(
+                get_issue_rollups(
+                    self.filters, dimension="assignee", project_id=project_id
+                )
+            )
+
         base_queryset = None
         if cycle_id is not None:
             cycle_issues = CycleIssue.objects.filter(
@@ -307,15 +346,24 @@ class ProjectAdvanceAnalyticsChartEndpoint(ProjectAdvanceAnalyticsBaseView):
                 )
 
             # Annotate by month and count
-            monthly_stats = (
-                queryset.annotate(month=TruncMonth("created_at"))
-                .values("month")
-                .annotate(
-                    created_count=Count("id"),
-                    completed_count=Count("id", filter=Q(state__group="completed")),
+            if settings.ENABLE_ANALYTICS_ROLLUP:
+                monthly_stats = get_rollup_monthly_stats(
+                    get_issue_rollups(
+                        self.filters,
+                        project_id=project_id,
+                        date_range=self.filters["chart_period_range"],
+                    )
+                )
+            else:
+                monthly_stats = (
+                    queryset.annotate(month=TruncMonth("created_at"))
+                    .values("month")
+                    .annotate(
+                        created_count=Count("id"),
+                        completed_count=Count("id", filter=Q(state__group="completed")),
+                    )
+                    .order_by("month")
                 )
-                .order_by("month")
-            )
 
             # Create dictionary of month -> counts
             stats_dict = {
@@ -372,6 +420,21 @@ class ProjectAdvanceAnalyticsChartEndpoint(ProjectAdvanceAnalyticsBaseView):
         module_id = request.GET.get("module_id", None)
 
         if type == "custom-work-items":
+            scope = self.get_rollup_scope(project_id, cycle_id, module_id)
+            dimension = get_chart_dimension(
+                x_axis, group_by, scope.get("dimension", "")
+            )
+            if settings.ENABLE_ANALYTICS_ROLLUP and dimension is not None:
+                rollups = get_issue_rollups(
+                    self.filters,
+                    **{**scope, "dimension": dimension},
+                    date_range=self.filters["chart_period_range"],
+                )
+                return Response(
+                    build_rollup_chart(rollups, x_axis, group_by),
+                    status=status.HTTP_200_OK,
+                )
+
             queryset = (
                 Issue.issue_objects.filter(**self.filters["base_filters"])
                 .filter(project_id=project_id)
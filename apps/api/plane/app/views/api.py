@@ -12,6 +12,7 @@ from .base import BaseAPIView
 from plane.db.models import APIToken, Workspace
 from plane.app.serializers import APITokenSerializer, APITokenReadSerializer
 from plane.app.permissions import WorkspaceEntityPermission
+from plane.utils.api_token_cache import invalidate_api_token
 
 
 class ApiTokenEndpoint(BaseAPIView):
@@ -48,6 +49,7 @@ class ApiTokenEndpoint(BaseAPIView):
     def delete(self, request: Request, pk: str) -> Response:
         api_token = APIToken.objects.get(user=request.user, pk=pk, is_service=False)
         api_token.delete()
+        invalidate_api_token(api_token.token)
         return Response(status=status.HTTP_204_NO_CONTENT)
 
     def patch(self, request: Request, pk: str) -> Response:
@@ -55,6 +57,7 @@ class ApiTokenEndpoint(BaseAPIView):
         serializer = APITokenSerializer(api_token, data=request.data, partial=True)
         if serializer.is_valid():
             serializer.save()
+            invalidate_api_token(api_token.token)
             return Response(serializer.data, status=status.HTTP_200_OK)
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
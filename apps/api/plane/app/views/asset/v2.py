@@ -480,8 +480,8 @@ class StaticFileAssetEndpoint(BaseAPIView):
 
         # Get the presigned URL
         storage = S3Storage(request=request)
-        # Generate a presigned URL to share an S3 object
-        signed_url = storage.generate_presigned_url(object_name=asset.asset.name)
+        # The assets are immutable, the presigned URL is reused
+        signed_url = storage.generate_cached_presigned_url(object_name=asset.asset.name)
         # Redirect to the signed URL
         return HttpResponseRedirect(signed_url)
 
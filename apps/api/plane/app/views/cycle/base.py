@@ -37,6 +37,8 @@ from plane.app.serializers import (
     CycleWriteSerializer,
 )
 from plane.bgtasks.issue_activities_task import issue_activity
+from plane.bgtasks.issue_list_projection_task import queue_issue_list_projection
+from plane.bgtasks.progress_snapshot_task import queue_progress_snapshot
 from plane.db.models import (
     Cycle,
     CycleIssue,
@@ -50,6 +52,13 @@ from plane.db.models import (
     UserRecentVisit,
 )
 from plane.utils.analytics_plot import burndown_plot
+from plane.utils.progress_snapshot import (
+    get_cycle_analytics,
+    get_cycle_progress,
+    get_progress_snapshot,
+    invalidate_progress_snapshots,
+    is_active_cycle,
+)
 from plane.bgtasks.recent_visited_task import recent_visited_task
 from plane.utils.host import base_host
 from .. import BaseAPIView, BaseViewSet
@@ -383,7 +392,11 @@ class CycleViewSet(BaseViewSet):
             cycle, data=request.data, partial=True, context={"project_id": project_id}
         )
         if serializer.is_valid():
+            dates = (cycle.start_date, cycle.end_date)
             serializer.save()
+            if (cycle.start_date, cycle.end_date) != dates:
+                # The burndown of the snapshots follows the dates of the cycle
+                invalidate_progress_snapshots(project_id)
             cycle = queryset.values(
                 # necessary fields
                 "id",
@@ -543,6 +556,8 @@ class CycleViewSet(BaseViewSet):
         )
         # TODO: Soft delete the cycle break the onetoone relationship with cycle issue
         cycle.delete()
+        # Refresh the list rows of the cycle issues
+        queue_issue_list_projection(cycle_issues)
 
         # Delete the user favorite cycle
         UserFavorite.objects.filter(
@@ -1126,139 +1141,30 @@ class CycleProgressEndpoint(BaseAPIView):
             return Response(
                 {"error": "Cycle not found"}, status=status.HTTP_404_NOT_FOUND
             )
-        aggregate_estimates = (
-            Issue.issue_objects.filter(
-                estimate_point__estimate__type="points",
-                issue_cycle__cycle_id=cycle_id,
-                issue_cycle__deleted_at__isnull=True,
-                workspace__slug=slug,
-                project_id=project_id,
-            )
-            .annotate(value_as_float=Cast("estimate_point__value", FloatField()))
-            .aggregate(
-                backlog_estimate_point=Sum(
-                    Case(
-                        When(state__group="backlog", then="value_as_float"),
-                        default=Value(0),
-                        output_field=FloatField(),
-                    )
-                ),
-                unstarted_estimate_point=Sum(
-                    Case(
-                        When(state__group="unstarted", then="value_as_float"),
-                        default=Value(0),
-                        output_field=FloatField(),
-                    )
-                ),
-                started_estimate_point=Sum(
-                    Case(
-                        When(state__group="started", then="value_as_float"),
-                        default=Value(0),
-                        output_field=FloatField(),
-                    )
-                ),
-                cancelled_estimate_point=Sum(
-                    Case(
-                        When(state__group="cancelled", then="value_as_float"),
-                        default=Value(0),
-                        output_field=FloatField(),
-                    )
-                ),
-                completed_estimate_points=Sum(
-                    Case(
-                        When(state__group="completed", then="value_as_float"),
-                        default=Value(0),
-                        output_field=FloatField(),
-                    )
-                ),
-                total_estimate_points=Sum(
-                    "value_as_float", default=Value(0), output_field=FloatField()
-                ),
-            )
-        )
-        if cycle.progress_snapshot:
-            backlog_issues = cycle.progress_snapshot.get("backlog_issues", 0)
-            unstarted_issues = cycle.progress_snapshot.get("unstarted_issues", 0)
-            started_issues = cycle.progress_snapshot.get("started_issues", 0)
-            cancelled_issues = cycle.progress_snapshot.get("cancelled_issues", 0)
-            completed_issues = cycle.progress_snapshot.get("completed_issues", 0)
-            total_issues = cycle.progress_snapshot.get("total_issues", 0)
-        else:
-            backlog_issues = Issue.issue_objects.filter(
-                issue_cycle__cycle_id=cycle_id,
-                issue_cycle__deleted_at__isnull=True,
-                workspace__slug=slug,
-                project_id=project_id,
-                state__group="backlog",
-            ).count()
-
-            unstarted_issues = Issue.issue_objects.filter(
-                issue_cycle__cycle_id=cycle_id,
-                issue_cycle__deleted_at__isnull=True,
-                workspace__slug=slug,
-                project_id=project_id,
-                state__group="unstarted",
-            ).count()
-
-            started_issues = Issue.issue_objects.filter(
-                issue_cycle__cycle_id=cycle_id,
-                issue_cycle__deleted_at__isnull=True,
-                workspace__slug=slug,
-                project_id=project_id,
-                state__group="started",
-            ).count()
-
-            cancelled_issues = Issue.issue_objects.filter(
-                issue_cycle__cycle_id=cycle_id,
-                issue_cycle__deleted_at__isnull=True,
-                workspace__slug=slug,
-                project_id=project_id,
-                state__group="cancelled",
-            ).count()
-
-            completed_issues = Issue.issue_objects.filter(
-                issue_cycle__cycle_id=cycle_id,
-                issue_cycle__deleted_at__isnull=True,
-                workspace__slug=slug,
-                project_id=project_id,
-                state__group="completed",
-            ).count()
 
-            total_issues = Issue.issue_objects.filter(
-                issue_cycle__cycle_id=cycle_id,
-                issue_cycle__deleted_at__isnull=True,
-                workspace__slug=slug,
-                project_id=project_id,
-            ).count()
+        # The transferred cycles keep the issue counts in their snapshot
+        if not cycle.progress_snapshot and is_active_cycle(cycle):
+            snapshot = get_progress_snapshot(project_id, cycle_id=cycle_id)
+            if snapshot is not None:
+                return Response(snapshot["progress"], status=status.HTTP_200_OK)
+            queue_progress_snapshot(cycle_id=cycle_id)
 
-        return Response(
-            {
-                "backlog_estimate_points": aggregate_estimates["backlog_estimate_point"]
-                or 0,
-                "unstarted_estimate_points": aggregate_estimates[
-                    "unstarted_estimate_point"
-                ]
-                or 0,
-                "started_estimate_points": aggregate_estimates["started_estimate_point"]
-                or 0,
-                "cancelled_estimate_points": aggregate_estimates[
-                    "cancelled_estimate_point"
-                ]
-                or 0,
-                "completed_estimate_points": aggregate_estimates[
-                    "completed_estimate_points"
-                ]
-                or 0,
-                "total_estimate_points": aggregate_estimates["total_estimate_points"],
-                "backlog_issues": backlog_issues,
-                "total_issues": total_issues,
-                "completed_issues": completed_issues,
-                "cancelled_issues": cancelled_issues,
-                "started_issues": started_issues,
-                "unstarted_issues": unstarted_issues,
-            },
-            status=status.HTTP_200_OK,
-        )
+        progress = get_cycle_progress(slug, project_id, cycle_id)
+        if cycle.progress_snapshot:
+            progress.update(
+                {
+                    key: cycle.progress_snapshot.get(key, 0)
+                    for key in [
+                        "backlog_issues",
+                        "unstarted_issues",
+                        "started_issues",
+                        "cancelled_issues",
+                        "completed_issues",
+                        "total_issues",
+                    ]
+                }
+            )
+        return Response(progress, status=status.HTTP_200_OK)
 
 
 class CycleAnalyticsEndpoint(BaseAPIView):
@@ -1309,229 +1215,15 @@ class CycleAnalyticsEndpoint(BaseAPIView):
                 status=status.HTTP_200_OK,
             )
 
-        estimate_type = Project.objects.filter(
-            workspace__slug=slug,
-            pk=project_id,
-            estimate__isnull=False,
-            estimate__type="points",
-        ).exists()
-
-        assignee_distribution = []
-        label_distribution = []
-        completion_chart = {}
-
-        if analytic_type == "points" and estimate_type:
-            assignee_distribution = (
-                Issue.issue_objects.filter(
-                    issue_cycle__cycle_id=cycle_id,
-                    issue_cycle__deleted_at__isnull=True,
-                    workspace__slug=slug,
-                    project_id=project_id,
-                )
-                .annotate(display_name=F("assignees__display_name"))
-                .annotate(assignee_id=F("assignees__id"))
-                .annotate(
-                    avatar_url=Case(
-                        # If `avatar_asset` exists, use it to generate the asset URL
-                        When(
-                            assignees__avatar_asset__isnull=False,
-                            then=Concat(
-                                Value("/api/assets/v2/static/"),
-                                "assignees__avatar_asset",  # Assuming avatar_asset has an id or relevant field
-                                Value("/"),
-                            ),
-                        ),
-                        # If `avatar_asset` is None, fall back to using `avatar` field directly
-                        When(
-                            assignees__avatar_asset__isnull=True,
-                            then="assignees__avatar",
-                        ),
-                        default=Value(None),
-                        output_field=models.CharField(),
-                    )
-                )
-                .values("display_name", "assignee_id", "avatar_url")
-                .annotate(
-                    total_estimates=Sum(Cast("estimate_point__value", FloatField()))
-                )
-                .annotate(
-                    completed_estimates=Sum(
-                        Cast("estimate_point__value", FloatField()),
-                        filter=Q(
-                            completed_at__isnull=False,
-                            archived_at__isnull=True,
-                            is_draft=False,
-                        ),
-                    )
-                )
-                .annotate(
-                    pending_estimates=Sum(
-                        Cast("estimate_point__value", FloatField()),
-                        filter=Q(
-                            completed_at__isnull=True,
-                            archived_at__isnull=True,
-                            is_draft=False,
-                        ),
-                    )
-                )
-                .order_by("display_name")
-            )
-
-            label_distribution = (
-                Issue.issue_objects.filter(
-                    issue_cycle__cycle_id=cycle_id,
-                    issue_cycle__deleted_at__isnull=True,
-                    workspace__slug=slug,
-                    project_id=project_id,
-                )
-                .annotate(label_name=F("labels__name"))
-                .annotate(color=F("labels__color"))
-                .annotate(label_id=F("labels__id"))
-                .values("label_name", "color", "label_id")
-                .annotate(
-                    total_estimates=Sum(Cast("estimate_point__value", FloatField()))
-                )
-                .annotate(
-                    completed_estimates=Sum(
-                        Cast("estimate_point__value", FloatField()),
-                        filter=Q(
-                            completed_at__isnull=False,
-                            archived_at__isnull=True,
-                            is_draft=False,
-                        ),
-                    )
-                )
-                .annotate(
-                    pending_estimates=Sum(
-                        Cast("estimate_point__value", FloatField()),
-                        filter=Q(
-                            completed_at__isnull=True,
-                            archived_at__isnull=True,
-                            is_draft=False,
-                        ),
-                    )
-                )
-                .order_by("label_name")
-            )
-            completion_chart = burndown_plot(
-                queryset=cycle,
-                slug=slug,
-                project_id=project_id,
-                plot_type="points",
-                cycle_id=cycle_id,
-            )
-
-        if analytic_type == "issues":
-            assignee_distribution = (
-                Issue.issue_objects.filter(
-                    issue_cycle__cycle_id=cycle_id,
-                    issue_cycle__deleted_at__isnull=True,
-                    project_id=project_id,
-                    workspace__slug=slug,
-                )
-                .annotate(display_name=F("assignees__display_name"))
-                .annotate(assignee_id=F("assignees__id"))
-                .annotate(
-                    avatar_url=Case(
-                        # If `avatar_asset` exists, use it to generate the asset URL
-                        When(
-                            assignees__avatar_asset__isnull=False,
-                            then=Concat(
-                                Value("/api/assets/v2/static/"),
-                                "assignees__avatar_asset",  # Assuming avatar_asset has an id or relevant field
-                                Value("/"),
-                            ),
-                        ),
-                        # If `avatar_asset` is None, fall back to using `avatar` field directly
-                        When(
-                            assignees__avatar_asset__isnull=True,
-                            then="assignees__avatar",
-                        ),
-                        default=Value(None),
-                        output_field=models.CharField(),
-                    )
-                )
-                .values("display_name", "assignee_id", "avatar_url")
-                .annotate(
-                    total_issues=Count(
-                        "assignee_id",
-                        filter=Q(archived_at__isnull=True, is_draft=False),
-                    )
-                )
-                .annotate(
-                    completed_issues=Count(
-                        "assignee_id",
-                        filter=Q(
-                            completed_at__isnull=False,
-                            archived_at__isnull=True,
-                            is_draft=False,
-                        ),
-                    )
-                )
-                .annotate(
-                    pending_issues=Count(
-                        "assignee_id",
-                        filter=Q(
-                            completed_at__isnull=True,
-                            archived_at__isnull=True,
-                            is_draft=False,
-                        ),
-                    )
-                )
-                .order_by("display_name")
-            )
-
-            label_distribution = (
-                Issue.issue_objects.filter(
-                    issue_cycle__cycle_id=cycle_id,
-                    issue_cycle__deleted_at__isnull=True,
-                    project_id=project_id,
-                    workspace__slug=slug,
-                )
-                .annotate(label_name=F("labels__name"))
-                .annotate(color=F("labels__color"))
-                .annotate(label_id=F("labels__id"))
-                .values("label_name", "color", "label_id")
-                .annotate(
-                    total_issues=Count(
-                        "label_id", filter=Q(archived_at__isnull=True, is_draft=False)
-                    )
-                )
-                .annotate(
-                    completed_issues=Count(
-                        "label_id",
-                        filter=Q(
-                            completed_at__isnull=False,
-                            archived_at__isnull=True,
-                            is_draft=False,
-                        ),
-                    )
-                )
-                .annotate(
-                    pending_issues=Count(
-                        "label_id",
-                        filter=Q(
-                            completed_at__isnull=True,
-                            archived_at__isnull=True,
-                            is_draft=False,
-                        ),
-                    )
+        if is_active_cycle(cycle):
+            snapshot = get_progress_snapshot(project_id, cycle_id=cycle_id)
+            if snapshot is not None and analytic_type in snapshot["analytics"]:
+                return Response(
+                    snapshot["analytics"][analytic_type], status=status.HTTP_200_OK
                 )
-                .order_by("label_name")
-            )
-            completion_chart = burndown_plot(
-                queryset=cycle,
-                slug=slug,
-                project_id=project_id,
-                cycle_id=cycle_id,
-                plot_type="issues",
-            )
+            queue_progress_snapshot(cycle_id=cycle_id)
 
         return Response(
-            {
-                "assignees": assignee_distribution,
-                "labels": label_distribution,
-                "completion_chart": completion_chart,
-            },
+            get_cycle_analytics(slug, project_id, cycle, analytic_type),
             status=status.HTTP_200_OK,
         )
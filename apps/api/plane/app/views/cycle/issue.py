@@ -18,6 +18,7 @@ from .. import BaseViewSet
 from plane.app.serializers import CycleIssueSerializer
 from plane.bgtasks.issue_activities_task import issue_activity
 from plane.db.models import Cycle, CycleIssue, Issue, FileAsset, IssueLink
+from plane.utils.group_count_cache import group_count_cache_key
 from plane.utils.grouper import (
     issue_group_values,
     issue_on_results,
@@ -124,6 +125,15 @@ class CycleIssueViewSet(BaseViewSet):
         group_by = request.GET.get("group_by", False)
         sub_group_by = request.GET.get("sub_group_by", False)
 
+        # Cache key for the group totals, shared across the pages
+        count_cache_key = group_count_cache_key(
+            project_id=project_id,
+            scope=f"cycle:{cycle_id}",
+            filters=filters,
+            group_by=group_by,
+            sub_group_by=sub_group_by,
+        )
+
         # issue queryset
         issue_queryset = issue_queryset_grouper(
             queryset=issue_queryset, group_by=group_by, sub_group_by=sub_group_by
@@ -149,6 +159,7 @@ class CycleIssueViewSet(BaseViewSet):
                             group_by=group_by, issues=issues, sub_group_by=sub_group_by
                         ),
                         paginator_cls=SubGroupedOffsetPaginator,
+                        count_cache_key=count_cache_key,
                         group_by_fields=issue_group_values(
                             field=group_by,
                             slug=slug,
@@ -183,6 +194,7 @@ class CycleIssueViewSet(BaseViewSet):
                         group_by=group_by, issues=issues, sub_group_by=sub_group_by
                     ),
                     paginator_cls=GroupedOffsetPaginator,
+                    count_cache_key=count_cache_key,
                     group_by_fields=issue_group_values(
                         field=group_by,
                         slug=slug,
@@ -2,6 +2,7 @@
 import json
 
 # Django imports
+from django.conf import settings
 from django.contrib.postgres.aggregates import ArrayAgg
 from django.contrib.postgres.fields import ArrayField
 from django.core.serializers.json import DjangoJSONEncoder
@@ -53,12 +54,15 @@ from plane.db.models import (
     IssueLabel,
     IntakeIssue,
 )
+from plane.utils.group_count_cache import group_count_cache_key
 from plane.utils.grouper import (
     issue_group_values,
     issue_on_results,
     issue_queryset_grouper,
 )
 from plane.utils.issue_filters import issue_filters
+from plane.utils.issue_list_projection import issue_count_annotations
+from plane.utils.member_role_cache import get_member_role
 from plane.utils.order_queryset import order_issue_queryset
 from plane.utils.paginator import GroupedOffsetPaginator, SubGroupedOffsetPaginator
 from .. import BaseAPIView, BaseViewSet
@@ -89,34 +93,7 @@ class IssueListEndpoint(BaseAPIView):
             .filter(workspace__slug=self.kwargs.get("slug"))
             .select_related("workspace", "project", "state", "parent")
             .prefetch_related("assignees", "labels", "issue_module__module")
-            .annotate(
-                cycle_id=Subquery(
-                    CycleIssue.objects.filter(
-                        issue=OuterRef("id"), deleted_at__isnull=True
-                    ).values("cycle_id")[:1]
-                )
-            )
-            .annotate(
-                link_count=IssueLink.objects.filter(issue=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
-            .annotate(
-                attachment_count=FileAsset.objects.filter(
-                    issue_id=OuterRef("id"),
-                    entity_type=FileAsset.EntityTypeContext.ISSUE_ATTACHMENT,
-                )
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
-            .annotate(
-                sub_issues_count=Issue.issue_objects.filter(parent=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
+            .annotate(**issue_count_annotations())
         ).distinct()
 
         filters = issue_filters(request.query_params, "GET")
@@ -206,42 +183,41 @@ class IssueViewSet(BaseViewSet):
             .filter(workspace__slug=self.kwargs.get("slug"))
             .select_related("workspace", "project", "state", "parent")
             .prefetch_related("assignees", "labels", "issue_module__module")
-            .annotate(
-                cycle_id=Subquery(
-                    CycleIssue.objects.filter(
-                        issue=OuterRef("id"), deleted_at__isnull=True
-                    ).values("cycle_id")[:1]
-                )
-            )
-            .annotate(
-                link_count=Subquery(
-                    IssueLink.objects.filter(issue=OuterRef("id"))
-                    .values("issue")
-                    .annotate(count=Count("id"))
-                    .values("count")
-                )
-            )
-            .annotate(
-                attachment_count=Subquery(
-                    FileAsset.objects.filter(
-                        issue_id=OuterRef("id"),
-                        entity_type=FileAsset.EntityTypeContext.ISSUE_ATTACHMENT,
-                    )
-                    .values("issue_id")
-                    .annotate(count=Count("id"))
-                    .values("count")
-                )
-            )
-            .annotate(
-                sub_issues_count=Subquery(
-                    Issue.issue_objects.filter(parent=OuterRef("id"))
-                    .values("parent")
-                    .annotate(count=Count("id"))
-                    .values("count")
-                )
-            )
+            .annotate(**self.get_count_annotations())
         )
 
+    def get_count_annotations(self):
+        if settings.ENABLE_ISSUE_LIST_PROJECTION:
+            return issue_count_annotations()
+        return {
+            "cycle_id": Subquery(
+                CycleIssue.objects.filter(
+                    issue=OuterRef("id"), deleted_at__isnull=True
+                ).values("cycle_id")[:1]
+            ),
+            "link_count": Subquery(
+                IssueLink.objects.filter(issue=OuterRef("id"))
+                .values("issue")
+                .annotate(count=Count("id"))
+                .values("count")
+            ),
+            "attachment_count": Subquery(
+                FileAsset.objects.filter(
+                    issue_id=OuterRef("id"),
+                    entity_type=FileAsset.EntityTypeContext.ISSUE_ATTACHMENT,
+                )
+                .values("issue_id")
+                .annotate(count=Count("id"))
+                .values("count")
+            ),
+            "sub_issues_count": Subquery(
+                Issue.issue_objects.filter(parent=OuterRef("id"))
+                .values("parent")
+                .annotate(count=Count("id"))
+                .values("count")
+            ),
+        }
+
     @method_decorator(gzip_page)
     @allow_permission([ROLE.ADMIN, ROLE.MEMBER, ROLE.GUEST])
     def list(self, request, slug, project_id):
@@ -281,18 +257,24 @@ class IssueViewSet(BaseViewSet):
             entity_identifier=project_id,
             user_id=request.user.id,
         )
+        guest_user_id = None
         if (
-            ProjectMember.objects.filter(
-                workspace__slug=slug,
-                project_id=project_id,
-                member=request.user,
-                role=5,
-                is_active=True,
-            ).exists()
+            get_member_role(request, slug, project_id) == ROLE.GUEST.value
             and not project.guest_view_all_features
         ):
             issue_queryset = issue_queryset.filter(created_by=request.user)
             total_issue_queryset = total_issue_queryset.filter(created_by=request.user)
+            guest_user_id = request.user.id
+
+        # Cache key for the group totals, shared across the pages
+        count_cache_key = group_count_cache_key(
+            project_id=project_id,
+            scope="issues",
+            filters={**filters, **extra_filters},
+            group_by=group_by,
+            sub_group_by=sub_group_by,
+            user_id=guest_user_id,
+        )
 
         if group_by:
             if sub_group_by:
@@ -313,6 +295,7 @@ class IssueViewSet(BaseViewSet):
                             group_by=group_by, issues=issues, sub_group_by=sub_group_by
                         ),
                         paginator_cls=SubGroupedOffsetPaginator,
+                        count_cache_key=count_cache_key,
                         group_by_fields=issue_group_values(
                             field=group_by,
                             slug=slug,
@@ -347,6 +330,7 @@ class IssueViewSet(BaseViewSet):
                         group_by=group_by, issues=issues, sub_group_by=sub_group_by
                     ),
                     paginator_cls=GroupedOffsetPaginator,
+                    count_cache_key=count_cache_key,
                     group_by_fields=issue_group_values(
                         field=group_by,
                         slug=slug,
@@ -579,13 +563,7 @@ class IssueViewSet(BaseViewSet):
         """
 
         if (
-            ProjectMember.objects.filter(
-                workspace__slug=slug,
-                project_id=project_id,
-                member=request.user,
-                role=5,
-                is_active=True,
-            ).exists()
+            get_member_role(request, slug, project_id) == ROLE.GUEST.value
             and not project.guest_view_all_features
             and not issue.created_by == request.user
         ):
@@ -1341,13 +1319,7 @@ class IssueDetailIdentifierEndpoint(BaseAPIView):
         """
 
         if (
-            ProjectMember.objects.filter(
-                workspace__slug=slug,
-                project_id=project.id,
-                member=request.user,
-                role=5,
-                is_active=True,
-            ).exists()
+            get_member_role(request, slug, project.id) == ROLE.GUEST.value
             and not project.guest_view_all_features
             and not issue.created_by == request.user
         ):
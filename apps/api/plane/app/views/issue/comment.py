@@ -18,6 +18,7 @@ from plane.app.permissions import allow_permission, ROLE
 from plane.db.models import IssueComment, ProjectMember, CommentReaction, Project, Issue
 from plane.bgtasks.issue_activities_task import issue_activity
 from plane.utils.host import base_host
+from plane.utils.member_role_cache import get_member_role
 from plane.bgtasks.webhook_task import model_activity
 
 
@@ -61,13 +62,7 @@ class IssueCommentViewSet(BaseViewSet):
         project = Project.objects.get(pk=project_id)
         issue = Issue.objects.get(pk=issue_id)
         if (
-            ProjectMember.objects.filter(
-                workspace__slug=slug,
-                project_id=project_id,
-                member=request.user,
-                role=5,
-                is_active=True,
-            ).exists()
+            get_member_role(request, slug, project_id) == ROLE.GUEST.value
             and not project.guest_view_all_features
             and not issue.created_by == request.user
         ):
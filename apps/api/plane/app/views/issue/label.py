@@ -12,7 +12,8 @@ from rest_framework import status
 from .. import BaseViewSet, BaseAPIView
 from plane.app.serializers import LabelSerializer
 from plane.app.permissions import allow_permission, ProjectBasePermission, ROLE
-from plane.db.models import Project, Label
+from plane.bgtasks.issue_list_projection_task import queue_issue_list_projection
+from plane.db.models import IssueLabel, Project, Label
 from plane.utils.cache import invalidate_cache
 
 
@@ -74,7 +75,15 @@ class LabelViewSet(BaseViewSet):
     @invalidate_cache(path="/api/workspaces/:slug/labels/", url_params=True, user=False)
     @allow_permission([ROLE.ADMIN])
     def destroy(self, request, *args, **kwargs):
-        return super().destroy(request, *args, **kwargs)
+        issue_ids = list(
+            IssueLabel.objects.filter(label_id=kwargs["pk"]).values_list(
+                "issue_id", flat=True
+            )
+        )
+        response = super().destroy(request, *args, **kwargs)
+        # Refresh the list rows of the labelled issues
+        queue_issue_list_projection(issue_ids)
+        return response
 
 
 class BulkCreateIssueLabelsEndpoint(BaseAPIView):
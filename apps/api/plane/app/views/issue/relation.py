@@ -2,8 +2,9 @@
 import json
 
 # Django imports
+from django.conf import settings
 from django.utils import timezone
-from django.db.models import Q, OuterRef, F, Func, UUIDField, Value, CharField, Subquery
+from django.db.models import Q, UUIDField, Value, CharField
 from django.core.serializers.json import DjangoJSONEncoder
 from django.db.models.functions import Coalesce
 from django.contrib.postgres.aggregates import ArrayAgg
@@ -17,15 +18,12 @@ from rest_framework import status
 from .. import BaseViewSet
 from plane.app.serializers import IssueRelationSerializer, RelatedIssueSerializer
 from plane.app.permissions import ProjectEntityPermission
-from plane.db.models import (
-    Project,
-    IssueRelation,
-    Issue,
-    FileAsset,
-    IssueLink,
-    CycleIssue,
-)
+from plane.db.models import Project, IssueRelation, Issue
 from plane.bgtasks.issue_activities_task import issue_activity
+from plane.utils.issue_list_projection import (
+    issue_array_annotations,
+    issue_count_annotations,
+)
 from plane.utils.issue_relation_mapper import get_actual_relation
 from plane.utils.host import base_host
 
@@ -101,35 +99,12 @@ class IssueRelationViewSet(BaseViewSet):
             Issue.issue_objects.filter(workspace__slug=slug)
             .select_related("workspace", "project", "state", "parent")
             .prefetch_related("assignees", "labels", "issue_module__module")
-            .annotate(
-                cycle_id=Subquery(
-                    CycleIssue.objects.filter(
-                        issue=OuterRef("id"), deleted_at__isnull=True
-                    ).values("cycle_id")[:1]
-                )
-            )
-            .annotate(
-                link_count=IssueLink.objects.filter(issue=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
-            .annotate(
-                attachment_count=FileAsset.objects.filter(
-                    issue_id=OuterRef("id"),
-                    entity_type=FileAsset.EntityTypeContext.ISSUE_ATTACHMENT,
-                )
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
-            .annotate(
-                sub_issues_count=Issue.issue_objects.filter(parent=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
-            .annotate(
+            .annotate(**issue_count_annotations())
+        )
+        if settings.ENABLE_ISSUE_LIST_PROJECTION:
+            queryset = queryset.annotate(**issue_array_annotations())
+        else:
+            queryset = queryset.annotate(
                 label_ids=Coalesce(
                     ArrayAgg(
                         "labels__id",
@@ -153,8 +128,7 @@ class IssueRelationViewSet(BaseViewSet):
                     ),
                     Value([], output_field=ArrayField(UUIDField())),
                 ),
-            )
-        ).distinct()
+            ).distinct()
 
         # Fields
         fields = [
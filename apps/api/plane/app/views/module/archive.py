@@ -26,7 +26,15 @@ from rest_framework import status
 from rest_framework.response import Response
 from plane.app.permissions import ProjectEntityPermission
 from plane.app.serializers import ModuleDetailSerializer
-from plane.db.models import Issue, Module, ModuleLink, UserFavorite, Project
+from plane.bgtasks.issue_list_projection_task import queue_issue_list_projection
+from plane.db.models import (
+    Issue,
+    Module,
+    ModuleIssue,
+    ModuleLink,
+    UserFavorite,
+    Project,
+)
 from plane.utils.analytics_plot import burndown_plot
 from plane.utils.timezone_converter import user_timezone_converter
 
@@ -594,6 +602,12 @@ class ModuleArchiveUnarchiveEndpoint(BaseAPIView):
             )
         module.archived_at = timezone.now()
         module.save()
+        # Refresh the list rows of the module issues
+        queue_issue_list_projection(
+            ModuleIssue.objects.filter(module_id=module_id).values_list(
+                "issue_id", flat=True
+            )
+        )
         UserFavorite.objects.filter(
             entity_type="module",
             entity_identifier=module_id,
@@ -610,4 +624,10 @@ class ModuleArchiveUnarchiveEndpoint(BaseAPIView):
         )
         module.archived_at = None
         module.save()
+        # Refresh the list rows of the module issues
+        queue_issue_list_projection(
+            ModuleIssue.objects.filter(module_id=module_id).values_list(
+                "issue_id", flat=True
+            )
+        )
         return Response(status=status.HTTP_204_NO_CONTENT)
@@ -18,11 +18,8 @@ from django.db.models import (
     Value,
     Sum,
     FloatField,
-    Case,
-    When,
 )
-from django.db import models
-from django.db.models.functions import Coalesce, Cast, Concat
+from django.db.models.functions import Coalesce, Cast
 from django.core.serializers.json import DjangoJSONEncoder
 from django.utils import timezone
 
@@ -46,6 +43,8 @@ from plane.app.serializers import (
     ModuleWriteSerializer,
 )
 from plane.bgtasks.issue_activities_task import issue_activity
+from plane.bgtasks.issue_list_projection_task import queue_issue_list_projection
+from plane.bgtasks.progress_snapshot_task import queue_progress_snapshot
 from plane.db.models import (
     Issue,
     Module,
@@ -56,7 +55,12 @@ from plane.db.models import (
     Project,
     UserRecentVisit,
 )
-from plane.utils.analytics_plot import burndown_plot
+from plane.utils.progress_snapshot import (
+    get_module_distribution,
+    get_progress_snapshot,
+    invalidate_progress_snapshots,
+    is_active_module,
+)
 from plane.utils.timezone_converter import user_timezone_converter
 from plane.bgtasks.webhook_task import model_activity
 from .. import BaseAPIView, BaseViewSet
@@ -454,250 +458,15 @@ class ModuleViewSet(BaseViewSet):
                 {"error": "Module not found"}, status=status.HTTP_404_NOT_FOUND
             )
 
-        estimate_type = Project.objects.filter(
-            workspace__slug=slug,
-            pk=project_id,
-            estimate__isnull=False,
-            estimate__type="points",
-        ).exists()
-
         data = ModuleDetailSerializer(queryset.first()).data
         modules = queryset.first()
 
-        data["estimate_distribution"] = {}
-
-        if estimate_type:
-            assignee_distribution = (
-                Issue.issue_objects.filter(
-                    issue_module__module_id=pk,
-                    issue_module__deleted_at__isnull=True,
-                    workspace__slug=slug,
-                    project_id=project_id,
-                )
-                .annotate(first_name=F("assignees__first_name"))
-                .annotate(last_name=F("assignees__last_name"))
-                .annotate(assignee_id=F("assignees__id"))
-                .annotate(display_name=F("assignees__display_name"))
-                .annotate(
-                    avatar_url=Case(
-                        # If `avatar_asset` exists, use it to generate the asset URL
-                        When(
-                            assignees__avatar_asset__isnull=False,
-                            then=Concat(
-                                Value("/api/assets/v2/static/"),
-                                "assignees__avatar_asset",  # Assuming avatar_asset has an id or relevant field
-                                Value("/"),
-                            ),
-                        ),
-                        # If `avatar_asset` is None, fall back to using `avatar` field directly
-                        When(
-                            assignees__avatar_asset__isnull=True,
-                            then="assignees__avatar",
-                        ),
-                        default=Value(None),
-                        output_field=models.CharField(),
-                    )
-                )
-                .values(
-                    "first_name",
-                    "last_name",
-                    "assignee_id",
-                    "avatar_url",
-                    "display_name",
-                )
-                .annotate(
-                    total_estimates=Sum(Cast("estimate_point__value", FloatField()))
-                )
-                .annotate(
-                    completed_estimates=Sum(
-                        Cast("estimate_point__value", FloatField()),
-                        filter=Q(
-                            completed_at__isnull=False,
-                            archived_at__isnull=True,
-                            is_draft=False,
-                        ),
-                    )
-                )
-                .annotate(
-                    pending_estimates=Sum(
-                        Cast("estimate_point__value", FloatField()),
-                        filter=Q(
-                            completed_at__isnull=True,
-                            archived_at__isnull=True,
-                            is_draft=False,
-                        ),
-                    )
-                )
-                .order_by("first_name", "last_name")
-            )
-
-            label_distribution = (
-                Issue.issue_objects.filter(
-                    issue_module__module_id=pk,
-                    issue_module__deleted_at__isnull=True,
-                    workspace__slug=slug,
-                    project_id=project_id,
-                )
-                .annotate(label_name=F("labels__name"))
-                .annotate(color=F("labels__color"))
-                .annotate(label_id=F("labels__id"))
-                .values("label_name", "color", "label_id")
-                .annotate(
-                    total_estimates=Sum(Cast("estimate_point__value", FloatField()))
-                )
-                .annotate(
-                    completed_estimates=Sum(
-                        Cast("estimate_point__value", FloatField()),
-                        filter=Q(
-                            completed_at__isnull=False,
-                            archived_at__isnull=True,
-                            is_draft=False,
-                        ),
-                    )
-                )
-                .annotate(
-                    pending_estimates=Sum(
-                        Cast("estimate_point__value", FloatField()),
-                        filter=Q(
-                            completed_at__isnull=True,
-                            archived_at__isnull=True,
-                            is_draft=False,
-                        ),
-                    )
-                )
-                .order_by("label_name")
-            )
-            data["estimate_distribution"]["assignees"] = assignee_distribution
-            data["estimate_distribution"]["labels"] = label_distribution
-
-            if modules and modules.start_date and modules.target_date:
-                data["estimate_distribution"]["completion_chart"] = burndown_plot(
-                    queryset=modules,
-                    slug=slug,
-                    project_id=project_id,
-                    plot_type="points",
-                    module_id=pk,
-                )
-
-        assignee_distribution = (
-            Issue.issue_objects.filter(
-                issue_module__module_id=pk,
-                issue_module__deleted_at__isnull=True,
-                workspace__slug=slug,
-                project_id=project_id,
-            )
-            .annotate(first_name=F("assignees__first_name"))
-            .annotate(last_name=F("assignees__last_name"))
-            .annotate(assignee_id=F("assignees__id"))
-            .annotate(display_name=F("assignees__display_name"))
-            .annotate(
-                avatar_url=Case(
-                    # If `avatar_asset` exists, use it to generate the asset URL
-                    When(
-                        assignees__avatar_asset__isnull=False,
-                        then=Concat(
-                            Value("/api/assets/v2/static/"),
-                            "assignees__avatar_asset",  # Assuming avatar_asset has an id or relevant field
-                            Value("/"),
-                        ),
-                    ),
-                    # If `avatar_asset` is None, fall back to using `avatar` field directly
-                    When(
-                        assignees__avatar_asset__isnull=True, then="assignees__avatar"
-                    ),
-                    default=Value(None),
-                    output_field=models.CharField(),
-                )
-            )
-            .values(
-                "first_name", "last_name", "assignee_id", "avatar_url", "display_name"
-            )
-            .annotate(
-                total_issues=Count(
-                    "id", filter=Q(archived_at__isnull=True, is_draft=False)
-                )
-            )
-            .annotate(
-                completed_issues=Count(
-                    "id",
-                    filter=Q(
-                        completed_at__isnull=False,
-                        archived_at__isnull=True,
-                        is_draft=False,
-                    ),
-                )
-            )
-            .annotate(
-                pending_issues=Count(
-                    "id",
-                    filter=Q(
-                        completed_at__isnull=True,
-                        archived_at__isnull=True,
-                        is_draft=False,
-                    ),
-                )
-            )
-            .order_by("first_name", "last_name")
-        )
-
-        label_distribution = (
-            Issue.issue_objects.filter(
-                issue_module__module_id=pk,
-                issue_module__deleted_at__isnull=True,
-                workspace__slug=slug,
-                project_id=project_id,
-            )
-            .annotate(label_name=F("labels__name"))
-            .annotate(color=F("labels__color"))
-            .annotate(label_id=F("labels__id"))
-            .values("label_name", "color", "label_id")
-            .annotate(
-                total_issues=Count(
-                    "id", filter=Q(archived_at__isnull=True, is_draft=False)
-                )
-            )
-            .annotate(
-                completed_issues=Count(
-                    "id",
-                    filter=Q(
-                        completed_at__isnull=False,
-                        archived_at__isnull=True,
-                        is_draft=False,
-                    ),
-                )
-            )
-            .annotate(
-                pending_issues=Count(
-                    "id",
-                    filter=Q(
-                        completed_at__isnull=True,
-                        archived_at__isnull=True,
-                        is_draft=False,
-                    ),
-                )
-            )
-            .order_by("label_name")
-        )
-
-        data["distribution"] = {
-            "assignees": assignee_distribution,
-            "labels": label_distribution,
-            "completion_chart": {},
-        }
-
-        if (
-            modules
-            and modules.start_date
-            and modules.target_date
-            and modules.total_issues > 0
-        ):
-            data["distribution"]["completion_chart"] = burndown_plot(
-                queryset=modules,
-                slug=slug,
-                project_id=project_id,
-                plot_type="issues",
-                module_id=pk,
-            )
+        snapshot = None
+        if is_active_module(modules):
+            snapshot = get_progress_snapshot(project_id, module_id=pk)
+            if snapshot is None:
+                queue_progress_snapshot(module_id=pk)
+        data.update(snapshot or get_module_distribution(slug, project_id, modules))
 
         recent_visited_task.delay(
             slug=slug,
@@ -734,7 +503,11 @@ class ModuleViewSet(BaseViewSet):
         )
 
         if serializer.is_valid():
+            dates = (current_module.start_date, current_module.target_date)
             serializer.save()
+            if (current_module.start_date, current_module.target_date) != dates:
+                # The burndown of the snapshots follows the dates of the module
+                invalidate_progress_snapshots(project_id)
             module = module_queryset.values(
                 # Required fields
                 "id",
@@ -811,6 +584,8 @@ class ModuleViewSet(BaseViewSet):
         module.delete()
         # Delete the module issues
         ModuleIssue.objects.filter(module=pk, project_id=project_id).delete()
+        # Refresh the list rows of the module issues
+        queue_issue_list_projection(module_issues)
         # Delete the user favorite module
         UserFavorite.objects.filter(
             user=request.user,
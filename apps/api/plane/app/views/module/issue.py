@@ -23,6 +23,7 @@ from plane.db.models import (
     Project,
     CycleIssue,
 )
+from plane.utils.group_count_cache import group_count_cache_key
 from plane.utils.grouper import (
     issue_group_values,
     issue_on_results,
@@ -101,6 +102,15 @@ class ModuleIssueViewSet(BaseViewSet):
         group_by = request.GET.get("group_by", False)
         sub_group_by = request.GET.get("sub_group_by", False)
 
+        # Cache key for the group totals, shared across the pages
+        count_cache_key = group_count_cache_key(
+            project_id=project_id,
+            scope=f"module:{module_id}",
+            filters=filters,
+            group_by=group_by,
+            sub_group_by=sub_group_by,
+        )
+
         # issue queryset
         issue_queryset = issue_queryset_grouper(
             queryset=issue_queryset, group_by=group_by, sub_group_by=sub_group_by
@@ -126,6 +136,7 @@ class ModuleIssueViewSet(BaseViewSet):
                             group_by=group_by, issues=issues, sub_group_by=sub_group_by
                         ),
                         paginator_cls=SubGroupedOffsetPaginator,
+                        count_cache_key=count_cache_key,
                         group_by_fields=issue_group_values(
                             field=group_by,
                             slug=slug,
@@ -160,6 +171,7 @@ class ModuleIssueViewSet(BaseViewSet):
                         group_by=group_by, issues=issues, sub_group_by=sub_group_by
                     ),
                     paginator_cls=GroupedOffsetPaginator,
+                    count_cache_key=count_cache_key,
                     group_by_fields=issue_group_values(
                         field=group_by,
                         slug=slug,
@@ -28,6 +28,7 @@ from plane.db.models import (
 )
 from plane.db.models.project import ProjectNetwork
 from plane.utils.host import base_host
+from plane.utils.member_role_cache import invalidate_member_roles
 
 
 class ProjectInvitationsViewset(BaseViewSet):
@@ -174,6 +175,7 @@ class UserProjectInvitationsViewset(BaseViewSet):
             ],
             ignore_conflicts=True,
         )
+        invalidate_member_roles([request.user.id])
 
         IssueUserProperty.objects.bulk_create(
             [
@@ -249,6 +251,7 @@ class ProjectJoinEndpoint(BaseAPIView):
                     project_member.is_active = True
                     project_member.role = project_member.role
                     project_member.save()
+                invalidate_member_roles([user.id])
 
                 return Response(
                     {"message": "Project Invitation Accepted"},
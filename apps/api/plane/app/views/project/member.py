@@ -15,6 +15,7 @@ from plane.app.permissions import WorkspaceUserPermission
 from plane.db.models import Project, ProjectMember, IssueUserProperty, WorkspaceMember
 from plane.bgtasks.project_add_user_email_task import project_add_user_email
 from plane.utils.host import base_host
+from plane.utils.member_role_cache import invalidate_member_roles
 from plane.app.permissions.base import allow_permission, ROLE
 
 
@@ -95,6 +96,9 @@ class ProjectMemberViewSet(BaseViewSet):
         ProjectMember.objects.bulk_update(
             bulk_project_members, ["is_active", "role"], batch_size=100
         )
+        invalidate_member_roles(
+            [project_member.member_id for project_member in bulk_project_members]
+        )
 
         # Get the list of project members of the requested workspace with the given slug
         project_members = (
@@ -230,6 +234,7 @@ class ProjectMemberViewSet(BaseViewSet):
 
         if serializer.is_valid():
             serializer.save()
+            invalidate_member_roles([project_member.member_id])
             return Response(serializer.data, status=status.HTTP_200_OK)
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
@@ -266,6 +271,7 @@ class ProjectMemberViewSet(BaseViewSet):
 
         project_member.is_active = False
         project_member.save()
+        invalidate_member_roles([project_member.member_id])
         return Response(status=status.HTTP_204_NO_CONTENT)
 
     @allow_permission([ROLE.ADMIN, ROLE.MEMBER, ROLE.GUEST])
@@ -294,6 +300,7 @@ class ProjectMemberViewSet(BaseViewSet):
         # Deactivate the user
         project_member.is_active = False
         project_member.save()
+        invalidate_member_roles([project_member.member_id])
         return Response(status=status.HTTP_204_NO_CONTENT)
 
 
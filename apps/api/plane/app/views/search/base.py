@@ -17,6 +17,7 @@ from django.contrib.postgres.aggregates import ArrayAgg
 from django.contrib.postgres.fields import ArrayField
 from django.db.models.functions import Coalesce, Concat
 from django.utils import timezone
+from django.conf import settings
 
 # Third party imports
 from rest_framework import status
@@ -24,6 +25,12 @@ from rest_framework.response import Response
 
 # Module imports
 from plane.app.views.base import BaseAPIView
+from plane.utils.full_text_search import (
+    full_text_search,
+    get_search_query,
+    trigram_search,
+)
+from plane.utils.issue_search import search_issues
 from plane.db.models import (
     Workspace,
     Project,
@@ -43,48 +50,51 @@ class GlobalSearchEndpoint(BaseAPIView):
     also show related workspace if found
     """
 
-    def filter_workspaces(self, query, slug, project_id, workspace_search):
-        fields = ["name"]
+    typeahead = False
+
+    def search_by_fields(self, queryset, query, fields):
+        # Rank the typeahead matches by their similarity to the partial words
+        if self.typeahead:
+            return trigram_search(queryset, query, fields)
         q = Q()
         for field in fields:
             q |= Q(**{f"{field}__icontains": query})
+        return queryset.filter(q)
+
+    def filter_workspaces(self, query, slug, project_id, workspace_search):
+        workspaces = Workspace.objects.filter(
+            workspace_member__member=self.request.user
+        )
         return (
-            Workspace.objects.filter(q, workspace_member__member=self.request.user)
+            self.search_by_fields(workspaces, query, ["name"])
             .distinct()
             .values("name", "id", "slug")
         )
 
     def filter_projects(self, query, slug, project_id, workspace_search):
-        fields = ["name", "identifier"]
-        q = Q()
-        for field in fields:
-            q |= Q(**{f"{field}__icontains": query})
+        projects = Project.objects.filter(
+            project_projectmember__member=self.request.user,
+            project_projectmember__is_active=True,
+            archived_at__isnull=True,
+            workspace__slug=slug,
+        )
         return (
-            Project.objects.filter(
-                q,
-                project_projectmember__member=self.request.user,
-                project_projectmember__is_active=True,
-                archived_at__isnull=True,
-                workspace__slug=slug,
-            )
+            self.search_by_fields(projects, query, ["name", "identifier"])
             .distinct()
             .values("name", "id", "identifier", "workspace__slug")
         )
 
-    def filter_issues(self, query, slug, project_id, workspace_search):
-        fields = ["name", "sequence_id", "project__identifier"]
-        q = Q()
-        for field in fields:
-            if field == "sequence_id":
-                # Match whole integers only (exclude decimal numbers)
-                sequences = re.findall(r"\b\d+\b", query)
-                for sequence_id in sequences:
-                    q |= Q(**{"sequence_id": sequence_id})
-            else:
-                q |= Q(**{f"{field}__icontains": query})
+    def search_by_name(self, queryset, query):
+        if self.typeahead:
+            return trigram_search(queryset, query, ["name"])
+        # Rank the word matches of the name and description with the search vector
+        search_query = get_search_query(query)
+        if search_query is None:
+            return queryset.filter(name__icontains=query)
+        return full_text_search(queryset, search_query)
 
+    def filter_issues(self, query, slug, project_id, workspace_search):
         issues = Issue.issue_objects.filter(
-            q,
             project__project_projectmember__member=self.request.user,
             project__project_projectmember__is_active=True,
             project__archived_at__isnull=True,
@@ -94,7 +104,7 @@ class GlobalSearchEndpoint(BaseAPIView):
         if workspace_search == "false" and project_id:
             issues = issues.filter(project_id=project_id)
 
-        return issues.distinct().values(
+        return search_issues(query, issues, typeahead=self.typeahead).values(
             "name",
             "id",
             "sequence_id",
@@ -104,13 +114,7 @@ class GlobalSearchEndpoint(BaseAPIView):
         )[:100]
 
     def filter_cycles(self, query, slug, project_id, workspace_search):
-        fields = ["name"]
-        q = Q()
-        for field in fields:
-            q |= Q(**{f"{field}__icontains": query})
-
         cycles = Cycle.objects.filter(
-            q,
             project__project_projectmember__member=self.request.user,
             project__project_projectmember__is_active=True,
             project__archived_at__isnull=True,
@@ -120,18 +124,16 @@ class GlobalSearchEndpoint(BaseAPIView):
         if workspace_search == "false" and project_id:
             cycles = cycles.filter(project_id=project_id)
 
-        return cycles.distinct().values(
-            "name", "id", "project_id", "project__identifier", "workspace__slug"
+        return (
+            self.search_by_name(cycles, query)
+            .distinct()
+            .values(
+                "name", "id", "project_id", "project__identifier", "workspace__slug"
+            )
         )
 
     def filter_modules(self, query, slug, project_id, workspace_search):
-        fields = ["name"]
-        q = Q()
-        for field in fields:
-            q |= Q(**{f"{field}__icontains": query})
-
         modules = Module.objects.filter(
-            q,
             project__project_projectmember__member=self.request.user,
             project__project_projectmember__is_active=True,
             project__archived_at__isnull=True,
@@ -141,19 +143,18 @@ class GlobalSearchEndpoint(BaseAPIView):
         if workspace_search == "false" and project_id:
             modules = modules.filter(project_id=project_id)
 
-        return modules.distinct().values(
-            "name", "id", "project_id", "project__identifier", "workspace__slug"
+        return (
+            self.search_by_name(modules, query)
+            .distinct()
+            .values(
+                "name", "id", "project_id", "project__identifier", "workspace__slug"
+            )
         )
 
     def filter_pages(self, query, slug, project_id, workspace_search):
-        fields = ["name"]
-        q = Q()
-        for field in fields:
-            q |= Q(**{f"{field}__icontains": query})
-
         pages = (
-            Page.objects.filter(
-                q,
+            self.search_by_name(Page.objects.all(), query)
+            .filter(
                 projects__project_projectmember__member=self.request.user,
                 projects__project_projectmember__is_active=True,
                 projects__archived_at__isnull=True,
@@ -193,13 +194,7 @@ class GlobalSearchEndpoint(BaseAPIView):
         )
 
     def filter_views(self, query, slug, project_id, workspace_search):
-        fields = ["name"]
-        q = Q()
-        for field in fields:
-            q |= Q(**{f"{field}__icontains": query})
-
         issue_views = IssueView.objects.filter(
-            q,
             project__project_projectmember__member=self.request.user,
             project__project_projectmember__is_active=True,
             project__archived_at__isnull=True,
@@ -209,6 +204,7 @@ class GlobalSearchEndpoint(BaseAPIView):
         if workspace_search == "false" and project_id:
             issue_views = issue_views.filter(project_id=project_id)
 
+        issue_views = self.search_by_fields(issue_views, query, ["name"])
         return issue_views.distinct().values(
             "name", "id", "project_id", "project__identifier", "workspace__slug"
         )
@@ -217,6 +213,7 @@ class GlobalSearchEndpoint(BaseAPIView):
         query = request.query_params.get("search", False)
         workspace_search = request.query_params.get("workspace_search", "false")
         project_id = request.query_params.get("project_id", False)
+        self.typeahead = request.query_params.get("typeahead", "false") == "true"
 
         if not query:
             return Response(
@@ -249,6 +246,8 @@ class GlobalSearchEndpoint(BaseAPIView):
         for model in MODELS_MAPPER.keys():
             func = MODELS_MAPPER.get(model, None)
             results[model] = func(query, slug, project_id, workspace_search)
+            if self.typeahead:
+                results[model] = results[model][: settings.TYPEAHEAD_RESULT_LIMIT]
         return Response({"results": results}, status=status.HTTP_200_OK)
 
 
@@ -260,6 +259,9 @@ class SearchEndpoint(BaseAPIView):
         count = int(request.query_params.get("count", 5))
         project_id = request.query_params.get("project_id", None)
         issue_id = request.query_params.get("issue_id", None)
+        typeahead = request.query_params.get("typeahead", "false") == "true"
+        if typeahead:
+            count = min(count, settings.TYPEAHEAD_RESULT_LIMIT)
 
         response_data = {}
 
@@ -273,7 +275,7 @@ class SearchEndpoint(BaseAPIView):
                     ]
                     q = Q()
 
-                    if query:
+                    if query and not typeahead:
                         for field in fields:
                             q |= Q(**{f"{field}__icontains": query})
 
@@ -306,6 +308,9 @@ class SearchEndpoint(BaseAPIView):
                         .order_by("-created_at")
                     )
 
+                    if query and typeahead:
+                        users = trigram_search(users, query, fields)
+
                     if issue_id:
                         issue_created_by = (
                             Issue.objects.filter(id=issue_id)
@@ -513,7 +518,7 @@ class SearchEndpoint(BaseAPIView):
                     ]
                     q = Q()
 
-                    if query:
+                    if query and not typeahead:
                         for field in fields:
                             q |= Q(**{f"{field}__icontains": query})
                     users = (
@@ -542,10 +547,14 @@ class SearchEndpoint(BaseAPIView):
                             )
                         )
                         .order_by("-created_at")
-                        .values(
-                            "member__avatar_url", "member__display_name", "member__id"
-                        )[:count]
                     )
+
+                    if query and typeahead:
+                        users = trigram_search(users, query, fields)
+
+                    users = users.values(
+                        "member__avatar_url", "member__display_name", "member__id"
+                    )[:count]
                     response_data["user_mention"] = list(users)
 
                 elif query_type == "project":
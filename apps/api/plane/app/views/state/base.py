@@ -13,7 +13,9 @@ from rest_framework import status
 from .. import BaseViewSet
 from plane.app.serializers import StateSerializer
 from plane.app.permissions import ROLE, allow_permission
+from plane.bgtasks.analytics_rollup_task import refresh_relation_rollups
 from plane.db.models import State, Issue
+from plane.utils.group_count_cache import invalidate_group_counts
 from plane.utils.cache import invalidate_cache
 
 
@@ -60,9 +62,15 @@ class StateViewSet(BaseViewSet):
             state = State.objects.get(
                 pk=pk, project_id=project_id, workspace__slug=slug
             )
+            group = state.group
             serializer = StateSerializer(state, data=request.data, partial=True)
             if serializer.is_valid():
                 serializer.save()
+                if state.group != group:
+                    # The issues of the state move to the new group
+                    refresh_relation_rollups.delay("state", str(state.id))
+                    # The group counts and the progress snapshots are stale
+                    invalidate_group_counts(project_id)
                 return Response(serializer.data, status=status.HTTP_200_OK)
             return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
         except IntegrityError as e:
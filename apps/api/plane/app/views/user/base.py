@@ -29,8 +29,10 @@ from plane.db.models import (
     User,
     WorkspaceMember,
     WorkspaceMemberInvite,
-    Session,
 )
+from plane.db.models.session import SessionStore
+from plane.utils.api_token_cache import invalidate_api_tokens
+from plane.utils.member_role_cache import invalidate_member_roles
 from plane.license.models import Instance, InstanceAdmin
 from plane.utils.paginator import BasePaginator
 from plane.authentication.utils.host import user_ip
@@ -149,7 +151,8 @@ class UserEndpoint(BaseViewSet):
         WorkspaceMemberInvite.objects.filter(email=user.email).delete()
 
         # Delete all sessions
-        Session.objects.filter(user_id=request.user.id).delete()
+        SessionStore.delete_user_sessions(request.user.id)
+        invalidate_member_roles([request.user.id])
 
         # Profile updates
         profile = Profile.objects.get(user=user)
@@ -176,6 +179,9 @@ class UserEndpoint(BaseViewSet):
         user.last_logout_time = timezone.now()
         user.save()
 
+        # The cached api tokens of the user are no longer valid
+        invalidate_api_tokens(user=user)
+
         # Send an email to the user
         user_deactivation_email.delay(base_host(request=request, is_app=True), user.id)
 
@@ -42,6 +42,7 @@ from plane.app.permissions import ROLE, allow_permission
 from django.utils.decorators import method_decorator
 from django.views.decorators.cache import cache_control
 from django.views.decorators.vary import vary_on_cookie
+from plane.utils.api_token_cache import invalidate_api_tokens
 from plane.utils.constants import RESTRICTED_WORKSPACE_SLUGS
 from plane.license.utils.instance_value import get_configuration_value
 from plane.bgtasks.workspace_seed_task import workspace_seed
@@ -171,7 +172,10 @@ class WorkSpaceViewSet(BaseViewSet):
         # Get the workspace
         workspace = self.get_object()
         self.remove_last_workspace_ids_from_user_settings(workspace.id)
-        return super().destroy(request, *args, **kwargs)
+        response = super().destroy(request, *args, **kwargs)
+        # The cached api tokens of the workspace are no longer valid
+        invalidate_api_tokens(workspace_id=workspace.id)
+        return response
 
 
 class UserWorkSpacesEndpoint(BaseAPIView):
@@ -27,6 +27,7 @@ from plane.db.models import User, Workspace, WorkspaceMember, WorkspaceMemberInv
 from plane.utils.cache import invalidate_cache, invalidate_cache_directly
 from plane.utils.host import base_host
 from plane.utils.ip_address import get_client_ip
+from plane.utils.member_role_cache import invalidate_member_roles
 from .. import BaseViewSet
 
 
@@ -193,6 +194,7 @@ class WorkspaceJoinEndpoint(BaseAPIView):
                         workspace_member.is_active = True
                         workspace_member.role = workspace_invite.role
                         workspace_member.save()
+                        invalidate_member_roles([user.id])
                     else:
                         # Create a Workspace
                         _ = WorkspaceMember.objects.create(
@@ -275,6 +277,8 @@ class UserWorkspaceInvitationsViewSet(BaseViewSet):
                 workspace_id=invitation.workspace_id, member=request.user
             ).update(is_active=True, role=invitation.role)
 
+        invalidate_member_roles([request.user.id])
+
         # Bulk create the user for all the workspaces
         WorkspaceMember.objects.bulk_create(
             [
@@ -19,6 +19,7 @@ from plane.app.serializers import (
 from plane.app.views.base import BaseAPIView
 from plane.db.models import Project, ProjectMember, WorkspaceMember, DraftIssue
 from plane.utils.cache import invalidate_cache
+from plane.utils.member_role_cache import invalidate_member_roles
 
 from .. import BaseViewSet
 
@@ -81,6 +82,7 @@ class WorkSpaceMemberViewSet(BaseViewSet):
 
         if serializer.is_valid():
             serializer.save()
+            invalidate_member_roles([workspace_member.member_id])
             return Response(serializer.data, status=status.HTTP_200_OK)
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
@@ -138,6 +140,7 @@ class WorkSpaceMemberViewSet(BaseViewSet):
 
         workspace_member.is_active = False
         workspace_member.save()
+        invalidate_member_roles([workspace_member.member_id])
         return Response(status=status.HTTP_204_NO_CONTENT)
 
     @invalidate_cache(
@@ -200,6 +203,7 @@ class WorkSpaceMemberViewSet(BaseViewSet):
         # # Deactivate the user
         workspace_member.is_active = False
         workspace_member.save()
+        invalidate_member_roles([workspace_member.member_id])
         return Response(status=status.HTTP_204_NO_CONTENT)
 
 
@@ -0,0 +1,134 @@
+# Python imports
+import logging
+from datetime import datetime, timedelta
+
+# Django imports
+from django.conf import settings
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+# Third party imports
+from celery import shared_task
+
+# Module imports
+from plane.db.models import Issue, IssueRollup, Project
+from plane.settings.redis import redis_instance
+from plane.utils.analytics_rollup import refresh_issue_rollups
+from plane.utils.exception_logger import log_exception
+
+# The issues updated after the watermark are rolled up again, the issues updated
+# shortly before it are read again for the writes committed late
+ISSUE_ROLLUP_WATERMARK_KEY = "issue_rollup:watermark"
+ISSUE_ROLLUP_OVERLAP = 60
+
+# The issues of the relations changed without updating the issues, the soft
+# deletes of the labels, cycles and modules and the group changes of the states
+ROLLUP_RELATION_LOOKUPS = {
+    "label": "label_issue__label_id",
+    "cycle": "issue_cycle__cycle_id",
+    "module": "issue_module__module_id",
+    "state": "state_id",
+}
+
+
+def get_issue_partitions(issues):
+    return set(
+        issues.annotate(date=TruncDate("created_at"))
+        .values_list("project_id", "date")
+        .order_by()
+        .distinct()
+    )
+
+
+@shared_task
+def refresh_changed_issue_rollups():
+    """Refresh the rollups of the issues updated since the last refresh"""
+    if not settings.ENABLE_ANALYTICS_ROLLUP:
+        return
+    try:
+        ri = redis_instance()
+        watermark = ri.get(ISSUE_ROLLUP_WATERMARK_KEY)
+        if watermark is None:
+            # The rollups are not built yet
+            return
+
+        now = timezone.now()
+        since = datetime.fromisoformat(watermark.decode()) - timedelta(
+            seconds=ISSUE_ROLLUP_OVERLAP
+        )
+        # The deleted issues are removed from their partitions
+        refresh_issue_rollups(
+            get_issue_partitions(Issue.all_objects.filter(updated_at__gte=since))
+        )
+        ri.set(ISSUE_ROLLUP_WATERMARK_KEY, now.isoformat())
+        return
+    except Exception as e:
+        log_exception(e)
+        return
+
+
+@shared_task
+def refresh_relation_rollups(relation, relation_id):
+    """Refresh the rollups of the issues of the label, cycle, module or state"""
+    if not settings.ENABLE_ANALYTICS_ROLLUP:
+        return
+    try:
+        lookup = ROLLUP_RELATION_LOOKUPS[relation]
+        refresh_issue_rollups(
+            get_issue_partitions(Issue.all_objects.filter(**{lookup: relation_id}))
+        )
+        return
+    except Exception as e:
+        log_exception(e)
+        return
+
+
+@shared_task
+def sync_issue_rollups(batch_size=100, last_id=None, countdown=60):
+    """Task to build the rollups of the existing projects in batches"""
+    try:
+        if last_id is None:
+            # The issues updated while the rollups are built are refreshed after
+            redis_instance().set(ISSUE_ROLLUP_WATERMARK_KEY, timezone.now().isoformat())
+
+        queryset = Project.all_objects.order_by("id")
+        if last_id:
+            queryset = queryset.filter(id__gt=last_id)
+
+        project_ids = list(queryset.values_list("id", flat=True)[:batch_size])
+        if not project_ids:
+            return
+
+        # The dates of the existing rollups are rebuilt to drop the removed issues
+        partitions = get_issue_partitions(
+            Issue.all_objects.filter(project_id__in=project_ids)
+        )
+        partitions.update(
+            IssueRollup.all_objects.filter(project_id__in=project_ids)
+            .values_list("project_id", "date")
+            .order_by()
+            .distinct()
+        )
+        refresh_issue_rollups(partitions)
+
+        # Schedule the next batch if there are more projects to process
+        if len(project_ids) == batch_size:
+            sync_issue_rollups.apply_async(
+                kwargs={
+                    "batch_size": batch_size,
+                    "last_id": str(project_ids[-1]),
+                    "countdown": countdown,
+                },
+                countdown=countdown,
+            )
+
+        logging.info(f"Processed issue rollups up to project: {project_ids[-1]}")
+        return
+    except Exception as e:
+        log_exception(e)
+        return
+
+
+@shared_task
+def schedule_issue_rollups(batch_size=100, countdown=60):
+    sync_issue_rollups.delay(batch_size=int(batch_size), countdown=countdown)
@@ -0,0 +1,48 @@
+# Python imports
+from typing import Any
+
+# Third party imports
+from celery import shared_task
+
+# Django imports
+from django.utils import timezone
+
+# Module imports
+from plane.db.models import APIActivityLog
+from plane.utils.exception_logger import log_exception
+from plane.utils.redis_buffer import bulk_create_buffered, flush_buffer, push_buffer
+
+# The api activity logs are buffered in redis and written in bulk
+API_ACTIVITY_LOG_BUFFER_KEY = "api_activity_logs:buffer"
+API_ACTIVITY_LOG_FLUSH_SIZE = 1000
+
+
+def log_api_activity(**log: Any) -> None:
+    """Buffer the api log for the bulk insert, written directly if redis fails"""
+    try:
+        # The log keeps the time of the request, not the time of the flush
+        push_buffer(
+            API_ACTIVITY_LOG_BUFFER_KEY,
+            {**log, "created_at": timezone.now().isoformat()},
+        )
+    except Exception as e:
+        log_exception(e)
+        APIActivityLog.objects.create(**log)
+
+
+def write_api_activity_logs(logs):
+    bulk_create_buffered(APIActivityLog, logs, batch_size=API_ACTIVITY_LOG_FLUSH_SIZE)
+
+
+@shared_task
+def flush_api_activity_logs() -> None:
+    """Write the buffered api activity logs in bulk"""
+    try:
+        flush_buffer(
+            API_ACTIVITY_LOG_BUFFER_KEY,
+            API_ACTIVITY_LOG_FLUSH_SIZE,
+            write_api_activity_logs,
+        )
+    except Exception as e:
+        log_exception(e)
+        return
@@ -0,0 +1,44 @@
+# Python imports
+from datetime import datetime
+
+# Third party imports
+from celery import shared_task
+
+# Module imports
+from plane.db.models import APIToken
+from plane.settings.redis import redis_instance
+from plane.utils.api_token_cache import API_TOKEN_LAST_USED_KEY
+from plane.utils.exception_logger import log_exception
+
+API_TOKEN_FLUSH_BATCH_SIZE = 500
+
+
+@shared_task
+def flush_api_token_last_used() -> None:
+    """Write the last usage of the api tokens recorded in redis in bulk"""
+    try:
+        ri = redis_instance()
+        pipe = ri.pipeline()
+        pipe.hgetall(API_TOKEN_LAST_USED_KEY)
+        pipe.delete(API_TOKEN_LAST_USED_KEY)
+        usages, _ = pipe.execute()
+        if not usages:
+            return
+
+        last_used = {
+            token_id.decode(): datetime.fromisoformat(timestamp.decode())
+            for token_id, timestamp in usages.items()
+        }
+        api_tokens = list(
+            APIToken.objects.filter(pk__in=list(last_used)).only("id", "last_used")
+        )
+        for api_token in api_tokens:
+            api_token.last_used = last_used[str(api_token.id)]
+
+        APIToken.objects.bulk_update(
+            api_tokens, ["last_used"], batch_size=API_TOKEN_FLUSH_BATCH_SIZE
+        )
+        return
+    except Exception as e:
+        log_exception(e)
+        return
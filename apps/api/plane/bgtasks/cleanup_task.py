@@ -1,7 +1,9 @@
 # Python imports
 from datetime import timedelta
 import logging
-from typing import List, Dict, Any, Callable, Optional
+import time
+import uuid
+from typing import List, Dict, Any, Optional, Tuple
 import os
 
 # Django imports
@@ -13,7 +15,7 @@ from django.db.models.functions import RowNumber
 from celery import shared_task
 from pymongo.errors import BulkWriteError
 from pymongo.collection import Collection
-from pymongo.operations import InsertOne
+from pymongo.operations import ReplaceOne
 
 # Module imports
 from plane.db.models import (
@@ -28,6 +30,8 @@ from plane.utils.exception_logger import log_exception
 
 logger = logging.getLogger("plane.worker")
 BATCH_SIZE = 1000
+# The archival jobs are split into ranges of the uuid keys archived concurrently
+ARCHIVE_PARTITIONS = 16
 
 
 def get_mongo_collection(collection_name: str) -> Optional[Collection]:
@@ -46,30 +50,44 @@ def get_mongo_collection(collection_name: str) -> Optional[Collection]:
         return None
 
 
+def get_partitions(count: int = ARCHIVE_PARTITIONS) -> List[Tuple[str, Optional[str]]]:
+    """Split the uuid key space into ranges of the same size."""
+    bounds = [str(uuid.UUID(int=(i * 2**128) // count)) for i in range(count)]
+    return list(zip(bounds, bounds[1:] + [None]))
+
+
+def partition_filter(field: str, start: str, end: Optional[str]) -> Dict[str, str]:
+    filters = {f"{field}__gte": start}
+    if end:
+        filters[f"{field}__lt"] = end
+    return filters
+
+
 def flush_to_mongo_and_delete(
     mongo_collection: Optional[Collection],
     buffer: List[Dict[str, Any]],
     ids_to_delete: List[int],
     model,
     mongo_available: bool,
-) -> None:
+) -> int:
     """
-    Inserts a batch of records into MongoDB and deletes the corresponding rows from PostgreSQL.
+    Upserts a batch of records into MongoDB and deletes the corresponding rows
+    from PostgreSQL. The upserts are keyed by the record id so a batch archived
+    again is not duplicated.
     """
     if not buffer:
         logger.debug("No records to flush - buffer is empty")
-        return
-
-    logger.info(
-        f"Starting batch flush: {len(buffer)} records, {len(ids_to_delete)} IDs to delete"
-    )
+        return 0
 
     mongo_archival_failed = False
 
-    # Try to insert into MongoDB if available
+    # Try to upsert into MongoDB if available
     if mongo_collection is not None and mongo_available:
         try:
-            mongo_collection.bulk_write([InsertOne(doc) for doc in buffer])
+            mongo_collection.bulk_write(
+                [ReplaceOne({"_id": doc["id"]}, doc, upsert=True) for doc in buffer],
+                ordered=False,
+            )
         except BulkWriteError as bwe:
             logger.error(f"MongoDB bulk write error: {str(bwe)}")
             log_exception(bwe)
@@ -78,84 +96,115 @@ def flush_to_mongo_and_delete(
     # If MongoDB is available and archival failed, log the error and return
     if mongo_available and mongo_archival_failed:
         logger.error(f"MongoDB archival failed for {len(buffer)} records")
-        return
+        return 0
 
     # Delete from PostgreSQL - delete() returns (count, {model: count})
     delete_result = model.all_objects.filter(id__in=ids_to_delete).delete()
-    deleted_count = (
-        delete_result[0] if delete_result and isinstance(delete_result, tuple) else 0
-    )
-    logger.info(f"Batch flush completed: {deleted_count} records deleted")
+    return delete_result[0] if delete_result and isinstance(delete_result, tuple) else 0
 
 
-def process_cleanup_task(
-    queryset_func: Callable,
-    transform_func: Callable[[Dict], Dict],
-    model,
-    task_name: str,
-    collection_name: str,
-):
+def process_cleanup_task(job_name: str):
     """
-    Generic function to process cleanup tasks.
+    Generic function to process cleanup tasks, the records of the job are
+    archived by one task per partition of the keys.
 
     Args:
-        queryset_func: Function that returns the queryset to process
-        transform_func: Function to transform each record for MongoDB
-        model: Django model class
-        task_name: Name of the task for logging
-        collection_name: MongoDB collection name
+        job_name: Name of the job in CLEANUP_JOBS
+    """
+    job = CLEANUP_JOBS[job_name]
+    partitions = get_partitions()
+    logger.info(f"Starting {job['task_name']} cleanup task")
+
+    for start, end in partitions:
+        archive_partition.delay(job_name=job_name, start=start, end=end)
+
+    logger.info(
+        f"{job['task_name']} cleanup task queued",
+        extra={"partitions": len(partitions)},
+    )
+
+
+@shared_task
+def archive_partition(job_name: str, start: str, end: Optional[str] = None):
+    """
+    Archive the records of the job in the partition, the records are streamed in
+    key order from a server side cursor and flushed in batches.
     """
-    logger.info(f"Starting {task_name} cleanup task")
+    job = CLEANUP_JOBS[job_name]
+    task_name = job["task_name"]
+    collection_name = job["collection_name"]
 
     # Get MongoDB collection
     mongo_collection = get_mongo_collection(collection_name)
     mongo_available = mongo_collection is not None
 
-    # Get queryset
-    queryset = queryset_func()
+    records = (
+        job["queryset_func"](start, end).order_by("id").iterator(chunk_size=BATCH_SIZE)
+    )
 
     # Process records in batches
     buffer: List[Dict[str, Any]] = []
     ids_to_delete: List[int] = []
     total_processed = 0
+    total_deleted = 0
     total_batches = 0
+    started_at = time.monotonic()
 
-    for record in queryset:
-        # Transform record for MongoDB
-        buffer.append(transform_func(record))
-        ids_to_delete.append(record["id"])
-
-        # Flush batch when it reaches BATCH_SIZE
-        if len(buffer) >= BATCH_SIZE:
-            total_batches += 1
-            flush_to_mongo_and_delete(
-                mongo_collection=mongo_collection,
-                buffer=buffer,
-                ids_to_delete=ids_to_delete,
-                model=model,
-                mongo_available=mongo_available,
-            )
-            total_processed += len(buffer)
-            buffer.clear()
-            ids_to_delete.clear()
-
-    # Process final batch if any records remain
-    if buffer:
-        total_batches += 1
-        flush_to_mongo_and_delete(
+    def flush():
+        nonlocal total_processed, total_deleted, total_batches
+        batch_started_at = time.monotonic()
+        deleted_count = flush_to_mongo_and_delete(
             mongo_collection=mongo_collection,
             buffer=buffer,
             ids_to_delete=ids_to_delete,
-            model=model,
+            model=job["model"],
             mongo_available=mongo_available,
         )
+        elapsed = time.monotonic() - batch_started_at
+        total_batches += 1
         total_processed += len(buffer)
+        total_deleted += deleted_count
+        logger.info(
+            f"{task_name} batch flushed",
+            extra={
+                "partition_start": start,
+                "last_id": str(ids_to_delete[-1]),
+                "records": len(buffer),
+                "deleted": deleted_count,
+                "seconds": round(elapsed, 3),
+                "records_per_second": round(len(buffer) / elapsed, 1)
+                if elapsed
+                else None,
+            },
+        )
+        buffer.clear()
+        ids_to_delete.clear()
+
+    try:
+        for record in records:
+            # Transform record for MongoDB
+            buffer.append(job["transform_func"](record))
+            ids_to_delete.append(record["id"])
+
+            # Flush batch when it reaches BATCH_SIZE
+            if len(buffer) >= BATCH_SIZE:
+                flush()
+
+        # Process final batch if any records remain
+        if buffer:
+            flush()
+    except Exception as e:
+        log_exception(e)
 
     logger.info(
-        f"{task_name} cleanup task completed",
+        f"{task_name} cleanup partition completed",
         extra={
+            "partition_start": start,
+            "partition_end": end,
             "total_records_processed": total_processed,
+            "total_records_deleted": total_deleted,
             "total_batches": total_batches,
+            "seconds": round(time.monotonic() - started_at, 3),
             "mongo_available": mongo_available,
             "collection_name": collection_name,
         },
@@ -248,64 +297,64 @@ def transform_issue_description_version(record: Dict) -> Dict:
 
 
 # Queryset functions for each cleanup task
-def get_api_logs_queryset():
-    """Get API logs older than cutoff days."""
+def get_api_logs_queryset(start: str, end: Optional[str] = None):
+    """Get API logs of the partition older than cutoff days."""
     cutoff_days = int(os.environ.get("HARD_DELETE_AFTER_DAYS", 30))
     cutoff_time = timezone.now() - timedelta(days=cutoff_days)
     logger.info(f"API logs cutoff time: {cutoff_time}")
 
-    return (
-        APIActivityLog.all_objects.filter(created_at__lte=cutoff_time)
-        .values(
-            "id",
-            "created_at",
-            "token_identifier",
-            "path",
-            "method",
-            "query_params",
-            "headers",
-            "body",
-            "response_code",
-            "response_body",
-            "ip_address",
-            "user_agent",
-            "created_by_id",
-        )
-        .iterator(chunk_size=BATCH_SIZE)
+    return APIActivityLog.all_objects.filter(
+        created_at__lte=cutoff_time, **partition_filter("id", start, end)
+    ).values(
+        "id",
+        "created_at",
+        "token_identifier",
+        "path",
+        "method",
+        "query_params",
+        "headers",
+        "body",
+        "response_code",
+        "response_body",
+        "ip_address",
+        "user_agent",
+        "created_by_id",
     )
 
 
-def get_email_logs_queryset():
-    """Get email logs older than cutoff days."""
+def get_email_logs_queryset(start: str, end: Optional[str] = None):
+    """Get email logs of the partition older than cutoff days."""
     cutoff_days = int(os.environ.get("HARD_DELETE_AFTER_DAYS", 30))
     cutoff_time = timezone.now() - timedelta(days=cutoff_days)
     logger.info(f"Email logs cutoff time: {cutoff_time}")
 
-    return (
-        EmailNotificationLog.all_objects.filter(sent_at__lte=cutoff_time)
-        .values(
-            "id",
-            "created_at",
-            "receiver_id",
-            "triggered_by_id",
-            "entity_identifier",
-            "entity_name",
-            "data",
-            "processed_at",
-            "sent_at",
-            "entity",
-            "old_value",
-            "new_value",
-            "created_by_id",
-        )
-        .iterator(chunk_size=BATCH_SIZE)
+    return EmailNotificationLog.all_objects.filter(
+        sent_at__lte=cutoff_time, **partition_filter("id", start, end)
+    ).values(
+        "id",
+        "created_at",
+        "receiver_id",
+        "triggered_by_id",
+        "entity_identifier",
+        "entity_name",
+        "data",
+        "processed_at",
+        "sent_at",
+        "entity",
+        "old_value",
+        "new_value",
+        "created_by_id",
     )
 
 
-def get_page_versions_queryset():
-    """Get page versions beyond the maximum allowed (20 per page)."""
+def get_page_versions_queryset(start: str, end: Optional[str] = None):
+    """
+    Get page versions of the partition pages beyond the maximum allowed
+    (20 per page).
+    """
     subq = (
-        PageVersion.all_objects.annotate(
+        PageVersion.all_objects.filter(**partition_filter("page_id", start, end))
+        .annotate(
             row_num=Window(
                 expression=RowNumber(),
                 partition_by=[F("page_id")],
@@ -316,32 +365,34 @@ def get_page_versions_queryset():
         .values("id")
     )
 
-    return (
-        PageVersion.all_objects.filter(id__in=Subquery(subq))
-        .values(
-            "id",
-            "created_at",
-            "page_id",
-            "workspace_id",
-            "owned_by_id",
-            "description_html",
-            "description_binary",
-            "description_stripped",
-            "description_json",
-            "sub_pages_data",
-            "created_by_id",
-            "updated_by_id",
-            "deleted_at",
-            "last_saved_at",
-        )
-        .iterator(chunk_size=BATCH_SIZE)
+    return PageVersion.all_objects.filter(id__in=Subquery(subq)).values(
+        "id",
+        "created_at",
+        "page_id",
+        "workspace_id",
+        "owned_by_id",
+        "description_html",
+        "description_binary",
+        "description_stripped",
+        "description_json",
+        "sub_pages_data",
+        "created_by_id",
+        "updated_by_id",
+        "deleted_at",
+        "last_saved_at",
     )
 
 
-def get_issue_description_versions_queryset():
-    """Get issue description versions beyond the maximum allowed (20 per issue)."""
+def get_issue_description_versions_queryset(start: str, end: Optional[str] = None):
+    """
+    Get issue description versions of the partition issues beyond the maximum
+    allowed (20 per issue).
+    """
     subq = (
-        IssueDescriptionVersion.all_objects.annotate(
+        IssueDescriptionVersion.all_objects.filter(
+            **partition_filter("issue_id", start, end)
+        )
+        .annotate(
             row_num=Window(
                 expression=RowNumber(),
                 partition_by=[F("issue_id")],
@@ -352,72 +403,76 @@ def get_issue_description_versions_queryset():
         .values("id")
     )
 
-    return (
-        IssueDescriptionVersion.all_objects.filter(id__in=Subquery(subq))
-        .values(
-            "id",
-            "created_at",
-            "issue_id",
-            "workspace_id",
-            "project_id",
-            "created_by_id",
-            "updated_by_id",
-            "owned_by_id",
-            "last_saved_at",
-            "description_binary",
-            "description_html",
-            "description_stripped",
-            "description_json",
-            "deleted_at",
-        )
-        .iterator(chunk_size=BATCH_SIZE)
+    return IssueDescriptionVersion.all_objects.filter(id__in=Subquery(subq)).values(
+        "id",
+        "created_at",
+        "issue_id",
+        "workspace_id",
+        "project_id",
+        "created_by_id",
+        "updated_by_id",
+        "owned_by_id",
+        "last_saved_at",
+        "description_binary",
+        "description_html",
+        "description_stripped",
+        "description_json",
+        "deleted_at",
     )
 
 
+CLEANUP_JOBS = {
+    "api_logs": {
+        "queryset_func": get_api_logs_queryset,
+        "transform_func": transform_api_log,
+        "model": APIActivityLog,
+        "task_name": "API Activity Log",
+        "collection_name": "api_activity_logs",
+    },
+    "email_notification_logs": {
+        "queryset_func": get_email_logs_queryset,
+        "transform_func": transform_email_log,
+        "model": EmailNotificationLog,
+        "task_name": "Email Notification Log",
+        "collection_name": "email_notification_logs",
+    },
+    "page_versions": {
+        "queryset_func": get_page_versions_queryset,
+        "transform_func": transform_page_version,
+        "model": PageVersion,
+        "task_name": "Page Version",
+        "collection_name": "page_versions",
+    },
+    "issue_description_versions": {
+        "queryset_func": get_issue_description_versions_queryset,
+        "transform_func": transform_issue_description_version,
+        "model": IssueDescriptionVersion,
+        "task_name": "Issue Description Version",
+        "collection_name": "issue_description_versions",
+    },
+}
+
+
 # Celery tasks - now much simpler!
 @shared_task
 def delete_api_logs():
     """Delete old API activity logs."""
-    process_cleanup_task(
-        queryset_func=get_api_logs_queryset,
-        transform_func=transform_api_log,
-        model=APIActivityLog,
-        task_name="API Activity Log",
-        collection_name="api_activity_logs",
-    )
+    process_cleanup_task("api_logs")
 
 
 @shared_task
 def delete_email_notification_logs():
     """Delete old email notification logs."""
-    process_cleanup_task(
-        queryset_func=get_email_logs_queryset,
-        transform_func=transform_email_log,
-        model=EmailNotificationLog,
-        task_name="Email Notification Log",
-        collection_name="email_notification_logs",
-    )
+    process_cleanup_task("email_notification_logs")
 
 
 @shared_task
 def delete_page_versions():
     """Delete excess page versions."""
-    process_cleanup_task(
-        queryset_func=get_page_versions_queryset,
-        transform_func=transform_page_version,
-        model=PageVersion,
-        task_name="Page Version",
-        collection_name="page_versions",
-    )
+    process_cleanup_task("page_versions")
 
 
 @shared_task
 def delete_issue_description_versions():
     """Delete excess issue description versions."""
-    process_cleanup_task(
-        queryset_func=get_issue_description_versions_queryset,
-        transform_func=transform_issue_description_version,
-        model=IssueDescriptionVersion,
-        task_name="Issue Description Version",
-        collection_name="issue_description_versions",
-    )
+    process_cleanup_task("issue_description_versions")
@@ -1,14 +1,169 @@
+# Python imports
+import json
+import logging
+import time
+from collections import defaultdict
+from datetime import datetime, timedelta
+from functools import lru_cache
+
 # Django imports
 from django.utils import timezone
 from django.apps import apps
 from django.conf import settings
-from django.db import models
-from django.db.models.fields.related import OneToOneRel
+from django.db import IntegrityError, connection, transaction
+from django.db.models.deletion import CASCADE, Collector
 
 
 # Third party imports
 from celery import shared_task
 
+# Module imports
+from plane.settings.redis import redis_instance
+from plane.utils.exception_logger import log_exception
+
+# Parents whose dependents are soft deleted or restored per update
+SOFT_DELETE_BATCH_SIZE = 1000
+
+# The progress of the running purge, a purge stopped midway resumes from it
+HARD_DELETE_CHECKPOINT_KEY = "hard_delete:checkpoint"
+HARD_DELETE_LOCK_KEY = "hard_delete:lock"
+# Seconds before a paused purge resumes
+HARD_DELETE_RESUME_COUNTDOWN = 60
+
+logger = logging.getLogger("plane.worker")
+
+
+@lru_cache(maxsize=None)
+def get_cascade_relations(model_class):
+    """
+    Return the reverse relations followed by the soft delete of the model as
+    (related model, foreign key name, on delete name), computed once per model
+    """
+    relations = []
+    for relation in model_class._meta.get_fields():
+        if not (
+            (relation.one_to_many or relation.one_to_one)
+            and relation.auto_created
+            and not relation.concrete
+        ):
+            continue
+
+        # Get the on_delete behavior name
+        on_delete_name = getattr(relation.on_delete, "__name__", "")
+        if on_delete_name == "DO_NOTHING":
+            continue
+        relations.append((relation.related_model, relation.field.name, on_delete_name))
+    return tuple(relations)
+
+
+def chunked(values, size=SOFT_DELETE_BATCH_SIZE):
+    for start in range(0, len(values), size):
+        yield values[start : start + size]
+
+
+def restore_rows(model_class, pks, values):
+    """
+    Restore the rows in one update, the rows conflicting with the rows created
+    since they were deleted are left deleted. Returns the restored pks
+    """
+    try:
+        with transaction.atomic():
+            model_class._base_manager.filter(pk__in=pks).update(**values)
+        return pks
+    except IntegrityError:
+        restored = []
+        for pk in pks:
+            try:
+                with transaction.atomic():
+                    model_class._base_manager.filter(pk=pk).update(**values)
+                restored.append(pk)
+            except IntegrityError:
+                continue
+        return restored
+
+
+def cascade_related_objects(model_class, pks, deleted_at, restore=False):
+    """
+    Soft delete the dependents of the rows of the model level by level, with
+    one update per related table and chunk of parents. The dependents get the
+    deleted_at of the rows, the restore brings back the dependents deleted
+    with them. Returns the number of rows updated by model
+    """
+    if restore:
+        pending = {"deleted_at": deleted_at}
+        values = {"deleted_at": None, "updated_at": timezone.now()}
+    else:
+        pending = {"deleted_at__isnull": True}
+        values = {"deleted_at": deleted_at, "updated_at": deleted_at}
+
+    updated = defaultdict(int)
+    level = {model_class: list(pks)}
+    depth = 0
+    while level:
+        next_level = defaultdict(list)
+        for parent_model, parent_pks in level.items():
+            for related_model, field_name, on_delete_name in get_cascade_relations(
+                parent_model
+            ):
+                try:
+                    for chunk in chunked(parent_pks):
+                        lookup = {f"{field_name}__in": chunk}
+                        if on_delete_name == "SET_NULL":
+                            if not restore:
+                                related_model._default_manager.filter(**lookup).update(
+                                    **{field_name: None}
+                                )
+                            continue
+
+                        if not hasattr(related_model, "deleted_at"):
+                            continue
+
+                        related_pks = list(
+                            related_model._base_manager.filter(
+                                **lookup, **pending
+                            ).values_list("pk", flat=True)
+                        )
+                        if not related_pks:
+                            continue
+                        if restore:
+                            related_pks = restore_rows(
+                                related_model, related_pks, values
+                            )
+                        else:
+                            related_model._base_manager.filter(
+                                pk__in=related_pks
+                            ).update(**values)
+                        updated[related_model._meta.label] += len(related_pks)
+                        next_level[related_model].extend(related_pks)
+                except Exception as e:
+                    log_exception(e)
+                    continue
+
+        if next_level:
+            logger.info(
+                "%s cascade of %s level %s: %s",
+                "Restore" if restore else "Soft delete",
+                model_class._meta.label,
+                depth,
+                {model._meta.label: len(rows) for model, rows in next_level.items()},
+            )
+        level = next_level
+        depth += 1
+
+    return dict(updated)
+
+
+def queue_relation_rollups(model_name, instance_pk):
+    """Refresh the analytics rollups of the issues of a deleted or restored relation"""
+    # The models import this module for their soft deletes
+    from plane.bgtasks.analytics_rollup_task import (
+        ROLLUP_RELATION_LOOKUPS,
+        refresh_relation_rollups,
+    )
+
+    if settings.ENABLE_ANALYTICS_ROLLUP and model_name in ROLLUP_RELATION_LOOKUPS:
+        refresh_relation_rollups.delay(model_name, str(instance_pk))
+
 
 @shared_task
 def soft_delete_related_objects(app_label, model_name, instance_pk, using=None):
@@ -24,212 +179,178 @@ def soft_delete_related_objects(app_label, model_name, instance_pk, using=None):
     except model_class.DoesNotExist:
         return
 
-    # Get all related fields that are reverse relationships
-    all_related = [
-        f
-        for f in instance._meta.get_fields()
-        if (f.one_to_many or f.one_to_one) and f.auto_created and not f.concrete
-    ]
+    # The related objects share the deleted_at of the instance
+    deleted_at = getattr(instance, "deleted_at", None) or timezone.now()
+    cascade_related_objects(model_class, [instance.pk], deleted_at)
 
-    # Handle each related field
-    for relation in all_related:
-        related_name = relation.get_accessor_name()
+    # Finally, soft delete the instance itself if it hasn't been deleted yet
+    if hasattr(instance, "deleted_at") and not instance.deleted_at:
+        instance.deleted_at = deleted_at
+        instance.save()
 
-        # Skip if the relation doesn't exist
-        if not hasattr(instance, related_name):
-            continue
+    # The issues are not updated by the cascade of their link rows
+    queue_relation_rollups(model_name, instance.pk)
 
-        # Get the on_delete behavior name
-        on_delete_name = (
-            relation.on_delete.__name__
-            if hasattr(relation.on_delete, "__name__")
-            else ""
-        )
-
-        if on_delete_name == "DO_NOTHING":
-            continue
 
-        elif on_delete_name == "SET_NULL":
-            # Handle SET_NULL relationships
-            if isinstance(relation, OneToOneRel):
-                # For OneToOne relationships
-                related_obj = getattr(instance, related_name, None)
-                if related_obj and isinstance(related_obj, models.Model):
-                    setattr(related_obj, relation.remote_field.name, None)
-                    related_obj.save(update_fields=[relation.remote_field.name])
-            else:
-                # For other relationships
-                related_queryset = getattr(instance, related_name).all()
-                related_queryset.update(**{relation.remote_field.name: None})
+@shared_task
+def restore_related_objects(app_label, model_name, instance_pk, using=None):
+    """
+    Restore a soft deleted model instance with the related objects deleted
+    along with it
+    """
+    model_class = apps.get_model(app_label, model_name)
 
-        else:
-            # Handle CASCADE and other delete behaviors
-            try:
-                if relation.one_to_one:
-                    # Handle OneToOne relationships
-                    related_obj = getattr(instance, related_name, None)
-                    if related_obj:
-                        if hasattr(related_obj, "deleted_at"):
-                            if not related_obj.deleted_at:
-                                related_obj.deleted_at = timezone.now()
-                                related_obj.save()
-                                # Recursively handle related objects
-                                soft_delete_related_objects(
-                                    related_obj._meta.app_label,
-                                    related_obj._meta.model_name,
-                                    related_obj.pk,
-                                    using,
-                                )
-                else:
-                    # Handle other relationships
-                    related_queryset = getattr(instance, related_name)(
-                        manager="objects"
-                    ).all()
-
-                    for related_obj in related_queryset:
-                        if hasattr(related_obj, "deleted_at"):
-                            if not related_obj.deleted_at:
-                                related_obj.deleted_at = timezone.now()
-                                related_obj.save()
-                                # Recursively handle related objects
-                                soft_delete_related_objects(
-                                    related_obj._meta.app_label,
-                                    related_obj._meta.model_name,
-                                    related_obj.pk,
-                                    using,
-                                )
-            except Exception as e:
-                # Log the error or handle as needed
-                print(f"Error handling relation {related_name}: {str(e)}")
-                continue
+    instance = model_class.all_objects.filter(pk=instance_pk).first()
+    if instance is None or not getattr(instance, "deleted_at", None):
+        return
 
-    # Finally, soft delete the instance itself if it hasn't been deleted yet
-    if hasattr(instance, "deleted_at") and not instance.deleted_at:
-        instance.deleted_at = timezone.now()
+    try:
+        deleted_at = instance.deleted_at
+        instance.deleted_at = None
         instance.save()
+        cascade_related_objects(model_class, [instance.pk], deleted_at, restore=True)
+        queue_relation_rollups(model_name, instance.pk)
+    except Exception as e:
+        log_exception(e)
+        return
 
 
-# @shared_task
-def restore_related_objects(app_label, model_name, instance_pk, using=None):
-    pass
+def get_purge_order():
+    """
+    Return the soft deleted models with the models referencing a model before
+    it, so the rows left to the cascade of the parents are few
+    """
+    order = []
+    visited = set()
+
+    def visit(model):
+        if model in visited:
+            return
+        visited.add(model)
+        # The set null references do not cascade and would only form cycles
+        for relation in model._meta.related_objects:
+            if relation.on_delete is CASCADE and hasattr(
+                relation.related_model, "deleted_at"
+            ):
+                visit(relation.related_model)
+        order.append(model)
+
+    for model in apps.get_models():
+        if hasattr(model, "deleted_at") and not model._meta.proxy:
+            visit(model)
+    return order
+
+
+def purge_chunk(model, cutoff, last_pk=None):
+    """
+    Hard delete the next chunk of the rows of the model soft deleted before the
+    cutoff, returns the last pk of the chunk, None when the model is purged
+    """
+    queryset = model._base_manager.filter(deleted_at__lt=cutoff).order_by("pk")
+    if last_pk is not None:
+        queryset = queryset.filter(pk__gt=last_pk)
+    pks = list(queryset.values_list("pk", flat=True)[: settings.HARD_DELETE_BATCH_SIZE])
+    if not pks:
+        return None
+
+    chunk = model._base_manager.filter(pk__in=pks)
+    try:
+        with transaction.atomic():
+            # The rows without cascades or signals are deleted in one statement
+            if Collector(using=chunk.db).can_fast_delete(chunk):
+                chunk._raw_delete(chunk.db)
+            else:
+                chunk.delete()
+    except Exception as e:
+        # The chunk is retried by the next purge
+        log_exception(e)
+    return pks[-1]
+
+
+def get_replication_lag():
+    """
+    Return the replay lag (seconds) of the replicas of the database, 0 without
+    replicas and None when the lag can not be read
+    """
+    try:
+        with connection.cursor() as cursor:
+            # The replay lag of an idle replica that replayed all the sent wal
+            # is null, the replica is caught up
+            cursor.execute(
+                "SELECT COALESCE(MAX(CASE "
+                "WHEN replay_lag IS NOT NULL THEN EXTRACT(EPOCH FROM replay_lag) "
+                "WHEN state = 'streaming' AND replay_lsn = sent_lsn THEN 0 "
+                "END), 0) FROM pg_stat_replication"
+            )
+            (lag,) = cursor.fetchone()
+    except Exception as e:
+        log_exception(e)
+        return None
+    return float(lag)
 
 
 @shared_task
 def hard_delete():
-    from plane.db.models import (
-        Workspace,
-        Project,
-        Cycle,
-        Module,
-        Issue,
-        Page,
-        IssueView,
-        Label,
-        State,
-        IssueActivity,
-        IssueComment,
-        IssueLink,
-        IssueReaction,
-        UserFavorite,
-        ModuleIssue,
-        CycleIssue,
-        Estimate,
-        EstimatePoint,
-    )
+    """
+    Purge the rows soft deleted before HARD_DELETE_AFTER_DAYS in chunks. The
+    purge pauses when it runs out of time or the replicas lag behind and
+    resumes from its checkpoint
+    """
+    ri = redis_instance()
+    if not ri.set(
+        HARD_DELETE_LOCK_KEY, 1, nx=True, ex=settings.HARD_DELETE_TIME_LIMIT + 300
+    ):
+        # A purge is running
+        return
 
-    days = settings.HARD_DELETE_AFTER_DAYS
-    # check delete workspace
-    _ = Workspace.all_objects.filter(
-        deleted_at__lt=timezone.now() - timezone.timedelta(days=days)
-    ).delete()
-
-    # check delete project
-    _ = Project.all_objects.filter(
-        deleted_at__lt=timezone.now() - timezone.timedelta(days=days)
-    ).delete()
-
-    # check delete cycle
-    _ = Cycle.all_objects.filter(
-        deleted_at__lt=timezone.now() - timezone.timedelta(days=days)
-    ).delete()
-
-    # check delete module
-    _ = Module.all_objects.filter(
-        deleted_at__lt=timezone.now() - timezone.timedelta(days=days)
-    ).delete()
-
-    # check delete issue
-    _ = Issue.all_objects.filter(
-        deleted_at__lt=timezone.now() - timezone.timedelta(days=days)
-    ).delete()
-
-    # check delete page
-    _ = Page.all_objects.filter(
-        deleted_at__lt=timezone.now() - timezone.timedelta(days=days)
-    ).delete()
-
-    # check delete view
-    _ = IssueView.all_objects.filter(
-        deleted_at__lt=timezone.now() - timezone.timedelta(days=days)
-    ).delete()
-
-    # check delete label
-    _ = Label.all_objects.filter(
-        deleted_at__lt=timezone.now() - timezone.timedelta(days=days)
-    ).delete()
-
-    # check delete state
-    _ = State.all_objects.filter(
-        deleted_at__lt=timezone.now() - timezone.timedelta(days=days)
-    ).delete()
-
-    _ = IssueActivity.all_objects.filter(
-        deleted_at__lt=timezone.now() - timezone.timedelta(days=days)
-    ).delete()
-
-    _ = IssueComment.all_objects.filter(
-        deleted_at__lt=timezone.now() - timezone.timedelta(days=days)
-    ).delete()
-
-    _ = IssueLink.all_objects.filter(
-        deleted_at__lt=timezone.now() - timezone.timedelta(days=days)
-    ).delete()
-
-    _ = IssueReaction.all_objects.filter(
-        deleted_at__lt=timezone.now() - timezone.timedelta(days=days)
-    ).delete()
-
-    _ = UserFavorite.all_objects.filter(
-        deleted_at__lt=timezone.now() - timezone.timedelta(days=days)
-    ).delete()
-
-    _ = ModuleIssue.all_objects.filter(
-        deleted_at__lt=timezone.now() - timezone.timedelta(days=days)
-    ).delete()
-
-    _ = CycleIssue.all_objects.filter(
-        deleted_at__lt=timezone.now() - timezone.timedelta(days=days)
-    ).delete()
-
-    _ = Estimate.all_objects.filter(
-        deleted_at__lt=timezone.now() - timezone.timedelta(days=days)
-    ).delete()
-
-    _ = EstimatePoint.all_objects.filter(
-        deleted_at__lt=timezone.now() - timezone.timedelta(days=days)
-    ).delete()
-
-    # at last, check for every thing which ever is left and delete it
-    # Get all Django models
-    all_models = apps.get_models()
-
-    # Iterate through all models
-    for model in all_models:
-        # Check if the model has a 'deleted_at' field
-        if hasattr(model, "deleted_at"):
-            # Get all instances where 'deleted_at' is greater than 30 days ago
-            _ = model.all_objects.filter(
-                deleted_at__lt=timezone.now() - timezone.timedelta(days=days)
-            ).delete()
-
-    return
+    try:
+        checkpoint = ri.get(HARD_DELETE_CHECKPOINT_KEY)
+        if checkpoint:
+            checkpoint = json.loads(checkpoint)
+        else:
+            cutoff = timezone.now() - timedelta(days=settings.HARD_DELETE_AFTER_DAYS)
+            checkpoint = {"cutoff": cutoff.isoformat(), "model": None, "last_pk": None}
+        cutoff = datetime.fromisoformat(checkpoint["cutoff"])
+        deadline = time.monotonic() + settings.HARD_DELETE_TIME_LIMIT
+
+        order = get_purge_order()
+        labels = [model._meta.label for model in order]
+        start = (
+            labels.index(checkpoint["model"]) if checkpoint["model"] in labels else 0
+        )
+
+        for model in order[start:]:
+            label = model._meta.label
+            last_pk = checkpoint["last_pk"] if label == checkpoint["model"] else None
+            while True:
+                last_pk = purge_chunk(model, cutoff, last_pk)
+                if last_pk is None:
+                    break
+
+                checkpoint.update(model=label, last_pk=str(last_pk))
+                ri.set(HARD_DELETE_CHECKPOINT_KEY, json.dumps(checkpoint))
+
+                lag = get_replication_lag()
+                if lag is None:
+                    # Pause as if the replicas lag behind, a chunk is purged
+                    # every resume until the lag can be read
+                    logger.warning("Replication lag unknown, pausing the hard delete")
+                if (
+                    time.monotonic() > deadline
+                    or lag is None
+                    or lag > settings.HARD_DELETE_MAX_REPLICATION_LAG
+                ):
+                    logger.info(f"Hard delete paused at {label} {last_pk}")
+                    hard_delete.apply_async(
+                        countdown=max(HARD_DELETE_RESUME_COUNTDOWN, int(lag or 0))
+                    )
+                    return
+                time.sleep(settings.HARD_DELETE_THROTTLE)
+
+        ri.delete(HARD_DELETE_CHECKPOINT_KEY)
+        return
+    except Exception as e:
+        log_exception(e)
+        return
+    finally:
+        ri.delete(HARD_DELETE_LOCK_KEY)
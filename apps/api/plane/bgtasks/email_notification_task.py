@@ -1,12 +1,16 @@
 import logging
 import re
-from datetime import datetime
+import smtplib
+from datetime import datetime, timedelta
+from itertools import groupby
+from operator import itemgetter
 
 from bs4 import BeautifulSoup
 
 # Third party imports
 from celery import shared_task
 from django.core.mail import EmailMultiAlternatives, get_connection
+from django.db.models import F, Q
 from django.template.loader import render_to_string
 
 # Django imports
@@ -18,10 +22,12 @@ from plane.db.models import EmailNotificationLog, Issue, User
 from plane.license.utils.instance_value import get_email_configuration
 from plane.settings.redis import redis_instance
 from plane.utils.exception_logger import log_exception
+from plane.utils.uuid import is_valid_uuid
 
 
 def remove_unwanted_characters(input_text):
-    # Remove only control characters and potentially problematic characters for email subjects
+    # Remove only control characters and potentially problematic characters for
+    # email subjects
     processed_text = re.sub(r"[\x00-\x1F\x7F-\x9F]", "", input_text)
     return processed_text
 
@@ -39,62 +45,84 @@ def release_lock(lock_id):
     redis_client.delete(lock_id)
 
 
+# Emails of a digest task, the emails of a task are sent over one connection
+EMAIL_DIGEST_BATCH_SIZE = 50
+# Notification logs fetched per round trip of the server side cursor
+EMAIL_NOTIFICATION_CHUNK_SIZE = 2000
+# Notifications claimed by a digest task that was lost are stacked again after
+EMAIL_DIGEST_CLAIM_TIMEOUT = timedelta(minutes=30)
+# Failed sends of a notification before it is given up
+EMAIL_DIGEST_MAX_ATTEMPTS = 3
+
+
+# The outcomes of a digest, the notifications of a digest that failed to send
+# are released and sent with the next stack of the notifications
+DIGEST_SENT = "sent"
+DIGEST_SKIPPED = "skipped"
+DIGEST_FAILED = "failed"
+
+
+def dispatch_email_digests(digests):
+    """
+    Claim the notifications of the digests and queue their sending, the
+    claimed notifications are left out of the next stacks
+    """
+    EmailNotificationLog.objects.filter(
+        pk__in=[
+            email_notification_id
+            for digest in digests
+            for email_notification_id in digest["email_notification_ids"]
+        ]
+    ).update(processing_at=timezone.now())
+    send_email_notification_digests.delay(digests=digests)
+
+
 @shared_task
 def stack_email_notification():
-    # get all email notifications
+    """
+    Group the unprocessed email notifications of every receiver by issue and
+    actor in one pass over the logs streamed in receiver order, skipping the
+    notifications claimed by a digest task unless the claim is stale
+    """
     email_notifications = (
-        EmailNotificationLog.objects.filter(processed_at__isnull=True)
-        .order_by("receiver")
-        .values()
-    )
-
-    # Create the below format for each of the issues
-    # {"issue_id" : { "actor_id1": [ { data }, { data } ], "actor_id2": [ { data }, { data } ] }}
-
-    # Convert to unique receivers list
-    receivers = list(
-        set(
-            [
-                str(notification.get("receiver_id"))
-                for notification in email_notifications
-            ]
+        EmailNotificationLog.objects.filter(
+            Q(processing_at__isnull=True)
+            | Q(processing_at__lt=timezone.now() - EMAIL_DIGEST_CLAIM_TIMEOUT),
+            processed_at__isnull=True,
         )
+        .order_by("receiver_id", "created_at")
+        .values("id", "receiver_id", "triggered_by_id", "entity_identifier", "data")
+        .iterator(chunk_size=EMAIL_NOTIFICATION_CHUNK_SIZE)
     )
-    processed_notifications = []
-    # Loop through all the issues to create the emails
-    for receiver_id in receivers:
-        # Notification triggered for the receiver
-        receiver_notifications = [
-            notification
-            for notification in email_notifications
-            if str(notification.get("receiver_id")) == receiver_id
-        ]
-        # create payload for all issues
-        payload = {}
-        email_notification_ids = []
-        for receiver_notification in receiver_notifications:
-            payload.setdefault(
-                receiver_notification.get("entity_identifier"), {}
-            ).setdefault(str(receiver_notification.get("triggered_by_id")), []).append(
-                receiver_notification.get("data")
-            )
-            # append processed notifications
-            processed_notifications.append(receiver_notification.get("id"))
-            email_notification_ids.append(receiver_notification.get("id"))
-
-        # Create emails for all the issues
-        for issue_id, notification_data in payload.items():
-            send_email_notification.delay(
-                issue_id=issue_id,
-                notification_data=notification_data,
-                receiver_id=receiver_id,
-                email_notification_ids=email_notification_ids,
+
+    # Create the below format for each of the issues of the receiver
+    # {"issue_id" : { "actor_id1": [ { data }, { data } ],
+    #                 "actor_id2": [ { data }, { data } ] }}
+    digests = []
+    for receiver_id, receiver_notifications in groupby(
+        email_notifications, key=itemgetter("receiver_id")
+    ):
+        issues = {}
+        for notification in receiver_notifications:
+            issue = issues.setdefault(
+                str(notification["entity_identifier"]),
+                {"notification_data": {}, "email_notification_ids": []},
             )
+            issue["notification_data"].setdefault(
+                str(notification["triggered_by_id"]), []
+            ).append(notification["data"])
+            issue["email_notification_ids"].append(str(notification["id"]))
+
+        digests.extend(
+            {"issue_id": issue_id, "receiver_id": str(receiver_id), **issue}
+            for issue_id, issue in issues.items()
+        )
+        if len(digests) >= EMAIL_DIGEST_BATCH_SIZE:
+            dispatch_email_digests(digests)
+            digests = []
 
-    # Update the email notification log
-    EmailNotificationLog.objects.filter(pk__in=processed_notifications).update(
-        processed_at=timezone.now()
-    )
+    if digests:
+        dispatch_email_digests(digests)
 
 
 def create_payload(notification_data):
@@ -168,170 +196,320 @@ def process_html_content(content):
     return processed_content_list
 
 
-@shared_task
-def send_email_notification(
-    issue_id, notification_data, receiver_id, email_notification_ids
-):
-    # Convert UUIDs to a sorted, concatenated string
-    sorted_ids = sorted(email_notification_ids)
-    ids_str = "_".join(str(id) for id in sorted_ids)
-    lock_id = f"send_email_notif_{issue_id}_{receiver_id}_{ids_str}"
+# The smtp connection of the worker process, reused across the emails
+_smtp_connection = None
+_smtp_configuration = None
+
+
+def close_smtp_connection():
+    global _smtp_connection, _smtp_configuration
+    if _smtp_connection is not None:
+        try:
+            _smtp_connection.close()
+        except Exception:
+            pass
+    _smtp_connection = None
+    _smtp_configuration = None
+
+
+def get_smtp_connection(configuration):
+    """
+    Return the open smtp connection of the worker, opened again when the email
+    configuration changes
+    """
+    global _smtp_connection, _smtp_configuration
+    if _smtp_connection is not None and _smtp_configuration != configuration:
+        close_smtp_connection()
+
+    if _smtp_connection is None:
+        (
+            EMAIL_HOST,
+            EMAIL_HOST_USER,
+            EMAIL_HOST_PASSWORD,
+            EMAIL_PORT,
+            EMAIL_USE_TLS,
+            EMAIL_USE_SSL,
+            _,
+        ) = configuration
+        connection = get_connection(
+            host=EMAIL_HOST,
+            port=int(EMAIL_PORT),
+            username=EMAIL_HOST_USER,
+            password=EMAIL_HOST_PASSWORD,
+            use_tls=EMAIL_USE_TLS == "1",
+            use_ssl=EMAIL_USE_SSL == "1",
+        )
+        connection.open()
+        _smtp_connection = connection
+        _smtp_configuration = configuration
+    return _smtp_connection
+
 
-    # acquire the lock for sending emails
+def send_message(msg, configuration):
+    """
+    Send the email over the connection of the worker, the connection is opened
+    again once when the server closed it
+    """
     try:
-        if acquire_lock(lock_id=lock_id):
-            # get the redis instance
-            ri = redis_instance()
-            base_api = ri.get(str(issue_id)).decode() if ri.get(str(issue_id)) else None
-
-            # Skip if base api is not present
-            if not base_api:
-                return
-
-            data = create_payload(notification_data=notification_data)
-
-            # Get email configurations
-            (
-                EMAIL_HOST,
-                EMAIL_HOST_USER,
-                EMAIL_HOST_PASSWORD,
-                EMAIL_PORT,
-                EMAIL_USE_TLS,
-                EMAIL_USE_SSL,
-                EMAIL_FROM,
-            ) = get_email_configuration()
-
-            receiver = User.objects.get(pk=receiver_id)
-            issue = Issue.objects.get(pk=issue_id)
-            template_data = []
-            total_changes = 0
-            comments = []
-            actors_involved = []
-            for actor_id, changes in data.items():
-                actor = User.objects.get(pk=actor_id)
-                total_changes = total_changes + len(changes)
-                comment = changes.pop("comment", False)
-                mention = changes.pop("mention", False)
-                actors_involved.append(actor_id)
-                if comment:
-                    comments.append(
-                        {
-                            "actor_comments": comment,
-                            "actor_detail": {
-                                "avatar_url": f"{base_api}{actor.avatar_url}",
-                                "first_name": actor.first_name,
-                                "last_name": actor.last_name,
-                            },
-                        }
-                    )
-                if mention:
-                    mention["new_value"] = process_html_content(
-                        mention.get("new_value")
-                    )
-                    mention["old_value"] = process_html_content(
-                        mention.get("old_value")
-                    )
-                    comments.append(
-                        {
-                            "actor_comments": mention,
-                            "actor_detail": {
-                                "avatar_url": f"{base_api}{actor.avatar_url}",
-                                "first_name": actor.first_name,
-                                "last_name": actor.last_name,
-                            },
-                        }
-                    )
-                activity_time = changes.pop("activity_time")
-                # Parse the input string into a datetime object
-                formatted_time = datetime.strptime(
-                    activity_time, "%Y-%m-%d %H:%M:%S"
-                ).strftime("%H:%M %p")
-
-                if changes:
-                    template_data.append(
-                        {
-                            "actor_detail": {
-                                "avatar_url": f"{base_api}{actor.avatar_url}",
-                                "first_name": actor.first_name,
-                                "last_name": actor.last_name,
-                            },
-                            "changes": changes,
-                            "issue_details": {
-                                "name": issue.name,
-                                "identifier": f"{issue.project.identifier}-{issue.sequence_id}",
-                            },
-                            "activity_time": str(formatted_time),
-                        }
-                    )
+        msg.connection = get_smtp_connection(configuration)
+        msg.send()
+    except (smtplib.SMTPServerDisconnected, ConnectionError):
+        close_smtp_connection()
+        msg.connection = get_smtp_connection(configuration)
+        msg.send()
+
+
+def build_issue_email(issue, receiver, actors, notification_data, base_api, sender):
+    """Render the email of the changes made to the issue by the actors"""
+    data = create_payload(notification_data=notification_data)
+
+    template_data = []
+    total_changes = 0
+    comments = []
+    actors_involved = []
+    for actor_id, changes in data.items():
+        actor = actors.get(actor_id)
+        if actor is None:
+            raise User.DoesNotExist
+        total_changes = total_changes + len(changes)
+        comment = changes.pop("comment", False)
+        mention = changes.pop("mention", False)
+        actors_involved.append(actor_id)
+        if comment:
+            comments.append(
+                {
+                    "actor_comments": comment,
+                    "actor_detail": {
+                        "avatar_url": f"{base_api}{actor.avatar_url}",
+                        "first_name": actor.first_name,
+                        "last_name": actor.last_name,
+                    },
+                }
+            )
+        if mention:
+            mention["new_value"] = process_html_content(mention.get("new_value"))
+            mention["old_value"] = process_html_content(mention.get("old_value"))
+            comments.append(
+                {
+                    "actor_comments": mention,
+                    "actor_detail": {
+                        "avatar_url": f"{base_api}{actor.avatar_url}",
+                        "first_name": actor.first_name,
+                        "last_name": actor.last_name,
+                    },
+                }
+            )
+        activity_time = changes.pop("activity_time")
+        # Parse the input string into a datetime object
+        formatted_time = datetime.strptime(activity_time, "%Y-%m-%d %H:%M:%S").strftime(
+            "%H:%M %p"
+        )
 
-            summary = "Updates were made to the issue by"
-
-            # Send the mail
-            subject = f"{issue.project.identifier}-{issue.sequence_id} {remove_unwanted_characters(issue.name)}"
-            context = {
-                "data": template_data,
-                "summary": summary,
-                "actors_involved": len(set(actors_involved)),
-                "issue": {
-                    "issue_identifier": f"{str(issue.project.identifier)}-{str(issue.sequence_id)}",
-                    "name": issue.name,
-                    "issue_url": f"{base_api}/{str(issue.project.workspace.slug)}/projects/{str(issue.project.id)}/issues/{str(issue.id)}",
-                },
-                "receiver": {"email": receiver.email},
-                "issue_url": f"{base_api}/{str(issue.project.workspace.slug)}/projects/{str(issue.project.id)}/issues/{str(issue.id)}",
-                "project_url": f"{base_api}/{str(issue.project.workspace.slug)}/projects/{str(issue.project.id)}/issues/",
-                "workspace": str(issue.project.workspace.slug),
-                "project": str(issue.project.name),
-                "user_preference": f"{base_api}/{str(issue.project.workspace.slug)}/settings/account/notifications/",
-                "comments": comments,
-                "entity_type": "issue",
-            }
-            html_content = render_to_string(
-                "emails/notifications/issue-updates.html", context
+        if changes:
+            template_data.append(
+                {
+                    "actor_detail": {
+                        "avatar_url": f"{base_api}{actor.avatar_url}",
+                        "first_name": actor.first_name,
+                        "last_name": actor.last_name,
+                    },
+                    "changes": changes,
+                    "issue_details": {
+                        "name": issue.name,
+                        "identifier": f"{issue.project.identifier}-{issue.sequence_id}",
+                    },
+                    "activity_time": str(formatted_time),
+                }
             )
-            text_content = strip_tags(html_content)
-
-            try:
-                connection = get_connection(
-                    host=EMAIL_HOST,
-                    port=int(EMAIL_PORT),
-                    username=EMAIL_HOST_USER,
-                    password=EMAIL_HOST_PASSWORD,
-                    use_tls=EMAIL_USE_TLS == "1",
-                    use_ssl=EMAIL_USE_SSL == "1",
-                )
-
-                msg = EmailMultiAlternatives(
-                    subject=subject,
-                    body=text_content,
-                    from_email=EMAIL_FROM,
-                    to=[receiver.email],
-                    connection=connection,
-                )
-                msg.attach_alternative(html_content, "text/html")
-                msg.send()
-                logging.getLogger("plane.worker").info("Email Sent Successfully")
 
-                # Update the logs
-                EmailNotificationLog.objects.filter(
-                    pk__in=email_notification_ids
-                ).update(sent_at=timezone.now())
-
-                # release the lock
-                release_lock(lock_id=lock_id)
-                return
-            except Exception as e:
-                log_exception(e)
-                # release the lock
-                release_lock(lock_id=lock_id)
-                return
-        else:
-            logging.getLogger("plane.worker").info("Duplicate email received skipping")
-            return
-    except (Issue.DoesNotExist, User.DoesNotExist):
+    summary = "Updates were made to the issue by"
+
+    # Send the mail
+    issue_identifier = f"{issue.project.identifier}-{issue.sequence_id}"
+    workspace_url = f"{base_api}/{issue.project.workspace.slug}"
+    project_url = f"{workspace_url}/projects/{issue.project.id}/issues/"
+    issue_url = f"{project_url}{issue.id}"
+    subject = f"{issue_identifier} {remove_unwanted_characters(issue.name)}"
+    context = {
+        "data": template_data,
+        "summary": summary,
+        "actors_involved": len(set(actors_involved)),
+        "issue": {
+            "issue_identifier": issue_identifier,
+            "name": issue.name,
+            "issue_url": issue_url,
+        },
+        "receiver": {"email": receiver.email},
+        "issue_url": issue_url,
+        "project_url": project_url,
+        "workspace": str(issue.project.workspace.slug),
+        "project": str(issue.project.name),
+        "user_preference": f"{workspace_url}/settings/account/notifications/",
+        "comments": comments,
+        "entity_type": "issue",
+    }
+    html_content = render_to_string("emails/notifications/issue-updates.html", context)
+    text_content = strip_tags(html_content)
+
+    msg = EmailMultiAlternatives(
+        subject=subject, body=text_content, from_email=sender, to=[receiver.email]
+    )
+    msg.attach_alternative(html_content, "text/html")
+    return msg
+
+
+def send_issue_digest(digest, base_api, users, issues, configuration):
+    """
+    Send the email of the notifications of the receiver on the issue, returns
+    DIGEST_SENT, DIGEST_SKIPPED when the digest can not be sent or None when
+    another task handles its notifications, and DIGEST_FAILED to send it again
+    """
+    issue_id = digest["issue_id"]
+    receiver_id = digest["receiver_id"]
+    email_notification_ids = digest["email_notification_ids"]
+
+    # One email of the issue is sent to the receiver at a time
+    lock_id = f"send_email_notif_{issue_id}_{receiver_id}"
+    if not acquire_lock(lock_id=lock_id):
+        logging.getLogger("plane.worker").info("Duplicate email received skipping")
+        return None
+
+    try:
+        # The digest was queued again before its notifications were processed
+        if EmailNotificationLog.objects.filter(
+            pk__in=email_notification_ids, processed_at__isnull=False
+        ).exists():
+            return None
+
+        receiver = users.get(str(receiver_id))
+        issue = issues.get(str(issue_id))
+        # Skip if base api is not present
+        if not base_api or receiver is None or issue is None:
+            return DIGEST_SKIPPED
+
+        try:
+            msg = build_issue_email(
+                issue=issue,
+                receiver=receiver,
+                actors=users,
+                notification_data=digest["notification_data"],
+                base_api=base_api,
+                sender=configuration[6],
+            )
+        except User.DoesNotExist:
+            return DIGEST_SKIPPED
+        except Exception as e:
+            log_exception(e)
+            return DIGEST_SKIPPED
+
+        try:
+            send_message(msg, configuration)
+        except Exception as e:
+            log_exception(e)
+            return DIGEST_FAILED
+        logging.getLogger("plane.worker").info("Email Sent Successfully")
+        return DIGEST_SENT
+    finally:
+        # release the lock
         release_lock(lock_id=lock_id)
-        return
+
+
+def mark_digest_processed(digest, sent):
+    now = timezone.now()
+    EmailNotificationLog.objects.filter(pk__in=digest["email_notification_ids"]).update(
+        processed_at=now, **({"sent_at": now} if sent else {})
+    )
+
+
+def release_failed_digest(digest):
+    """
+    Release the claim of the notifications of the digest that failed to send,
+    the notifications are given up once they failed EMAIL_DIGEST_MAX_ATTEMPTS
+    """
+    email_notifications = EmailNotificationLog.objects.filter(
+        pk__in=digest["email_notification_ids"], processed_at__isnull=True
+    )
+    email_notifications.update(processing_at=None, send_attempts=F("send_attempts") + 1)
+    email_notifications.filter(send_attempts__gte=EMAIL_DIGEST_MAX_ATTEMPTS).update(
+        processed_at=timezone.now()
+    )
+
+
+@shared_task
+def send_email_notification_digests(digests):
+    """
+    Send the emails of a batch of digests, the receivers, the actors and the
+    issues of the batch are loaded together and the emails share a connection.
+    A digest failing to send does not stop the others, its notifications are
+    marked processed once it is sent or can not be sent and released otherwise
+    """
+    try:
+        if not digests:
+            return
+
+        # Get email configurations
+        configuration = get_email_configuration()
+
+        # The request origins of the issues
+        base_apis = redis_instance().mget([str(d["issue_id"]) for d in digests])
+
+        # The issue and the actors of a notification can be missing, the digests
+        # of the invalid ids are skipped instead of failing the batch
+        user_ids = {str(digest["receiver_id"]) for digest in digests}
+        for digest in digests:
+            user_ids.update(digest["notification_data"].keys())
+        users = {
+            str(user_id): user
+            for user_id, user in User.objects.in_bulk(
+                [user_id for user_id in user_ids if is_valid_uuid(user_id)]
+            ).items()
+        }
+        issue_ids = {str(digest["issue_id"]) for digest in digests}
+        issues = {
+            str(issue_id): issue
+            for issue_id, issue in Issue.objects.select_related(
+                "project", "project__workspace"
+            )
+            .in_bulk([issue_id for issue_id in issue_ids if is_valid_uuid(issue_id)])
+            .items()
+        }
     except Exception as e:
+        # Nothing is processed, the digests are stacked again once their claim
+        # is stale
         log_exception(e)
-        release_lock(lock_id=lock_id)
         return
+
+    for digest, base_api in zip(digests, base_apis):
+        try:
+            result = send_issue_digest(
+                digest,
+                base_api.decode() if base_api else None,
+                users,
+                issues,
+                configuration,
+            )
+            if result in (DIGEST_SENT, DIGEST_SKIPPED):
+                # Update the logs
+                mark_digest_processed(digest, sent=result == DIGEST_SENT)
+            elif result == DIGEST_FAILED:
+                release_failed_digest(digest)
+        except Exception as e:
+            log_exception(e)
+    return
+
+
+@shared_task
+def send_email_notification(
+    issue_id, notification_data, receiver_id, email_notification_ids
+):
+    # Send the emails queued before the digests, one email per task
+    send_email_notification_digests(
+        digests=[
+            {
+                "issue_id": str(issue_id),
+                "receiver_id": str(receiver_id),
+                "notification_data": notification_data,
+                "email_notification_ids": email_notification_ids,
+            }
+        ]
+    )
@@ -3,28 +3,76 @@ import csv
 import io
 import json
 import zipfile
-from typing import List
+from typing import Iterator, List
 import boto3
 from botocore.client import Config
 from uuid import UUID
 from datetime import datetime, date
 
 # Third party imports
-from celery import shared_task
+from celery import chord, shared_task
 
 
 # Django imports
 from django.conf import settings
 from django.utils import timezone
 from openpyxl import Workbook
-from django.db.models import F, Prefetch
+from django.db.models import Count, F, Prefetch
 
 from collections import defaultdict
 
 # Module imports
-from plane.db.models import ExporterHistory, Issue, FileAsset, Label, User, IssueComment
+from plane.db.models import (
+    ExporterHistory,
+    FileAsset,
+    Issue,
+    IssueComment,
+    Label,
+    ProjectMember,
+    User,
+)
 from plane.utils.exception_logger import log_exception
 
+# Number of issues fetched and written per chunk of the export
+EXPORT_CHUNK_SIZE = 2000
+
+# Size of the parts of the multipart upload, S3 needs at least 5MB per part
+EXPORT_UPLOAD_PART_SIZE = 8 * 1024 * 1024
+
+# Size of the chunks the part files of a parallel export are read in
+EXPORT_READ_CHUNK_SIZE = 1024 * 1024
+
+# Presigned urls of the exports are valid for a week
+EXPORT_URL_EXPIRES_IN = 7 * 24 * 60 * 60
+
+EXPORT_HEADER = [
+    "ID",
+    "Project",
+    "Name",
+    "Description",
+    "State",
+    "Start Date",
+    "Target Date",
+    "Priority",
+    "Created By",
+    "Labels",
+    "Cycle Name",
+    "Cycle Start Date",
+    "Cycle End Date",
+    "Module Name",
+    "Created At",
+    "Updated At",
+    "Completed At",
+    "Archived At",
+    "Comments",
+    "Estimate",
+    "Link",
+    "Assignees",
+    "Subscribers Count",
+    "Attachment Count",
+    "Attachment Links",
+]
+
 
 def dateTimeConverter(time: datetime) -> str | None:
     """
@@ -42,130 +90,253 @@ def dateConverter(time: date) -> str | None:
         return time.strftime("%a, %d %b %Y")
 
 
-def create_csv_file(data: List[List[str]]) -> str:
+class CSVExportWriter:
     """
-    Create a CSV file from the provided data.
+    Write the CSV export rows straight into the binary stream of the file, a
+    part of a sharded export is written without the header.
     """
-    csv_buffer = io.StringIO()
-    csv_writer = csv.writer(csv_buffer, delimiter=",", quoting=csv.QUOTE_ALL)
 
-    for row in data:
-        csv_writer.writerow(row)
+    extension = "csv"
+
+    def __init__(self, stream, header: List[str] | None):
+        self.stream = io.TextIOWrapper(stream, encoding="utf-8", newline="")
+        self.writer = csv.writer(self.stream, delimiter=",", quoting=csv.QUOTE_ALL)
+        if header is not None:
+            self.writer.writerow(header)
+
+    def write(self, issues: List[dict]) -> None:
+        self.writer.writerows(generate_table_row(issue) for issue in issues)
 
-    csv_buffer.seek(0)
-    return csv_buffer.getvalue()
+    def close(self) -> None:
+        self.stream.close()
 
 
-def create_json_file(data: List[dict]) -> str:
+class JSONExportWriter:
     """
-    Create a JSON file from the provided data.
+    Write the JSON export rows straight into the binary stream of the file, a
+    part of a sharded export holds the items without the brackets of the list.
     """
-    return json.dumps(data)
 
+    extension = "json"
+
+    def __init__(self, stream, header: List[str] | None):
+        self.stream = io.TextIOWrapper(stream, encoding="utf-8")
+        self.part = header is None
+        if not self.part:
+            self.stream.write("[")
+        self.empty = True
+
+    def write(self, issues: List[dict]) -> None:
+        for issue in issues:
+            row = generate_json_row(issue)
+            # The items are separated the same way as json.dumps of the whole list
+            self.stream.write(("" if self.empty else ", ") + json.dumps(row))
+            self.empty = False
+
+    def close(self) -> None:
+        if not self.part:
+            self.stream.write("]")
+        self.stream.close()
 
-def create_xlsx_file(data: List[List[str]]) -> bytes:
+
+class XLSXExportWriter:
     """
-    Create an XLSX file from the provided data.
+    Write the XLSX export rows with the write only workbook, the rows are kept
+    in temporary files by openpyxl until the workbook is saved to the stream.
     """
-    workbook = Workbook()
-    sheet = workbook.active
 
-    for row in data:
-        sheet.append(row)
+    extension = "xlsx"
+
+    def __init__(self, stream, header: List[str] | None):
+        self.stream = stream
+        self.workbook = Workbook(write_only=True)
+        self.sheet = self.workbook.create_sheet()
+        if header is not None:
+            self.sheet.append(header)
+
+    def write(self, issues: List[dict]) -> None:
+        for issue in issues:
+            self.sheet.append(generate_table_row(issue))
 
-    xlsx_buffer = io.BytesIO()
-    workbook.save(xlsx_buffer)
-    xlsx_buffer.seek(0)
-    return xlsx_buffer.getvalue()
+    def close(self) -> None:
+        self.workbook.save(self.stream)
+        self.stream.close()
 
 
-def create_zip_file(files: List[tuple[str, str | bytes]]) -> io.BytesIO:
+class XLSXPartWriter:
     """
-    Create a ZIP file from the provided files.
+    Write the XLSX rows of a part of a sharded export as json lines, the rows
+    are appended to one workbook when the parts are merged.
     """
-    zip_buffer = io.BytesIO()
-    with zipfile.ZipFile(zip_buffer, "w", zipfile.ZIP_DEFLATED) as zipf:
-        for filename, file_content in files:
-            zipf.writestr(filename, file_content)
 
-    zip_buffer.seek(0)
-    return zip_buffer
+    extension = "xlsx"
 
+    def __init__(self, stream, header: List[str] | None):
+        self.stream = io.TextIOWrapper(stream, encoding="utf-8")
 
-# TODO: Change the upload_to_s3 function to use the new storage method with entry in file asset table
-def upload_to_s3(
-    zip_file: io.BytesIO, workspace_id: UUID, token_id: str, slug: str
-) -> None:
+    def write(self, issues: List[dict]) -> None:
+        for issue in issues:
+            self.stream.write(json.dumps(generate_table_row(issue)) + "\n")
+
+    def close(self) -> None:
+        self.stream.close()
+
+
+def merge_csv_parts(stream, header: List[str], parts) -> None:
+    writer = CSVExportWriter(stream, header)
+    writer.stream.flush()
+    for part in parts:
+        for chunk in part.iter_chunks(EXPORT_READ_CHUNK_SIZE):
+            stream.write(chunk)
+    writer.close()
+
+
+def merge_json_parts(stream, header: List[str], parts) -> None:
+    stream.write(b"[")
+    empty = True
+    for part in parts:
+        chunks = part.iter_chunks(EXPORT_READ_CHUNK_SIZE)
+        for index, chunk in enumerate(chunks):
+            if index == 0 and not empty:
+                stream.write(b", ")
+            stream.write(chunk)
+            empty = False
+    stream.write(b"]")
+    stream.close()
+
+
+def merge_xlsx_parts(stream, header: List[str], parts) -> None:
+    writer = XLSXExportWriter(stream, header)
+    for part in parts:
+        for line in part.iter_lines():
+            if line:
+                writer.sheet.append(json.loads(line))
+    writer.close()
+
+
+class S3MultipartWriter(io.RawIOBase):
     """
-    Upload a ZIP file to S3 and generate a presigned URL.
+    Writable stream that uploads the written bytes as the parts of a S3
+    multipart upload, only one part is kept in memory.
     """
-    file_name = (
-        f"{workspace_id}/export-{slug}-{token_id[:6]}-{str(timezone.now().date())}.zip"
-    )
-    expires_in = 7 * 24 * 60 * 60
 
-    if settings.USE_MINIO:
-        upload_s3 = boto3.client(
-            "s3",
-            endpoint_url=settings.AWS_S3_ENDPOINT_URL,
-            aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
-            aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
-            config=Config(signature_version="s3v4"),
+    def __init__(
+        self, client, bucket: str, key: str, part_size=EXPORT_UPLOAD_PART_SIZE, **kwargs
+    ):
+        self.client = client
+        self.bucket = bucket
+        self.key = key
+        self.part_size = part_size
+        self.buffer = bytearray()
+        self.parts = []
+        self.upload_id = client.create_multipart_upload(
+            Bucket=bucket, Key=key, **kwargs
+        )["UploadId"]
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self.buffer.extend(data)
+        while len(self.buffer) >= self.part_size:
+            self.upload_part(self.buffer[: self.part_size])
+            del self.buffer[: self.part_size]
+        return len(data)
+
+    def upload_part(self, body) -> None:
+        part_number = len(self.parts) + 1
+        response = self.client.upload_part(
+            Bucket=self.bucket,
+            Key=self.key,
+            UploadId=self.upload_id,
+            PartNumber=part_number,
+            Body=bytes(body),
         )
-        upload_s3.upload_fileobj(
-            zip_file,
-            settings.AWS_STORAGE_BUCKET_NAME,
-            file_name,
-            ExtraArgs={"ACL": "public-read", "ContentType": "application/zip"},
+        self.parts.append({"ETag": response["ETag"], "PartNumber": part_number})
+
+    def complete(self) -> None:
+        # The last part can be smaller than the part size
+        if self.buffer or not self.parts:
+            self.upload_part(self.buffer)
+            self.buffer = bytearray()
+        self.client.complete_multipart_upload(
+            Bucket=self.bucket,
+            Key=self.key,
+            UploadId=self.upload_id,
+            MultipartUpload={"Parts": self.parts},
         )
 
-        # Generate presigned url for the uploaded file with different base
-        presign_s3 = boto3.client(
+    def abort(self) -> None:
+        self.client.abort_multipart_upload(
+            Bucket=self.bucket, Key=self.key, UploadId=self.upload_id
+        )
+
+
+def get_s3_client(endpoint_url: str | None = None):
+    """
+    Get the S3 client for the export uploads.
+    """
+    if endpoint_url:
+        return boto3.client(
             "s3",
-            endpoint_url=f"{settings.AWS_S3_URL_PROTOCOL}//{str(settings.AWS_S3_CUSTOM_DOMAIN).replace('/uploads', '')}/",
+            endpoint_url=endpoint_url,
             aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
             aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
             config=Config(signature_version="s3v4"),
         )
+    return boto3.client(
+        "s3",
+        region_name=settings.AWS_REGION,
+        aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
+        aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
+        config=Config(signature_version="s3v4"),
+    )
 
-        presigned_url = presign_s3.generate_presigned_url(
-            "get_object",
-            Params={"Bucket": settings.AWS_STORAGE_BUCKET_NAME, "Key": file_name},
-            ExpiresIn=expires_in,
-        )
-    else:
-        # If endpoint url is present, use it
-        if settings.AWS_S3_ENDPOINT_URL:
-            s3 = boto3.client(
-                "s3",
-                endpoint_url=settings.AWS_S3_ENDPOINT_URL,
-                aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
-                aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
-                config=Config(signature_version="s3v4"),
-            )
-        else:
-            s3 = boto3.client(
-                "s3",
-                region_name=settings.AWS_REGION,
-                aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
-                aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
-                config=Config(signature_version="s3v4"),
-            )
 
-        # Upload the file to S3
-        s3.upload_fileobj(
-            zip_file,
+def get_export_file_name(workspace_id: UUID, token_id: str, slug: str) -> str:
+    return (
+        f"{workspace_id}/export-{slug}-{token_id[:6]}-{str(timezone.now().date())}.zip"
+    )
+
+
+def create_export_upload(file_name: str) -> S3MultipartWriter:
+    """
+    Start the multipart upload of the export zip.
+    """
+    if settings.USE_MINIO:
+        return S3MultipartWriter(
+            get_s3_client(settings.AWS_S3_ENDPOINT_URL),
             settings.AWS_STORAGE_BUCKET_NAME,
             file_name,
-            ExtraArgs={"ContentType": "application/zip"},
+            ACL="public-read",
+            ContentType="application/zip",
         )
+    return S3MultipartWriter(
+        get_s3_client(settings.AWS_S3_ENDPOINT_URL),
+        settings.AWS_STORAGE_BUCKET_NAME,
+        file_name,
+        ContentType="application/zip",
+    )
+
 
-        # Generate presigned url for the uploaded file
-        presigned_url = s3.generate_presigned_url(
-            "get_object",
-            Params={"Bucket": settings.AWS_STORAGE_BUCKET_NAME, "Key": file_name},
-            ExpiresIn=expires_in,
+# TODO: Change the export upload to use the new storage method with entry in file asset table
+def update_export_url(file_name: str, token_id: str) -> None:
+    """
+    Generate the presigned URL of the uploaded export and complete the exporter.
+    """
+    if settings.USE_MINIO:
+        # Generate presigned url for the uploaded file with different base
+        presign_s3 = get_s3_client(
+            f"{settings.AWS_S3_URL_PROTOCOL}//{str(settings.AWS_S3_CUSTOM_DOMAIN).replace('/uploads', '')}/"
         )
+    else:
+        presign_s3 = get_s3_client(settings.AWS_S3_ENDPOINT_URL)
+
+    presigned_url = presign_s3.generate_presigned_url(
+        "get_object",
+        Params={"Bucket": settings.AWS_STORAGE_BUCKET_NAME, "Key": file_name},
+        ExpiresIn=EXPORT_URL_EXPIRES_IN,
+    )
 
     exporter_instance = ExporterHistory.objects.get(token=token_id)
 
@@ -255,122 +426,398 @@ def generate_json_row(issue: dict) -> dict:
     }
 
 
-def update_json_row(rows: List[dict], row: dict) -> None:
+def get_created_by(obj: Issue | IssueComment) -> str:
     """
-    Update the json row with the new assignee and label.
+    Get the created by user for the given object.
     """
-    matched_index = next(
-        (
-            index
-            for index, existing_row in enumerate(rows)
-            if existing_row["ID"] == row["ID"]
-        ),
-        None,
-    )
+    if obj.created_by:
+        return f"{obj.created_by.first_name} {obj.created_by.last_name}"
+    return ""
+
 
-    if matched_index is not None:
-        existing_assignees, existing_labels = (
-            rows[matched_index]["Assignee"],
-            rows[matched_index]["Labels"],
+def get_export_queryset(workspace_id: UUID, project_ids: List[str], member_id):
+    """
+    Get the issues of the export with the relations used by the rows, the
+    projects of the member are filtered with a subquery so every issue is
+    exported once.
+    """
+    return (
+        Issue.objects.filter(
+            workspace__id=workspace_id,
+            project_id__in=ProjectMember.objects.filter(
+                project_id__in=project_ids, member=member_id, is_active=True
+            ).values("project_id"),
+            project__archived_at__isnull=True,
         )
-        assignee, label = row["Assignee"], row["Labels"]
+        .select_related(
+            "project", "workspace", "state", "parent", "created_by", "estimate_point"
+        )
+        .prefetch_related(
+            "labels",
+            "issue_cycle__cycle",
+            "issue_module__module",
+            "issue_comments",
+            "assignees",
+            Prefetch(
+                "assignees",
+                queryset=User.objects.only("first_name", "last_name").distinct(),
+                to_attr="assignee_details",
+            ),
+            Prefetch(
+                "labels",
+                queryset=Label.objects.only("name").distinct(),
+                to_attr="label_details",
+            ),
+            "issue_subscribers",
+            "issue_link",
+        )
+        # The sharded exports read the same order, the shards are ID ranges
+        .order_by("project_id", "id")
+    )
 
-        if assignee is not None and (
-            existing_assignees is None or label not in existing_assignees
-        ):
-            rows[matched_index]["Assignee"] += f", {assignee}"
-        if label is not None and (
-            existing_labels is None or label not in existing_labels
-        ):
-            rows[matched_index]["Labels"] += f", {label}"
+
+def get_issue_data(issue: Issue, attachments: List[UUID]) -> dict:
+    """
+    Get the export data of the issue.
+    """
+    issue_data = {
+        "id": issue.id,
+        "project_identifier": issue.project.identifier,
+        "project_name": issue.project.name,
+        "project_id": issue.project.id,
+        "sequence_id": issue.sequence_id,
+        "name": issue.name,
+        "description": issue.description_stripped,
+        "priority": issue.priority,
+        "start_date": issue.start_date,
+        "target_date": issue.target_date,
+        "state_name": issue.state.name if issue.state else None,
+        "created_at": issue.created_at,
+        "updated_at": issue.updated_at,
+        "completed_at": issue.completed_at,
+        "archived_at": issue.archived_at,
+        "module_name": [module.module.name for module in issue.issue_module.all()],
+        "created_by": get_created_by(issue),
+        "labels": [label.name for label in issue.label_details],
+        "comments": [
+            {
+                "comment": comment.comment_stripped,
+                "created_at": dateConverter(comment.created_at),
+                "created_by": get_created_by(comment),
+            }
+            for comment in issue.issue_comments.all()
+        ],
+        "estimate": issue.estimate_point.value
+        if issue.estimate_point and issue.estimate_point.value
+        else "",
+        "link": [link.url for link in issue.issue_link.all()],
+        "assignees": [
+            f"{assignee.first_name} {assignee.last_name}"
+            for assignee in issue.assignee_details
+        ],
+        "subscribers_count": issue.issue_subscribers.count(),
+        "attachment_count": len(attachments),
+        "attachment_links": [
+            f"/api/assets/v2/workspaces/{issue.workspace.slug}/projects/{issue.project_id}/issues/{issue.id}/attachments/{asset}/"
+            for asset in attachments
+        ],
+    }
+
+    # Get Cycles data for the issue, from the prefetched cycles
+    cycles = issue.issue_cycle.all()
+    cycle = cycles[len(cycles) - 1] if cycles else None
+    if cycle:
+        # Update cycle data
+        issue_data["cycle_name"] = cycle.cycle.name
+        issue_data["cycle_start_date"] = dateConverter(cycle.cycle.start_date)
+        issue_data["cycle_end_date"] = dateConverter(cycle.cycle.end_date)
     else:
-        rows.append(row)
+        issue_data["cycle_name"] = ""
+        issue_data["cycle_start_date"] = ""
+        issue_data["cycle_end_date"] = ""
+
+    return issue_data
 
 
-def update_table_row(rows: List[List[str]], row: List[str]) -> None:
+def iter_issue_chunks(
+    queryset, chunk_size: int = EXPORT_CHUNK_SIZE
+) -> Iterator[List[dict]]:
     """
-    Update the table row with the new assignee and label.
+    Iterate the export data of the issues in chunks, only one chunk of issues
+    and their prefetched relations is held in memory.
     """
-    matched_index = next(
-        (index for index, existing_row in enumerate(rows) if existing_row[0] == row[0]),
-        None,
-    )
+    issues = []
+    for issue in queryset.iterator(chunk_size=chunk_size):
+        issues.append(issue)
+        if len(issues) == chunk_size:
+            yield get_issues_data(issues)
+            issues = []
+    if issues:
+        yield get_issues_data(issues)
 
-    if matched_index is not None:
-        existing_assignees, existing_labels = rows[matched_index][7:9]
-        assignee, label = row[7:9]
 
-        if assignee is not None and (
-            existing_assignees is None or label not in existing_assignees
-        ):
-            rows[matched_index][8] += f", {assignee}"
-        if label is not None and (
-            existing_labels is None or label not in existing_labels
-        ):
-            rows[matched_index][8] += f", {label}"
-    else:
-        rows.append(row)
+def get_issues_data(issues: List[Issue]) -> List[dict]:
+    # Get the attachments for the chunk of issues
+    attachment_dict = defaultdict(list)
+    for asset in FileAsset.objects.filter(
+        issue_id__in=[issue.id for issue in issues],
+        entity_type=FileAsset.EntityTypeContext.ISSUE_ATTACHMENT,
+    ).annotate(work_item_id=F("issue_id"), asset_id=F("id")):
+        attachment_dict[asset.work_item_id].append(asset.asset_id)
+
+    return [
+        get_issue_data(issue, attachment_dict.get(issue.id, [])) for issue in issues
+    ]
 
 
-def generate_csv(
-    header: List[str],
-    project_id: str,
-    issues: List[dict],
-    files: List[tuple[str, str | bytes]],
-) -> None:
+# Map the provider to the writer
+EXPORTER_MAPPER = {
+    "csv": CSVExportWriter,
+    "json": JSONExportWriter,
+    "xlsx": XLSXExportWriter,
+}
+
+# Map the provider to the writer of the part files of a parallel export
+PART_WRITER_MAPPER = {
+    "csv": CSVExportWriter,
+    "json": JSONExportWriter,
+    "xlsx": XLSXPartWriter,
+}
+
+
+def write_export_file(stream, provider: str, header, queryset, progress) -> None:
     """
-    Generate CSV export for all the passed issues.
+    Write the issues of the queryset to the binary stream of one export file,
+    the file is written as a part of a sharded export without a header.
     """
-    rows = [header]
-    for issue in issues:
-        row = generate_table_row(issue)
-        update_table_row(rows, row)
-    csv_file = create_csv_file(rows)
-    files.append((f"{project_id}.csv", csv_file))
+    exporter = (EXPORTER_MAPPER if header is not None else PART_WRITER_MAPPER).get(
+        provider
+    )
+    if exporter is None:
+        return
 
+    writer = exporter(stream, header)
+    for issues in iter_issue_chunks(queryset):
+        writer.write(issues)
+        progress(len(issues))
+    writer.close()
 
-def generate_json(
-    header: List[str],
-    project_id: str,
-    issues: List[dict],
-    files: List[tuple[str, str | bytes]],
-) -> None:
+
+def export_progress(token_id: str):
     """
-    Generate JSON export for all the passed issues.
+    Get the callback recording the number of exported issues on the exporter.
     """
-    rows = []
-    for issue in issues:
-        row = generate_json_row(issue)
-        update_json_row(rows, row)
-    json_file = create_json_file(rows)
-    files.append((f"{project_id}.json", json_file))
 
+    def progress(count):
+        ExporterHistory.objects.filter(token=token_id).update(
+            exported_issues=F("exported_issues") + count
+        )
 
-def generate_xlsx(
-    header: List[str],
-    project_id: str,
-    issues: List[dict],
-    files: List[tuple[str, str | bytes]],
-) -> None:
+    return progress
+
+
+def open_export_entry(zip_file: zipfile.ZipFile, name: str, provider: str):
+    return zip_file.open(
+        f"{name}.{EXPORTER_MAPPER[provider].extension}", "w", force_zip64=True
+    )
+
+
+def get_export_shards(queryset, project_ids: List[str], multiple: bool) -> List[dict]:
     """
-    Generate XLSX export for all the passed issues.
+    Split the export in shards of at most EXPORT_SHARD_SIZE issues, the small
+    projects share a shard and the large projects are split by ID ranges.
+    A shard lists its projects, its ID range and the file it belongs to. The
+    shards follow the project and ID order of the export queryset.
     """
-    rows = [header]
-    for issue in issues:
-        row = generate_table_row(issue)
+    shard_size = settings.EXPORT_SHARD_SIZE
+    counts = {
+        str(row["project_id"]): row["count"]
+        for row in queryset.prefetch_related(None)
+        .order_by()
+        .values("project_id")
+        .annotate(count=Count("id", distinct=True))
+    }
+
+    shards = []
+    current = None
+    for project_id in sorted(project_ids, key=lambda project_id: UUID(str(project_id))):
+        project_id = str(project_id)
+        count = counts.get(project_id, 0)
+        file = project_id if multiple else None
+
+        if count > shard_size:
+            # Split the large project at every shard size issue, the IDs are
+            # read in one pass over the index
+            issue_ids = (
+                queryset.filter(project_id=project_id)
+                .prefetch_related(None)
+                .order_by("id")
+                .values_list("id", flat=True)
+            )
+            boundaries = [None]
+            for index, issue_id in enumerate(
+                issue_ids.iterator(chunk_size=EXPORT_CHUNK_SIZE)
+            ):
+                if index and index % shard_size == 0:
+                    boundaries.append(str(issue_id))
+            boundaries.append(None)
+            for start_id, end_id in zip(boundaries, boundaries[1:]):
+                shards.append(
+                    {
+                        "file": file,
+                        "project_ids": [project_id],
+                        "start_id": start_id,
+                        "end_id": end_id,
+                    }
+                )
+            current = None
+            continue
+
+        # Add the project to the current shard of the same file if it fits
+        if (
+            current is not None
+            and current["file"] == file
+            and current["count"] + count <= shard_size
+        ):
+            current["project_ids"].append(project_id)
+            current["count"] += count
+            continue
+
+        current = {
+            "file": file,
+            "project_ids": [project_id],
+            "start_id": None,
+            "end_id": None,
+            "count": count,
+        }
+        shards.append(current)
 
-        update_table_row(rows, row)
-    xlsx_file = create_xlsx_file(rows)
-    files.append((f"{project_id}.xlsx", xlsx_file))
+    for shard in shards:
+        shard.pop("count", None)
+    return shards
 
 
-def get_created_by(obj: Issue | IssueComment) -> str:
+def get_shard_queryset(queryset, shard: dict):
+    queryset = queryset.filter(project_id__in=shard["project_ids"])
+    if shard["start_id"]:
+        queryset = queryset.filter(id__gte=shard["start_id"])
+    if shard["end_id"]:
+        queryset = queryset.filter(id__lt=shard["end_id"])
+    return queryset
+
+
+def fail_export(token_id: str, reason: str) -> None:
+    exporter_instance = ExporterHistory.objects.get(token=token_id)
+    exporter_instance.status = "failed"
+    exporter_instance.reason = reason
+    exporter_instance.save(update_fields=["status", "reason"])
+
+
+@shared_task(ignore_result=False)
+def export_shard_task(
+    provider: str, workspace_id: UUID, token_id: str, index: int, shard: dict
+) -> str | None:
     """
-    Get the created by user for the given object.
+    Write the issues of one shard of a parallel export to its part file, the
+    key of the part file is returned to the assembly of the export.
     """
-    if obj.created_by:
-        return f"{obj.created_by.first_name} {obj.created_by.last_name}"
-    return ""
+    try:
+        exporter_instance = ExporterHistory.objects.get(token=token_id)
+        queryset = get_shard_queryset(
+            get_export_queryset(
+                workspace_id, shard["project_ids"], exporter_instance.initiated_by_id
+            ),
+            shard,
+        )
+
+        key = f"{workspace_id}/export-parts/{token_id}/{index}"
+        upload = S3MultipartWriter(
+            get_s3_client(settings.AWS_S3_ENDPOINT_URL),
+            settings.AWS_STORAGE_BUCKET_NAME,
+            key,
+        )
+        try:
+            write_export_file(
+                upload, provider, None, queryset, export_progress(token_id)
+            )
+            upload.complete()
+        except Exception:
+            upload.abort()
+            raise
+        return key
+    except Exception as e:
+        log_exception(e)
+        return None
+
+
+# Map the provider to the merge of the part files
+PART_MERGE_MAPPER = {
+    "csv": merge_csv_parts,
+    "json": merge_json_parts,
+    "xlsx": merge_xlsx_parts,
+}
+
+
+@shared_task
+def assemble_export_task(
+    part_keys: List[str | None],
+    provider: str,
+    workspace_id: UUID,
+    token_id: str,
+    slug: str,
+    shards: List[dict],
+) -> None:
+    """
+    Merge the part files of a parallel export into the files of the export zip
+    and complete the exporter.
+    """
+    client = get_s3_client(settings.AWS_S3_ENDPOINT_URL)
+    try:
+        if None in part_keys:
+            fail_export(token_id, "Failed to export a part of the issues")
+            return
+
+        # Group the parts by their file keeping the order of the shards
+        files = defaultdict(list)
+        for shard, key in zip(shards, part_keys):
+            files[shard["file"] or str(workspace_id)].append(key)
+
+        file_name = get_export_file_name(workspace_id, token_id, slug)
+        upload = create_export_upload(file_name)
+        try:
+            with zipfile.ZipFile(upload, "w", zipfile.ZIP_DEFLATED) as zip_file:
+                for name, keys in files.items():
+                    parts = (
+                        client.get_object(
+                            Bucket=settings.AWS_STORAGE_BUCKET_NAME, Key=key
+                        )["Body"]
+                        for key in keys
+                    )
+                    PART_MERGE_MAPPER[provider](
+                        open_export_entry(zip_file, name, provider),
+                        EXPORT_HEADER,
+                        parts,
+                    )
+            upload.complete()
+        except Exception:
+            upload.abort()
+            raise
+
+        update_export_url(file_name, token_id)
+    except Exception as e:
+        fail_export(token_id, str(e))
+        log_exception(e)
+    finally:
+        # Remove the part files
+        keys = [{"Key": key} for key in part_keys if key]
+        for start in range(0, len(keys), 1000):
+            try:
+                client.delete_objects(
+                    Bucket=settings.AWS_STORAGE_BUCKET_NAME,
+                    Delete={"Objects": keys[start : start + 1000]},
+                )
+            except Exception as e:
+                log_exception(e)
 
 
 @shared_task
@@ -387,188 +834,85 @@ def issue_export_task(
     provider (str): The provider to export the issues to csv | json | xlsx.
     token_id (str): The export object token id.
     multiple (bool): Whether to export the issues to multiple files per project.
+
+    The issues are read in chunks and streamed through the zip to a multipart
+    upload, the number of exported issues is recorded on the exporter. Exports
+    larger than EXPORT_SHARD_SIZE issues are split in shards written by
+    parallel tasks and merged by a chord.
     """
     try:
         exporter_instance = ExporterHistory.objects.get(token=token_id)
-        exporter_instance.status = "processing"
-        exporter_instance.save(update_fields=["status"])
+
+        if provider not in EXPORTER_MAPPER:
+            return
 
         # Base query to get the issues
-        workspace_issues = (
-            Issue.objects.filter(
-                workspace__id=workspace_id,
-                project_id__in=project_ids,
-                project__project_projectmember__member=exporter_instance.initiated_by_id,
-                project__project_projectmember__is_active=True,
-                project__archived_at__isnull=True,
-            )
-            .select_related(
-                "project",
-                "workspace",
-                "state",
-                "parent",
-                "created_by",
-                "estimate_point",
-            )
-            .prefetch_related(
-                "labels",
-                "issue_cycle__cycle",
-                "issue_module__module",
-                "issue_comments",
-                "assignees",
-                Prefetch(
-                    "assignees",
-                    queryset=User.objects.only("first_name", "last_name").distinct(),
-                    to_attr="assignee_details",
-                ),
-                Prefetch(
-                    "labels",
-                    queryset=Label.objects.only("name").distinct(),
-                    to_attr="label_details",
-                ),
-                "issue_subscribers",
-                "issue_link",
-            )
+        workspace_issues = get_export_queryset(
+            workspace_id, project_ids, exporter_instance.initiated_by_id
         )
 
-        # Get the attachments for the issues
-        file_assets = FileAsset.objects.filter(
-            issue_id__in=workspace_issues.values_list("id", flat=True),
-            entity_type=FileAsset.EntityTypeContext.ISSUE_ATTACHMENT,
-        ).annotate(work_item_id=F("issue_id"), asset_id=F("id"))
-
-        # Create a dictionary to store the attachments for the issues
-        attachment_dict = defaultdict(list)
-        for asset in file_assets:
-            attachment_dict[asset.work_item_id].append(asset.asset_id)
-
-        # Create a list to store the issues data
-        issues_data = []
-
-        # Iterate over the issues
-        for issue in workspace_issues:
-            attachments = attachment_dict.get(issue.id, [])
-
-            issue_data = {
-                "id": issue.id,
-                "project_identifier": issue.project.identifier,
-                "project_name": issue.project.name,
-                "project_id": issue.project.id,
-                "sequence_id": issue.sequence_id,
-                "name": issue.name,
-                "description": issue.description_stripped,
-                "priority": issue.priority,
-                "start_date": issue.start_date,
-                "target_date": issue.target_date,
-                "state_name": issue.state.name if issue.state else None,
-                "created_at": issue.created_at,
-                "updated_at": issue.updated_at,
-                "completed_at": issue.completed_at,
-                "archived_at": issue.archived_at,
-                "module_name": [
-                    module.module.name for module in issue.issue_module.all()
-                ],
-                "created_by": get_created_by(issue),
-                "labels": [label.name for label in issue.label_details],
-                "comments": [
-                    {
-                        "comment": comment.comment_stripped,
-                        "created_at": dateConverter(comment.created_at),
-                        "created_by": get_created_by(comment),
-                    }
-                    for comment in issue.issue_comments.all()
-                ],
-                "estimate": issue.estimate_point.value
-                if issue.estimate_point and issue.estimate_point.value
-                else "",
-                "link": [link.url for link in issue.issue_link.all()],
-                "assignees": [
-                    f"{assignee.first_name} {assignee.last_name}"
-                    for assignee in issue.assignee_details
-                ],
-                "subscribers_count": issue.issue_subscribers.count(),
-                "attachment_count": len(attachments),
-                "attachment_links": [
-                    f"/api/assets/v2/workspaces/{issue.workspace.slug}/projects/{issue.project_id}/issues/{issue.id}/attachments/{asset}/"
-                    for asset in attachments
-                ],
-            }
-
-            # Get Cycles data for the issue
-            cycle = issue.issue_cycle.last()
-            if cycle:
-                # Update cycle data
-                issue_data["cycle_name"] = cycle.cycle.name
-                issue_data["cycle_start_date"] = dateConverter(cycle.cycle.start_date)
-                issue_data["cycle_end_date"] = dateConverter(cycle.cycle.end_date)
-            else:
-                issue_data["cycle_name"] = ""
-                issue_data["cycle_start_date"] = ""
-                issue_data["cycle_end_date"] = ""
-
-            issues_data.append(issue_data)
-
-            # CSV header
-        header = [
-            "ID",
-            "Project",
-            "Name",
-            "Description",
-            "State",
-            "Start Date",
-            "Target Date",
-            "Priority",
-            "Created By",
-            "Labels",
-            "Cycle Name",
-            "Cycle Start Date",
-            "Cycle End Date",
-            "Module Name",
-            "Created At",
-            "Updated At",
-            "Completed At",
-            "Archived At",
-            "Comments",
-            "Estimate",
-            "Link",
-            "Assignees",
-            "Subscribers Count",
-            "Attachment Count",
-            "Attachment Links",
-        ]
-
-        # Map the provider to the function
-        EXPORTER_MAPPER = {
-            "csv": generate_csv,
-            "json": generate_json,
-            "xlsx": generate_xlsx,
-        }
-
-        files = []
-        if multiple:
-            project_dict = defaultdict(list)
-            for issue in issues_data:
-                project_dict[str(issue["project_id"])].append(issue)
-
-            for project_id in project_ids:
-                issues = project_dict.get(str(project_id), [])
-
-                exporter = EXPORTER_MAPPER.get(provider)
-                if exporter is not None:
-                    exporter(header, project_id, issues, files)
-
-        else:
-            exporter = EXPORTER_MAPPER.get(provider)
-            if exporter is not None:
-                exporter(header, workspace_id, issues_data, files)
+        exporter_instance.status = "processing"
+        exporter_instance.total_issues = workspace_issues.count()
+        exporter_instance.exported_issues = 0
+        exporter_instance.save(
+            update_fields=["status", "total_issues", "exported_issues"]
+        )
 
-        zip_buffer = create_zip_file(files)
-        upload_to_s3(zip_buffer, workspace_id, token_id, slug)
+        if (
+            settings.EXPORT_SHARD_SIZE
+            and exporter_instance.total_issues > settings.EXPORT_SHARD_SIZE
+        ):
+            shards = get_export_shards(workspace_issues, project_ids, multiple)
+            chord(
+                export_shard_task.s(
+                    provider=provider,
+                    workspace_id=str(workspace_id),
+                    token_id=token_id,
+                    index=index,
+                    shard=shard,
+                )
+                for index, shard in enumerate(shards)
+            )(
+                assemble_export_task.s(
+                    provider=provider,
+                    workspace_id=str(workspace_id),
+                    token_id=token_id,
+                    slug=slug,
+                    shards=shards,
+                )
+            )
+            return
+
+        progress = export_progress(token_id)
+        file_name = get_export_file_name(workspace_id, token_id, slug)
+        upload = create_export_upload(file_name)
+        try:
+            with zipfile.ZipFile(upload, "w", zipfile.ZIP_DEFLATED) as zip_file:
+                if multiple:
+                    for project_id in project_ids:
+                        write_export_file(
+                            open_export_entry(zip_file, str(project_id), provider),
+                            provider,
+                            EXPORT_HEADER,
+                            workspace_issues.filter(project_id=project_id),
+                            progress,
+                        )
+                else:
+                    write_export_file(
+                        open_export_entry(zip_file, str(workspace_id), provider),
+                        provider,
+                        EXPORT_HEADER,
+                        workspace_issues,
+                        progress,
+                    )
+            upload.complete()
+        except Exception:
+            upload.abort()
+            raise
+
+        update_export_url(file_name, token_id)
 
     except Exception as e:
-        exporter_instance = ExporterHistory.objects.get(token=token_id)
-        exporter_instance.status = "failed"
-        exporter_instance.reason = str(e)
-        exporter_instance.save(update_fields=["status", "reason"])
+        fail_export(token_id, str(e))
         log_exception(e)
         return
@@ -3,16 +3,24 @@ import json
 
 
 # Third Party imports
-from celery import shared_task
+from celery import Task, shared_task
 
 # Django imports
+from django.conf import settings
 from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
 from django.utils import timezone
 
 
 # Module imports
 from plane.app.serializers import IssueActivitySerializer
-from plane.bgtasks.notification_task import notifications
+from plane.bgtasks.issue_list_projection_task import (
+    PROJECTION_ACTIVITIES,
+    get_activity_issue_ids,
+    refresh_issue_list_projection,
+)
+from plane.bgtasks.notification_task import batch_notifications
+from plane.bgtasks.progress_snapshot_task import queue_progress_snapshots
 from plane.db.models import (
     CommentReaction,
     Cycle,
@@ -30,7 +38,9 @@ from plane.db.models import (
 )
 from plane.settings.redis import redis_instance
 from plane.utils.exception_logger import log_exception
+from plane.utils.group_count_cache import invalidate_group_counts
 from plane.utils.issue_relation_mapper import get_inverse_relation
+from plane.utils.redis_buffer import flush_buffer
 from plane.utils.uuid import is_valid_uuid
 
 
@@ -1566,8 +1576,255 @@ def create_intake_activity(
         )
 
 
+# Activities that can change the issue group counts
+GROUP_COUNT_ACTIVITIES = (
+    "issue.",
+    "issue_draft.",
+    "cycle.",
+    "module.",
+    "intake.",
+)
+
+# Redis keys of the activity buffer and of the scheduled drain of the buffer
+ISSUE_ACTIVITY_BUFFER_KEY = "issue_activity:buffer"
+ISSUE_ACTIVITY_DRAIN_KEY = "issue_activity:drain"
+
+ACTIVITY_MAPPER = {
+    "issue.activity.created": create_issue_activity,
+    "issue.activity.updated": update_issue_activity,
+    "issue.activity.deleted": delete_issue_activity,
+    "comment.activity.created": create_comment_activity,
+    "comment.activity.updated": update_comment_activity,
+    "comment.activity.deleted": delete_comment_activity,
+    "cycle.activity.created": create_cycle_issue_activity,
+    "cycle.activity.deleted": delete_cycle_issue_activity,
+    "module.activity.created": create_module_issue_activity,
+    "module.activity.deleted": delete_module_issue_activity,
+    "link.activity.created": create_link_activity,
+    "link.activity.updated": update_link_activity,
+    "link.activity.deleted": delete_link_activity,
+    "attachment.activity.created": create_attachment_activity,
+    "attachment.activity.deleted": delete_attachment_activity,
+    "issue_relation.activity.created": create_issue_relation_activity,
+    "issue_relation.activity.deleted": delete_issue_relation_activity,
+    "issue_reaction.activity.created": create_issue_reaction_activity,
+    "issue_reaction.activity.deleted": delete_issue_reaction_activity,
+    "comment_reaction.activity.created": create_comment_reaction_activity,
+    "comment_reaction.activity.deleted": delete_comment_reaction_activity,
+    "issue_vote.activity.created": create_issue_vote_activity,
+    "issue_vote.activity.deleted": delete_issue_vote_activity,
+    "issue_draft.activity.created": create_draft_issue_activity,
+    "issue_draft.activity.updated": update_draft_issue_activity,
+    "issue_draft.activity.deleted": delete_draft_issue_activity,
+    "intake.activity.created": create_intake_activity,
+}
+
+
+def invalidate_activity_group_counts(type, project_id):
+    # Invalidate the cached group totals for the issue writes
+    if type and type.startswith(GROUP_COUNT_ACTIVITIES):
+        invalidate_group_counts(project_id)
+
+
+def invalidate_events_group_counts(events):
+    # Invalidate once per project for a batch of events
+    project_ids = {
+        str(event.get("project_id"))
+        for event in events
+        if (event.get("type") or "").startswith(GROUP_COUNT_ACTIVITIES)
+    }
+    for project_id in project_ids:
+        invalidate_group_counts(project_id)
+
+
+def buffer_issue_activity(event):
+    """
+    Push the event to the activity buffer, the first event of the batch window
+    schedules the drain of the buffer. Returns False if the event was not buffered
+    """
+    window = settings.ISSUE_ACTIVITY_BATCH_WINDOW
+    try:
+        ri = redis_instance()
+        ri.rpush(ISSUE_ACTIVITY_BUFFER_KEY, json.dumps(event, cls=DjangoJSONEncoder))
+    except Exception as e:
+        log_exception(e)
+        return False
+
+    try:
+        # The drain key expires so a lost drain does not block the buffer
+        if ri.set(ISSUE_ACTIVITY_DRAIN_KEY, 1, nx=True, ex=window + 60):
+            drain_issue_activities.apply_async(countdown=window)
+    except Exception as e:
+        log_exception(e)
+    return True
+
+
+def process_issue_activities(events):
+    """
+    Write the activities of a batch of issue events, the project and issue
+    lookups, the activity insert and the notifications are shared by the batch
+    """
+    events = [event for event in events if is_valid_uuid(str(event.get("project_id")))]
+    if not events:
+        return []
+
+    projects = {
+        str(project.id): project
+        for project in Project.objects.filter(
+            pk__in={str(event["project_id"]) for event in events}
+        )
+    }
+
+    issue_ids = {str(event["issue_id"]) for event in events if event.get("issue_id")}
+    if issue_ids:
+        # Set the request origins in redis
+        origins = [
+            event for event in events if event.get("issue_id") and event.get("origin")
+        ]
+        if origins:
+            pipe = redis_instance().pipeline(transaction=False)
+            for event in origins:
+                pipe.set(str(event["issue_id"]), event["origin"], ex=600)
+            pipe.execute()
+
+    # The bulk cycle and module activities change the issues of their payload,
+    # the analytics rollups are refreshed from the updated issues
+    changed_issue_ids = set(issue_ids)
+    for event in events:
+        changed_issue_ids.update(
+            get_activity_issue_ids(
+                event.get("issue_id"),
+                event.get("requested_data"),
+                event.get("current_instance"),
+            )
+        )
+    changed_issue_ids = {
+        issue_id for issue_id in changed_issue_ids if is_valid_uuid(issue_id)
+    }
+
+    issue_activities = []
+    processed_events = []
+    for event in events:
+        project = projects.get(str(event["project_id"]))
+        if project is None:
+            continue
+
+        start = len(issue_activities)
+        func = ACTIVITY_MAPPER.get(event["type"])
+        if func is not None:
+            try:
+                func(
+                    requested_data=event.get("requested_data"),
+                    current_instance=event.get("current_instance"),
+                    issue_id=event.get("issue_id"),
+                    project_id=event["project_id"],
+                    workspace_id=project.workspace_id,
+                    actor_id=event.get("actor_id"),
+                    issue_activities=issue_activities,
+                    epoch=event.get("epoch"),
+                )
+            except Exception as e:
+                # Drop the partial activities of the failed event
+                del issue_activities[start:]
+                log_exception(e)
+                continue
+        processed_events.append((event, start, len(issue_activities)))
+
+    def refresh_group_counts():
+        # Invalidate again for the list requests made before the write was committed
+        invalidate_events_group_counts([event for event, _, _ in processed_events])
+
+        # Refresh the progress snapshots of the active cycles and modules
+        queue_progress_snapshots(
+            {
+                str(event["project_id"])
+                for event, _, _ in processed_events
+                if event["type"].startswith(GROUP_COUNT_ACTIVITIES)
+            }
+        )
+
+    def send_notifications():
+        notification_events = [
+            {
+                "type": event["type"],
+                "issue_id": event.get("issue_id"),
+                "actor_id": event.get("actor_id"),
+                "project_id": event["project_id"],
+                "subscriber": event.get("subscriber", True),
+                "issue_activities_created": json.dumps(
+                    IssueActivitySerializer(
+                        issue_activities_created[start:end], many=True
+                    ).data,
+                    cls=DjangoJSONEncoder,
+                ),
+                "requested_data": event.get("requested_data"),
+                "current_instance": event.get("current_instance"),
+            }
+            for event, start, end in processed_events
+            if event.get("notification", False)
+        ]
+        if notification_events:
+            batch_notifications.delay(events=notification_events)
+
+    def refresh_projection():
+        # Refresh the list rows of the changed issues
+        projection_issue_ids = set()
+        for event, _, _ in processed_events:
+            if event["type"].startswith(PROJECTION_ACTIVITIES):
+                projection_issue_ids.update(
+                    get_activity_issue_ids(
+                        event.get("issue_id"),
+                        event.get("requested_data"),
+                        event.get("current_instance"),
+                    )
+                )
+        refresh_issue_list_projection(projection_issue_ids)
+
+    # The activities are written once, a failure after the write can not insert
+    # them again so the follow ups run after the commit and do not fail the write
+    with transaction.atomic():
+        if changed_issue_ids:
+            Issue.objects.filter(pk__in=changed_issue_ids).update(
+                updated_at=timezone.now()
+            )
+        issue_activities_created = IssueActivity.objects.bulk_create(issue_activities)
+
+        transaction.on_commit(refresh_group_counts, robust=True)
+        transaction.on_commit(send_notifications, robust=True)
+        if settings.ENABLE_ISSUE_LIST_PROJECTION:
+            transaction.on_commit(refresh_projection, robust=True)
+
+    return issue_activities_created
+
+
+class IssueActivityTask(Task):
+    def apply_async(self, args=None, kwargs=None, **options):
+        if kwargs:
+            # Invalidate the group counts as soon as the write is queued
+            invalidate_activity_group_counts(
+                kwargs.get("type"), kwargs.get("project_id")
+            )
+            # Coalesce the plain events into the batched writer when it is enabled
+            if (
+                settings.ISSUE_ACTIVITY_BATCH_WINDOW
+                and not args
+                and not options
+                and buffer_issue_activity(kwargs)
+            ):
+                return None
+        return super().apply_async(args=args, kwargs=kwargs, **options)
+
+
+class IssueActivityBatchTask(Task):
+    def apply_async(self, args=None, kwargs=None, **options):
+        # Invalidate the group counts as soon as the writes are queued
+        if kwargs:
+            invalidate_events_group_counts(kwargs.get("events") or [])
+        return super().apply_async(args=args, kwargs=kwargs, **options)
+
+
 # Receive message from room group
-@shared_task
+@shared_task(base=IssueActivityTask)
 def issue_activity(
     type,
     requested_data,
@@ -1582,89 +1839,74 @@ def issue_activity(
     intake=None,
 ):
     try:
-        issue_activities = []
-
-        # check if project_id is valid
-        if not is_valid_uuid(str(project_id)):
-            return
+        process_issue_activities(
+            [
+                {
+                    "type": type,
+                    "requested_data": requested_data,
+                    "current_instance": current_instance,
+                    "issue_id": issue_id,
+                    "actor_id": actor_id,
+                    "project_id": project_id,
+                    "epoch": epoch,
+                    "subscriber": subscriber,
+                    "notification": notification,
+                    "origin": origin,
+                }
+            ]
+        )
+        return
+    except Exception as e:
+        log_exception(e)
+        return
 
-        project = Project.objects.get(pk=project_id)
-        workspace_id = project.workspace_id
 
-        if issue_id is not None:
-            if origin:
-                ri = redis_instance()
-                # set the request origin in redis
-                ri.set(str(issue_id), origin, ex=600)
-            issue = Issue.objects.filter(pk=issue_id).first()
-            if issue:
-                try:
-                    issue.updated_at = timezone.now()
-                    issue.save(update_fields=["updated_at"])
-                except Exception:
-                    pass
-
-        ACTIVITY_MAPPER = {
-            "issue.activity.created": create_issue_activity,
-            "issue.activity.updated": update_issue_activity,
-            "issue.activity.deleted": delete_issue_activity,
-            "comment.activity.created": create_comment_activity,
-            "comment.activity.updated": update_comment_activity,
-            "comment.activity.deleted": delete_comment_activity,
-            "cycle.activity.created": create_cycle_issue_activity,
-            "cycle.activity.deleted": delete_cycle_issue_activity,
-            "module.activity.created": create_module_issue_activity,
-            "module.activity.deleted": delete_module_issue_activity,
-            "link.activity.created": create_link_activity,
-            "link.activity.updated": update_link_activity,
-            "link.activity.deleted": delete_link_activity,
-            "attachment.activity.created": create_attachment_activity,
-            "attachment.activity.deleted": delete_attachment_activity,
-            "issue_relation.activity.created": create_issue_relation_activity,
-            "issue_relation.activity.deleted": delete_issue_relation_activity,
-            "issue_reaction.activity.created": create_issue_reaction_activity,
-            "issue_reaction.activity.deleted": delete_issue_reaction_activity,
-            "comment_reaction.activity.created": create_comment_reaction_activity,
-            "comment_reaction.activity.deleted": delete_comment_reaction_activity,
-            "issue_vote.activity.created": create_issue_vote_activity,
-            "issue_vote.activity.deleted": delete_issue_vote_activity,
-            "issue_draft.activity.created": create_draft_issue_activity,
-            "issue_draft.activity.updated": update_draft_issue_activity,
-            "issue_draft.activity.deleted": delete_draft_issue_activity,
-            "intake.activity.created": create_intake_activity,
-        }
-
-        func = ACTIVITY_MAPPER.get(type)
-        if func is not None:
-            func(
-                requested_data=requested_data,
-                current_instance=current_instance,
-                issue_id=issue_id,
-                project_id=project_id,
-                workspace_id=workspace_id,
-                actor_id=actor_id,
-                issue_activities=issue_activities,
-                epoch=epoch,
-            )
+@shared_task(base=IssueActivityBatchTask)
+def issue_activity_batch(events):
+    """Write the activities of the events, events take the issue_activity arguments"""
+    try:
+        batch_size = settings.ISSUE_ACTIVITY_BATCH_SIZE
+        for start in range(0, len(events), batch_size):
+            process_issue_activities(events[start : start + batch_size])
+        return
+    except Exception as e:
+        log_exception(e)
+        return
 
-        # Save all the values to database
-        issue_activities_created = IssueActivity.objects.bulk_create(issue_activities)
 
-        if notification:
-            notifications.delay(
-                type=type,
-                issue_id=issue_id,
-                actor_id=actor_id,
-                project_id=project_id,
-                subscriber=subscriber,
-                issue_activities_created=json.dumps(
-                    IssueActivitySerializer(issue_activities_created, many=True).data,
-                    cls=DjangoJSONEncoder,
-                ),
-                requested_data=requested_data,
-                current_instance=current_instance,
+@shared_task
+def drain_issue_activities():
+    """Write a batch of the buffered activities"""
+    try:
+        ri = redis_instance()
+        # Release the window first, the events pushed from now on schedule a new drain
+        ri.delete(ISSUE_ACTIVITY_DRAIN_KEY)
+
+        # The batch is removed from the buffer only after its activities are written
+        batch_size = settings.ISSUE_ACTIVITY_BATCH_SIZE
+        try:
+            # A batch failing as a whole is kept, its events are not written one by
+            # one as the failure is not caused by a single event
+            drained = flush_buffer(
+                ISSUE_ACTIVITY_BUFFER_KEY,
+                batch_size,
+                process_issue_activities,
+                max_batches=1,
+                retry_items=False,
             )
-
+        except Exception as e:
+            # The events stay in the buffer and are retried after the window
+            log_exception(e)
+            drained = None
+
+        if drained is None:
+            # Another drain is writing or the write failed, try again after the window
+            drain_issue_activities.apply_async(
+                countdown=settings.ISSUE_ACTIVITY_BATCH_WINDOW
+            )
+        elif drained == batch_size:
+            # Keep draining while the buffer fills complete batches
+            drain_issue_activities.delay()
         return
     except Exception as e:
         log_exception(e)
@@ -10,7 +10,7 @@ from django.db.models import Q
 from django.utils import timezone
 
 # Module imports
-from plane.bgtasks.issue_activities_task import issue_activity
+from plane.bgtasks.issue_activities_task import issue_activity_batch
 from plane.db.models import Issue, Project, State
 from plane.utils.exception_logger import log_exception
 
@@ -70,22 +70,25 @@ def archive_old_issues():
                     Issue.objects.bulk_update(
                         issues_to_update, ["archived_at"], batch_size=100
                     )
-                    _ = [
-                        issue_activity.delay(
-                            type="issue.activity.updated",
-                            requested_data=json.dumps(
-                                {"archived_at": str(archive_at), "automation": True}
-                            ),
-                            actor_id=str(project.created_by_id),
-                            issue_id=issue.id,
-                            project_id=project_id,
-                            current_instance=json.dumps({"archived_at": None}),
-                            subscriber=False,
-                            epoch=int(timezone.now().timestamp()),
-                            notification=True,
-                        )
-                        for issue in issues_to_update
-                    ]
+                    epoch = int(timezone.now().timestamp())
+                    issue_activity_batch.delay(
+                        events=[
+                            {
+                                "type": "issue.activity.updated",
+                                "requested_data": json.dumps(
+                                    {"archived_at": str(archive_at), "automation": True}
+                                ),
+                                "actor_id": str(project.created_by_id),
+                                "issue_id": str(issue.id),
+                                "project_id": str(project_id),
+                                "current_instance": json.dumps({"archived_at": None}),
+                                "subscriber": False,
+                                "epoch": epoch,
+                                "notification": True,
+                            }
+                            for issue in issues_to_update
+                        ]
+                    )
         return
     except Exception as e:
         log_exception(e)
@@ -145,22 +148,25 @@ def close_old_issues():
                     Issue.objects.bulk_update(
                         issues_to_update, ["state"], batch_size=100
                     )
-                    [
-                        issue_activity.delay(
-                            type="issue.activity.updated",
-                            requested_data=json.dumps(
-                                {"closed_to": str(issue.state_id)}
-                            ),
-                            actor_id=str(project.created_by_id),
-                            issue_id=issue.id,
-                            project_id=project_id,
-                            current_instance=None,
-                            subscriber=False,
-                            epoch=int(timezone.now().timestamp()),
-                            notification=True,
-                        )
-                        for issue in issues_to_update
-                    ]
+                    epoch = int(timezone.now().timestamp())
+                    issue_activity_batch.delay(
+                        events=[
+                            {
+                                "type": "issue.activity.updated",
+                                "requested_data": json.dumps(
+                                    {"closed_to": str(issue.state_id)}
+                                ),
+                                "actor_id": str(project.created_by_id),
+                                "issue_id": str(issue.id),
+                                "project_id": str(project_id),
+                                "current_instance": None,
+                                "subscriber": False,
+                                "epoch": epoch,
+                                "notification": True,
+                            }
+                            for issue in issues_to_update
+                        ]
+                    )
         return
     except Exception as e:
         log_exception(e)
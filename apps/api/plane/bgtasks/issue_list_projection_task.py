@@ -0,0 +1,188 @@
+# Python imports
+import json
+import logging
+
+# Django imports
+from django.conf import settings
+
+# Third party imports
+from celery import shared_task
+
+# Module imports
+from plane.db.models import Issue, IssueListProjection
+from plane.utils.exception_logger import log_exception
+from plane.utils.uuid import is_valid_uuid
+from plane.utils.issue_list_projection import (
+    issue_array_subqueries,
+    issue_count_subqueries,
+)
+
+PROJECTION_FIELDS = [
+    "cycle_id",
+    "link_count",
+    "attachment_count",
+    "sub_issues_count",
+    "label_ids",
+    "assignee_ids",
+    "module_ids",
+]
+
+# Activities that can change the issue list rows
+PROJECTION_ACTIVITIES = (
+    "issue.",
+    "issue_draft.",
+    "cycle.",
+    "module.",
+    "link.",
+    "attachment.",
+    "intake.",
+)
+
+
+def load_activity_payload(payload):
+    # The activity payloads are sent as json strings
+    if isinstance(payload, str):
+        try:
+            return json.loads(payload)
+        except ValueError:
+            return {}
+    return payload if isinstance(payload, dict) else {}
+
+
+def get_activity_issue_ids(issue_id, requested_data, current_instance):
+    """Return the ids of the issues changed by an issue activity"""
+    issue_ids = {str(issue_id)} if issue_id else set()
+
+    requested_data = load_activity_payload(requested_data)
+    current_instance = load_activity_payload(current_instance)
+
+    # Bulk cycle and module activities send the issues in the payload
+    for key in ["issues", "cycles_list"]:
+        issue_ids.update(str(issue) for issue in requested_data.get(key) or [])
+
+    # Transferred cycle issues
+    for cycle_issue in current_instance.get("updated_cycle_issues") or []:
+        if isinstance(cycle_issue, dict) and cycle_issue.get("issue_id"):
+            issue_ids.add(str(cycle_issue["issue_id"]))
+
+    # The previous parent loses a sub issue
+    for key in ["parent_id", "parent"]:
+        if is_valid_uuid(str(current_instance.get(key))):
+            issue_ids.add(str(current_instance[key]))
+
+    return issue_ids
+
+
+def refresh_issue_list_projection(issue_ids, batch_size=500):
+    """
+    Recompute the list rows of the issues and their parents, every batch is
+    computed in one query and written with one upsert
+    """
+    issue_ids = {str(issue_id) for issue_id in issue_ids if issue_id}
+    if not issue_ids:
+        return 0
+
+    # The parents hold the sub issue counts
+    issue_ids.update(
+        str(parent_id)
+        for parent_id in Issue.all_objects.filter(
+            pk__in=issue_ids, parent_id__isnull=False
+        ).values_list("parent_id", flat=True)
+    )
+
+    issue_ids = list(issue_ids)
+    refreshed = 0
+    for start in range(0, len(issue_ids), batch_size):
+        rows = (
+            Issue.all_objects.filter(
+                pk__in=issue_ids[start : start + batch_size], deleted_at__isnull=True
+            )
+            .annotate(
+                **issue_count_subqueries(active_only=True),
+                **issue_array_subqueries(active_only=True),
+            )
+            .values("id", "project_id", "workspace_id", *PROJECTION_FIELDS)
+        )
+
+        projections = [
+            IssueListProjection(
+                issue_id=row["id"],
+                project_id=row["project_id"],
+                workspace_id=row["workspace_id"],
+                cycle_id=row["cycle_id"],
+                link_count=row["link_count"] or 0,
+                attachment_count=row["attachment_count"] or 0,
+                sub_issues_count=row["sub_issues_count"] or 0,
+                label_ids=row["label_ids"],
+                assignee_ids=row["assignee_ids"],
+                module_ids=row["module_ids"],
+                deleted_at=None,
+            )
+            for row in rows
+        ]
+
+        IssueListProjection.all_objects.bulk_create(
+            projections,
+            update_conflicts=True,
+            unique_fields=["issue"],
+            update_fields=[*PROJECTION_FIELDS, "updated_at", "deleted_at"],
+        )
+        refreshed += len(projections)
+
+    return refreshed
+
+
+@shared_task
+def issue_list_projection_task(issue_ids):
+    if not settings.ENABLE_ISSUE_LIST_PROJECTION:
+        return
+    try:
+        refresh_issue_list_projection(issue_ids)
+        return
+    except Exception as e:
+        log_exception(e)
+        return
+
+
+def queue_issue_list_projection(issue_ids):
+    """Queue the refresh of the list rows for writes that are not issue activities"""
+    issue_ids = [str(issue_id) for issue_id in issue_ids if issue_id]
+    if settings.ENABLE_ISSUE_LIST_PROJECTION and issue_ids:
+        issue_list_projection_task.delay(issue_ids=issue_ids)
+
+
+@shared_task
+def sync_issue_list_projection(batch_size=5000, last_id=None, countdown=60):
+    """Task to build the list rows of the existing issues in batches"""
+    try:
+        queryset = Issue.all_objects.filter(deleted_at__isnull=True).order_by("id")
+        if last_id:
+            queryset = queryset.filter(id__gt=last_id)
+
+        issue_ids = list(queryset.values_list("id", flat=True)[:batch_size])
+        if not issue_ids:
+            return
+
+        refresh_issue_list_projection(issue_ids)
+
+        # Schedule the next batch if there are more issues to process
+        if len(issue_ids) == batch_size:
+            sync_issue_list_projection.apply_async(
+                kwargs={
+                    "batch_size": batch_size,
+                    "last_id": str(issue_ids[-1]),
+                    "countdown": countdown,
+                },
+                countdown=countdown,
+            )
+
+        logging.info(f"Processed issue list rows up to: {issue_ids[-1]}")
+        return
+    except Exception as e:
+        log_exception(e)
+        return
+
+
+@shared_task
+def schedule_issue_list_projection(batch_size=5000, countdown=60):
+    sync_issue_list_projection.delay(batch_size=int(batch_size), countdown=countdown)
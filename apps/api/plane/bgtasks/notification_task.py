@@ -1,10 +1,13 @@
 # Python imports
 import json
 import uuid
+from collections import defaultdict
 from uuid import UUID
 
 
 # Module imports
+from plane.utils.exception_logger import log_exception
+from plane.utils.uuid import is_valid_uuid
 from plane.db.models import (
     IssueMention,
     IssueSubscriber,
@@ -20,7 +23,6 @@ from plane.db.models import (
     UserNotificationPreference,
     ProjectMember,
 )
-from django.db.models import Subquery
 
 # Third Party imports
 from celery import shared_task
@@ -81,40 +83,6 @@ def get_removed_mentions(requested_instance, current_instance):
 
 
 # Adds mentions as subscribers
-def extract_mentions_as_subscribers(project_id, issue_id, mentions):
-    # mentions is an array of User IDs representing the FILTERED set of mentioned users
-
-    bulk_mention_subscribers = []
-
-    for mention_id in mentions:
-        # If the particular mention has not already been subscribed to the issue, he must be sent the mentioned notification
-        if (
-            not IssueSubscriber.objects.filter(
-                issue_id=issue_id, subscriber_id=mention_id, project_id=project_id
-            ).exists()
-            and not IssueAssignee.objects.filter(
-                project_id=project_id, issue_id=issue_id, assignee_id=mention_id
-            ).exists()
-            and not Issue.objects.filter(
-                project_id=project_id, pk=issue_id, created_by_id=mention_id
-            ).exists()
-            and ProjectMember.objects.filter(
-                project_id=project_id, member_id=mention_id, is_active=True
-            ).exists()
-        ):
-            project = Project.objects.get(pk=project_id)
-
-            bulk_mention_subscribers.append(
-                IssueSubscriber(
-                    workspace_id=project.workspace_id,
-                    project_id=project_id,
-                    issue_id=issue_id,
-                    subscriber_id=mention_id,
-                )
-            )
-    return bulk_mention_subscribers
-
-
 # Parse Issue Description & extracts mentions
 def extract_mentions(issue_instance):
     try:
@@ -207,8 +175,209 @@ def create_mention_notification(
     )
 
 
-@shared_task
-def notifications(
+# The activities without notifications
+SKIPPED_NOTIFICATION_ACTIVITIES = [
+    "cycle.activity.created",
+    "cycle.activity.deleted",
+    "module.activity.created",
+    "module.activity.deleted",
+    "issue_reaction.activity.created",
+    "issue_reaction.activity.deleted",
+    "comment_reaction.activity.created",
+    "comment_reaction.activity.deleted",
+    "issue_vote.activity.created",
+    "issue_vote.activity.deleted",
+    "issue_draft.activity.created",
+    "issue_draft.activity.updated",
+    "issue_draft.activity.deleted",
+]
+
+
+class NotificationBatch:
+    """
+    The rows read by the notifications of a batch of issue activities, fetched
+    once for the batch, and the rows created by the notifications, written once
+    """
+
+    def __init__(self, events):
+        self.events = [
+            {
+                **event,
+                "issue_activities_created": (
+                    json.loads(event["issue_activities_created"])
+                    if event.get("issue_activities_created") is not None
+                    else None
+                ),
+            }
+            for event in events
+            if event["type"] not in SKIPPED_NOTIFICATION_ACTIVITIES
+        ]
+        self.subscribers_created = []
+        self.notifications = []
+        self.email_logs = []
+
+        project_ids = {str(event["project_id"]) for event in self.events}
+        issue_ids = {
+            str(event["issue_id"])
+            for event in self.events
+            if is_valid_uuid(str(event["issue_id"]))
+        }
+        activities = [
+            activity
+            for event in self.events
+            for activity in event["issue_activities_created"] or []
+        ]
+
+        self.projects = {
+            str(project.id): project
+            for project in Project.objects.filter(pk__in=project_ids).select_related(
+                "workspace"
+            )
+        }
+        self.issues = {
+            str(issue.id): issue
+            for issue in Issue.objects.filter(pk__in=issue_ids).select_related(
+                "project", "project__workspace", "state"
+            )
+        }
+        self.actors = {
+            str(actor.id): actor
+            for actor in User.objects.filter(
+                pk__in={str(event["actor_id"]) for event in self.events}
+            )
+        }
+
+        self.project_members = defaultdict(set)
+        for project_id, member_id in ProjectMember.objects.filter(
+            project_id__in=project_ids, is_active=True
+        ).values_list("project_id", "member_id"):
+            self.project_members[str(project_id)].add(member_id)
+
+        self.subscribers = defaultdict(set)
+        for issue_id, subscriber_id in IssueSubscriber.objects.filter(
+            issue_id__in=issue_ids
+        ).values_list("issue_id", "subscriber_id"):
+            self.subscribers[str(issue_id)].add(subscriber_id)
+
+        self.assignees = defaultdict(set)
+        for issue_id, assignee_id in IssueAssignee.objects.filter(
+            issue_id__in=issue_ids
+        ).values_list("issue_id", "assignee_id"):
+            self.assignees[str(issue_id)].add(assignee_id)
+
+        # The recipients are the subscribers, the subscribed actors and the
+        # mentioned users of the descriptions and the comments
+        recipient_ids = {
+            str(user_id)
+            for user_ids in self.subscribers.values()
+            for user_id in user_ids
+        }
+        recipient_ids.update(self.actors)
+        for event in self.events:
+            recipient_ids.update(extract_mentions(event["requested_data"]))
+        for activity in activities:
+            if activity.get("issue_comment") is not None:
+                recipient_ids.update(
+                    extract_comment_mentions(activity.get("new_value"))
+                )
+        self.preferences = {
+            str(preference.user_id): preference
+            for preference in UserNotificationPreference.objects.filter(
+                user_id__in=[
+                    user_id for user_id in recipient_ids if is_valid_uuid(user_id)
+                ]
+            )
+        }
+
+        self.completed_state_ids = {
+            str(state_id)
+            for state_id in State.objects.filter(
+                project_id__in=project_ids,
+                pk__in=[
+                    activity.get("new_identifier")
+                    for activity in activities
+                    if activity.get("field") == "state"
+                    and is_valid_uuid(str(activity.get("new_identifier")))
+                ],
+                group="completed",
+            ).values_list("id", flat=True)
+        }
+
+        self.issue_comments = defaultdict(dict)
+        for issue_comment in IssueComment.objects.filter(
+            id__in=[
+                activity.get("issue_comment")
+                for activity in activities
+                if is_valid_uuid(str(activity.get("issue_comment")))
+            ],
+            issue_id__in=issue_ids,
+            project_id__in=project_ids,
+        ):
+            self.issue_comments[str(issue_comment.issue_id)][str(issue_comment.id)] = (
+                issue_comment
+            )
+
+        # The last activity of the issues for the description mentions
+        self.last_activities = {
+            str(activity.issue_id): activity
+            for activity in IssueActivity.objects.filter(issue_id__in=issue_ids)
+            .order_by("issue_id", "-created_at")
+            .distinct("issue_id")
+        }
+
+    def get_mention_subscribers(self, project, issue, mentions):
+        """
+        The mentioned project members to add as subscribers, the users that get
+        the issue notifications as a subscriber, an assignee or the creator of
+        the issue are not added again
+        """
+        subscribed = {
+            str(user_id)
+            for user_id in self.subscribers[str(issue.id)]
+            | self.assignees[str(issue.id)]
+            | {issue.created_by_id}
+        }
+        members = {
+            str(member_id) for member_id in self.project_members[str(project.id)]
+        }
+        return [
+            mention
+            for mention in {str(mention) for mention in mentions}
+            if mention in members and mention not in subscribed
+        ]
+
+    def add(self, project, issue_id, subscriber_ids, notifications, email_logs):
+        """Add the rows created by the notifications of an event"""
+        subscribers = self.subscribers[str(issue_id)]
+        for subscriber_id in subscriber_ids:
+            subscriber_id = uuid.UUID(str(subscriber_id))
+            if subscriber_id in subscribers:
+                continue
+            # The next events of the issue notify the new subscribers
+            subscribers.add(subscriber_id)
+            self.subscribers_created.append(
+                IssueSubscriber(
+                    workspace_id=project.workspace_id,
+                    project_id=project.id,
+                    issue_id=issue_id,
+                    subscriber_id=subscriber_id,
+                )
+            )
+        self.notifications.extend(notifications)
+        self.email_logs.extend(email_logs)
+
+    def save(self):
+        IssueSubscriber.objects.bulk_create(
+            self.subscribers_created, batch_size=100, ignore_conflicts=True
+        )
+        Notification.objects.bulk_create(self.notifications, batch_size=100)
+        EmailNotificationLog.objects.bulk_create(
+            self.email_logs, batch_size=100, ignore_conflicts=True
+        )
+
+
+def create_issue_notifications(
+    batch,
     type,
     issue_id,
     project_id,
@@ -218,27 +387,15 @@ def notifications(
     requested_data,
     current_instance,
 ):
+    """Create the notifications of an event of the batch, written by the batch"""
     try:
-        issue_activities_created = (
-            json.loads(issue_activities_created)
-            if issue_activities_created is not None
-            else None
-        )
-        if type not in [
-            "cycle.activity.created",
-            "cycle.activity.deleted",
-            "module.activity.created",
-            "module.activity.deleted",
-            "issue_reaction.activity.created",
-            "issue_reaction.activity.deleted",
-            "comment_reaction.activity.created",
-            "comment_reaction.activity.deleted",
-            "issue_vote.activity.created",
-            "issue_vote.activity.deleted",
-            "issue_draft.activity.created",
-            "issue_draft.activity.updated",
-            "issue_draft.activity.deleted",
-        ]:
+        if type not in SKIPPED_NOTIFICATION_ACTIVITIES:
+            issue = batch.issues.get(str(issue_id))
+            project = batch.projects.get(str(project_id))
+            actor = batch.actors.get(str(actor_id))
+            if issue is None or project is None or actor is None:
+                return
+
             # Create Notifications
             bulk_notifications = []
             bulk_email_logs = []
@@ -250,16 +407,14 @@ def notifications(
             """
 
             # get the list of active project members
-            project_members = ProjectMember.objects.filter(
-                project_id=project_id, is_active=True
-            ).values_list("member_id", flat=True)
+            project_member_ids = batch.project_members[str(project_id)]
 
             # Get new mentions from the newer instance
             new_mentions = get_new_mentions(
                 requested_instance=requested_data, current_instance=current_instance
             )
             new_mentions = list(
-                set(new_mentions) & {str(member) for member in project_members}
+                set(new_mentions) & {str(member) for member in project_member_ids}
             )
             removed_mention = get_removed_mentions(
                 requested_instance=requested_data, current_instance=current_instance
@@ -270,8 +425,8 @@ def notifications(
 
             # Get New Subscribers from the mentions of the newer instance
             requested_mentions = extract_mentions(issue_instance=requested_data)
-            mention_subscribers = extract_mentions_as_subscribers(
-                project_id=project_id, issue_id=issue_id, mentions=requested_mentions
+            mention_subscribers = batch.get_mention_subscribers(
+                project=project, issue=issue, mentions=requested_mentions
             )
 
             for issue_activity in issue_activities_created:
@@ -294,11 +449,11 @@ def notifications(
                     comment_mentions = [
                         mention
                         for mention in comment_mentions
-                        if UUID(mention) in set(project_members)
+                        if UUID(mention) in project_member_ids
                     ]
 
-            comment_mention_subscribers = extract_mentions_as_subscribers(
-                project_id=project_id, issue_id=issue_id, mentions=all_comment_mentions
+            comment_mention_subscribers = batch.get_mention_subscribers(
+                project=project, issue=issue, mentions=all_comment_mentions
             )
             """
             We will not send subscription activity notification to the below mentioned user sets
@@ -308,38 +463,30 @@ def notifications(
             """
 
             # ----------------------------------------------------------------------------------------------------------------------------------------------------------------------------- #
-            issue_subscribers = list(
-                IssueSubscriber.objects.filter(
-                    project_id=project_id,
-                    issue_id=issue_id,
-                    subscriber__in=Subquery(project_members),
-                )
-                .exclude(
-                    subscriber_id__in=list(new_mentions + comment_mentions + [actor_id])
-                )
-                .values_list("subscriber", flat=True)
-            )
-
-            issue = Issue.objects.filter(pk=issue_id).first()
-
-            if subscriber:
-                # add the user to issue subscriber
-                try:
-                    _ = IssueSubscriber.objects.get_or_create(
-                        project_id=project_id, issue_id=issue_id, subscriber_id=actor_id
-                    )
-                except Exception:
-                    pass
-
-            project = Project.objects.get(pk=project_id)
-
-            issue_assignees = IssueAssignee.objects.filter(
-                issue_id=issue_id,
-                project_id=project_id,
-                assignee__in=Subquery(project_members),
-            ).values_list("assignee", flat=True)
-
-            issue_subscribers = list(set(issue_subscribers) - {uuid.UUID(actor_id)})
+            excluded_subscribers = {
+                str(user_id) for user_id in new_mentions + comment_mentions + [actor_id]
+            }
+            issue_subscribers = [
+                subscriber_id
+                for subscriber_id in batch.subscribers[str(issue_id)]
+                if subscriber_id in project_member_ids
+                and str(subscriber_id) not in excluded_subscribers
+            ]
+
+            # add the user to issue subscriber
+            new_subscriber_ids = [actor_id] if subscriber else []
+
+            issue_assignees = {
+                assignee_id
+                for assignee_id in batch.assignees[str(issue_id)]
+                if assignee_id in project_member_ids
+            }
+
+            # The preferences of the recipients, the completed states and the
+            # comments of the activities are fetched once for the batch
+            preferences = batch.preferences
+            completed_state_ids = batch.completed_state_ids
+            issue_comments = batch.issue_comments[str(issue_id)]
 
             for subscriber in issue_subscribers:
                 if issue.created_by_id and issue.created_by_id == subscriber:
@@ -352,7 +499,9 @@ def notifications(
                 else:
                     sender = "in_app:issue_activities:subscribed"
 
-                preference = UserNotificationPreference.objects.get(user_id=subscriber)
+                preference = preferences.get(str(subscriber))
+                if preference is None:
+                    continue
 
                 for issue_activity in issue_activities_created:
                     # If activity done in blocking then blocked by email should not go
@@ -373,11 +522,8 @@ def notifications(
                     elif (
                         issue_activity.get("field") == "state"
                         and preference.issue_completed
-                        and State.objects.filter(
-                            project_id=project_id,
-                            pk=issue_activity.get("new_identifier"),
-                            group="completed",
-                        ).exists()
+                        and str(issue_activity.get("new_identifier"))
+                        in completed_state_ids
                     ):
                         send_email = True
                     elif (
@@ -390,15 +536,8 @@ def notifications(
                         send_email = False
 
                     # If activity is of issue comment fetch the comment
-                    issue_comment = (
-                        IssueComment.objects.filter(
-                            id=issue_activity.get("issue_comment"),
-                            issue_id=issue_id,
-                            project_id=project_id,
-                            workspace_id=project.workspace_id,
-                        ).first()
-                        if issue_activity.get("issue_comment")
-                        else None
+                    issue_comment = issue_comments.get(
+                        str(issue_activity.get("issue_comment"))
                     )
 
                     # Create in app notification
@@ -505,25 +644,15 @@ def notifications(
             # ----------------------------------------------------------------------------------------------------------------- #
 
             # Add Mentioned as Issue Subscribers
-            IssueSubscriber.objects.bulk_create(
-                mention_subscribers + comment_mention_subscribers,
-                batch_size=100,
-                ignore_conflicts=True,
-            )
+            new_subscriber_ids.extend(mention_subscribers + comment_mention_subscribers)
 
-            last_activity = (
-                IssueActivity.objects.filter(issue_id=issue_id)
-                .order_by("-created_at")
-                .first()
-            )
-
-            actor = User.objects.get(pk=actor_id)
+            last_activity = batch.last_activities.get(str(issue_id))
 
             for mention_id in comment_mentions:
                 if mention_id != actor_id:
-                    preference = UserNotificationPreference.objects.get(
-                        user_id=mention_id
-                    )
+                    preference = preferences.get(str(mention_id))
+                    if preference is None:
+                        continue
                     for issue_activity in issue_activities_created:
                         notification = create_mention_notification(
                             project=project,
@@ -594,9 +723,9 @@ def notifications(
 
             for mention_id in new_mentions:
                 if mention_id != actor_id:
-                    preference = UserNotificationPreference.objects.get(
-                        user_id=mention_id
-                    )
+                    preference = preferences.get(str(mention_id))
+                    if preference is None:
+                        continue
                     if (
                         last_activity is not None
                         and last_activity.field == "description"
@@ -770,12 +899,62 @@ def notifications(
                 new_mentions=new_mentions,
                 removed_mention=removed_mention,
             )
-            # Bulk create notifications
-            Notification.objects.bulk_create(bulk_notifications, batch_size=100)
-            EmailNotificationLog.objects.bulk_create(
-                bulk_email_logs, batch_size=100, ignore_conflicts=True
+            # The notifications are created with the ones of the batch
+            batch.add(
+                project=project,
+                issue_id=issue_id,
+                subscriber_ids=new_subscriber_ids,
+                notifications=bulk_notifications,
+                email_logs=bulk_email_logs,
             )
         return
     except Exception as e:
         print(e)
         return
+
+
+@shared_task
+def notifications(
+    type,
+    issue_id,
+    project_id,
+    actor_id,
+    subscriber,
+    issue_activities_created,
+    requested_data,
+    current_instance,
+):
+    batch_notifications(
+        events=[
+            {
+                "type": type,
+                "issue_id": issue_id,
+                "project_id": project_id,
+                "actor_id": actor_id,
+                "subscriber": subscriber,
+                "issue_activities_created": issue_activities_created,
+                "requested_data": requested_data,
+                "current_instance": current_instance,
+            }
+        ]
+    )
+    return
+
+
+@shared_task
+def batch_notifications(events):
+    """Send the notifications of a batch of activities, events take the notifications arguments"""
+    try:
+        batch = NotificationBatch(events)
+    except Exception as e:
+        log_exception(e)
+        return
+
+    for event in batch.events:
+        create_issue_notifications(batch, **event)
+
+    try:
+        batch.save()
+    except Exception as e:
+        log_exception(e)
+    return
@@ -0,0 +1,168 @@
+# Django imports
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Count, Q
+from django.utils import timezone
+
+# Third party imports
+from celery import shared_task
+
+# Module imports
+from plane.db.models import Cycle, Module, ProgressSnapshot
+from plane.utils.exception_logger import log_exception
+from plane.utils.group_count_cache import get_group_count_version
+from plane.utils.progress_snapshot import (
+    ACTIVE_MODULE_STATUSES,
+    get_cycle_analytics,
+    get_cycle_progress,
+    get_module_distribution,
+    module_issues,
+)
+
+
+def active_cycles():
+    now = timezone.now()
+    return Cycle.objects.filter(
+        start_date__lte=now, end_date__gte=now, archived_at__isnull=True
+    )
+
+
+def active_modules():
+    return Module.objects.filter(
+        archived_at__isnull=True, status__in=ACTIVE_MODULE_STATUSES
+    )
+
+
+def save_progress_snapshot(entity, version, data, cycle_id=None, module_id=None):
+    ProgressSnapshot.objects.bulk_create(
+        [
+            ProgressSnapshot(
+                workspace_id=entity.workspace_id,
+                project_id=entity.project_id,
+                cycle_id=cycle_id,
+                module_id=module_id,
+                date=timezone.now().date(),
+                version=version,
+                data=data,
+            )
+        ],
+        update_conflicts=True,
+        unique_fields=["cycle", "date"] if cycle_id else ["module", "date"],
+        update_fields=["version", "data", "updated_at"],
+    )
+
+
+def take_cycle_snapshot(cycle_id):
+    cycle = (
+        active_cycles()
+        .filter(pk=cycle_id)
+        .select_related("workspace")
+        .annotate(
+            total_issues=Count(
+                "issue_cycle__issue__id",
+                distinct=True,
+                filter=Q(
+                    issue_cycle__issue__archived_at__isnull=True,
+                    issue_cycle__issue__is_draft=False,
+                    issue_cycle__issue__deleted_at__isnull=True,
+                    issue_cycle__deleted_at__isnull=True,
+                ),
+            )
+        )
+        .first()
+    )
+    if cycle is None:
+        return
+
+    # The version is read first so the writes made while computing expire it
+    version = get_group_count_version(cycle.project_id)
+    slug = cycle.workspace.slug
+    data = {
+        "progress": get_cycle_progress(slug, cycle.project_id, cycle.id),
+        "analytics": {
+            analytic_type: get_cycle_analytics(
+                slug, cycle.project_id, cycle, analytic_type
+            )
+            for analytic_type in ["issues", "points"]
+        },
+    }
+    save_progress_snapshot(cycle, version, data, cycle_id=cycle.id)
+
+
+def take_module_snapshot(module_id):
+    module = active_modules().filter(pk=module_id).select_related("workspace").first()
+    if module is None:
+        return
+
+    version = get_group_count_version(module.project_id)
+    slug = module.workspace.slug
+    module.total_issues = module_issues(slug, module.project_id, module.id).count()
+    data = get_module_distribution(slug, module.project_id, module)
+    save_progress_snapshot(module, version, data, module_id=module.id)
+
+
+@shared_task
+def refresh_progress_snapshot(cycle_id=None, module_id=None):
+    """Take today's progress snapshot of the cycle or the module if it is active"""
+    try:
+        if cycle_id:
+            take_cycle_snapshot(cycle_id)
+        if module_id:
+            take_module_snapshot(module_id)
+    except Exception as e:
+        log_exception(e)
+        return
+
+
+def queue_progress_snapshot(cycle_id=None, module_id=None):
+    """
+    Queue the refresh of the progress snapshot, the refreshes queued within the
+    debounce are coalesced into one
+    """
+    key = f"progress_snapshot:queued:{cycle_id or module_id}"
+    debounce = settings.PROGRESS_SNAPSHOT_DEBOUNCE
+    try:
+        if cache.add(key, 1, timeout=debounce):
+            refresh_progress_snapshot.apply_async(
+                kwargs={
+                    "cycle_id": str(cycle_id) if cycle_id else None,
+                    "module_id": str(module_id) if module_id else None,
+                },
+                countdown=debounce,
+            )
+    except Exception as e:
+        log_exception(e)
+
+
+def queue_progress_snapshots(project_ids):
+    """Queue the refresh of the snapshots of the active cycles and modules"""
+    if not project_ids:
+        return
+    try:
+        cycle_ids = list(
+            active_cycles()
+            .filter(project_id__in=project_ids)
+            .values_list("id", flat=True)
+        )
+        module_ids = list(
+            active_modules()
+            .filter(project_id__in=project_ids)
+            .values_list("id", flat=True)
+        )
+    except Exception as e:
+        log_exception(e)
+        return
+
+    for cycle_id in cycle_ids:
+        queue_progress_snapshot(cycle_id=cycle_id)
+    for module_id in module_ids:
+        queue_progress_snapshot(module_id=module_id)
+
+
+@shared_task
+def take_progress_snapshots():
+    """Take the daily progress snapshots of all the active cycles and modules"""
+    for cycle_id in active_cycles().values_list("id", flat=True).iterator():
+        refresh_progress_snapshot.delay(cycle_id=str(cycle_id))
+    for module_id in active_modules().values_list("id", flat=True).iterator():
+        refresh_progress_snapshot.delay(module_id=str(module_id))
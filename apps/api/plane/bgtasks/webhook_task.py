@@ -2,9 +2,12 @@ import hashlib
 import hmac
 import json
 import logging
+import os
+import threading
 import uuid
 
 import requests
+from requests.adapters import HTTPAdapter
 from typing import Any, Dict, List, Optional, Union
 
 # Third party imports
@@ -16,6 +19,7 @@ from django.db.models import Prefetch
 from django.core.mail import EmailMultiAlternatives, get_connection
 from django.core.serializers.json import DjangoJSONEncoder
 from django.template.loader import render_to_string
+from django.utils import timezone
 from django.utils.html import strip_tags
 from django.core.exceptions import ObjectDoesNotExist
 
@@ -48,6 +52,7 @@ from plane.db.models import (
 )
 from plane.license.utils.instance_value import get_email_configuration
 from plane.utils.exception_logger import log_exception
+from plane.utils.redis_buffer import bulk_create_buffered, flush_buffer, push_buffer
 
 SERIALIZER_MAPPER = {
     "project": ProjectSerializer,
@@ -76,6 +81,55 @@ MODEL_MAPPER = {
 
 logger = logging.getLogger("plane.worker")
 
+# Redis list the webhook logs are buffered in before the bulk insert
+WEBHOOK_LOG_BUFFER_KEY = "webhook_logs:buffer"
+WEBHOOK_LOG_FLUSH_SIZE = 1000
+
+# Keep alive connections are pooled per destination host
+WEBHOOK_POOL_CONNECTIONS = 50
+WEBHOOK_POOL_MAXSIZE = 10
+
+_webhook_session = None
+_webhook_session_pid = None
+_webhook_session_lock = threading.Lock()
+
+
+def get_webhook_session() -> requests.Session:
+    """
+    Return the process wide session of the webhook deliveries, the session is
+    created again in a forked worker so the sockets are never shared
+    """
+    global _webhook_session, _webhook_session_pid
+    if _webhook_session is None or _webhook_session_pid != os.getpid():
+        with _webhook_session_lock:
+            if _webhook_session is None or _webhook_session_pid != os.getpid():
+                session = requests.Session()
+                adapter = HTTPAdapter(
+                    pool_connections=WEBHOOK_POOL_CONNECTIONS,
+                    pool_maxsize=WEBHOOK_POOL_MAXSIZE,
+                )
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                _webhook_session = session
+                _webhook_session_pid = os.getpid()
+    return _webhook_session
+
+
+def log_webhook_delivery(**log: Any) -> None:
+    """Buffer the webhook log for the bulk insert, written directly if redis fails"""
+    try:
+        # The log keeps the time of the delivery, not the time of the flush
+        push_buffer(
+            WEBHOOK_LOG_BUFFER_KEY, {**log, "created_at": timezone.now().isoformat()}
+        )
+    except Exception as e:
+        log_exception(e)
+        WebhookLog.objects.create(**log)
+
+
+def write_webhook_logs(logs):
+    bulk_create_buffered(WebhookLog, logs, batch_size=WEBHOOK_LOG_FLUSH_SIZE)
+
 
 def get_issue_prefetches():
     return [
@@ -292,10 +346,12 @@ def webhook_send_task(
 
     try:
         # Send the webhook event
-        response = requests.post(webhook.url, headers=headers, json=payload, timeout=30)
+        response = get_webhook_session().post(
+            webhook.url, headers=headers, json=payload, timeout=30
+        )
 
         # Log the webhook request
-        WebhookLog.objects.create(
+        log_webhook_delivery(
             workspace_id=str(webhook.workspace_id),
             webhook=str(webhook.id),
             event_type=str(event),
@@ -305,22 +361,22 @@ def webhook_send_task(
             response_status=str(response.status_code),
             response_headers=str(response.headers),
             response_body=str(response.text),
-            retry_count=str(self.request.retries),
+            retry_count=self.request.retries,
         )
         logger.info(f"Webhook {webhook.id} sent successfully")
     except requests.RequestException as e:
         # Log the failed webhook request
-        WebhookLog.objects.create(
+        log_webhook_delivery(
             workspace_id=str(webhook.workspace_id),
             webhook=str(webhook.id),
             event_type=str(event),
             request_method=str(action),
             request_headers=str(headers),
             request_body=str(payload),
-            response_status=500,
+            response_status="500",
             response_headers="",
             response_body=str(e),
-            retry_count=str(self.request.retries),
+            retry_count=self.request.retries,
         )
         logger.error(f"Webhook {webhook.id} failed with error: {e}")
         # Retry logic
@@ -355,12 +411,14 @@ def webhook_activity(
     event_id: str | uuid.UUID,
     old_identifier: Optional[str],
     new_identifier: Optional[str],
+    changes: Optional[List[Dict[str, Any]]] = None,
 ) -> None:
     """
     Process and send webhook notifications for various activities in the system.
 
     This task filters relevant webhooks based on the event type and sends notifications
-    to all active webhooks for the workspace.
+    to all active webhooks for the workspace. The event data and the actor are
+    serialized once and shared by all the deliveries.
 
     Args:
         event (str): Type of event (project, issue, module, cycle, issue_comment)
@@ -374,6 +432,9 @@ def webhook_activity(
         event_id (str | uuid.UUID): ID of the event object
         old_identifier (Optional[str]): Previous identifier if any
         new_identifier (Optional[str]): New identifier if any
+        changes (Optional[List[Dict[str, Any]]]): All the fields changed by one
+            update, sent in a single delivery. field, old_value and new_value are
+            kept for backwards compatibility and mirror the first change
 
     Returns:
         None
@@ -400,26 +461,36 @@ def webhook_activity(
         if event == "issue_comment":
             webhooks = webhooks.filter(issue_comment=True)
 
-        for webhook in webhooks:
+        webhook_ids = list(webhooks.values_list("id", flat=True))
+        if not webhook_ids:
+            return
+
+        # Serialize the payload once for all the webhooks
+        event_data = (
+            {"id": event_id}
+            if verb == "deleted"
+            else get_model_data(event=event, event_id=event_id)
+        )
+        activity = {
+            "field": field,
+            "new_value": new_value,
+            "old_value": old_value,
+            "actor": get_model_data(event="user", event_id=actor_id),
+            "old_identifier": old_identifier,
+            "new_identifier": new_identifier,
+        }
+        if changes:
+            activity["changes"] = changes
+
+        for webhook_id in webhook_ids:
             webhook_send_task.delay(
-                webhook_id=webhook.id,
+                webhook_id=webhook_id,
                 slug=slug,
                 event=event,
-                event_data=(
-                    {"id": event_id}
-                    if verb == "deleted"
-                    else get_model_data(event=event, event_id=event_id)
-                ),
+                event_data=event_data,
                 action=verb,
                 current_site=current_site,
-                activity={
-                    "field": field,
-                    "new_value": new_value,
-                    "old_value": old_value,
-                    "actor": get_model_data(event="user", event_id=actor_id),
-                    "old_identifier": old_identifier,
-                    "new_identifier": new_identifier,
-                },
+                activity=activity,
             )
         return
     except Exception as e:
@@ -458,25 +529,50 @@ def model_activity(
         json.loads(current_instance) if current_instance is not None else None
     )
 
-    # Loop through all keys in requested data and check the current value and requested value
+    # Loop through all keys in requested data and collect the changed values
+    changes = []
     for key in requested_data:
         # Check if key is present in current instance or not
         if key in current_instance:
             current_value = current_instance.get(key, None)
             requested_value = requested_data.get(key, None)
             if current_value != requested_value:
-                webhook_activity.delay(
-                    event=model_name,
-                    verb="updated",
-                    field=key,
-                    old_value=current_value,
-                    new_value=requested_value,
-                    actor_id=actor_id,
-                    slug=slug,
-                    current_site=origin,
-                    event_id=model_id,
-                    old_identifier=None,
-                    new_identifier=None,
+                changes.append(
+                    {
+                        "field": key,
+                        "old_value": current_value,
+                        "new_value": requested_value,
+                    }
                 )
 
+    if not changes:
+        return
+
+    # Send all the changes of the update in one delivery, field, old_value and
+    # new_value mirror the first change for the consumers reading a single field
+    webhook_activity.delay(
+        event=model_name,
+        verb="updated",
+        field=changes[0]["field"],
+        old_value=changes[0]["old_value"],
+        new_value=changes[0]["new_value"],
+        actor_id=actor_id,
+        slug=slug,
+        current_site=origin,
+        event_id=model_id,
+        old_identifier=None,
+        new_identifier=None,
+        changes=changes,
+    )
+
     return
+
+
+@shared_task
+def flush_webhook_logs() -> None:
+    """Write the buffered webhook logs in bulk"""
+    try:
+        flush_buffer(WEBHOOK_LOG_BUFFER_KEY, WEBHOOK_LOG_FLUSH_SIZE, write_webhook_logs)
+    except Exception as e:
+        log_exception(e)
+        return
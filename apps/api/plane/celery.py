@@ -8,14 +8,9 @@ from pythonjsonlogger.jsonlogger import JsonFormatter
 from celery.signals import after_setup_logger, after_setup_task_logger
 from celery.schedules import crontab
 
-# Module imports
-from plane.settings.redis import redis_instance
-
 # Set the default Django settings module for the 'celery' program.
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "plane.settings.production")
 
-ri = redis_instance()
-
 app = Celery("plane")
 
 # Using a string here means the worker will not have to
@@ -32,6 +27,22 @@ app.conf.beat_schedule = {
         "task": "plane.license.bgtasks.tracer.instance_traces",
         "schedule": crontab(hour="*/6", minute=0),  # Every 6 hours
     },
+    "check-every-minute-to-flush-webhook-logs": {
+        "task": "plane.bgtasks.webhook_task.flush_webhook_logs",
+        "schedule": crontab(minute="*"),  # Every minute
+    },
+    "check-every-minute-to-flush-api-token-last-used": {
+        "task": "plane.bgtasks.api_token_task.flush_api_token_last_used",
+        "schedule": crontab(minute="*"),  # Every minute
+    },
+    "check-every-minute-to-flush-api-activity-logs": {
+        "task": "plane.bgtasks.api_log_task.flush_api_activity_logs",
+        "schedule": crontab(minute="*"),  # Every minute
+    },
+    "check-every-minute-to-refresh-issue-rollups": {
+        "task": "plane.bgtasks.analytics_rollup_task.refresh_changed_issue_rollups",
+        "schedule": crontab(minute="*"),  # Every minute
+    },
     # Occurs once every day
     "check-every-day-to-delete-hard-delete": {
         "task": "plane.bgtasks.deletion_task.hard_delete",
@@ -65,6 +76,10 @@ app.conf.beat_schedule = {
         "task": "plane.bgtasks.cleanup_task.delete_issue_description_versions",
         "schedule": crontab(hour=4, minute=0),  # UTC 04:00
     },
+    "check-every-day-to-take-progress-snapshots": {
+        "task": "plane.bgtasks.progress_snapshot_task.take_progress_snapshots",
+        "schedule": crontab(hour=0, minute=5),  # UTC 00:05
+    },
 }
 
 
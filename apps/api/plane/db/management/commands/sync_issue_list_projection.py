@@ -0,0 +1,21 @@
+# Django imports
+from django.core.management.base import BaseCommand
+
+# Module imports
+from plane.bgtasks.issue_list_projection_task import schedule_issue_list_projection
+
+
+class Command(BaseCommand):
+    help = "Creates IssueListProjection records for existing Issues in batches"
+
+    def handle(self, *args, **options):
+        batch_size = input("Enter the batch size: ")
+        batch_countdown = input("Enter the batch countdown: ")
+
+        schedule_issue_list_projection.delay(
+            batch_size=batch_size, countdown=int(batch_countdown)
+        )
+
+        self.stdout.write(
+            self.style.SUCCESS("Successfully created issue list projection task")
+        )
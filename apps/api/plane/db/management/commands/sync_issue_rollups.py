@@ -0,0 +1,19 @@
+# Django imports
+from django.core.management.base import BaseCommand
+
+# Module imports
+from plane.bgtasks.analytics_rollup_task import schedule_issue_rollups
+
+
+class Command(BaseCommand):
+    help = "Creates the IssueRollup records of the existing projects in batches"
+
+    def handle(self, *args, **options):
+        batch_size = input("Enter the batch size (projects): ")
+        batch_countdown = input("Enter the batch countdown: ")
+
+        schedule_issue_rollups.delay(
+            batch_size=batch_size, countdown=int(batch_countdown)
+        )
+
+        self.stdout.write(self.style.SUCCESS("Successfully created issue rollups task"))
@@ -0,0 +1,23 @@
+# Generated by Django 4.2.24 on 2026-10-17 18:01
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('db', '0105_issuelistprojection'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='exporterhistory',
+            name='exported_issues',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='exporterhistory',
+            name='total_issues',
+            field=models.PositiveIntegerField(default=0),
+        ),
+    ]
@@ -0,0 +1,36 @@
+from django.db import migrations
+
+# Weighted search vectors of the rows, indexed as expressions so the tables are
+# neither altered nor rewritten. The expressions must stay equal to the ones of
+# plane.utils.full_text_search for the planner to use the indexes
+SEARCH_VECTORS = {
+    "issues": ("name", "description_stripped"),
+    "pages": ("name", "description_stripped"),
+    "cycles": ("name", "description"),
+    "modules": ("name", "description"),
+}
+
+
+def add_search_vector_index(table, title, description):
+    # The index is built concurrently, the writes of the table are not blocked
+    return migrations.RunSQL(
+        sql=f"""
+        CREATE INDEX CONCURRENTLY IF NOT EXISTS {table}_search_vector_idx
+        ON {table} USING GIN ((
+            setweight(to_tsvector('simple'::regconfig, coalesce({title}, '')), 'A') ||
+            setweight(to_tsvector('simple'::regconfig, coalesce({description}, '')), 'B')
+        ));
+        """,
+        reverse_sql=f"DROP INDEX CONCURRENTLY IF EXISTS {table}_search_vector_idx;",
+    )
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [("db", "0106_exporterhistory_progress")]
+
+    operations = [
+        add_search_vector_index(table, title, description)
+        for table, (title, description) in SEARCH_VECTORS.items()
+    ]
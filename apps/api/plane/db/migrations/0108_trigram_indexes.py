@@ -0,0 +1,40 @@
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+# Trigram indexes serving the similarity operators of the typeahead searches
+TRIGRAM_INDEXES = {
+    "workspaces": ("name",),
+    "projects": ("name", "identifier"),
+    "issues": ("name",),
+    "cycles": ("name",),
+    "modules": ("name",),
+    "pages": ("name",),
+    "issue_views": ("name",),
+    "users": ("first_name", "last_name", "display_name"),
+}
+
+
+def add_trigram_index(table, column):
+    # The index is built concurrently, the writes of the table are not blocked
+    return migrations.RunSQL(
+        sql=f"""
+        CREATE INDEX CONCURRENTLY IF NOT EXISTS {table}_{column}_trgm_idx
+        ON {table} USING GIN ({column} gin_trgm_ops);
+        """,
+        reverse_sql=f"DROP INDEX CONCURRENTLY IF EXISTS {table}_{column}_trgm_idx;",
+    )
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [("db", "0107_search_vectors")]
+
+    operations = [
+        TrigramExtension(),
+        *[
+            add_trigram_index(table, column)
+            for table, columns in TRIGRAM_INDEXES.items()
+            for column in columns
+        ],
+    ]
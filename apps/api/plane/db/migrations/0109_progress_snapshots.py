@@ -0,0 +1,49 @@
+# Generated by Django 4.2.24 on 2026-10-17 18:18
+
+from django.conf import settings
+import django.core.serializers.json
+from django.db import migrations, models
+import django.db.models.deletion
+import uuid
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('db', '0108_trigram_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProgressSnapshot',
+            fields=[
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Created At')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='Last Modified At')),
+                ('deleted_at', models.DateTimeField(blank=True, null=True, verbose_name='Deleted At')),
+                ('id', models.UUIDField(db_index=True, default=uuid.uuid4, editable=False, primary_key=True, serialize=False, unique=True)),
+                ('date', models.DateField()),
+                ('version', models.BigIntegerField(default=0)),
+                ('data', models.JSONField(default=dict, encoder=django.core.serializers.json.DjangoJSONEncoder)),
+                ('created_by', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='%(class)s_created_by', to=settings.AUTH_USER_MODEL, verbose_name='Created By')),
+                ('cycle', models.ForeignKey(null=True, on_delete=django.db.models.deletion.CASCADE, related_name='progress_snapshots', to='db.cycle')),
+                ('module', models.ForeignKey(null=True, on_delete=django.db.models.deletion.CASCADE, related_name='progress_snapshots', to='db.module')),
+                ('project', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='project_%(class)s', to='db.project')),
+                ('updated_by', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='%(class)s_updated_by', to=settings.AUTH_USER_MODEL, verbose_name='Last Modified By')),
+                ('workspace', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='workspace_%(class)s', to='db.workspace')),
+            ],
+            options={
+                'verbose_name': 'Progress Snapshot',
+                'verbose_name_plural': 'Progress Snapshots',
+                'db_table': 'progress_snapshots',
+                'ordering': ('-date',),
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='progresssnapshot',
+            constraint=models.UniqueConstraint(fields=('cycle', 'date'), name='progress_snapshot_unique_cycle_date'),
+        ),
+        migrations.AddConstraint(
+            model_name='progresssnapshot',
+            constraint=models.UniqueConstraint(fields=('module', 'date'), name='progress_snapshot_unique_module_date'),
+        ),
+    ]
@@ -0,0 +1,71 @@
+# Generated by Django 4.2.24 on 2026-10-17 18:22
+
+from django.conf import settings
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+import django.db.models.deletion
+import uuid
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ('db', '0109_progress_snapshots'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='IssueRollup',
+            fields=[
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Created At')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='Last Modified At')),
+                ('deleted_at', models.DateTimeField(blank=True, null=True, verbose_name='Deleted At')),
+                ('id', models.UUIDField(db_index=True, default=uuid.uuid4, editable=False, primary_key=True, serialize=False, unique=True)),
+                ('date', models.DateField()),
+                ('state_group', models.CharField(max_length=20)),
+                ('priority', models.CharField(max_length=30)),
+                ('dimension', models.CharField(blank=True, default='', max_length=20)),
+                ('dimension_id', models.UUIDField(null=True)),
+                ('issue_count', models.IntegerField(default=0)),
+            ],
+            options={
+                'verbose_name': 'Issue Rollup',
+                'verbose_name_plural': 'Issue Rollups',
+                'db_table': 'issue_rollups',
+                'ordering': ('-date',),
+            },
+        ),
+        AddIndexConcurrently(
+            model_name='issue',
+            index=models.Index(fields=['updated_at'], name='issue_updated_at_idx'),
+        ),
+        migrations.AddField(
+            model_name='issuerollup',
+            name='created_by',
+            field=models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='%(class)s_created_by', to=settings.AUTH_USER_MODEL, verbose_name='Created By'),
+        ),
+        migrations.AddField(
+            model_name='issuerollup',
+            name='project',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='project_%(class)s', to='db.project'),
+        ),
+        migrations.AddField(
+            model_name='issuerollup',
+            name='updated_by',
+            field=models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='%(class)s_updated_by', to=settings.AUTH_USER_MODEL, verbose_name='Last Modified By'),
+        ),
+        migrations.AddField(
+            model_name='issuerollup',
+            name='workspace',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='workspace_%(class)s', to='db.workspace'),
+        ),
+        migrations.AddIndex(
+            model_name='issuerollup',
+            index=models.Index(fields=['project', 'date'], name='issue_rollup_project_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='issuerollup',
+            index=models.Index(fields=['workspace', 'dimension', 'date'], name='issue_rollup_dimension_idx'),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 4.2.24 on 2026-10-17 19:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('db', '0110_issue_rollups'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='emailnotificationlog',
+            name='processing_at',
+            field=models.DateTimeField(null=True),
+        ),
+        migrations.AddField(
+            model_name='emailnotificationlog',
+            name='send_attempts',
+            field=models.PositiveSmallIntegerField(default=0),
+        ),
+    ]
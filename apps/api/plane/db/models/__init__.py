@@ -1,4 +1,4 @@
-from .analytic import AnalyticView
+from .analytic import AnalyticView, IssueRollup, ProgressSnapshot
 from .api import APIActivityLog, APIToken
 from .asset import FileAsset
 from .base import BaseModel
@@ -42,6 +42,7 @@ from .issue import (
     IssueVote,
     IssueVersion,
     IssueDescriptionVersion,
+    IssueListProjection,
 )
 from .module import Module, ModuleIssue, ModuleLink, ModuleMember, ModuleUserProperties
 from .notification import EmailNotificationLog, Notification, UserNotificationPreference
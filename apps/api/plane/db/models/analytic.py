@@ -1,7 +1,9 @@
 # Django models
+from django.core.serializers.json import DjangoJSONEncoder
 from django.db import models
 
 from .base import BaseModel
+from .project import ProjectBaseModel
 
 
 class AnalyticView(BaseModel):
@@ -22,3 +24,75 @@ class AnalyticView(BaseModel):
     def __str__(self):
         """Return name of the analytic view"""
         return f"{self.name} <{self.workspace.name}>"
+
+
+class ProgressSnapshot(ProjectBaseModel):
+    """
+    Daily progress of an active cycle or module, the issues and the estimate
+    points by state group, assignee and label served by the analytics endpoints
+    """
+
+    cycle = models.ForeignKey(
+        "db.Cycle",
+        on_delete=models.CASCADE,
+        related_name="progress_snapshots",
+        null=True,
+    )
+    module = models.ForeignKey(
+        "db.Module",
+        on_delete=models.CASCADE,
+        related_name="progress_snapshots",
+        null=True,
+    )
+    date = models.DateField()
+    # Group count version of the project the snapshot was computed at
+    version = models.BigIntegerField(default=0)
+    data = models.JSONField(default=dict, encoder=DjangoJSONEncoder)
+
+    class Meta:
+        verbose_name = "Progress Snapshot"
+        verbose_name_plural = "Progress Snapshots"
+        db_table = "progress_snapshots"
+        ordering = ("-date",)
+        constraints = [
+            models.UniqueConstraint(
+                fields=["cycle", "date"], name="progress_snapshot_unique_cycle_date"
+            ),
+            models.UniqueConstraint(
+                fields=["module", "date"], name="progress_snapshot_unique_module_date"
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.cycle_id or self.module_id} <{self.date}>"
+
+
+class IssueRollup(ProjectBaseModel):
+    """
+    Daily counts of the issues of a project by their creation date, state group
+    and priority, with one rollup per assignee, label, cycle and module
+    """
+
+    date = models.DateField()
+    state_group = models.CharField(max_length=20)
+    priority = models.CharField(max_length=30)
+    # The multi valued dimension of the rollup, empty for the issue totals
+    dimension = models.CharField(max_length=20, blank=True, default="")
+    dimension_id = models.UUIDField(null=True)
+    issue_count = models.IntegerField(default=0)
+
+    class Meta:
+        verbose_name = "Issue Rollup"
+        verbose_name_plural = "Issue Rollups"
+        db_table = "issue_rollups"
+        ordering = ("-date",)
+        indexes = [
+            models.Index(fields=["project", "date"], name="issue_rollup_project_idx"),
+            models.Index(
+                fields=["workspace", "dimension", "date"],
+                name="issue_rollup_dimension_idx",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.project_id} <{self.date}>"
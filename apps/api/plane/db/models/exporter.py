@@ -57,6 +57,9 @@ class ExporterHistory(BaseModel):
     )
     filters = models.JSONField(blank=True, null=True)
     rich_filters = models.JSONField(default=dict, blank=True, null=True)
+    # Progress of the export
+    total_issues = models.PositiveIntegerField(default=0)
+    exported_issues = models.PositiveIntegerField(default=0)
 
     class Meta:
         verbose_name = "Exporter"
@@ -178,6 +178,10 @@ class Issue(ProjectBaseModel):
         verbose_name_plural = "Issues"
         db_table = "issues"
         ordering = ("-created_at",)
+        indexes = [
+            # The analytics rollups are refreshed from the updated issues
+            models.Index(fields=["updated_at"], name="issue_updated_at_idx")
+        ]
 
     def save(self, *args, **kwargs):
         if self.state is None:
@@ -836,3 +840,30 @@ class IssueDescriptionVersion(ProjectBaseModel):
         except Exception as e:
             log_exception(e)
             return False
+
+
+class IssueListProjection(ProjectBaseModel):
+    """
+    Precomputed values of the issue list rows, maintained on the issue writes
+    so the list endpoints do not rebuild the subqueries on every request
+    """
+
+    issue = models.OneToOneField(
+        "db.Issue", on_delete=models.CASCADE, related_name="list_projection"
+    )
+    cycle_id = models.UUIDField(null=True, blank=True)
+    link_count = models.PositiveIntegerField(default=0)
+    attachment_count = models.PositiveIntegerField(default=0)
+    sub_issues_count = models.PositiveIntegerField(default=0)
+    label_ids = ArrayField(models.UUIDField(), blank=True, default=list)
+    assignee_ids = ArrayField(models.UUIDField(), blank=True, default=list)
+    module_ids = ArrayField(models.UUIDField(), blank=True, default=list)
+
+    class Meta:
+        verbose_name = "Issue List Projection"
+        verbose_name_plural = "Issue List Projections"
+        db_table = "issue_list_projections"
+        ordering = ("-created_at",)
+
+    def __str__(self):
+        return str(self.issue_id)
@@ -122,6 +122,9 @@ class EmailNotificationLog(BaseModel):
     # sent at
     processed_at = models.DateTimeField(null=True)
     sent_at = models.DateTimeField(null=True)
+    # claimed by a digest task and the failed sends
+    processing_at = models.DateTimeField(null=True)
+    send_attempts = models.PositiveSmallIntegerField(default=0)
     entity = models.CharField(max_length=200)
     old_value = models.CharField(max_length=300, blank=True, null=True)
     new_value = models.CharField(max_length=300, blank=True, null=True)
@@ -2,8 +2,12 @@
 import string
 
 # Django imports
-from django.contrib.sessions.backends.db import SessionStore as DBSessionStore
+from django.contrib.sessions.backends.cached_db import (
+    SessionStore as CachedDBSessionStore,
+)
 from django.contrib.sessions.base_session import AbstractBaseSession
+from django.conf import settings
+from django.core.cache import caches
 from django.db import models
 from django.utils.crypto import get_random_string
 
@@ -23,20 +27,36 @@ class Session(AbstractBaseSession):
         db_table = "sessions"
 
 
-class SessionStore(DBSessionStore):
+class SessionStore(CachedDBSessionStore):
+    """
+    Write through session store, the sessions are saved in the database for
+    auditing and read from the cache
+    """
+
     @classmethod
     def get_model_class(cls):
         return Session
 
+    @classmethod
+    def delete_user_sessions(cls, user_id):
+        """Delete the sessions of the user from the database and the cache"""
+        session_keys = list(
+            Session.objects.filter(user_id=user_id).values_list(
+                "session_key", flat=True
+            )
+        )
+        caches[settings.SESSION_CACHE_ALIAS].delete_many(
+            [cls.cache_key_prefix + session_key for session_key in session_keys]
+        )
+        Session.objects.filter(session_key__in=session_keys).delete()
+
     def _get_new_session_key(self):
         """
-        Return a new session key that is not present in the current backend.
-        Override this method to use a custom session key generation mechanism.
+        Return a new random session key. The keys have 128 random characters so
+        the collisions are not checked upfront, the create raises an error and
+        retries with a new key on the unlikely collision
         """
-        while True:
-            session_key = get_random_string(128, VALID_KEY_CHARS)
-            if not self.exists(session_key):
-                return session_key
+        return get_random_string(128, VALID_KEY_CHARS)
 
     def create_model_instance(self, data):
         obj = super().create_model_instance(data)
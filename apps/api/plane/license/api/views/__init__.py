@@ -1,4 +1,8 @@
-from .instance import InstanceEndpoint, SignUpScreenVisitedEndpoint
+from .instance import (
+    InstanceEndpoint,
+    InstanceRedisPoolEndpoint,
+    SignUpScreenVisitedEndpoint,
+)
 
 
 from .configuration import (
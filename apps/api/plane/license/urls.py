@@ -8,6 +8,7 @@ from plane.license.api.views import (
     InstanceConfigurationEndpoint,
     DisableEmailFeatureEndpoint,
     InstanceEndpoint,
+    InstanceRedisPoolEndpoint,
     SignUpScreenVisitedEndpoint,
     InstanceAdminUserMeEndpoint,
     InstanceAdminSignOutEndpoint,
@@ -67,4 +68,7 @@ urlpatterns = [
         name="instance-workspace-availability",
     ),
     path("workspaces/", InstanceWorkSpaceEndpoint.as_view(), name="instance-workspace"),
+    path(
+        "redis-pool/", InstanceRedisPoolEndpoint.as_view(), name="instance-redis-pool"
+    ),
 ]
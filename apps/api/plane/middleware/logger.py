@@ -1,8 +1,11 @@
 # Python imports
+import ipaddress
 import logging
+import random
 import time
 
 # Django imports
+from django.conf import settings
 from django.http import HttpRequest
 
 # Third party imports
@@ -10,12 +13,20 @@ from rest_framework.request import Request
 
 # Module imports
 from plane.utils.ip_address import get_client_ip
-from plane.db.models import APIActivityLog
+from plane.bgtasks.api_log_task import log_api_activity
 
 
 api_logger = logging.getLogger("plane.api.request")
 
 
+def is_valid_ip(ip_address):
+    try:
+        ipaddress.ip_address(ip_address)
+        return True
+    except ValueError:
+        return False
+
+
 class RequestLoggerMiddleware:
     def __init__(self, get_response):
         self.get_response = get_response
@@ -77,12 +88,33 @@ class APITokenLogMiddleware:
     def __init__(self, get_response):
         self.get_response = get_response
 
+    api_key_header = "X-Api-Key"
+
     def __call__(self, request):
-        request_body = request.body
+        # Only the api key requests are logged, their body is read before the
+        # view consumes the stream
+        request_body = None
+        if (
+            request.headers.get(self.api_key_header)
+            and settings.API_ACTIVITY_LOG_BODY_LIMIT
+        ):
+            request_body = request.body
         response = self.get_response(request)
         self.process_request(request, response, request_body)
         return response
 
+    def _truncate(self, content):
+        """Truncate the logged body to the configured limit"""
+        if content is None or not settings.API_ACTIVITY_LOG_BODY_LIMIT:
+            return None
+        return content[: settings.API_ACTIVITY_LOG_BODY_LIMIT]
+
+    def _should_log(self, response):
+        # The errors are always logged, the other requests are sampled
+        if response.status_code >= 400:
+            return True
+        return random.random() < settings.API_ACTIVITY_LOG_SAMPLE_RATE
+
     def _safe_decode_body(self, content):
         """
         Safely decodes request/response body content, handling binary data.
@@ -110,28 +142,35 @@ class APITokenLogMiddleware:
             return "[Could not decode content]"
 
     def process_request(self, request, response, request_body):
-        api_key_header = "X-Api-Key"
-        api_key = request.headers.get(api_key_header)
+        api_key = request.headers.get(self.api_key_header)
         # If the API key is present, log the request
-        if api_key:
+        if api_key and self._should_log(response):
             try:
-                APIActivityLog.objects.create(
-                    token_identifier=api_key,
-                    path=request.path,
-                    method=request.method,
+                # The streamed responses have no content to log
+                response_content = getattr(response, "content", None)
+                ip_address = get_client_ip(request=request)
+                user_agent = request.META.get("HTTP_USER_AGENT", None)
+                # The logs are inserted in batches, the values are fitted to the
+                # columns so a single request can not fail the batch
+                log_api_activity(
+                    token_identifier=api_key[:255],
+                    path=request.path[:255],
+                    method=request.method[:10],
                     query_params=request.META.get("QUERY_STRING", ""),
                     headers=str(request.headers),
                     body=(
-                        self._safe_decode_body(request_body) if request_body else None
+                        self._truncate(self._safe_decode_body(request_body))
+                        if request_body
+                        else None
                     ),
                     response_body=(
-                        self._safe_decode_body(response.content)
-                        if response.content
+                        self._truncate(self._safe_decode_body(response_content))
+                        if response_content
                         else None
                     ),
                     response_code=response.status_code,
-                    ip_address=get_client_ip(request=request),
-                    user_agent=request.META.get("HTTP_USER_AGENT", None),
+                    ip_address=ip_address if is_valid_ip(ip_address) else None,
+                    user_agent=user_agent[:512] if user_agent else None,
                 )
 
             except Exception as e:
@@ -2,6 +2,7 @@
 
 # Python imports
 import os
+import ssl
 from urllib.parse import urlparse
 from urllib.parse import urljoin
 
@@ -33,6 +34,7 @@ INSTALLED_APPS = [
     "django.contrib.auth",
     "django.contrib.contenttypes",
     "django.contrib.sessions",
+    "django.contrib.postgres",
     # Inhouse apps
     "plane.analytics",
     "plane.app",
@@ -176,25 +178,38 @@ if os.environ.get("ENABLE_READ_REPLICA", "0") == "1":
 REDIS_URL = os.environ.get("REDIS_URL")
 REDIS_SSL = REDIS_URL and "rediss" in REDIS_URL
 
+# Connection pool shared by the cache and the redis client of every process
+REDIS_CONNECTION_POOL_CLASS = "redis.ConnectionPool"
+REDIS_CONNECTION_POOL_KWARGS = {
+    "health_check_interval": int(os.environ.get("REDIS_HEALTH_CHECK_INTERVAL", 30)),
+    "socket_keepalive": True,
+    "retry_on_timeout": True,
+}
+
+# The pool is not capped by default, a capped pool waits up to the timeout for a
+# free connection instead of raising when all of its connections are in use
+REDIS_MAX_CONNECTIONS = os.environ.get("REDIS_MAX_CONNECTIONS")
+if REDIS_MAX_CONNECTIONS:
+    REDIS_CONNECTION_POOL_CLASS = "redis.BlockingConnectionPool"
+    REDIS_CONNECTION_POOL_KWARGS["max_connections"] = int(REDIS_MAX_CONNECTIONS)
+    REDIS_CONNECTION_POOL_KWARGS["timeout"] = int(
+        os.environ.get("REDIS_POOL_TIMEOUT", 20)
+    )
+
 if REDIS_SSL:
-    CACHES = {
-        "default": {
-            "BACKEND": "django_redis.cache.RedisCache",
-            "LOCATION": REDIS_URL,
-            "OPTIONS": {
-                "CLIENT_CLASS": "django_redis.client.DefaultClient",
-                "CONNECTION_POOL_KWARGS": {"ssl_cert_reqs": False},
-            },
-        }
-    }
-else:
-    CACHES = {
-        "default": {
-            "BACKEND": "django_redis.cache.RedisCache",
-            "LOCATION": REDIS_URL,
-            "OPTIONS": {"CLIENT_CLASS": "django_redis.client.DefaultClient"},
-        }
+    REDIS_CONNECTION_POOL_KWARGS["ssl_cert_reqs"] = False
+
+CACHES = {
+    "default": {
+        "BACKEND": "django_redis.cache.RedisCache",
+        "LOCATION": REDIS_URL,
+        "OPTIONS": {
+            "CLIENT_CLASS": "django_redis.client.DefaultClient",
+            "CONNECTION_POOL_CLASS": REDIS_CONNECTION_POOL_CLASS,
+            "CONNECTION_POOL_KWARGS": REDIS_CONNECTION_POOL_KWARGS,
+        },
     }
+}
 
 # Password validations
 AUTH_PASSWORD_VALIDATORS = [
@@ -258,6 +273,10 @@ if AWS_S3_ENDPOINT_URL and USE_MINIO:
     AWS_S3_CUSTOM_DOMAIN = f"{parsed_url.netloc}/{AWS_STORAGE_BUCKET_NAME}"
     AWS_S3_URL_PROTOCOL = f"{parsed_url.scheme}:"
 
+# The presigned URLs of the immutable assets (avatars, covers and logos) are
+# reused for the time (seconds), at most half of their expiration
+PRESIGNED_URL_CACHE_TTL = int(os.environ.get("PRESIGNED_URL_CACHE_TTL", 1800))
+
 # RabbitMQ connection settings
 RABBITMQ_HOST = os.environ.get("RABBITMQ_HOST", "localhost")
 RABBITMQ_PORT = os.environ.get("RABBITMQ_PORT", "5672")
@@ -276,6 +295,12 @@ CELERY_TIMEZONE = TIME_ZONE
 CELERY_TASK_SERIALIZER = "json"
 CELERY_RESULT_SERIALIZER = "json"
 CELERY_ACCEPT_CONTENT = ["application/json"]
+# The results are only stored for the tasks that need them, like the chord headers
+CELERY_RESULT_BACKEND = REDIS_URL
+CELERY_TASK_IGNORE_RESULT = True
+CELERY_RESULT_EXPIRES = 60 * 60 * 24
+if REDIS_SSL:
+    CELERY_REDIS_BACKEND_USE_SSL = {"ssl_cert_reqs": ssl.CERT_NONE}
 
 
 CELERY_IMPORTS = (
@@ -285,14 +310,59 @@ CELERY_IMPORTS = (
     "plane.bgtasks.file_asset_task",
     "plane.bgtasks.email_notification_task",
     "plane.bgtasks.cleanup_task",
+    "plane.bgtasks.webhook_task",
+    "plane.bgtasks.api_token_task",
+    "plane.bgtasks.api_log_task",
     "plane.license.bgtasks.tracer",
     # management tasks
     "plane.bgtasks.dummy_data_task",
     # issue version tasks
     "plane.bgtasks.issue_version_sync",
     "plane.bgtasks.issue_description_version_sync",
+    # issue list projection tasks
+    "plane.bgtasks.issue_list_projection_task",
+    # progress snapshot tasks
+    "plane.bgtasks.progress_snapshot_task",
+    # analytics rollup tasks
+    "plane.bgtasks.analytics_rollup_task",
+)
+
+# Issue list projection, the issue lists read the precomputed rows when enabled
+ENABLE_ISSUE_LIST_PROJECTION = (
+    os.environ.get("ENABLE_ISSUE_LIST_PROJECTION", "0") == "1"
 )
 
+# Analytics rollups, the advanced analytics read the daily issue rollups when
+# enabled, build them with the sync_issue_rollups command first
+ENABLE_ANALYTICS_ROLLUP = os.environ.get("ENABLE_ANALYTICS_ROLLUP", "0") == "1"
+
+# Issue activity batching, the activities are buffered for the window (seconds)
+# and written in batches when the window is set
+ISSUE_ACTIVITY_BATCH_WINDOW = int(os.environ.get("ISSUE_ACTIVITY_BATCH_WINDOW", 0))
+ISSUE_ACTIVITY_BATCH_SIZE = int(os.environ.get("ISSUE_ACTIVITY_BATCH_SIZE", 500))
+
+# Exports larger than the shard size are written by parallel tasks, 0 disables it
+EXPORT_SHARD_SIZE = int(os.environ.get("EXPORT_SHARD_SIZE", 50000))
+
+# Rate limit shared by all the api tokens of a workspace, e.g. 1000/minute
+API_WORKSPACE_RATE_LIMIT = os.environ.get("API_WORKSPACE_RATE_LIMIT", None)
+
+# API activity logs, the request and response bodies are truncated to the limit
+# (characters, 0 skips the bodies) and the successful requests are sampled
+API_ACTIVITY_LOG_BODY_LIMIT = int(os.environ.get("API_ACTIVITY_LOG_BODY_LIMIT", 10000))
+API_ACTIVITY_LOG_SAMPLE_RATE = float(
+    os.environ.get("API_ACTIVITY_LOG_SAMPLE_RATE", 1.0)
+)
+
+# Maximum number of results of every entity of the typeahead searches
+TYPEAHEAD_RESULT_LIMIT = int(os.environ.get("TYPEAHEAD_RESULT_LIMIT", 10))
+
+# Progress snapshots of the active cycles and modules, a snapshot is served for
+# the age (seconds) unless the issues are written, the writes refresh the
+# snapshots after the debounce (seconds)
+PROGRESS_SNAPSHOT_MAX_AGE = int(os.environ.get("PROGRESS_SNAPSHOT_MAX_AGE", 900))
+PROGRESS_SNAPSHOT_DEBOUNCE = int(os.environ.get("PROGRESS_SNAPSHOT_DEBOUNCE", 30))
+
 FILE_SIZE_LIMIT = int(os.environ.get("FILE_SIZE_LIMIT", 5242880))
 
 # Unsplash Access key
@@ -317,7 +387,8 @@ DATA_UPLOAD_MAX_MEMORY_SIZE = int(os.environ.get("FILE_SIZE_LIMIT", 5242880))
 SESSION_COOKIE_SECURE = secure_origins
 SESSION_COOKIE_HTTPONLY = True
 SESSION_ENGINE = "plane.db.models.session"
-SESSION_COOKIE_AGE = os.environ.get("SESSION_COOKIE_AGE", 604800)
+SESSION_COOKIE_AGE = int(os.environ.get("SESSION_COOKIE_AGE", 604800))
+SESSION_CACHE_ALIAS = "default"
 SESSION_COOKIE_NAME = os.environ.get("SESSION_COOKIE_NAME", "session-id")
 SESSION_COOKIE_DOMAIN = os.environ.get("COOKIE_DOMAIN", None)
 SESSION_SAVE_EVERY_REQUEST = os.environ.get("SESSION_SAVE_EVERY_REQUEST", "0") == "1"
@@ -365,6 +436,15 @@ LIVE_URL = urljoin(LIVE_BASE_URL, LIVE_BASE_PATH) if LIVE_BASE_URL else None
 WEB_URL = os.environ.get("WEB_URL")
 
 HARD_DELETE_AFTER_DAYS = int(os.environ.get("HARD_DELETE_AFTER_DAYS", 60))
+# The purge deletes the rows in chunks with a pause (seconds) between them, it
+# stops after the time limit (seconds) or when the replicas lag behind
+# (seconds) and resumes from where it stopped
+HARD_DELETE_BATCH_SIZE = int(os.environ.get("HARD_DELETE_BATCH_SIZE", 1000))
+HARD_DELETE_THROTTLE = float(os.environ.get("HARD_DELETE_THROTTLE", 0.1))
+HARD_DELETE_TIME_LIMIT = int(os.environ.get("HARD_DELETE_TIME_LIMIT", 1800))
+HARD_DELETE_MAX_REPLICATION_LAG = int(
+    os.environ.get("HARD_DELETE_MAX_REPLICATION_LAG", 30)
+)
 
 # Instance Changelog URL
 INSTANCE_CHANGELOG_URL = os.environ.get("INSTANCE_CHANGELOG_URL", "")
@@ -21,7 +21,11 @@ CACHES = {
     "default": {
         "BACKEND": "django_redis.cache.RedisCache",
         "LOCATION": REDIS_URL,  # noqa
-        "OPTIONS": {"CLIENT_CLASS": "django_redis.client.DefaultClient"},
+        "OPTIONS": {
+            "CLIENT_CLASS": "django_redis.client.DefaultClient",
+            "CONNECTION_POOL_CLASS": REDIS_CONNECTION_POOL_CLASS,  # noqa
+            "CONNECTION_POOL_KWARGS": REDIS_CONNECTION_POOL_KWARGS,  # noqa
+        },
     }
 }
 
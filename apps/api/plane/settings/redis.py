@@ -1,20 +1,65 @@
+import threading
+from urllib.parse import urlparse
+
 import redis
 from django.conf import settings
-from urllib.parse import urlparse
+from django.utils.module_loading import import_string
+
+# Process wide client, the pool re-creates its connections after a fork so the
+# client is safe to share across the celery prefork and the web workers
+_redis_client = None
+_redis_client_lock = threading.Lock()
+
+
+def is_shared_cache_database():
+    # The cache pool can be shared when it points to the database 0
+    path = urlparse(settings.REDIS_URL).path.strip("/")
+    return path in ("", "0")
+
+
+def redis_connection_pool():
+    """Return the connection pool, shared with the django-redis cache when possible"""
+    if is_shared_cache_database():
+        from django_redis import get_redis_connection
+
+        return get_redis_connection("default").connection_pool
+
+    pool_class = import_string(settings.REDIS_CONNECTION_POOL_CLASS)
+    return pool_class.from_url(
+        settings.REDIS_URL, db=0, **settings.REDIS_CONNECTION_POOL_KWARGS
+    )
 
 
 def redis_instance():
     # connect to redis
-    if settings.REDIS_SSL:
-        url = urlparse(settings.REDIS_URL)
-        ri = redis.Redis(
-            host=url.hostname,
-            port=url.port,
-            password=url.password,
-            ssl=True,
-            ssl_cert_reqs=None,
+    global _redis_client
+    if _redis_client is None:
+        with _redis_client_lock:
+            if _redis_client is None:
+                _redis_client = redis.Redis(connection_pool=redis_connection_pool())
+
+    return _redis_client
+
+
+def redis_pool_stats():
+    """Return the connection statistics of the pool of the current process"""
+    pool = redis_instance().connection_pool
+    if isinstance(pool, redis.BlockingConnectionPool):
+        # The queue of the blocking pool holds None for the connections that
+        # are not created yet
+        created_connections = len(pool._connections)
+        available_connections = sum(
+            connection is not None for connection in list(pool.pool.queue)
         )
+        in_use_connections = created_connections - available_connections
     else:
-        ri = redis.Redis.from_url(settings.REDIS_URL, db=0)
-
-    return ri
+        created_connections = pool._created_connections
+        available_connections = len(pool._available_connections)
+        in_use_connections = len(pool._in_use_connections)
+    return {
+        "pid": pool.pid,
+        "max_connections": pool.max_connections,
+        "created_connections": created_connections,
+        "available_connections": available_connections,
+        "in_use_connections": in_use_connections,
+    }
@@ -1,17 +1,55 @@
 # Python imports
+import hashlib
 import os
+import threading
 import uuid
+from collections import OrderedDict
 
 # Third party imports
 import boto3
 from botocore.exceptions import ClientError
 from urllib.parse import quote
 
+# Django imports
+from django.conf import settings
+from django.core.cache import cache
+
 # Module imports
 from plane.utils.exception_logger import log_exception
 from storages.backends.s3boto3 import S3Boto3Storage
 
 
+# The clients are shared by the storages of the process, one per endpoint and
+# credentials. The endpoints follow the request host with MinIO so the number
+# of clients kept is bounded
+S3_CLIENT_REGISTRY_SIZE = 32
+
+_s3_clients = OrderedDict()
+_s3_clients_lock = threading.Lock()
+
+
+def get_s3_client(aws_access_key_id, aws_secret_access_key, region_name, endpoint_url):
+    """Return the shared S3 client of the endpoint, created on first use"""
+    key = (aws_access_key_id, aws_secret_access_key, region_name, endpoint_url)
+    with _s3_clients_lock:
+        client = _s3_clients.get(key)
+        if client is None:
+            client = boto3.session.Session().client(
+                "s3",
+                aws_access_key_id=aws_access_key_id,
+                aws_secret_access_key=aws_secret_access_key,
+                region_name=region_name,
+                endpoint_url=endpoint_url,
+                config=boto3.session.Config(signature_version="s3v4"),
+            )
+            _s3_clients[key] = client
+            if len(_s3_clients) > S3_CLIENT_REGISTRY_SIZE:
+                _s3_clients.popitem(last=False)
+        else:
+            _s3_clients.move_to_end(key)
+        return client
+
+
 class S3Storage(S3Boto3Storage):
     def url(self, name, parameters=None, expire=None, http_method=None):
         return name
@@ -38,9 +76,8 @@ class S3Storage(S3Boto3Storage):
                 endpoint_protocol = "https"
             else:
                 endpoint_protocol = request.scheme if request else "http"
-            # Create an S3 client for MinIO
-            self.s3_client = boto3.client(
-                "s3",
+            # Get the S3 client for MinIO
+            self.s3_client = get_s3_client(
                 aws_access_key_id=self.aws_access_key_id,
                 aws_secret_access_key=self.aws_secret_access_key,
                 region_name=self.aws_region,
@@ -49,17 +86,14 @@ class S3Storage(S3Boto3Storage):
                     if request
                     else self.aws_s3_endpoint_url
                 ),
-                config=boto3.session.Config(signature_version="s3v4"),
             )
         else:
-            # Create an S3 client
-            self.s3_client = boto3.client(
-                "s3",
+            # Get the S3 client
+            self.s3_client = get_s3_client(
                 aws_access_key_id=self.aws_access_key_id,
                 aws_secret_access_key=self.aws_secret_access_key,
                 region_name=self.aws_region,
                 endpoint_url=self.aws_s3_endpoint_url,
-                config=boto3.session.Config(signature_version="s3v4"),
             )
 
     def generate_presigned_post(
@@ -139,6 +173,58 @@ class S3Storage(S3Boto3Storage):
         # The response contains the presigned URL
         return response
 
+    def generate_cached_presigned_url(
+        self, object_name, expiration=3600, disposition="inline", filename=None
+    ):
+        """
+        Generate a presigned URL to share an immutable S3 object, the URL is
+        reused for PRESIGNED_URL_CACHE_TTL so the browsers can cache the object
+        """
+        timeout = min(settings.PRESIGNED_URL_CACHE_TTL, expiration // 2)
+        if timeout <= 0:
+            return self.generate_presigned_url(
+                object_name=object_name,
+                expiration=expiration,
+                disposition=disposition,
+                filename=filename,
+            )
+
+        key = (
+            "presigned_url:"
+            + hashlib.sha256(
+                "|".join(
+                    [
+                        str(self.s3_client.meta.endpoint_url),
+                        str(self.aws_storage_bucket_name),
+                        str(object_name),
+                        str(expiration),
+                        disposition,
+                        str(filename),
+                    ]
+                ).encode()
+            ).hexdigest()
+        )
+
+        try:
+            signed_url = cache.get(key)
+            if signed_url:
+                return signed_url
+        except Exception as e:
+            log_exception(e)
+
+        signed_url = self.generate_presigned_url(
+            object_name=object_name,
+            expiration=expiration,
+            disposition=disposition,
+            filename=filename,
+        )
+        if signed_url:
+            try:
+                cache.set(key, signed_url, timeout)
+            except Exception as e:
+                log_exception(e)
+        return signed_url
+
     def get_object_metadata(self, object_name):
         """Get the metadata for an S3 object"""
         try:
@@ -1,3 +1,5 @@
+from unittest.mock import patch
+
 import pytest
 from rest_framework.test import APIClient
 from pytest_django.fixtures import django_db_setup
@@ -136,3 +138,46 @@ def workspace(create_user):
     )
 
     return created_workspace
+
+
+class FakeRedis:
+    """The list and lock commands of the buffer on a dict"""
+
+    def __init__(self):
+        self.data = {}
+        self.expiries = {}
+
+    def set(self, key, value, nx=False, ex=None):
+        if nx and key in self.data:
+            return None
+        self.data[key] = value
+        if ex is not None:
+            self.expiries[key] = ex
+        return True
+
+    def expire(self, key, seconds):
+        if key not in self.data:
+            return False
+        self.expiries[key] = seconds
+        return True
+
+    def delete(self, key):
+        self.data.pop(key, None)
+        self.expiries.pop(key, None)
+
+    def rpush(self, key, *values):
+        self.data.setdefault(key, []).extend(values)
+
+    def lrange(self, key, start, end):
+        return self.data.get(key, [])[start : end + 1]
+
+    def ltrim(self, key, start, end):
+        self.data[key] = self.data.get(key, [])[start:]
+
+
+@pytest.fixture
+def fake_redis():
+    """Patch the redis of the buffered writes with an in memory one"""
+    ri = FakeRedis()
+    with patch("plane.utils.redis_buffer.redis_instance", return_value=ri):
+        yield ri
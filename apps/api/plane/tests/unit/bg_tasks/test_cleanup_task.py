@@ -0,0 +1,42 @@
+import uuid
+from unittest.mock import MagicMock
+
+import pytest
+
+from plane.bgtasks.cleanup_task import flush_to_mongo_and_delete, get_partitions
+
+
+@pytest.mark.unit
+def test_partitions_cover_the_uuid_key_space():
+    partitions = get_partitions(4)
+
+    assert partitions[0][0] == str(uuid.UUID(int=0))
+    assert partitions[-1][1] is None
+    # The ranges are contiguous
+    for (_, end), (start, _) in zip(partitions, partitions[1:]):
+        assert end == start
+    assert partitions[2][0] == str(uuid.UUID(int=2**127))
+
+
+@pytest.mark.unit
+def test_flush_upserts_the_batch_unordered():
+    collection = MagicMock()
+    model = MagicMock()
+    model.all_objects.filter.return_value.delete.return_value = (2, {})
+
+    deleted = flush_to_mongo_and_delete(
+        mongo_collection=collection,
+        buffer=[{"id": "a"}, {"id": "b"}],
+        ids_to_delete=["a", "b"],
+        model=model,
+        mongo_available=True,
+    )
+
+    assert deleted == 2
+    operations = collection.bulk_write.call_args.args[0]
+    assert collection.bulk_write.call_args.kwargs == {"ordered": False}
+    assert [operation._filter for operation in operations] == [
+        {"_id": "a"},
+        {"_id": "b"},
+    ]
+    model.all_objects.filter.assert_called_once_with(id__in=["a", "b"])
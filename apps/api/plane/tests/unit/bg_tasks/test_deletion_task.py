@@ -0,0 +1,70 @@
+from unittest.mock import patch
+
+import pytest
+
+from plane.bgtasks.deletion_task import (
+    chunked,
+    get_cascade_relations,
+    get_purge_order,
+    get_replication_lag,
+)
+from plane.db.models import (
+    Issue,
+    IssueActivity,
+    IssueComment,
+    IssueLink,
+    Project,
+    Workspace,
+)
+
+
+@pytest.mark.unit
+class TestGetCascadeRelations:
+    """Test the relations followed by the soft delete cascade"""
+
+    def test_reverse_relations_are_planned(self):
+        relations = get_cascade_relations(Issue)
+
+        assert (IssueComment, "issue", "CASCADE") in relations
+        assert (IssueLink, "issue", "CASCADE") in relations
+        assert (IssueActivity, "issue", "SET_NULL") in relations
+
+    def test_relations_are_computed_once(self):
+        assert get_cascade_relations(Issue) is get_cascade_relations(Issue)
+
+
+@pytest.mark.unit
+def test_chunked_splits_the_parents():
+    assert list(chunked(list(range(5)), size=2)) == [[0, 1], [2, 3], [4]]
+
+
+@pytest.mark.unit
+def test_purge_order_deletes_the_referencing_models_first():
+    order = get_purge_order()
+
+    assert order.index(IssueComment) < order.index(Issue)
+    assert order.index(Issue) < order.index(Project)
+    assert order.index(Project) < order.index(Workspace)
+
+
+@pytest.mark.unit
+class TestGetReplicationLag:
+    """Test the replay lag read from the replication statistics"""
+
+    @pytest.mark.parametrize("row, lag", [((0,), 0.0), ((4.5,), 4.5)])
+    @patch("plane.bgtasks.deletion_task.connection")
+    def test_lag(self, mock_connection, row, lag):
+        cursor = mock_connection.cursor.return_value.__enter__.return_value
+        cursor.fetchone.return_value = row
+
+        assert get_replication_lag() == lag
+
+    @pytest.mark.django_db
+    def test_lag_is_read_without_replicas(self):
+        assert get_replication_lag() == 0
+
+    @patch("plane.bgtasks.deletion_task.connection")
+    def test_lag_is_unknown_when_it_can_not_be_read(self, mock_connection):
+        mock_connection.cursor.side_effect = Exception("permission denied")
+
+        assert get_replication_lag() is None
@@ -0,0 +1,259 @@
+import smtplib
+from datetime import timedelta
+from unittest.mock import MagicMock, patch
+
+import pytest
+from django.utils import timezone
+
+from plane.bgtasks import email_notification_task
+from plane.bgtasks.email_notification_task import (
+    EMAIL_DIGEST_CLAIM_TIMEOUT,
+    EMAIL_DIGEST_MAX_ATTEMPTS,
+    close_smtp_connection,
+    send_email_notification_digests,
+    send_message,
+    stack_email_notification,
+)
+from plane.db.models import EmailNotificationLog, Issue, Project
+
+CONFIGURATION = ("smtp.example.com", "user", "password", "587", "1", "0", "from@x.y")
+
+
+def notification(id, receiver_id, issue_id, actor_id):
+    return {
+        "id": id,
+        "receiver_id": receiver_id,
+        "triggered_by_id": actor_id,
+        "entity_identifier": issue_id,
+        "data": {"id": id},
+    }
+
+
+@pytest.mark.unit
+class TestStackEmailNotification:
+    """Test the grouping of the notifications into digests"""
+
+    @patch("plane.bgtasks.email_notification_task.dispatch_email_digests")
+    @patch("plane.bgtasks.email_notification_task.EmailNotificationLog")
+    def test_notifications_are_grouped_by_receiver_and_issue(
+        self, mock_log, mock_dispatch
+    ):
+        logs = mock_log.objects.filter.return_value.order_by.return_value
+        logs.values.return_value.iterator.return_value = iter(
+            [
+                notification("n1", "r1", "i1", "a1"),
+                notification("n2", "r1", "i2", "a1"),
+                notification("n3", "r1", "i1", "a2"),
+                notification("n4", "r2", "i1", "a1"),
+            ]
+        )
+
+        stack_email_notification()
+
+        mock_dispatch.assert_called_once()
+        digests = mock_dispatch.call_args.args[0]
+        assert digests == [
+            {
+                "issue_id": "i1",
+                "receiver_id": "r1",
+                "notification_data": {"a1": [{"id": "n1"}], "a2": [{"id": "n3"}]},
+                "email_notification_ids": ["n1", "n3"],
+            },
+            {
+                "issue_id": "i2",
+                "receiver_id": "r1",
+                "notification_data": {"a1": [{"id": "n2"}]},
+                "email_notification_ids": ["n2"],
+            },
+            {
+                "issue_id": "i1",
+                "receiver_id": "r2",
+                "notification_data": {"a1": [{"id": "n4"}]},
+                "email_notification_ids": ["n4"],
+            },
+        ]
+
+
+@pytest.mark.unit
+@pytest.mark.django_db
+class TestClaimEmailNotification:
+    """Test the dispatched notifications are not stacked again"""
+
+    @pytest.fixture(autouse=True)
+    def mock_send(self):
+        with patch.object(
+            email_notification_task.send_email_notification_digests, "delay"
+        ) as delay:
+            yield delay
+
+    def test_claimed_notifications_are_not_dispatched_again(
+        self, mock_send, digest_issue, create_user
+    ):
+        digest = create_digest(str(digest_issue.id), create_user, create_user)
+
+        stack_email_notification()
+        stack_email_notification()
+
+        mock_send.assert_called_once()
+        assert mock_send.call_args.kwargs["digests"] == [digest]
+        assert EmailNotificationLog.objects.get(
+            pk=digest["email_notification_ids"][0]
+        ).processing_at
+
+    def test_stale_claim_is_dispatched_again(
+        self, mock_send, digest_issue, create_user
+    ):
+        digest = create_digest(str(digest_issue.id), create_user, create_user)
+        EmailNotificationLog.objects.filter(
+            pk__in=digest["email_notification_ids"]
+        ).update(
+            processing_at=timezone.now()
+            - EMAIL_DIGEST_CLAIM_TIMEOUT
+            - timedelta(minutes=1)
+        )
+
+        stack_email_notification()
+
+        mock_send.assert_called_once()
+
+
+@pytest.fixture
+def digest_issue(workspace, create_user):
+    project = Project.objects.create(
+        name="Test Project", identifier="TP", workspace=workspace
+    )
+    return Issue.objects.create(name="Issue", workspace=workspace, project=project)
+
+
+def create_digest(issue_id, receiver, actor):
+    log = EmailNotificationLog.objects.create(
+        receiver=receiver,
+        triggered_by=actor,
+        entity_identifier=None if issue_id == "None" else issue_id,
+        entity_name="issue",
+        entity="issue",
+        data={},
+    )
+    return {
+        "issue_id": issue_id,
+        "receiver_id": str(receiver.id),
+        "notification_data": {str(actor.id): [{}]},
+        "email_notification_ids": [str(log.id)],
+    }
+
+
+@pytest.mark.unit
+@pytest.mark.django_db
+class TestSendEmailNotificationDigests:
+    """Test each digest is sent and marked processed on its own"""
+
+    @pytest.fixture(autouse=True)
+    def mock_email(self):
+        ri = MagicMock()
+        ri.set.return_value = True
+        ri.mget.side_effect = lambda keys: [b"https://plane.so" for _ in keys]
+        with (
+            patch.object(email_notification_task, "redis_instance", return_value=ri),
+            patch.object(
+                email_notification_task,
+                "get_email_configuration",
+                return_value=CONFIGURATION,
+            ),
+            patch.object(email_notification_task, "build_issue_email"),
+            patch.object(email_notification_task, "send_message") as send_message,
+        ):
+            yield send_message
+
+    def test_invalid_issue_id_does_not_drop_the_batch(
+        self, mock_email, digest_issue, create_user
+    ):
+        invalid = create_digest("None", create_user, create_user)
+        valid = create_digest(str(digest_issue.id), create_user, create_user)
+
+        send_email_notification_digests([invalid, valid])
+
+        mock_email.assert_called_once()
+        sent = EmailNotificationLog.objects.get(pk=valid["email_notification_ids"][0])
+        skipped = EmailNotificationLog.objects.get(
+            pk=invalid["email_notification_ids"][0]
+        )
+        assert sent.processed_at is not None and sent.sent_at is not None
+        assert skipped.processed_at is not None and skipped.sent_at is None
+
+    def test_failed_send_stays_unprocessed(self, mock_email, digest_issue, create_user):
+        mock_email.side_effect = [smtplib.SMTPServerDisconnected(), None]
+        failed = create_digest(str(digest_issue.id), create_user, create_user)
+        EmailNotificationLog.objects.filter(
+            pk__in=failed["email_notification_ids"]
+        ).update(processing_at=timezone.now())
+        other_issue = Issue.objects.create(
+            name="Other issue",
+            workspace=digest_issue.workspace,
+            project=digest_issue.project,
+        )
+        sent = create_digest(str(other_issue.id), create_user, create_user)
+
+        send_email_notification_digests([failed, sent])
+
+        assert EmailNotificationLog.objects.filter(
+            pk__in=failed["email_notification_ids"],
+            processed_at__isnull=True,
+            processing_at__isnull=True,
+            send_attempts=1,
+        ).exists()
+        assert EmailNotificationLog.objects.filter(
+            pk__in=sent["email_notification_ids"], sent_at__isnull=False
+        ).exists()
+
+    def test_failed_send_is_given_up_after_max_attempts(
+        self, mock_email, digest_issue, create_user
+    ):
+        mock_email.side_effect = smtplib.SMTPServerDisconnected()
+        digest = create_digest(str(digest_issue.id), create_user, create_user)
+
+        for _ in range(EMAIL_DIGEST_MAX_ATTEMPTS):
+            send_email_notification_digests([digest])
+
+        log = EmailNotificationLog.objects.get(pk=digest["email_notification_ids"][0])
+        assert log.send_attempts == EMAIL_DIGEST_MAX_ATTEMPTS
+        assert log.processed_at is not None and log.sent_at is None
+
+    def test_processed_digest_is_not_sent_again(
+        self, mock_email, digest_issue, create_user
+    ):
+        digest = create_digest(str(digest_issue.id), create_user, create_user)
+
+        send_email_notification_digests([digest])
+        send_email_notification_digests([digest])
+
+        mock_email.assert_called_once()
+
+
+@pytest.mark.unit
+class TestSmtpConnection:
+    """Test the reuse of the smtp connection across the emails"""
+
+    def setup_method(self):
+        close_smtp_connection()
+
+    def teardown_method(self):
+        close_smtp_connection()
+
+    @patch("plane.bgtasks.email_notification_task.get_connection")
+    def test_connection_is_reused(self, mock_get_connection):
+        for _ in range(3):
+            send_message(MagicMock(), CONFIGURATION)
+
+        assert mock_get_connection.call_count == 1
+        mock_get_connection.return_value.open.assert_called_once()
+
+    @patch("plane.bgtasks.email_notification_task.get_connection")
+    def test_connection_is_reopened_when_disconnected(self, mock_get_connection):
+        msg = MagicMock()
+        msg.send.side_effect = [smtplib.SMTPServerDisconnected(), 1]
+
+        send_message(msg, CONFIGURATION)
+
+        assert mock_get_connection.call_count == 2
+        assert msg.send.call_count == 2
+        assert email_notification_task._smtp_connection is not None
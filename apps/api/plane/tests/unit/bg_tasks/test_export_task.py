@@ -0,0 +1,254 @@
+import csv
+import io
+import json
+import zipfile
+from unittest.mock import MagicMock
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from plane.bgtasks.export_task import (
+    EXPORT_HEADER,
+    CSVExportWriter,
+    S3MultipartWriter,
+    get_export_queryset,
+    get_export_shards,
+    get_shard_queryset,
+    merge_csv_parts,
+    merge_json_parts,
+    write_export_file,
+)
+from plane.db.models import (
+    Issue,
+    IssueAssignee,
+    IssueLabel,
+    Label,
+    Project,
+    ProjectMember,
+    State,
+)
+
+
+@pytest.fixture
+def s3_client():
+    client = MagicMock()
+    client.create_multipart_upload.return_value = {"UploadId": "upload-id"}
+    client.upload_part.side_effect = lambda **kwargs: {
+        "ETag": str(kwargs["PartNumber"])
+    }
+    return client
+
+
+@pytest.mark.unit
+class TestS3MultipartWriter:
+    """Test the multipart upload stream of the exports"""
+
+    def test_parts_are_uploaded_when_full(self, s3_client):
+        """Test the written bytes are uploaded in parts of the part size"""
+        writer = S3MultipartWriter(s3_client, "bucket", "key", part_size=4)
+
+        writer.write(b"abcdef")
+        writer.write(b"gh")
+        writer.write(b"i")
+        writer.complete()
+
+        bodies = [call.kwargs["Body"] for call in s3_client.upload_part.call_args_list]
+        assert bodies == [b"abcd", b"efgh", b"i"]
+        s3_client.complete_multipart_upload.assert_called_once_with(
+            Bucket="bucket",
+            Key="key",
+            UploadId="upload-id",
+            MultipartUpload={
+                "Parts": [
+                    {"ETag": "1", "PartNumber": 1},
+                    {"ETag": "2", "PartNumber": 2},
+                    {"ETag": "3", "PartNumber": 3},
+                ]
+            },
+        )
+
+    def test_zip_is_streamed(self, s3_client):
+        """Test the zip written to the stream can be read back from the parts"""
+        writer = S3MultipartWriter(s3_client, "bucket", "key", part_size=64)
+
+        with zipfile.ZipFile(writer, "w", zipfile.ZIP_DEFLATED) as zip_file:
+            csv_writer = CSVExportWriter(
+                zip_file.open("project.csv", "w"), EXPORT_HEADER
+            )
+            csv_writer.close()
+        writer.complete()
+
+        data = b"".join(
+            call.kwargs["Body"] for call in s3_client.upload_part.call_args_list
+        )
+        with zipfile.ZipFile(io.BytesIO(data)) as zip_file:
+            content = zip_file.read("project.csv").decode()
+        assert content.startswith('"ID","Project","Name"')
+
+
+class Part:
+    """Stand in for the streaming body of a part file"""
+
+    def __init__(self, content):
+        self.content = content
+
+    def iter_chunks(self, chunk_size):
+        for start in range(0, len(self.content), 2):
+            yield self.content[start : start + 2]
+
+
+class Stream(io.BytesIO):
+    def close(self):
+        self.value = self.getvalue()
+        super().close()
+
+
+@pytest.mark.unit
+class TestMergeParts:
+    """Test the merge of the part files of a parallel export"""
+
+    def test_json_parts(self):
+        """Test the items of the parts are merged in one list"""
+        stream = Stream()
+        merge_json_parts(
+            stream,
+            EXPORT_HEADER,
+            [Part(b'{"ID": "P-1"}, {"ID": "P-2"}'), Part(b""), Part(b'{"ID": "P-3"}')],
+        )
+
+        assert [row["ID"] for row in json.loads(stream.value)] == ["P-1", "P-2", "P-3"]
+
+    def test_csv_parts(self):
+        """Test the rows of the parts follow a single header"""
+        stream = Stream()
+        merge_csv_parts(
+            stream, ["ID", "Name"], [Part(b'"P-1","A"\r\n'), Part(b'"P-2","B"\r\n')]
+        )
+
+        assert stream.value == b'"ID","Name"\r\n"P-1","A"\r\n"P-2","B"\r\n'
+
+
+@pytest.fixture
+def project(workspace, create_user):
+    project = Project.objects.create(
+        name="Test Project", identifier="TP", workspace=workspace
+    )
+    ProjectMember.objects.create(project=project, member=create_user, role=20)
+    State.objects.create(name="Todo", group="unstarted", default=True, project=project)
+    return project
+
+
+def create_issues(project, user, count):
+    label, _ = Label.objects.get_or_create(
+        name="bug, ui", workspace=project.workspace, project=project
+    )
+    for index in range(count):
+        issue = Issue.objects.create(
+            name=f"Issue {index}", workspace=project.workspace, project=project
+        )
+        IssueLabel.objects.create(
+            issue=issue, label=label, workspace=project.workspace, project=project
+        )
+        IssueAssignee.objects.create(
+            issue=issue, assignee=user, workspace=project.workspace, project=project
+        )
+
+
+def export_csv(project, user):
+    """Write the csv export of the project, returns the rows and the query count"""
+    stream = Stream()
+    queryset = get_export_queryset(project.workspace_id, [project.id], user.id)
+    with CaptureQueriesContext(connection) as context:
+        write_export_file(stream, "csv", EXPORT_HEADER, queryset, lambda count: None)
+    rows = list(csv.reader(io.StringIO(stream.value.decode())))
+    return rows[1:], len(context.captured_queries)
+
+
+@pytest.mark.unit
+@pytest.mark.django_db
+class TestWriteExportFile:
+    """Test the rows written for the issues of the export"""
+
+    def test_one_row_per_issue(self, project, create_user):
+        """Test every issue is written once with its labels and assignees"""
+        create_issues(project, create_user, 3)
+        # A soft deleted membership of the member does not repeat the issues
+        ProjectMember.all_objects.create(
+            project=project,
+            member=create_user,
+            role=20,
+            deleted_at=project.created_at,
+        )
+
+        rows, _ = export_csv(project, create_user)
+
+        assert sorted(row[EXPORT_HEADER.index("ID")] for row in rows) == [
+            "TP-1",
+            "TP-2",
+            "TP-3",
+        ]
+        # The names holding the separator are written as they are
+        assert {row[EXPORT_HEADER.index("Labels")] for row in rows} == {"bug, ui"}
+        assert {row[EXPORT_HEADER.index("Assignees")] for row in rows} == {
+            f"{create_user.first_name} {create_user.last_name}"
+        }
+
+    def test_queries_do_not_grow_with_the_issues(self, project, create_user):
+        """Test the relations of the issues are prefetched for the chunk"""
+        create_issues(project, create_user, 1)
+        _, single = export_csv(project, create_user)
+
+        create_issues(project, create_user, 9)
+        rows, many = export_csv(project, create_user)
+
+        assert len(rows) == 10
+        assert many == single
+
+    @pytest.mark.slow
+    def test_export_grows_linearly_with_the_issues(self, project, create_user):
+        """Test the rows follow the issues while the queries stay per chunk"""
+        sizes = [25, 100, 400]
+        rows_written = []
+        query_counts = set()
+        for created, size in zip([0] + sizes, sizes):
+            create_issues(project, create_user, size - created)
+            rows, queries = export_csv(project, create_user)
+            rows_written.append(len(rows))
+            query_counts.add(queries)
+
+        assert rows_written == sizes
+        # The sizes fit in one chunk of the export
+        assert len(query_counts) == 1
+
+
+@pytest.mark.unit
+@pytest.mark.django_db
+class TestExportShards:
+    """Test the shards of a large export"""
+
+    def test_shards_follow_the_unsharded_order(
+        self, settings, project, workspace, create_user
+    ):
+        """Test the shards hold every issue once in the order of the export"""
+        settings.EXPORT_SHARD_SIZE = 3
+        small_project = Project.objects.create(
+            name="Small Project", identifier="SP", workspace=workspace
+        )
+        ProjectMember.objects.create(project=small_project, member=create_user, role=20)
+        create_issues(project, create_user, 8)
+        create_issues(small_project, create_user, 2)
+        project_ids = [project.id, small_project.id]
+        queryset = get_export_queryset(workspace.id, project_ids, create_user.id)
+
+        shards = get_export_shards(queryset, project_ids, multiple=False)
+        shard_ids = [
+            list(get_shard_queryset(queryset, shard).values_list("id", flat=True))
+            for shard in shards
+        ]
+
+        assert len(shards) == 4
+        assert all(len(ids) <= 3 for ids in shard_ids)
+        assert [issue_id for ids in shard_ids for issue_id in ids] == list(
+            queryset.values_list("id", flat=True)
+        )
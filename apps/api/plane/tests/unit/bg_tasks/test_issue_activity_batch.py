@@ -0,0 +1,145 @@
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+from django.test import override_settings
+
+from plane.bgtasks.issue_activities_task import (
+    ISSUE_ACTIVITY_BUFFER_KEY,
+    ISSUE_ACTIVITY_DRAIN_KEY,
+    drain_issue_activities,
+    issue_activity,
+    process_issue_activities,
+)
+from plane.db.models import Issue, IssueActivity, Project
+
+
+@pytest.mark.unit
+class TestIssueActivityBuffer:
+    """Test the coalescing of the issue activities"""
+
+    event = {
+        "type": "comment.activity.created",
+        "requested_data": json.dumps({"comment_html": "<p>test</p>"}),
+        "current_instance": None,
+        "issue_id": "35e8b958-6ee5-43ce-ae56-fb0e776f421e",
+        "actor_id": "97988198-274f-4dfe-aa7a-4c0ffc684214",
+        "project_id": "c0a6a0a4-7a5b-4c4c-9a57-1b1f0f0b1b1b",
+        "epoch": 1700000000,
+    }
+
+    @override_settings(ISSUE_ACTIVITY_BATCH_WINDOW=5)
+    @patch("plane.bgtasks.issue_activities_task.drain_issue_activities")
+    @patch("plane.bgtasks.issue_activities_task.redis_instance")
+    def test_events_are_buffered(self, mock_redis_instance, mock_drain):
+        """Test only the first event of the window schedules the drain"""
+        ri = MagicMock()
+        ri.set.side_effect = [True, None]
+        mock_redis_instance.return_value = ri
+
+        with patch("celery.app.task.Task.apply_async") as mock_apply_async:
+            issue_activity.delay(**self.event)
+            issue_activity.delay(**self.event)
+
+        mock_apply_async.assert_not_called()
+        assert ri.rpush.call_count == 2
+        assert json.loads(ri.rpush.call_args[0][1]) == self.event
+        ri.set.assert_called_with(ISSUE_ACTIVITY_DRAIN_KEY, 1, nx=True, ex=65)
+        mock_drain.apply_async.assert_called_once_with(countdown=5)
+
+    @override_settings(ISSUE_ACTIVITY_BATCH_WINDOW=5)
+    @patch("plane.bgtasks.issue_activities_task.redis_instance")
+    def test_buffer_failure_sends_the_task(self, mock_redis_instance):
+        """Test the event is sent as a task when the buffer is not reachable"""
+        mock_redis_instance.return_value.rpush.side_effect = ConnectionError()
+
+        with patch("celery.app.task.Task.apply_async") as mock_apply_async:
+            issue_activity.delay(**self.event)
+
+        mock_apply_async.assert_called_once()
+
+    @override_settings(ISSUE_ACTIVITY_BATCH_SIZE=2)
+    @patch("plane.bgtasks.issue_activities_task.process_issue_activities")
+    def test_drain_processes_one_batch(self, mock_process, fake_redis):
+        """Test the drain writes one batch and schedules the next for a full batch"""
+        fake_redis.set(ISSUE_ACTIVITY_DRAIN_KEY, 1)
+        fake_redis.rpush(ISSUE_ACTIVITY_BUFFER_KEY, *[json.dumps(self.event)] * 3)
+
+        with (
+            patch(
+                "plane.bgtasks.issue_activities_task.redis_instance",
+                return_value=fake_redis,
+            ),
+            patch.object(drain_issue_activities, "delay") as mock_delay,
+        ):
+            drain_issue_activities()
+
+        assert ISSUE_ACTIVITY_DRAIN_KEY not in fake_redis.data
+        mock_process.assert_called_once_with([self.event, self.event])
+        assert len(fake_redis.data[ISSUE_ACTIVITY_BUFFER_KEY]) == 1
+        mock_delay.assert_called_once()
+
+    @override_settings(ISSUE_ACTIVITY_BATCH_SIZE=2, ISSUE_ACTIVITY_BATCH_WINDOW=5)
+    @patch("plane.bgtasks.issue_activities_task.process_issue_activities")
+    def test_failed_drain_keeps_the_events(self, mock_process, fake_redis):
+        """Test the events of a failed write stay buffered and the drain is retried"""
+        mock_process.side_effect = ConnectionError()
+        fake_redis.rpush(ISSUE_ACTIVITY_BUFFER_KEY, *[json.dumps(self.event)] * 2)
+
+        with (
+            patch(
+                "plane.bgtasks.issue_activities_task.redis_instance",
+                return_value=fake_redis,
+            ),
+            patch.object(drain_issue_activities, "apply_async") as mock_apply_async,
+        ):
+            drain_issue_activities()
+
+        assert len(fake_redis.data[ISSUE_ACTIVITY_BUFFER_KEY]) == 2
+        # The batch is not written again event by event
+        mock_process.assert_called_once()
+        mock_apply_async.assert_called_once_with(countdown=5)
+
+
+@pytest.mark.unit
+@pytest.mark.django_db
+class TestProcessIssueActivities:
+    """Test the activities are written once whatever follows the write"""
+
+    @override_settings(ENABLE_ISSUE_LIST_PROJECTION=True)
+    @patch("plane.bgtasks.issue_activities_task.batch_notifications")
+    @patch("plane.bgtasks.issue_activities_task.refresh_issue_list_projection")
+    def test_follow_up_failures_do_not_fail_the_write(
+        self,
+        mock_refresh,
+        mock_notifications,
+        workspace,
+        create_user,
+        django_capture_on_commit_callbacks,
+    ):
+        project = Project.objects.create(
+            name="Test Project", identifier="TP", workspace=workspace
+        )
+        issue = Issue.objects.create(name="Issue", workspace=workspace, project=project)
+        mock_refresh.side_effect = Exception("projection failed")
+        mock_notifications.delay.side_effect = Exception("broker down")
+
+        with django_capture_on_commit_callbacks(execute=True) as callbacks:
+            created = process_issue_activities(
+                [
+                    {
+                        "type": "issue.activity.updated",
+                        "requested_data": json.dumps({"name": "Renamed"}),
+                        "current_instance": json.dumps({"name": "Issue"}),
+                        "issue_id": str(issue.id),
+                        "actor_id": str(create_user.id),
+                        "project_id": str(project.id),
+                        "epoch": 1700000000,
+                        "notification": True,
+                    }
+                ]
+            )
+
+        assert len(callbacks) == 3
+        mock_refresh.assert_called_once()
+        assert IssueActivity.objects.filter(issue=issue).count() == len(created) == 1
@@ -0,0 +1,118 @@
+import json
+import uuid
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from plane.bgtasks.notification_task import batch_notifications
+from plane.db.models import (
+    EmailNotificationLog,
+    Issue,
+    IssueSubscriber,
+    Notification,
+    Project,
+    ProjectMember,
+    State,
+    User,
+)
+
+
+@pytest.fixture
+def issue(workspace, create_user):
+    project = Project.objects.create(
+        name="Test Project", identifier="TP", workspace=workspace
+    )
+    ProjectMember.objects.create(project=project, member=create_user, role=20)
+    State.objects.create(name="Todo", group="unstarted", default=True, project=project)
+    return Issue.objects.create(name="Issue", workspace=workspace, project=project)
+
+
+@pytest.fixture
+def subscriber(issue):
+    user = User.objects.create(email="subscriber@plane.so", username="subscriber")
+    ProjectMember.objects.create(project=issue.project, member=user, role=15)
+    IssueSubscriber.objects.create(
+        issue=issue, subscriber=user, project=issue.project, workspace=issue.workspace
+    )
+    return user
+
+
+def activity_event(issue, actor, field="priority"):
+    activity = {
+        "id": str(uuid.uuid4()),
+        "verb": "updated",
+        "field": field,
+        "comment": f"updated the {field}",
+        "actor_id": str(actor.id),
+        "old_value": "low",
+        "new_value": "high",
+        "issue_detail": {"id": str(issue.id)},
+        "issue_comment": None,
+    }
+    return {
+        "type": "issue.activity.updated",
+        "issue_id": str(issue.id),
+        "project_id": str(issue.project_id),
+        "actor_id": str(actor.id),
+        "subscriber": True,
+        "issue_activities_created": json.dumps([activity]),
+        "requested_data": json.dumps({field: "high"}),
+        "current_instance": json.dumps({field: "low"}),
+    }
+
+
+def count_queries(events):
+    with CaptureQueriesContext(connection) as context:
+        batch_notifications(events)
+    return len(context.captured_queries)
+
+
+@pytest.mark.unit
+@pytest.mark.django_db
+class TestBatchNotifications:
+    """Test the notifications of a batch of activities"""
+
+    def test_every_event_notifies_the_subscribers(self, issue, subscriber, create_user):
+        batch_notifications(
+            [
+                activity_event(issue, create_user, "priority"),
+                activity_event(issue, create_user, "state"),
+                activity_event(issue, create_user, "name"),
+            ]
+        )
+
+        notifications = Notification.objects.filter(receiver=subscriber)
+        assert sorted(
+            notification.data["issue_activity"]["field"]
+            for notification in notifications
+        ) == ["name", "priority", "state"]
+        assert EmailNotificationLog.objects.filter(receiver=subscriber).count() == 3
+        # The actor is subscribed once and is not notified of their own changes
+        assert IssueSubscriber.objects.filter(subscriber=create_user).count() == 1
+        assert not Notification.objects.filter(receiver=create_user).exists()
+
+    def test_subscribed_actor_is_notified_by_the_next_events(
+        self, issue, subscriber, create_user
+    ):
+        """Test the actor subscribed by an event gets the notifications of the next"""
+        batch_notifications(
+            [
+                activity_event(issue, create_user),
+                activity_event(issue, subscriber),
+            ]
+        )
+
+        assert Notification.objects.filter(receiver=create_user).count() == 1
+        assert Notification.objects.filter(receiver=subscriber).count() == 1
+
+    def test_queries_do_not_grow_with_the_events(self, issue, subscriber, create_user):
+        """Test the lookups and the writes are shared by the events of the batch"""
+        # Subscribe the actor so both batches run the same writes
+        batch_notifications([activity_event(issue, create_user)])
+
+        single = count_queries([activity_event(issue, create_user)])
+        batch = count_queries([activity_event(issue, create_user)] * 5)
+
+        assert batch == single
+        assert Notification.objects.filter(receiver=subscriber).count() == 7
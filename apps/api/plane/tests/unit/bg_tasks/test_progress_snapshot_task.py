@@ -0,0 +1,154 @@
+from datetime import timedelta
+from unittest.mock import patch
+
+import pytest
+from django.utils import timezone
+
+from plane.bgtasks.progress_snapshot_task import queue_progress_snapshot
+from plane.db.models import (
+    Cycle,
+    Module,
+    ProgressSnapshot,
+    Project,
+    ProjectMember,
+    State,
+)
+from plane.utils.group_count_cache import get_group_count_version
+from plane.utils.progress_snapshot import (
+    get_progress_snapshot,
+    is_active_cycle,
+    is_active_module,
+)
+
+LOCMEM_CACHES = {
+    "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+}
+
+
+@pytest.fixture(autouse=True)
+def locmem_cache(settings):
+    settings.CACHES = LOCMEM_CACHES
+    settings.PROGRESS_SNAPSHOT_DEBOUNCE = 30
+
+
+@pytest.mark.unit
+class TestActiveEntities:
+    """Test the cycles and the modules kept in the snapshots"""
+
+    def test_running_cycle_is_active(self):
+        now = timezone.now()
+        cycle = Cycle(
+            start_date=now - timedelta(days=1), end_date=now + timedelta(days=1)
+        )
+        assert is_active_cycle(cycle)
+
+    def test_draft_and_completed_cycles_are_not_active(self):
+        now = timezone.now()
+        assert not is_active_cycle(Cycle(start_date=None, end_date=None))
+        assert not is_active_cycle(
+            Cycle(start_date=now - timedelta(days=7), end_date=now - timedelta(days=1))
+        )
+
+    def test_open_modules_are_active(self):
+        assert is_active_module(Module(status="in-progress"))
+        assert not is_active_module(Module(status="completed"))
+        assert not is_active_module(Module(status="paused", archived_at=timezone.now()))
+
+
+@pytest.mark.unit
+class TestQueueProgressSnapshot:
+    """Test the debounce of the snapshot refreshes"""
+
+    @patch("plane.bgtasks.progress_snapshot_task.refresh_progress_snapshot")
+    def test_refreshes_are_coalesced(self, mock_refresh):
+        """Test the refreshes queued within the debounce run once"""
+        for _ in range(3):
+            queue_progress_snapshot(cycle_id="cycle-1")
+        queue_progress_snapshot(module_id="module-1")
+
+        assert mock_refresh.apply_async.call_count == 2
+        mock_refresh.apply_async.assert_any_call(
+            kwargs={"cycle_id": "cycle-1", "module_id": None}, countdown=30
+        )
+
+
+@pytest.fixture
+def snapshot_cycle(workspace, create_user):
+    project = Project.objects.create(
+        name="Test Project", identifier="TP", workspace=workspace
+    )
+    ProjectMember.objects.create(project=project, member=create_user, role=20)
+    now = timezone.now()
+    cycle = Cycle.objects.create(
+        name="Cycle",
+        project=project,
+        workspace=workspace,
+        owned_by=create_user,
+        start_date=now - timedelta(days=1),
+        end_date=now + timedelta(days=7),
+    )
+    ProgressSnapshot.objects.create(
+        project=project,
+        workspace=workspace,
+        cycle=cycle,
+        date=now.date(),
+        version=get_group_count_version(project.id),
+        data={"progress": {"total_issues": 0}},
+    )
+    return cycle
+
+
+@pytest.mark.unit
+@pytest.mark.django_db
+class TestProgressSnapshotVersion:
+    """Test the snapshots are not served after the writes they depend on"""
+
+    @patch("plane.app.views.cycle.base.model_activity")
+    def test_cycle_date_edit_invalidates_the_snapshot(
+        self, mock_activity, settings, session_client, workspace, snapshot_cycle
+    ):
+        settings.WEB_URL = "http://localhost"
+        project_id = snapshot_cycle.project_id
+        assert get_progress_snapshot(project_id, cycle_id=snapshot_cycle.id)
+        url = (
+            f"/api/workspaces/{workspace.slug}/projects/{project_id}"
+            f"/cycles/{snapshot_cycle.id}/"
+        )
+
+        session_client.patch(url, {"name": "Renamed"}, format="json")
+        assert get_progress_snapshot(project_id, cycle_id=snapshot_cycle.id)
+
+        end_date = snapshot_cycle.end_date + timedelta(days=7)
+        response = session_client.patch(
+            url,
+            {
+                "start_date": snapshot_cycle.start_date.isoformat(),
+                "end_date": end_date.isoformat(),
+            },
+            format="json",
+        )
+
+        assert response.status_code == 200
+        assert get_progress_snapshot(project_id, cycle_id=snapshot_cycle.id) is None
+
+    @patch("plane.app.views.state.base.refresh_relation_rollups")
+    def test_state_group_edit_invalidates_the_snapshot(
+        self, mock_rollups, session_client, workspace, snapshot_cycle
+    ):
+        project_id = snapshot_cycle.project_id
+        state = State.objects.create(
+            name="Doing",
+            group="started",
+            project_id=project_id,
+            workspace=workspace,
+        )
+
+        response = session_client.patch(
+            f"/api/workspaces/{workspace.slug}/projects/{project_id}"
+            f"/states/{state.id}/",
+            {"group": "completed"},
+            format="json",
+        )
+
+        assert response.status_code == 200
+        assert get_progress_snapshot(project_id, cycle_id=snapshot_cycle.id) is None
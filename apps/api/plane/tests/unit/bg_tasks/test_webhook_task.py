@@ -0,0 +1,108 @@
+import json
+import uuid
+from datetime import timedelta
+from unittest.mock import patch
+
+import pytest
+from django.utils import timezone
+
+from plane.bgtasks.webhook_task import (
+    WEBHOOK_LOG_BUFFER_KEY,
+    flush_webhook_logs,
+    get_webhook_session,
+    log_webhook_delivery,
+    model_activity,
+)
+from plane.db.models import WebhookLog
+
+
+@pytest.mark.unit
+class TestModelActivity:
+    """Test the webhook deliveries of the model updates"""
+
+    @patch("plane.bgtasks.webhook_task.webhook_activity")
+    def test_changes_are_sent_in_one_delivery(self, mock_webhook_activity):
+        """Test all the changed fields of an update are sent together"""
+        model_activity(
+            model_name="issue",
+            model_id="35e8b958-6ee5-43ce-ae56-fb0e776f421e",
+            requested_data={"name": "New", "priority": "high", "sort_order": 1},
+            current_instance=json.dumps(
+                {"name": "Old", "priority": "low", "sort_order": 1}
+            ),
+            actor_id="97988198-274f-4dfe-aa7a-4c0ffc684214",
+            slug="workspace",
+        )
+
+        mock_webhook_activity.delay.assert_called_once()
+        kwargs = mock_webhook_activity.delay.call_args.kwargs
+        assert kwargs["field"] == "name"
+        assert kwargs["changes"] == [
+            {"field": "name", "old_value": "Old", "new_value": "New"},
+            {"field": "priority", "old_value": "low", "new_value": "high"},
+        ]
+
+    @patch("plane.bgtasks.webhook_task.webhook_activity")
+    def test_a_single_change_is_sent_in_changes(self, mock_webhook_activity):
+        """Test the changes are sent for an update of one field too"""
+        model_activity(
+            model_name="issue",
+            model_id="35e8b958-6ee5-43ce-ae56-fb0e776f421e",
+            requested_data={"name": "New"},
+            current_instance=json.dumps({"name": "Old"}),
+            actor_id="97988198-274f-4dfe-aa7a-4c0ffc684214",
+            slug="workspace",
+        )
+
+        kwargs = mock_webhook_activity.delay.call_args.kwargs
+        assert kwargs["changes"] == [
+            {"field": "name", "old_value": "Old", "new_value": "New"}
+        ]
+        assert (kwargs["field"], kwargs["old_value"], kwargs["new_value"]) == (
+            "name",
+            "Old",
+            "New",
+        )
+
+    @patch("plane.bgtasks.webhook_task.webhook_activity")
+    def test_no_delivery_without_changes(self, mock_webhook_activity):
+        """Test an update without changed fields is not delivered"""
+        model_activity(
+            model_name="issue",
+            model_id="35e8b958-6ee5-43ce-ae56-fb0e776f421e",
+            requested_data={"name": "Same"},
+            current_instance=json.dumps({"name": "Same"}),
+            actor_id="97988198-274f-4dfe-aa7a-4c0ffc684214",
+            slug="workspace",
+        )
+
+        mock_webhook_activity.delay.assert_not_called()
+
+
+@pytest.mark.unit
+def test_webhook_session_is_reused():
+    """Test the deliveries of a process share the pooled session"""
+    assert get_webhook_session() is get_webhook_session()
+
+
+@pytest.mark.unit
+@pytest.mark.django_db
+def test_webhook_logs_keep_the_delivery_time(fake_redis, workspace):
+    """Test the flushed webhook logs are created at the time of the delivery"""
+    delivered_at = timezone.now() - timedelta(minutes=10)
+    with patch("plane.bgtasks.webhook_task.timezone.now", return_value=delivered_at):
+        log_webhook_delivery(
+            workspace_id=str(workspace.id),
+            webhook=str(uuid.uuid4()),
+            event_type="issue",
+            request_method="POST",
+            response_status="200",
+            retry_count=0,
+        )
+
+    flush_webhook_logs()
+
+    log = WebhookLog.objects.get()
+    assert log.created_at == delivered_at
+    assert log.event_type == "issue"
+    assert fake_redis.data[WEBHOOK_LOG_BUFFER_KEY] == []
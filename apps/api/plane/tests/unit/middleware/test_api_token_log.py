@@ -0,0 +1,62 @@
+import pytest
+from unittest.mock import Mock, patch
+
+from django.http import HttpResponse
+from django.test import RequestFactory
+
+from plane.middleware.logger import APITokenLogMiddleware
+
+
+@pytest.fixture
+def api_request():
+    return RequestFactory().post(
+        "/api/v1/workspaces/",
+        data=b'{"name": "Plane"}',
+        content_type="application/json",
+        HTTP_X_API_KEY="plane_api_token",
+        REMOTE_ADDR="127.0.0.1",
+    )
+
+
+@pytest.mark.unit
+@patch("plane.middleware.logger.log_api_activity")
+class TestAPITokenLogMiddleware:
+    """Test the buffered logs of the api key requests"""
+
+    def test_bodies_are_truncated(self, mock_log, api_request, settings):
+        """Test the logged bodies are cut to the configured limit"""
+        settings.API_ACTIVITY_LOG_BODY_LIMIT = 5
+        middleware = APITokenLogMiddleware(Mock(return_value=HttpResponse("abcdefgh")))
+
+        middleware(api_request)
+
+        log = mock_log.call_args.kwargs
+        assert log["body"] == '{"nam'
+        assert log["response_body"] == "abcde"
+        assert log["ip_address"] == "127.0.0.1"
+
+    def test_requests_are_sampled(self, mock_log, api_request, settings):
+        """Test the successful requests are skipped outside of the sample"""
+        settings.API_ACTIVITY_LOG_SAMPLE_RATE = 0
+        middleware = APITokenLogMiddleware(Mock(return_value=HttpResponse()))
+
+        middleware(api_request)
+
+        mock_log.assert_not_called()
+
+    def test_errors_are_always_logged(self, mock_log, api_request, settings):
+        """Test the failed requests are logged regardless of the sample"""
+        settings.API_ACTIVITY_LOG_SAMPLE_RATE = 0
+        middleware = APITokenLogMiddleware(Mock(return_value=HttpResponse(status=400)))
+
+        middleware(api_request)
+
+        assert mock_log.call_args.kwargs["response_code"] == 400
+
+    def test_requests_without_api_key_are_not_logged(self, mock_log):
+        """Test the session requests are not logged"""
+        middleware = APITokenLogMiddleware(Mock(return_value=HttpResponse()))
+
+        middleware(RequestFactory().get("/api/workspaces/"))
+
+        mock_log.assert_not_called()
@@ -0,0 +1,33 @@
+import pytest
+from django.core.cache import caches
+
+from plane.db.models.session import SessionStore
+
+LOCMEM_CACHES = {
+    "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+}
+
+
+@pytest.mark.unit
+class TestSessionStore:
+    """Test the cached session store"""
+
+    def test_load_from_cache(self, settings):
+        """Test a cached session is read without a database query"""
+        settings.CACHES = LOCMEM_CACHES
+        session_key = SessionStore()._get_new_session_key()
+        caches["default"].set(
+            SessionStore.cache_key_prefix + session_key, {"_auth_user_id": "1"}
+        )
+
+        # The database access is blocked outside of the django_db tests
+        session = SessionStore(session_key)
+
+        assert session["_auth_user_id"] == "1"
+
+    def test_new_session_key(self):
+        """Test the new session keys are random without a lookup"""
+        session_key = SessionStore()._get_new_session_key()
+
+        assert len(session_key) == 128
+        assert session_key != SessionStore()._get_new_session_key()
@@ -0,0 +1,111 @@
+import json
+from unittest.mock import patch
+
+import pytest
+import redis
+from django.test import RequestFactory
+from django.utils import timezone
+
+from plane.license.models import Instance, InstanceAdmin
+from plane.settings.redis import redis_connection_pool, redis_pool_stats
+from plane.web.views import health_check
+
+
+@pytest.fixture
+def own_pool_settings(settings):
+    # The database 1 does not share the pool of the cache
+    settings.REDIS_URL = "redis://localhost:6379/1"
+    return settings
+
+
+@pytest.mark.unit
+class TestRedisConnectionPool:
+    """Test the pool of the redis client"""
+
+    def test_pool_is_not_capped_by_default(self, own_pool_settings):
+        own_pool_settings.REDIS_CONNECTION_POOL_CLASS = "redis.ConnectionPool"
+        own_pool_settings.REDIS_CONNECTION_POOL_KWARGS = {}
+
+        pool = redis_connection_pool()
+
+        assert type(pool) is redis.ConnectionPool
+        assert pool.max_connections == 2**31
+
+    @patch("redis.connection.AbstractConnection.connect")
+    def test_capped_pool_waits_for_a_free_connection(
+        self, mock_connect, own_pool_settings
+    ):
+        own_pool_settings.REDIS_CONNECTION_POOL_CLASS = "redis.BlockingConnectionPool"
+        own_pool_settings.REDIS_CONNECTION_POOL_KWARGS = {
+            "max_connections": 1,
+            "timeout": 0.1,
+        }
+
+        pool = redis_connection_pool()
+        connection = pool.get_connection("GET")
+        # The exhausted pool raises only once the timeout elapsed
+        with pytest.raises(redis.ConnectionError):
+            pool.get_connection("GET")
+        pool.release(connection)
+
+        assert isinstance(pool, redis.BlockingConnectionPool)
+        assert pool.get_connection("GET") is connection
+
+
+@pytest.mark.unit
+class TestRedisPoolStats:
+    """Test the connection statistics of the pool"""
+
+    @pytest.mark.parametrize(
+        "pool_class", [redis.ConnectionPool, redis.BlockingConnectionPool]
+    )
+    @patch("redis.connection.AbstractConnection.connect")
+    def test_stats_count_the_connections(self, mock_connect, pool_class):
+        pool = pool_class(max_connections=5)
+        in_use = pool.get_connection("GET")
+        pool.release(pool.get_connection("GET"))
+        pool.get_connection("GET")
+
+        with patch(
+            "plane.settings.redis.redis_instance",
+            return_value=redis.Redis(connection_pool=pool),
+        ):
+            stats = redis_pool_stats()
+
+        pool.release(in_use)
+        assert stats["max_connections"] == 5
+        assert stats["created_connections"] == 2
+        assert stats["in_use_connections"] == 2
+        assert stats["available_connections"] == 0
+
+    @pytest.mark.django_db
+    def test_stats_are_limited_to_the_instance_admins(
+        self, session_client, create_user
+    ):
+        url = "/api/instances/redis-pool/"
+        assert session_client.get(url).status_code == 403
+
+        instance = Instance.objects.create(
+            instance_name="Plane",
+            instance_id="instance",
+            current_version="1.0.0",
+            last_checked_at=timezone.now(),
+        )
+        InstanceAdmin.objects.create(user=create_user, instance=instance)
+        with patch(
+            "plane.license.api.views.instance.redis_pool_stats",
+            return_value={"in_use_connections": 1},
+        ):
+            response = session_client.get(url)
+
+        assert response.status_code == 200
+        assert response.data == {"in_use_connections": 1}
+
+
+@pytest.mark.unit
+def test_health_check_does_not_expose_the_redis_pool():
+    request = RequestFactory().get("/", {"redis_pool": "true"})
+
+    response = health_check(request)
+
+    assert json.loads(response.content) == {"status": "OK"}
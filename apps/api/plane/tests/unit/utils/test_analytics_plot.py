@@ -0,0 +1,106 @@
+import random
+from collections import Counter
+from datetime import date, timedelta
+
+import pytest
+
+from plane.utils.analytics_plot import cumulative_burndown
+
+
+def date_range(start, days):
+    return [start + timedelta(days=day) for day in range(days)]
+
+
+@pytest.mark.unit
+class TestCumulativeBurndown:
+    """Test the pending work series of the burndown charts"""
+
+    def test_pending_work_of_every_date(self):
+        """Test every date subtracts the completions up to the date"""
+        dates = date_range(date(2024, 1, 1), 4)
+        histogram = {
+            date(2023, 12, 30): 1,
+            date(2024, 1, 2): 2,
+            date(2024, 1, 4): 3,
+            date(2024, 2, 1): 4,
+        }
+
+        assert cumulative_burndown(dates, 10, histogram, date(2024, 3, 1)) == {
+            "2024-01-01": 9,
+            "2024-01-02": 7,
+            "2024-01-03": 7,
+            "2024-01-04": 4,
+        }
+
+    def test_future_dates_have_no_value(self):
+        """Test the dates after today are not plotted"""
+        dates = date_range(date(2024, 1, 1), 3)
+
+        assert cumulative_burndown(dates, 5.0, {}, date(2024, 1, 2)) == {
+            "2024-01-01": 5.0,
+            "2024-01-02": 5.0,
+            "2024-01-03": None,
+        }
+
+
+class CountingHistogram(Counter):
+    """Counts the passes over the completions"""
+
+    passes = 0
+
+    def items(self):
+        self.passes += 1
+        return super().items()
+
+
+@pytest.mark.unit
+def test_burndown_matches_the_scan_of_every_date():
+    """Test the prefix sum gives the series of a scan of the issues for every date"""
+    dates = date_range(date(2024, 1, 1), 90)
+    random.seed(0)
+    # Some completions fall before and after the range of the chart
+    completions = [
+        random.choice(date_range(date(2023, 12, 1), 150)) for _ in range(2_000)
+    ]
+    histogram = CountingHistogram(completions)
+    today = date(2024, 3, 1)
+
+    chart = cumulative_burndown(dates, 2_000, histogram, today)
+
+    assert chart == {
+        str(day): (
+            None
+            if day > today
+            else 2_000 - sum(1 for completed in completions if completed <= day)
+        )
+        for day in dates
+    }
+    # The completions are read once for all the dates
+    assert histogram.passes == 1
+
+
+@pytest.mark.unit
+@pytest.mark.slow
+def test_burndown_of_a_year_long_module():
+    """Test a year long module with many completions is read in a single pass"""
+    dates = date_range(date(2024, 1, 1), 366)
+    random.seed(1)
+    completion_dates = date_range(date(2023, 12, 1), 420)
+    completions = [random.choice(completion_dates) for _ in range(50_000)]
+    histogram = CountingHistogram(completions)
+    today = date(2024, 10, 1)
+
+    chart = cumulative_burndown(dates, 50_000, histogram, today)
+
+    # The scan of every date runs over the per day counts of the completions
+    counts = Counter(completions)
+    assert chart == {
+        str(day): (
+            None
+            if day > today
+            else 50_000
+            - sum(count for completed, count in counts.items() if completed <= day)
+        )
+        for day in dates
+    }
+    assert histogram.passes == 1
@@ -0,0 +1,103 @@
+from datetime import date
+from unittest.mock import patch
+
+import pytest
+
+from plane.bgtasks.analytics_rollup_task import refresh_relation_rollups
+from plane.bgtasks.deletion_task import soft_delete_related_objects
+from plane.db.models import (
+    Issue,
+    IssueLabel,
+    IssueRollup,
+    Label,
+    Project,
+    State,
+)
+from plane.utils.analytics_rollup import (
+    get_analytics_rollup_range,
+    get_chart_dimension,
+    get_dimension_names,
+    refresh_issue_rollups,
+)
+from plane.utils.date_utils import get_analytics_date_range
+
+
+@pytest.mark.unit
+class TestGetChartDimension:
+    """Test the charts answered by the analytics rollups"""
+
+    def test_single_valued_axes_use_the_totals(self):
+        assert get_chart_dimension("PRIORITY") == ""
+        assert get_chart_dimension("STATE_GROUPS", "CREATED_AT") == ""
+
+    def test_one_multi_valued_axis_uses_its_dimension(self):
+        assert get_chart_dimension("LABELS", "PRIORITY") == "label"
+        assert get_chart_dimension("PRIORITY", "ASSIGNEES") == "assignee"
+        assert get_chart_dimension("CYCLES", "CYCLES") == "cycle"
+
+    def test_filtered_dimension_is_combined_with_the_axes(self):
+        assert get_chart_dimension("PRIORITY", None, "cycle") == "cycle"
+        assert get_chart_dimension("LABELS", None, "module") is None
+
+    def test_unsupported_charts_are_not_answered(self):
+        """Test two multi valued axes or the other fields are computed live"""
+        assert get_chart_dimension("LABELS", "ASSIGNEES") is None
+        assert get_chart_dimension("STATES") is None
+        assert get_chart_dimension("PRIORITY", "ESTIMATE_POINTS") is None
+
+
+@pytest.mark.unit
+def test_analytics_rollup_range_covers_the_current_period():
+    date_range = get_analytics_date_range("custom", "2025-01-01", "2025-01-31")
+
+    assert get_analytics_rollup_range(date_range) == (
+        date(2025, 1, 1),
+        date(2025, 1, 31),
+    )
+    assert get_analytics_rollup_range(None) is None
+
+
+@pytest.mark.unit
+@pytest.mark.django_db
+class TestRelationRollups:
+    """Test the rollups follow the relation changes that do not update the issues"""
+
+    @pytest.fixture
+    def issue(self, settings, workspace):
+        settings.ENABLE_ANALYTICS_ROLLUP = True
+        project = Project.objects.create(
+            name="Test Project", identifier="TP", workspace=workspace
+        )
+        State.objects.create(
+            name="Todo", group="unstarted", default=True, project=project
+        )
+        issue = Issue.objects.create(name="Issue", workspace=workspace, project=project)
+        label = Label.objects.create(name="bug", workspace=workspace, project=project)
+        IssueLabel.objects.create(
+            label=label, issue=issue, workspace=workspace, project=project
+        )
+        refresh_issue_rollups({(project.id, issue.created_at.date())})
+        return issue
+
+    def test_deleted_label_is_removed_from_the_rollups(self, issue):
+        label = Label.objects.get()
+        assert IssueRollup.objects.filter(dimension="label").count() == 1
+
+        with patch.object(
+            refresh_relation_rollups, "delay", side_effect=refresh_relation_rollups
+        ):
+            label.deleted_at = issue.created_at
+            label.save()
+            soft_delete_related_objects("db", "label", label.id)
+
+        assert not IssueRollup.objects.filter(dimension="label").exists()
+        assert get_dimension_names("label", [label.id]) == {}
+
+    def test_state_group_change_moves_the_issues(self, issue):
+        State.objects.filter(pk=issue.state_id).update(group="started")
+
+        refresh_relation_rollups("state", str(issue.state_id))
+
+        assert set(
+            IssueRollup.objects.values_list("state_group", flat=True).distinct()
+        ) == {"started"}
@@ -0,0 +1,80 @@
+from datetime import timedelta
+from unittest.mock import patch
+
+import pytest
+from django.core.cache import cache
+from django.utils import timezone
+
+from plane.db.models import APIToken
+from plane.utils.api_token_cache import (
+    api_token_cache_key,
+    get_api_token,
+    invalidate_api_tokens,
+)
+
+LOCMEM_CACHES = {
+    "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+}
+
+
+@pytest.fixture(autouse=True)
+def locmem_cache(settings):
+    settings.CACHES = LOCMEM_CACHES
+    cache.clear()
+
+
+@pytest.mark.unit
+class TestGetApiToken:
+    """Test the cached lookup of the api tokens"""
+
+    def test_cached_token_is_returned(self):
+        """Test a cached token is returned without a database query"""
+        api_token = APIToken(token="plane_api_token", expired_at=None)
+        cache.set(api_token_cache_key("plane_api_token"), api_token)
+
+        assert get_api_token("plane_api_token").token == "plane_api_token"
+
+    def test_expired_cached_token_is_rejected(self):
+        """Test a token expiring while it is cached is not valid"""
+        api_token = APIToken(
+            token="plane_api_token", expired_at=timezone.now() - timedelta(seconds=1)
+        )
+        cache.set(api_token_cache_key("plane_api_token"), api_token)
+
+        assert get_api_token("plane_api_token") is None
+
+    @patch("plane.utils.api_token_cache.APIToken.objects")
+    def test_invalid_token_is_cached(self, mock_objects):
+        """Test an unknown token is looked up in the database only once"""
+        queryset = mock_objects.filter.return_value.select_related.return_value
+        queryset.first.return_value = None
+
+        assert get_api_token("unknown") is None
+        assert get_api_token("unknown") is None
+        mock_objects.filter.assert_called_once()
+
+
+@pytest.mark.unit
+@pytest.mark.django_db
+class TestInvalidateApiTokens:
+    """Test the cached tokens are dropped when they stop being valid"""
+
+    def test_deactivated_user_token_is_rejected(self, api_token, create_user):
+        """Test the token of a deactivated user is rejected once invalidated"""
+        assert get_api_token(api_token.token) is not None
+
+        create_user.is_active = False
+        create_user.save()
+        invalidate_api_tokens(user=create_user)
+
+        assert get_api_token(api_token.token) is None
+
+    def test_workspace_tokens_are_invalidated(self, api_token, workspace):
+        """Test the tokens of a workspace are removed from the cache"""
+        api_token.workspace = workspace
+        api_token.save()
+        assert get_api_token(api_token.token) is not None
+
+        invalidate_api_tokens(workspace_id=workspace.id)
+
+        assert cache.get(api_token_cache_key(api_token.token)) is None
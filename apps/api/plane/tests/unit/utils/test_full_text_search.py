@@ -0,0 +1,105 @@
+from importlib import import_module
+
+import pytest
+from django.contrib.postgres.search import SearchQuery
+from django.db import connection
+
+from plane.db.models import Issue, Project, State
+from plane.utils.full_text_search import (
+    full_text_search,
+    get_search_query,
+    trigram_search,
+)
+
+search_vectors_migration = import_module("plane.db.migrations.0107_search_vectors")
+
+
+@pytest.mark.unit
+class TestGetSearchQuery:
+    """Test the search query built from the search text"""
+
+    def test_words_are_prefix_matched(self):
+        """Test every word of the search is matched as a prefix"""
+        assert get_search_query("Login  Bug!") == SearchQuery(
+            "login:* & bug:*", search_type="raw", config="simple"
+        )
+
+    def test_operators_are_removed(self):
+        """Test the tsquery operators of the search text are not passed through"""
+        assert get_search_query("a|b & !c:*") == SearchQuery(
+            "a:* & b:* & c:*", search_type="raw", config="simple"
+        )
+
+    def test_search_without_words(self):
+        """Test a search without words has no search query"""
+        assert get_search_query("--") is None
+
+
+@pytest.mark.unit
+class TestTrigramSearch:
+    """Test the typeahead search by trigram similarity"""
+
+    def test_fields_are_similarity_matched(self):
+        """Test the fields are matched by their word similarity to the query"""
+        queryset = trigram_search(Project.objects.all(), "plne", ["name", "identifier"])
+        sql = str(queryset.query)
+
+        assert '"projects"."name" %> plne' in sql
+        assert '"projects"."identifier" %> plne' in sql
+        assert queryset.query.order_by == ("-similarity",)
+
+    def test_short_query_is_prefix_matched(self):
+        """Test a query shorter than a trigram is matched by the prefix"""
+        sql = str(trigram_search(Project.objects.all(), "pl", ["name"]).query)
+
+        assert "%>" not in sql
+        assert "LIKE" in sql
+
+
+@pytest.mark.unit
+@pytest.mark.django_db
+class TestFullTextSearch:
+    """Test the word search against the search vector indexes"""
+
+    @pytest.fixture
+    def project(self, workspace):
+        project = Project.objects.create(
+            name="Test Project", identifier="TP", workspace=workspace
+        )
+        State.objects.create(
+            name="Todo", group="unstarted", default=True, project=project
+        )
+        return project
+
+    def test_name_matches_are_ranked_first(self, workspace, project):
+        """Test the matches of the name rank above the matches of the description"""
+        description_match = Issue.objects.create(
+            name="Crash on save",
+            description_html="<p>The login page</p>",
+            workspace=workspace,
+            project=project,
+        )
+        name_match = Issue.objects.create(
+            name="Login fails", workspace=workspace, project=project
+        )
+        Issue.objects.create(name="Other", workspace=workspace, project=project)
+
+        issues = full_text_search(Issue.objects.all(), get_search_query("logi"))
+
+        assert list(issues) == [name_match, description_match]
+
+    def test_search_uses_the_migration_index(self, project):
+        """Test the search vector expression matches the indexed expression"""
+        operation = search_vectors_migration.add_search_vector_index(
+            "issues", *search_vectors_migration.SEARCH_VECTORS["issues"]
+        )
+        queryset = full_text_search(Issue.objects.all(), get_search_query("login"))
+        with connection.cursor() as cursor:
+            # The test runs in a transaction, the index can not be concurrent
+            cursor.execute(operation.sql.replace("CONCURRENTLY ", ""))
+            cursor.execute("SET LOCAL enable_seqscan = off")
+            sql, params = queryset.query.sql_with_params()
+            cursor.execute(f"EXPLAIN {sql}", params)
+            plan = "\n".join(row[0] for row in cursor.fetchall())
+
+        assert "issues_search_vector_idx" in plan
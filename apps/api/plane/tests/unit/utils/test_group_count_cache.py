@@ -0,0 +1,101 @@
+import pytest
+from django.core.cache import cache
+from django.db.models import Q
+
+from plane.db.models import Issue, Project, State
+from plane.utils.group_count_cache import (
+    group_count_cache_key,
+    invalidate_group_counts,
+)
+from plane.utils.paginator import GroupedOffsetPaginator
+
+LOCMEM_CACHES = {
+    "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+}
+
+
+@pytest.fixture(autouse=True)
+def locmem_cache(settings):
+    settings.CACHES = LOCMEM_CACHES
+    cache.clear()
+
+
+@pytest.fixture
+def project(workspace):
+    project = Project.objects.create(
+        name="Test Project", identifier="TP", workspace=workspace
+    )
+    for group in ["backlog", "started"]:
+        State.objects.create(
+            name=group, group=group, project=project, workspace=workspace
+        )
+    return project
+
+
+def create_issue(project, group):
+    return Issue.objects.create(
+        name="Issue",
+        workspace=project.workspace,
+        project=project,
+        state=State.objects.get(project=project, group=group),
+    )
+
+
+def get_group_totals(project, filters):
+    """Return the totals of the first page of the issues grouped by state group"""
+    paginator = GroupedOffsetPaginator(
+        queryset=Issue.issue_objects.filter(project=project),
+        group_by_field_name="state__group",
+        group_by_fields=["backlog", "started"],
+        count_filter=Q(),
+        order_by="-created_at",
+        count_cache_key=group_count_cache_key(
+            project_id=project.id,
+            scope="issues",
+            filters=filters,
+            group_by="state__group",
+        ),
+    )
+    result = paginator.get_result(limit=10)
+    groups = paginator.process_results(list(result.results.values()))
+    return {group: value["total_results"] for group, value in groups.items()}
+
+
+@pytest.mark.unit
+@pytest.mark.django_db
+class TestGroupCountCache:
+    """Test the cached totals of the grouped issue lists"""
+
+    def test_totals_are_cached_across_the_pages(
+        self, project, django_assert_num_queries
+    ):
+        create_issue(project, "backlog")
+        create_issue(project, "started")
+        first = get_group_totals(project, {})
+
+        # Only the page rows and the next page are queried, the hits and the
+        # group totals are cached
+        with django_assert_num_queries(3):
+            assert get_group_totals(project, {}) == first
+        assert first == {"backlog": 1, "started": 1}
+
+    def test_issue_write_invalidates_the_totals(self, project):
+        create_issue(project, "backlog")
+        assert get_group_totals(project, {}) == {"backlog": 1, "started": 0}
+
+        create_issue(project, "backlog")
+        # The totals are served from the cache until the project is invalidated
+        assert get_group_totals(project, {}) == {"backlog": 1, "started": 0}
+        invalidate_group_counts(project.id)
+
+        assert get_group_totals(project, {}) == {"backlog": 2, "started": 0}
+
+    def test_filters_have_their_own_totals(self, project):
+        create_issue(project, "backlog")
+        get_group_totals(project, {})
+
+        assert group_count_cache_key(
+            project.id, "issues", {}, "state__group"
+        ) != group_count_cache_key(
+            project.id, "issues", {"priority__in": ["high"]}, "state__group"
+        )
@@ -0,0 +1,169 @@
+import pytest
+
+from plane.app.views.issue.base import IssueViewSet
+from plane.bgtasks.issue_list_projection_task import (
+    PROJECTION_FIELDS,
+    refresh_issue_list_projection,
+)
+from plane.db.models import (
+    Cycle,
+    CycleIssue,
+    FileAsset,
+    Issue,
+    IssueAssignee,
+    IssueLabel,
+    IssueLink,
+    IssueListProjection,
+    Label,
+    Module,
+    ModuleIssue,
+    Project,
+    ProjectMember,
+    State,
+)
+from plane.utils.issue_list_projection import (
+    issue_array_annotations,
+    issue_count_annotations,
+)
+
+
+def list_rows(issue_ids):
+    rows = (
+        Issue.issue_objects.filter(pk__in=issue_ids)
+        .annotate(**issue_count_annotations(), **issue_array_annotations())
+        .values("id", *PROJECTION_FIELDS)
+    )
+    return {
+        row["id"]: {
+            key: sorted(value) if isinstance(value, list) else value
+            for key, value in row.items()
+        }
+        for row in rows
+    }
+
+
+@pytest.fixture
+def project(workspace, create_user):
+    project = Project.objects.create(
+        name="Test Project", identifier="TP", workspace=workspace
+    )
+    ProjectMember.objects.create(project=project, member=create_user, role=20)
+    State.objects.create(
+        name="Todo",
+        group="unstarted",
+        default=True,
+        project=project,
+        workspace=workspace,
+    )
+    return project
+
+
+@pytest.fixture
+def issues(workspace, project, create_user):
+    """An issue with a value for every column of the list row and a bare issue"""
+    issue = Issue.objects.create(name="Issue", workspace=workspace, project=project)
+    bare_issue = Issue.objects.create(
+        name="Bare issue", workspace=workspace, project=project
+    )
+    Issue.objects.create(
+        name="Sub issue", workspace=workspace, project=project, parent=issue
+    )
+
+    cycle = Cycle.objects.create(
+        name="Cycle", workspace=workspace, project=project, owned_by=create_user
+    )
+    CycleIssue.objects.create(
+        cycle=cycle, issue=issue, workspace=workspace, project=project
+    )
+    module = Module.objects.create(name="Module", workspace=workspace, project=project)
+    ModuleIssue.objects.create(
+        module=module, issue=issue, workspace=workspace, project=project
+    )
+    for name in ["bug", "feature"]:
+        label = Label.objects.create(name=name, workspace=workspace, project=project)
+        IssueLabel.objects.create(
+            label=label, issue=issue, workspace=workspace, project=project
+        )
+    IssueAssignee.objects.create(
+        assignee=create_user, issue=issue, workspace=workspace, project=project
+    )
+    IssueLink.objects.create(
+        url="https://plane.so", issue=issue, workspace=workspace, project=project
+    )
+    FileAsset.objects.create(
+        asset="attachment.pdf",
+        attributes={"name": "attachment.pdf"},
+        entity_type=FileAsset.EntityTypeContext.ISSUE_ATTACHMENT,
+        issue=issue,
+        workspace=workspace,
+        project=project,
+    )
+    return issue, bare_issue
+
+
+@pytest.mark.unit
+@pytest.mark.django_db
+class TestIssueListProjection:
+    """Test the issue list rows read from the projection against the live rows"""
+
+    def test_projection_matches_the_live_annotations(self, settings, issues):
+        issue_ids = [issue.id for issue in issues]
+        settings.ENABLE_ISSUE_LIST_PROJECTION = False
+        live = list_rows(issue_ids)
+
+        refresh_issue_list_projection(issue_ids)
+        settings.ENABLE_ISSUE_LIST_PROJECTION = True
+
+        assert IssueListProjection.objects.filter(issue_id__in=issue_ids).count() == 2
+        assert list_rows(issue_ids) == live
+        assert live[issues[0].id]["link_count"] == 1
+        assert live[issues[0].id]["sub_issues_count"] == 1
+        assert len(live[issues[0].id]["label_ids"]) == 2
+
+    def test_issues_without_a_row_are_computed_live(self, settings, issues):
+        issue_ids = [issue.id for issue in issues]
+        settings.ENABLE_ISSUE_LIST_PROJECTION = False
+        live = list_rows(issue_ids)
+
+        settings.ENABLE_ISSUE_LIST_PROJECTION = True
+        assert not IssueListProjection.objects.filter(issue_id__in=issue_ids).exists()
+        assert list_rows(issue_ids) == live
+
+    def test_refresh_updates_the_issue_and_its_parent(
+        self, settings, issues, workspace, project
+    ):
+        issue, bare_issue = issues
+        refresh_issue_list_projection([issue.id, bare_issue.id])
+
+        IssueLink.objects.create(
+            url="https://plane.so",
+            issue=bare_issue,
+            workspace=workspace,
+            project=project,
+        )
+        sub_issue = Issue.objects.create(
+            name="Sub issue", workspace=workspace, project=project, parent=issue
+        )
+        # The parent of the sub issue is refreshed with it
+        refresh_issue_list_projection([sub_issue.id, bare_issue.id])
+
+        assert IssueListProjection.objects.get(issue=issue).sub_issues_count == 2
+        assert IssueListProjection.objects.get(issue=bare_issue).link_count == 1
+        assert IssueListProjection.objects.get(issue=sub_issue).link_count == 0
+
+    def test_flag_off_viewset_counts_are_null_without_rows(self, settings, issues):
+        """Test the issue viewset keeps its grouped count subqueries"""
+        settings.ENABLE_ISSUE_LIST_PROJECTION = False
+        row = (
+            Issue.issue_objects.filter(pk=issues[1].id)
+            .annotate(**IssueViewSet().get_count_annotations())
+            .values("cycle_id", "link_count", "attachment_count", "sub_issues_count")
+            .get()
+        )
+
+        assert row == {
+            "cycle_id": None,
+            "link_count": None,
+            "attachment_count": None,
+            "sub_issues_count": None,
+        }
@@ -0,0 +1,51 @@
+import uuid
+from types import SimpleNamespace
+
+import pytest
+from django.core.cache import cache
+
+from plane.utils.member_role_cache import (
+    get_member_role,
+    invalidate_member_roles,
+    member_role_cache_key,
+)
+
+LOCMEM_CACHES = {
+    "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+}
+
+
+@pytest.fixture
+def request_user(settings):
+    settings.CACHES = LOCMEM_CACHES
+    return SimpleNamespace(user=SimpleNamespace(id=uuid.uuid4()))
+
+
+@pytest.mark.unit
+class TestMemberRoleCache:
+    """Test the cache of the membership roles"""
+
+    def test_role_is_read_from_cache(self, request_user):
+        """Test a cached role is resolved without a database query"""
+        project_id = uuid.uuid4()
+        cache.set(member_role_cache_key(request_user.user.id, "ws", project_id), 15)
+
+        # The database access is blocked outside of the django_db tests
+        assert get_member_role(request_user, "ws", project_id) == 15
+
+    def test_role_is_resolved_once_per_request(self, request_user):
+        """Test the role is kept on the request for the later checks"""
+        cache.set(member_role_cache_key(request_user.user.id, "ws"), 20)
+        assert get_member_role(request_user, "ws") == 20
+
+        cache.clear()
+
+        assert get_member_role(request_user, "ws") == 20
+
+    def test_invalidate_changes_the_key(self, request_user):
+        """Test the invalidation moves the user to new cache keys"""
+        key = member_role_cache_key(request_user.user.id, "ws")
+
+        invalidate_member_roles([request_user.user.id])
+
+        assert member_role_cache_key(request_user.user.id, "ws") != key
@@ -0,0 +1,234 @@
+import uuid
+from datetime import date, datetime, timezone
+
+import pytest
+from django.db.models import Q
+
+from plane.db.models import Issue, Project, State
+from plane.utils.paginator import (
+    GroupedOffsetPaginator,
+    KeysetCursor,
+    OffsetPaginator,
+    SubGroupedOffsetPaginator,
+)
+
+
+@pytest.mark.unit
+class TestKeysetCursor:
+    """Test the keyset cursor encoding"""
+
+    def test_round_trip(self):
+        """Test the cursor survives the string conversion"""
+        issue_id = str(uuid.uuid4())
+        cursor = KeysetCursor(
+            {("backlog",): (1000.0, "2024-01-01T00:00:00Z", issue_id)},
+            has_results=True,
+        )
+
+        decoded = KeysetCursor.from_string(str(cursor))
+
+        assert decoded.positions == cursor.positions
+        assert decoded.is_prev is False
+
+    def test_round_trip_previous_cursor(self):
+        """Test the direction of the cursor survives the string conversion"""
+        cursor = KeysetCursor({(): (None, "2024-01-01T00:00:00Z", "id")}, True, True)
+
+        assert KeysetCursor.from_string(str(cursor)).is_prev is True
+
+    def test_empty_cursor(self):
+        """Test an empty cursor starts from the first page"""
+        cursor = KeysetCursor.from_string("")
+
+        assert cursor.positions == {}
+        assert str(KeysetCursor()) == ""
+
+    def test_invalid_cursor(self):
+        """Test an invalid cursor raises a value error"""
+        with pytest.raises(ValueError):
+            KeysetCursor.from_string("not-a-cursor")
+
+
+@pytest.mark.unit
+class TestKeysetFilter:
+    """Test the seek filter of the offset paginator"""
+
+    created_at = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    issue_id = uuid.uuid4()
+
+    def tie_breaker(self):
+        return Q(created_at__lt=self.created_at) | Q(
+            created_at=self.created_at, id__lt=self.issue_id
+        )
+
+    def test_filter_without_key(self):
+        """Test the filter only uses the tie breakers without a key"""
+        paginator = OffsetPaginator(queryset=None)
+
+        assert (
+            paginator.get_keyset_filter((self.created_at, self.issue_id))
+            == self.tie_breaker()
+        )
+
+    def test_filter_descending_key(self):
+        """Test the filter seeks below the key for descending order"""
+        paginator = OffsetPaginator(queryset=None, order_by="-sort_order")
+
+        assert paginator.get_keyset_filter((65535, self.created_at, self.issue_id)) == (
+            Q(sort_order__lt=65535)
+            | Q(sort_order__isnull=True)
+            | (Q(sort_order=65535) & self.tie_breaker())
+        )
+
+    def test_filter_null_key(self):
+        """Test only null keys follow a null key"""
+        paginator = OffsetPaginator(queryset=None, order_by="target_date")
+
+        assert paginator.get_keyset_filter((None, self.created_at, self.issue_id)) == (
+            Q(target_date__isnull=True) & self.tie_breaker()
+        )
+
+    def test_reverse_filter_descending_key(self):
+        """Test the reverse filter seeks above the key and skips the nulls"""
+        paginator = OffsetPaginator(queryset=None, order_by="-sort_order")
+
+        assert paginator.get_keyset_filter(
+            (65535, self.created_at, self.issue_id), reverse=True
+        ) == (
+            Q(sort_order__gt=65535)
+            | (
+                Q(sort_order=65535)
+                & (
+                    Q(created_at__gt=self.created_at)
+                    | Q(created_at=self.created_at, id__gt=self.issue_id)
+                )
+            )
+        )
+
+
+@pytest.fixture
+def paged_issues(workspace):
+    """Issues sharing their sort keys and their created_at"""
+    project = Project.objects.create(
+        name="Test Project", identifier="TP", workspace=workspace
+    )
+    states = [
+        State.objects.create(
+            name=name, group=name, project=project, workspace=workspace
+        )
+        for name in ["backlog", "started"]
+    ]
+    target_dates = [None, date(2024, 1, 1), date(2024, 1, 2)]
+    for index in range(13):
+        Issue.objects.create(
+            name=f"Issue {index}",
+            workspace=workspace,
+            project=project,
+            state=states[index % 2],
+            target_date=target_dates[index % 3],
+        )
+    queryset = Issue.issue_objects.filter(project=project)
+    queryset.update(
+        sort_order=65535, created_at=datetime(2024, 1, 1, tzinfo=timezone.utc)
+    )
+    return queryset
+
+
+def read_pages(paginator, limit, cursor=None):
+    """Return the pages and the last cursor following the cursors of the pages"""
+    pages = []
+    while True:
+        result = paginator.get_result(limit=limit, cursor=cursor)
+        pages.append([issue.id for issue in result.results])
+        following = (
+            result.prev if cursor is not None and cursor.is_prev else result.next
+        )
+        if not following:
+            return pages, result
+        cursor = KeysetCursor.from_string(str(following))
+
+
+@pytest.mark.unit
+@pytest.mark.django_db
+class TestKeysetPagination:
+    """Test the keyset pages of the rows sharing their sort keys"""
+
+    @pytest.mark.parametrize("order_by", ["sort_order", "-target_date", "target_date"])
+    def test_pages_have_no_gaps_or_duplicates(self, paged_issues, order_by):
+        paginator = OffsetPaginator(
+            queryset=paged_issues, order_by=order_by, keyset=True
+        )
+        expected = list(
+            paged_issues.order_by(*paginator.get_keyset_order()).values_list(
+                "id", flat=True
+            )
+        )
+
+        pages, last = read_pages(paginator, limit=4)
+
+        assert [len(page) for page in pages] == [4, 4, 4, 1]
+        assert [issue_id for page in pages for issue_id in page] == expected
+
+        # Going back returns the same pages
+        back_pages, first = read_pages(
+            paginator, limit=4, cursor=KeysetCursor.from_string(str(last.prev))
+        )
+        assert back_pages == pages[-2::-1]
+        assert not first.prev
+
+    def test_grouped_pages_skip_the_totals(
+        self, paged_issues, django_assert_num_queries
+    ):
+        paginator = GroupedOffsetPaginator(
+            queryset=paged_issues,
+            group_by_field_name="state_id",
+            group_by_fields=list(
+                paged_issues.values_list("state_id", flat=True).distinct()
+            ),
+            count_filter=Q(),
+            order_by="-target_date",
+            keyset=True,
+            include_total=False,
+        )
+
+        seen = []
+        cursor = None
+        while True:
+            # The page rows are probed and fetched, the totals are not counted
+            with django_assert_num_queries(2):
+                result = paginator.get_result(limit=2, cursor=cursor)
+                groups = paginator.process_results(list(result.results.values()))
+            assert result.hits is None
+            assert all(group["total_results"] is None for group in groups.values())
+            seen.extend(
+                issue["id"] for group in groups.values() for issue in group["results"]
+            )
+            if not result.next:
+                break
+            cursor = KeysetCursor.from_string(str(result.next))
+
+        assert sorted(seen) == sorted(paged_issues.values_list("id", flat=True))
+
+    def test_sub_grouped_pages_without_totals(self, paged_issues):
+        paginator = SubGroupedOffsetPaginator(
+            queryset=paged_issues,
+            group_by_field_name="state_id",
+            sub_group_by_field_name="target_date",
+            group_by_fields=list(
+                paged_issues.values_list("state_id", flat=True).distinct()
+            ),
+            sub_group_by_fields=[],
+            count_filter=Q(),
+            order_by="sort_order",
+            keyset=True,
+            include_total=False,
+        )
+
+        result = paginator.get_result(limit=20)
+        groups = paginator.process_results(list(result.results.values()))
+
+        assert sum(
+            len(sub_group["results"])
+            for group in groups.values()
+            for sub_group in group["results"].values()
+        ) == len(paged_issues)
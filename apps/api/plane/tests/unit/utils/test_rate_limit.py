@@ -0,0 +1,67 @@
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+from django.test import RequestFactory
+
+from plane.api.rate_limit import ApiKeyRateThrottle
+
+
+@pytest.fixture
+def api_request():
+    return RequestFactory().get(
+        "/api/v1/workspaces/plane/projects/", HTTP_X_API_KEY="plane_api_token"
+    )
+
+
+@pytest.mark.unit
+class TestSlidingWindowRateThrottle:
+    """Test the quotas and the headers of the api throttle"""
+
+    def test_token_quota(self, api_request, settings):
+        """Test the requests of a token are limited by the rate of the scope"""
+        settings.API_WORKSPACE_RATE_LIMIT = None
+        throttle = ApiKeyRateThrottle()
+        view = SimpleNamespace(kwargs={"slug": "plane"})
+
+        quotas = throttle.get_quotas(api_request, view)
+
+        assert len(quotas) == 1
+        key, num_requests, duration = quotas[0]
+        assert "plane_api_token" not in key
+        assert (num_requests, duration) == (throttle.num_requests, throttle.duration)
+
+    def test_workspace_and_endpoint_quotas(self, api_request, settings):
+        """Test the workspace and the endpoint quotas are checked with the token"""
+        settings.API_WORKSPACE_RATE_LIMIT = "1000/hour"
+        view = SimpleNamespace(kwargs={"slug": "plane"}, endpoint_rate="10/minute")
+
+        quotas = ApiKeyRateThrottle().get_quotas(api_request, view)
+
+        assert quotas[1] == ("throttle:workspace:plane", 1000, 3600)
+        assert quotas[2][1:] == (10, 60)
+
+    def test_request_without_api_key(self):
+        """Test the requests without an api key are not throttled"""
+        request = RequestFactory().get("/api/v1/workspaces/plane/projects/")
+
+        assert ApiKeyRateThrottle().allow_request(request, SimpleNamespace()) is True
+
+    @patch("plane.api.rate_limit.sliding_window")
+    def test_throttled_request(self, mock_sliding_window, api_request, settings):
+        """Test the throttled requests get the headers and the wait time"""
+        settings.API_WORKSPACE_RATE_LIMIT = None
+        mock_sliding_window.return_value = (False, 0, 1_700_000_060, 1_700_000_030.5)
+        throttle = ApiKeyRateThrottle()
+
+        assert throttle.allow_request(api_request, SimpleNamespace(kwargs={})) is False
+        assert api_request.META["X-RateLimit-Remaining"] == 0
+        assert api_request.META["X-RateLimit-Reset"] == 1_700_000_060
+        assert throttle.wait() == 30
+
+    @patch("plane.api.rate_limit.sliding_window", side_effect=ConnectionError)
+    def test_redis_failure_allows_request(self, mock_sliding_window, api_request):
+        """Test the requests are allowed when the counters are not available"""
+        throttle = ApiKeyRateThrottle()
+
+        assert throttle.allow_request(api_request, SimpleNamespace(kwargs={})) is True
@@ -0,0 +1,131 @@
+import json
+from datetime import timedelta
+
+import pytest
+from django.utils import timezone
+
+from plane.bgtasks.api_log_task import (
+    API_ACTIVITY_LOG_BUFFER_KEY,
+    flush_api_activity_logs,
+)
+from plane.db.models import APIActivityLog
+from plane.utils.redis_buffer import BUFFER_FLUSH_LOCK_TIMEOUT, flush_buffer
+
+
+def fill(ri, key, count):
+    ri.rpush(key, *[json.dumps({"index": index}) for index in range(count)])
+
+
+@pytest.mark.unit
+class TestFlushBuffer:
+    """Test the buffered items are removed only after they are written"""
+
+    def test_items_are_written_in_batches(self, fake_redis):
+        fill(fake_redis, "buffer", 5)
+        batches = []
+
+        assert flush_buffer("buffer", 2, batches.append) == 5
+
+        assert [[item["index"] for item in batch] for batch in batches] == [
+            [0, 1],
+            [2, 3],
+            [4],
+        ]
+        assert fake_redis.data["buffer"] == []
+        assert "buffer:flush" not in fake_redis.data
+
+    def test_items_are_kept_when_the_write_fails(self, fake_redis):
+        fill(fake_redis, "buffer", 3)
+
+        def write(items):
+            raise ConnectionError("database is down")
+
+        with pytest.raises(ConnectionError):
+            flush_buffer("buffer", 10, write)
+
+        assert len(fake_redis.data["buffer"]) == 3
+        assert "buffer:flush" not in fake_redis.data
+
+    def test_a_bad_item_does_not_block_the_buffer(self, fake_redis):
+        fill(fake_redis, "buffer", 3)
+        written = []
+
+        def write(items):
+            if any(item["index"] == 1 for item in items):
+                raise ValueError("bad item")
+            written.extend(items)
+
+        assert flush_buffer("buffer", 10, write) == 3
+
+        assert [item["index"] for item in written] == [0, 2]
+        assert fake_redis.data["buffer"] == []
+
+    def test_batch_is_kept_without_item_retries(self, fake_redis):
+        fill(fake_redis, "buffer", 3)
+        calls = []
+
+        def write(items):
+            calls.append(items)
+            raise ValueError("bad item")
+
+        with pytest.raises(ValueError):
+            flush_buffer("buffer", 10, write, retry_items=False)
+
+        assert len(calls) == 1
+        assert len(fake_redis.data["buffer"]) == 3
+
+    def test_max_batches(self, fake_redis):
+        fill(fake_redis, "buffer", 5)
+        batches = []
+
+        assert flush_buffer("buffer", 2, batches.append, max_batches=1) == 2
+
+        assert len(batches) == 1
+        assert len(fake_redis.data["buffer"]) == 3
+
+    def test_lock_is_extended_after_every_batch(self, fake_redis):
+        fill(fake_redis, "buffer", 5)
+        lock_timeouts = []
+
+        def write(items):
+            # The lock would expire without the extension of the last batch
+            lock_timeouts.append(fake_redis.expiries.pop("buffer:flush", None))
+
+        assert flush_buffer("buffer", 2, write) == 5
+
+        assert lock_timeouts == [BUFFER_FLUSH_LOCK_TIMEOUT] * 3
+
+    def test_concurrent_flush_is_skipped(self, fake_redis):
+        fill(fake_redis, "buffer", 1)
+        fake_redis.set("buffer:flush", 1)
+        batches = []
+
+        assert flush_buffer("buffer", 10, batches.append) is None
+
+        assert batches == []
+        assert len(fake_redis.data["buffer"]) == 1
+
+
+@pytest.mark.unit
+@pytest.mark.django_db
+def test_api_activity_logs_keep_the_request_time(fake_redis):
+    """Test the flushed api logs are created at the time of the request"""
+    requested_at = timezone.now() - timedelta(minutes=10)
+    fake_redis.rpush(
+        API_ACTIVITY_LOG_BUFFER_KEY,
+        json.dumps(
+            {
+                "token_identifier": "plane_api_token",
+                "path": "/api/v1/workspaces/",
+                "method": "GET",
+                "response_code": 200,
+                "created_at": requested_at.isoformat(),
+            }
+        ),
+    )
+
+    flush_api_activity_logs()
+
+    log = APIActivityLog.objects.get()
+    assert log.created_at == requested_at
+    assert fake_redis.data[API_ACTIVITY_LOG_BUFFER_KEY] == []
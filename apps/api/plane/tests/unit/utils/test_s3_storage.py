@@ -0,0 +1,45 @@
+from unittest.mock import patch
+
+import pytest
+
+from plane.settings import storage
+from plane.settings.storage import S3Storage
+
+LOCMEM_CACHES = {
+    "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+}
+
+
+@pytest.fixture(autouse=True)
+def s3_settings(settings, monkeypatch):
+    settings.CACHES = LOCMEM_CACHES
+    settings.PRESIGNED_URL_CACHE_TTL = 1800
+    monkeypatch.delenv("USE_MINIO", raising=False)
+    monkeypatch.setenv("AWS_S3_ENDPOINT_URL", "http://s3.example.com")
+    storage._s3_clients.clear()
+    yield
+    storage._s3_clients.clear()
+
+
+@pytest.mark.unit
+@patch("plane.settings.storage.boto3.session.Session")
+def test_client_is_shared_by_the_storages(mock_session):
+    first = S3Storage()
+    second = S3Storage()
+
+    assert first.s3_client is second.s3_client
+    assert mock_session.return_value.client.call_count == 1
+
+
+@pytest.mark.unit
+@patch("plane.settings.storage.boto3.session.Session")
+def test_presigned_url_of_immutable_assets_is_reused(mock_session):
+    client = mock_session.return_value.client.return_value
+    client.meta.endpoint_url = "http://s3.example.com"
+    client.generate_presigned_url.side_effect = ["url-1", "url-2", "url-3"]
+
+    s3_storage = S3Storage()
+    assert s3_storage.generate_cached_presigned_url("a/avatar.png") == "url-1"
+    assert s3_storage.generate_cached_presigned_url("a/avatar.png") == "url-1"
+    assert s3_storage.generate_cached_presigned_url("a/cover.png") == "url-2"
+    assert client.generate_presigned_url.call_count == 2
@@ -101,41 +101,58 @@ def build_graph_plot(queryset, x_axis, y_axis, segment=None):
     return sort_data(grouped_data, temp_axis)
 
 
+def get_completion_histogram(issues, plot_type):
+    """
+    Return the completed issues, or their estimate points, of every completion
+    date in one grouped query
+    """
+    completed = (
+        issues.filter(completed_at__isnull=False)
+        .annotate(date=TruncDate("completed_at"))
+        .values("date")
+    )
+    if plot_type == "points":
+        completed = completed.annotate(
+            total_completed=Sum(Cast("estimate_point__value", FloatField()))
+        )
+    else:
+        completed = completed.annotate(total_completed=Count("id"))
+    return {
+        item["date"]: item["total_completed"] or 0
+        for item in completed.values("date", "total_completed").order_by("date")
+    }
+
+
+def cumulative_burndown(date_range, total, completion_histogram, today):
+    """
+    Compute the pending work of every date of the range with a prefix sum of
+    the completions, the future dates have no value
+    """
+    completions = sorted(completion_histogram.items())
+    chart_data = {}
+    index = 0
+    total_completed = 0
+    for date in date_range:
+        # Add the completions up to the date
+        while index < len(completions) and completions[index][0] <= date:
+            total_completed += completions[index][1]
+            index += 1
+        chart_data[str(date)] = None if date > today else total - total_completed
+    return chart_data
+
+
 def burndown_plot(queryset, slug, project_id, plot_type, cycle_id=None, module_id=None):
     # Total Issues in Cycle or Module
-    total_issues = queryset.total_issues
-    # check whether the estimate is a point or not
-    estimate_type = Project.objects.filter(
-        workspace__slug=slug,
-        pk=project_id,
-        estimate__isnull=False,
-        estimate__type="points",
-    ).exists()
-    if estimate_type and plot_type == "points" and cycle_id:
-        issue_estimates = Issue.issue_objects.filter(
+    total = queryset.total_issues
+    date_range = []
+
+    if cycle_id:
+        issues = Issue.issue_objects.filter(
             workspace__slug=slug,
             project_id=project_id,
             issue_cycle__cycle_id=cycle_id,
             issue_cycle__deleted_at__isnull=True,
-            estimate_point__isnull=False,
-        ).values_list("estimate_point__value", flat=True)
-
-        issue_estimates = [float(value) for value in issue_estimates]
-        total_estimate_points = sum(issue_estimates)
-
-    if estimate_type and plot_type == "points" and module_id:
-        issue_estimates = Issue.issue_objects.filter(
-            workspace__slug=slug,
-            project_id=project_id,
-            issue_module__module_id=module_id,
-            issue_module__deleted_at__isnull=True,
-            estimate_point__isnull=False,
-        ).values_list("estimate_point__value", flat=True)
-
-        issue_estimates = [float(value) for value in issue_estimates]
-        total_estimate_points = sum(issue_estimates)
-
-    if cycle_id:
+        )
         if queryset.end_date and queryset.start_date:
             # Get all dates between the two dates
             date_range = [
@@ -144,105 +161,40 @@ def burndown_plot(queryset, slug, project_id, plot_type, cycle_id=None, module_i
                     (queryset.end_date.date() - queryset.start_date.date()).days + 1
                 )
             ]
-        else:
-            date_range = []
-
-        chart_data = {str(date): 0 for date in date_range}
-
-        if plot_type == "points":
-            completed_issues_estimate_point_distribution = (
-                Issue.issue_objects.filter(
-                    workspace__slug=slug,
-                    project_id=project_id,
-                    issue_cycle__cycle_id=cycle_id,
-                    issue_cycle__deleted_at__isnull=True,
-                    estimate_point__isnull=False,
-                )
-                .annotate(date=TruncDate("completed_at"))
-                .values("date")
-                .values("date", "estimate_point__value")
-                .order_by("date")
-            )
-        else:
-            completed_issues_distribution = (
-                Issue.issue_objects.filter(
-                    workspace__slug=slug,
-                    project_id=project_id,
-                    issue_cycle__cycle_id=cycle_id,
-                    issue_cycle__deleted_at__isnull=True,
-                )
-                .annotate(date=TruncDate("completed_at"))
-                .values("date")
-                .annotate(total_completed=Count("id"))
-                .values("date", "total_completed")
-                .order_by("date")
-            )
 
     if module_id:
+        issues = Issue.issue_objects.filter(
+            workspace__slug=slug,
+            project_id=project_id,
+            issue_module__module_id=module_id,
+            issue_module__deleted_at__isnull=True,
+        )
         # Get all dates between the two dates
         date_range = [
             (queryset.start_date + timedelta(days=x))
             for x in range((queryset.target_date - queryset.start_date).days + 1)
         ]
 
-        chart_data = {str(date): 0 for date in date_range}
-
-        if plot_type == "points":
-            completed_issues_estimate_point_distribution = (
-                Issue.issue_objects.filter(
-                    workspace__slug=slug,
-                    project_id=project_id,
-                    issue_module__module_id=module_id,
-                    issue_module__deleted_at__isnull=True,
-                    estimate_point__isnull=False,
-                )
-                .annotate(date=TruncDate("completed_at"))
-                .values("date")
-                .values("date", "estimate_point__value")
-                .order_by("date")
-            )
-        else:
-            completed_issues_distribution = (
-                Issue.issue_objects.filter(
-                    workspace__slug=slug,
-                    project_id=project_id,
-                    issue_module__module_id=module_id,
-                    issue_module__deleted_at__isnull=True,
-                )
-                .annotate(date=TruncDate("completed_at"))
-                .values("date")
-                .annotate(total_completed=Count("id"))
-                .values("date", "total_completed")
-                .order_by("date")
-            )
-
     if plot_type == "points":
-        for date in date_range:
-            cumulative_pending_issues = total_estimate_points
-            total_completed = 0
-            total_completed = sum(
-                float(item["estimate_point__value"])
-                for item in completed_issues_estimate_point_distribution
-                if item["date"] is not None and item["date"] <= date
-            )
-            cumulative_pending_issues -= total_completed
-            if date > timezone.now().date():
-                chart_data[str(date)] = None
-            else:
-                chart_data[str(date)] = cumulative_pending_issues
-    else:
-        for date in date_range:
-            cumulative_pending_issues = total_issues
-            total_completed = 0
-            total_completed = sum(
-                item["total_completed"]
-                for item in completed_issues_distribution
-                if item["date"] is not None and item["date"] <= date
-            )
-            cumulative_pending_issues -= total_completed
-            if date > timezone.now().date():
-                chart_data[str(date)] = None
-            else:
-                chart_data[str(date)] = cumulative_pending_issues
+        # check whether the estimate is a point or not
+        estimate_type = Project.objects.filter(
+            workspace__slug=slug,
+            pk=project_id,
+            estimate__isnull=False,
+            estimate__type="points",
+        ).exists()
+        if not estimate_type:
+            return {str(date): 0 for date in date_range}
+
+        issues = issues.filter(estimate_point__isnull=False)
+        total = sum(
+            float(value)
+            for value in issues.values_list("estimate_point__value", flat=True)
+        )
 
-    return chart_data
+    return cumulative_burndown(
+        date_range,
+        total,
+        get_completion_histogram(issues, plot_type),
+        timezone.now().date(),
+    )
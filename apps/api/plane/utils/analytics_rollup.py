@@ -0,0 +1,317 @@
+# Python imports
+from collections import defaultdict
+from typing import Any, Dict, List, Optional, Tuple
+
+# Django imports
+from django.db import connection, transaction
+from django.db.models import Count, F, Q, QuerySet, Sum, UUIDField, Value
+from django.db.models.functions import Coalesce, TruncDate, TruncMonth
+
+# Module imports
+from plane.db.models import Cycle, Issue, IssueRollup, Label, Module, Project, User
+from plane.utils.build_chart import process_grouped_data
+
+# The dimensions of the rollups, the issue field and the filter of the relation
+# of the multi valued dimensions, the same as the fields of the analytics charts
+ROLLUP_DIMENSIONS = {
+    "": (None, None),
+    "assignee": ("assignees__id", {"issue_assignee__deleted_at__isnull": True}),
+    "label": ("labels__id", {"label_issue__deleted_at__isnull": True}),
+    "cycle": ("issue_cycle__cycle_id", {"issue_cycle__deleted_at__isnull": True}),
+    "module": ("issue_module__module_id", {"issue_module__deleted_at__isnull": True}),
+}
+
+# The chart axes answered by the rollups, a rollup field or a dimension. The
+# distinct issues can only be summed across one multi valued dimension
+ROLLUP_AXES = {
+    "STATE_GROUPS": "state_group",
+    "PRIORITY": "priority",
+    "CREATED_AT": "date",
+}
+DIMENSION_AXES = {
+    "ASSIGNEES": "assignee",
+    "LABELS": "label",
+    "CYCLES": "cycle",
+    "MODULES": "module",
+}
+
+WORK_ITEM_STATS = {
+    "started_work_items": "started",
+    "backlog_work_items": "backlog",
+    "un_started_work_items": "unstarted",
+    "completed_work_items": "completed",
+}
+
+PROJECT_WORK_ITEM_STATS = {
+    "cancelled_work_items": "cancelled",
+    "completed_work_items": "completed",
+    "backlog_work_items": "backlog",
+    "un_started_work_items": "unstarted",
+    "started_work_items": "started",
+}
+
+
+def compute_issue_rollups(project_id, dates) -> List[IssueRollup]:
+    """Count the issues of the project created on the dates for every dimension"""
+    issues = Issue.issue_objects.filter(
+        project_id=project_id, created_at__date__in=dates
+    )
+    rollups = []
+    for dimension, (field, relation_filter) in ROLLUP_DIMENSIONS.items():
+        queryset = issues.filter(**relation_filter) if relation_filter else issues
+        rows = (
+            queryset.annotate(
+                date=TruncDate("created_at"),
+                dimension_id=(
+                    F(field) if field else Value(None, output_field=UUIDField())
+                ),
+            )
+            .values("workspace_id", "date", "state__group", "priority", "dimension_id")
+            .annotate(issue_count=Count("id", distinct=True))
+            .order_by()
+        )
+        rollups.extend(
+            IssueRollup(
+                workspace_id=row["workspace_id"],
+                project_id=project_id,
+                date=row["date"],
+                state_group=row["state__group"],
+                priority=row["priority"],
+                dimension=dimension,
+                dimension_id=row["dimension_id"],
+                issue_count=row["issue_count"],
+            )
+            for row in rows
+        )
+    return rollups
+
+
+def refresh_issue_rollups(partitions) -> int:
+    """
+    Recompute the rollups of the (project, creation date) partitions of the
+    changed issues, the partitions of a project are replaced in one transaction
+    """
+    dates = defaultdict(set)
+    for project_id, date in partitions:
+        if project_id and date:
+            dates[str(project_id)].add(date)
+
+    refreshed = 0
+    for project_id, project_dates in dates.items():
+        with transaction.atomic():
+            # Serialize the refreshes of the project
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    "SELECT pg_advisory_xact_lock("
+                    "hashtext('issue_rollups'), hashtext(%s))",
+                    [project_id],
+                )
+            IssueRollup.all_objects.filter(
+                project_id=project_id, date__in=project_dates
+            ).delete()
+            rollups = IssueRollup.objects.bulk_create(
+                compute_issue_rollups(project_id, project_dates), batch_size=1000
+            )
+        refreshed += len(rollups)
+    return refreshed
+
+
+def get_issue_rollups(
+    filters: Dict[str, Any],
+    dimension: str = "",
+    dimension_id: Optional[str] = None,
+    project_id: Optional[str] = None,
+    date_range: Optional[Tuple[Any, Any]] = None,
+) -> QuerySet:
+    """
+    Return the rollups of the projects visible with the analytics filters, of
+    the dimension value and of the issues created in the date range
+    """
+    rollups = IssueRollup.objects.filter(
+        project_id__in=Project.objects.filter(**filters["project_filters"]).values(
+            "id"
+        ),
+        dimension=dimension,
+    )
+    if dimension_id is not None:
+        rollups = rollups.filter(dimension_id=dimension_id)
+    if project_id:
+        rollups = rollups.filter(project_id=project_id)
+    if date_range:
+        start_date, end_date = date_range
+        rollups = rollups.filter(date__gte=start_date, date__lte=end_date)
+    return rollups
+
+
+def get_analytics_rollup_range(analytics_date_range) -> Optional[Tuple[Any, Any]]:
+    """Return the creation dates of the current analytics period"""
+    if not analytics_date_range:
+        return None
+    current = analytics_date_range["current"]
+    return current["gte"].date(), current["lte"].date()
+
+
+def get_rollup_work_items_stats(rollups: QuerySet) -> Dict[str, Dict[str, int]]:
+    counts = {
+        row["state_group"]: row["count"]
+        for row in rollups.values("state_group")
+        .annotate(count=Sum("issue_count"))
+        .order_by()
+    }
+    return {
+        "total_work_items": {"count": sum(counts.values())},
+        **{
+            key: {"count": counts.get(group, 0)}
+            for key, group in WORK_ITEM_STATS.items()
+        },
+    }
+
+
+def work_item_stats_aggregates() -> Dict[str, Any]:
+    return {
+        key: Coalesce(Sum("issue_count", filter=Q(state_group=group)), 0)
+        for key, group in PROJECT_WORK_ITEM_STATS.items()
+    }
+
+
+def get_rollup_project_stats(rollups: QuerySet) -> QuerySet:
+    return (
+        rollups.values("project_id", "project__name")
+        .annotate(**work_item_stats_aggregates())
+        .order_by("project_id")
+    )
+
+
+def get_assignee_avatar_url(user) -> Optional[str]:
+    if user.get("avatar_asset_id"):
+        return f"/api/assets/v2/static/{user['avatar_asset_id']}/"
+    return user.get("avatar")
+
+
+def get_rollup_assignee_stats(rollups: QuerySet) -> List[Dict[str, Any]]:
+    rows = list(
+        rollups.values("dimension_id")
+        .annotate(**work_item_stats_aggregates())
+        .order_by()
+    )
+    users = {
+        user["id"]: user
+        for user in User.objects.filter(
+            pk__in=[row["dimension_id"] for row in rows if row["dimension_id"]]
+        ).values("id", "display_name", "avatar", "avatar_asset_id")
+    }
+
+    stats = []
+    for row in rows:
+        user = users.get(row.pop("dimension_id"), {})
+        stats.append(
+            {
+                "display_name": user.get("display_name"),
+                "assignee_id": user.get("id"),
+                "avatar_url": get_assignee_avatar_url(user),
+                **row,
+            }
+        )
+    # The unassigned work items are listed last
+    return sorted(
+        stats,
+        key=lambda stat: (stat["display_name"] is None, stat["display_name"] or ""),
+    )
+
+
+def get_rollup_monthly_stats(rollups: QuerySet) -> QuerySet:
+    return (
+        rollups.annotate(month=TruncMonth("date"))
+        .values("month")
+        .annotate(
+            created_count=Sum("issue_count"),
+            completed_count=Coalesce(
+                Sum("issue_count", filter=Q(state_group="completed")), 0
+            ),
+        )
+        .order_by("month")
+    )
+
+
+def get_chart_dimension(
+    x_axis: str, group_by: Optional[str] = None, dimension: str = ""
+) -> Optional[str]:
+    """
+    Return the rollup dimension answering the chart, None when the chart needs
+    other fields or more than one multi valued dimension
+    """
+    axes = [axis for axis in [x_axis, group_by] if axis]
+    if any(axis not in ROLLUP_AXES and axis not in DIMENSION_AXES for axis in axes):
+        return None
+
+    dimensions = {DIMENSION_AXES[axis] for axis in axes if axis in DIMENSION_AXES}
+    if dimension:
+        dimensions.add(dimension)
+    if len(dimensions) > 1:
+        return None
+    return dimensions.pop() if dimensions else ""
+
+
+def get_dimension_names(dimension: str, ids) -> Dict[Any, str]:
+    ids = [dimension_id for dimension_id in ids if dimension_id]
+    if not ids:
+        return {}
+    if dimension == "assignee":
+        return dict(User.objects.filter(pk__in=ids).values_list("id", "display_name"))
+    model = {"label": Label, "cycle": Cycle, "module": Module}[dimension]
+    return dict(model.objects.filter(pk__in=ids).values_list("id", "name"))
+
+
+def build_rollup_chart(
+    rollups: QuerySet, x_axis: str, group_by: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Build the analytics chart from the rollups of the chart dimension, the
+    response is the same as the one of `build_analytics_chart`
+    """
+    x_field = ROLLUP_AXES.get(x_axis, "dimension_id")
+    group_field = ROLLUP_AXES.get(group_by, "dimension_id") if group_by else None
+    fields = list(dict.fromkeys(field for field in [x_field, group_field] if field))
+
+    data = list(
+        rollups.values(*fields)
+        .annotate(count=Sum("issue_count"))
+        .order_by("-count" if group_by else x_field)
+    )
+
+    dimension = DIMENSION_AXES.get(x_axis) or DIMENSION_AXES.get(group_by)
+    names = (
+        get_dimension_names(dimension, {row["dimension_id"] for row in data})
+        if dimension
+        else {}
+    )
+
+    def display_name(axis, value):
+        return names.get(value) if axis in DIMENSION_AXES else value
+
+    if group_by:
+        response, schema = process_grouped_data(
+            [
+                {
+                    "key": row[x_field],
+                    "display_name": display_name(x_axis, row[x_field]),
+                    "group_key": row[group_field],
+                    "group_name": display_name(group_by, row[group_field]),
+                    "count": row["count"],
+                }
+                for row in data
+            ]
+        )
+        return {"data": response, "schema": schema}
+
+    return {
+        "data": [
+            {
+                "key": row[x_field] if row[x_field] else "None",
+                "name": display_name(x_axis, row[x_field]) or "None",
+                "count": row["count"],
+            }
+            for row in data
+        ],
+        "schema": {},
+    }
@@ -0,0 +1,98 @@
+# Python imports
+import hashlib
+
+# Django imports
+from django.core.cache import cache
+from django.db.models import Q
+from django.utils import timezone
+
+# Module imports
+from plane.db.models import APIToken
+from plane.settings.redis import redis_instance
+from plane.utils.exception_logger import log_exception
+
+# The valid tokens are cached with their user, the unknown tokens for a shorter
+# time so the lookups of the invalid tokens do not reach the database
+API_TOKEN_CACHE_TIMEOUT = 60 * 5
+INVALID_API_TOKEN_CACHE_TIMEOUT = 60
+INVALID_API_TOKEN = "invalid"
+
+# Hash of the token ids and their latest usage, flushed to the tokens in bulk
+API_TOKEN_LAST_USED_KEY = "api_token:last_used"
+
+
+def api_token_cache_key(token):
+    # The tokens are not stored in the cache keys
+    return f"api_token:{hashlib.sha256(token.encode()).hexdigest()}"
+
+
+def get_api_token(token):
+    """
+    Return the active and not expired api token of an active user with the
+    user, None when the token is not valid
+    """
+    key = api_token_cache_key(token)
+    api_token = cache.get(key)
+
+    if api_token is None:
+        api_token = (
+            APIToken.objects.filter(token=token, is_active=True, user__is_active=True)
+            .select_related("user")
+            .first()
+        )
+        if api_token is None:
+            cache.set(key, INVALID_API_TOKEN, INVALID_API_TOKEN_CACHE_TIMEOUT)
+        else:
+            cache.set(key, api_token, API_TOKEN_CACHE_TIMEOUT)
+
+    if api_token == INVALID_API_TOKEN or api_token is None:
+        return None
+
+    # The cached tokens can expire while they are cached
+    if api_token.expired_at is not None and api_token.expired_at <= timezone.now():
+        return None
+    return api_token
+
+
+def invalidate_api_token(token):
+    """Remove the api token from the cache after it is updated or deleted"""
+    try:
+        cache.delete(api_token_cache_key(token))
+    except Exception as e:
+        log_exception(e)
+
+
+def invalidate_api_tokens(**filters):
+    """
+    Remove the api tokens matching the filters from the cache, used when the
+    user of the tokens is deactivated or their workspace is deleted
+    """
+    try:
+        cache.delete_many(
+            [
+                api_token_cache_key(token)
+                for token in APIToken.all_objects.filter(**filters).values_list(
+                    "token", flat=True
+                )
+            ]
+        )
+    except Exception as e:
+        log_exception(e)
+
+
+def record_api_token_usage(api_token):
+    """
+    Record the last usage of the api token in redis, the usages are written to
+    the tokens in bulk by the flush task
+    """
+    now = timezone.now()
+    try:
+        redis_instance().hset(
+            API_TOKEN_LAST_USED_KEY, str(api_token.id), now.isoformat()
+        )
+    except Exception as e:
+        log_exception(e)
+        # Write the usage directly when redis is not available
+        APIToken.objects.filter(
+            Q(last_used__isnull=True) | Q(last_used__lt=now), pk=api_token.id
+        ).update(last_used=now)
@@ -0,0 +1,105 @@
+# Python imports
+import re
+
+# Django imports
+from django.contrib.postgres.search import (
+    SearchQuery,
+    SearchRank,
+    SearchVectorField,
+    TrigramWordSimilarity,
+)
+from django.db.models import F, FloatField, Q, Value
+from django.db.models.expressions import RawSQL
+from django.db.models.functions import Coalesce, Greatest
+
+# The vectors are built with the simple configuration so the names in every
+# language are matched by their words without stemming
+SEARCH_CONFIG = "simple"
+
+# The title and description of the search vectors by table, the vectors are not
+# stored but indexed as expressions by the 0107_search_vectors migration
+SEARCH_VECTOR_FIELDS = {
+    "issues": ("name", "description_stripped"),
+    "pages": ("name", "description_stripped"),
+    "cycles": ("name", "description"),
+    "modules": ("name", "description"),
+}
+
+# pg_trgm splits the words in trigrams, shorter queries have no full trigram
+TRIGRAM_LENGTH = 3
+
+
+def get_search_query(query):
+    """
+    Build the prefix matching query of the words of the search, returns None
+    when the search has no words
+    """
+    words = re.findall(r"\w+", query.lower())
+    if not words:
+        return None
+    return SearchQuery(
+        " & ".join(f"{word}:*" for word in words),
+        search_type="raw",
+        config=SEARCH_CONFIG,
+    )
+
+
+def search_vector(model):
+    """
+    The weighted search vector of the model, the expression matches the one of
+    the index of the table so the matches are served by the index
+    """
+    table = model._meta.db_table
+    title, description = SEARCH_VECTOR_FIELDS[table]
+    return RawSQL(
+        f"setweight(to_tsvector('{SEARCH_CONFIG}'::regconfig, "
+        f"coalesce(\"{table}\".\"{title}\", '')), 'A') || "
+        f"setweight(to_tsvector('{SEARCH_CONFIG}'::regconfig, "
+        f"coalesce(\"{table}\".\"{description}\", '')), 'B')",
+        [],
+        output_field=SearchVectorField(),
+    )
+
+
+def full_text_search(queryset, search_query, q=None):
+    """
+    Filter the queryset by the search vector or the additional conditions and
+    rank the matches of the search vector first
+    """
+    search_filter = Q(search_vector=search_query)
+    if q is not None:
+        search_filter |= q
+    return (
+        queryset.alias(search_vector=search_vector(queryset.model))
+        .filter(search_filter)
+        .annotate(search_rank=SearchRank(F("search_vector"), search_query))
+        .order_by("-search_rank")
+    )
+
+
+def trigram_search(queryset, query, fields, q=None):
+    """
+    Filter the queryset by the word similarity of the query to any of the fields
+    and order the closest matches first. The similarity operator is served by the
+    trigram indexes of the fields, queries shorter than a trigram are matched by
+    the prefix of the fields
+    """
+    query = query.strip()
+    search_filter = Q()
+    for field in fields:
+        if len(query) < TRIGRAM_LENGTH:
+            search_filter |= Q(**{f"{field}__istartswith": query})
+        else:
+            search_filter |= Q(**{f"{field}__trigram_word_similar": query})
+    if q is not None:
+        search_filter |= q
+
+    similarities = [TrigramWordSimilarity(query, field) for field in fields]
+    similarity = Greatest(*similarities) if len(similarities) > 1 else similarities[0]
+    return (
+        queryset.filter(search_filter)
+        .annotate(
+            similarity=Coalesce(similarity, Value(0.0, output_field=FloatField()))
+        )
+        .order_by("-similarity")
+    )
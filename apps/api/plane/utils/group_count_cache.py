@@ -0,0 +1,68 @@
+# Python imports
+import hashlib
+import json
+
+# Django imports
+from django.core.cache import cache
+
+# Module imports
+from plane.utils.exception_logger import log_exception
+
+# Cache the group totals for a short time as a safety net for missed invalidations
+GROUP_COUNT_CACHE_TIMEOUT = 60 * 10
+
+
+def get_group_count_version_key(project_id):
+    return f"issue_group_count_version:{project_id}"
+
+
+def get_group_count_version(project_id):
+    """Return the current version of the group counts of the project"""
+    return cache.get(get_group_count_version_key(project_id)) or 0
+
+
+def invalidate_group_counts(project_id):
+    """Invalidate all the cached group counts of the project by bumping its version"""
+    if not project_id:
+        return
+    key = get_group_count_version_key(project_id)
+    try:
+        try:
+            cache.incr(key)
+        except ValueError:
+            # The version does not exist yet
+            if not cache.add(key, 1, timeout=None):
+                cache.incr(key)
+    except Exception as e:
+        log_exception(e)
+
+
+def group_count_cache_key(
+    project_id, scope, filters, group_by=None, sub_group_by=None, user_id=None
+):
+    """
+    Generate the group count cache key for the project, the scope of the list
+    (project, cycle, module, archived) and the hash of the applied filters
+    """
+    filter_hash = hashlib.md5(
+        json.dumps(
+            {"filters": filters, "user_id": user_id}, sort_keys=True, default=str
+        ).encode()
+    ).hexdigest()
+    version = get_group_count_version(project_id)
+    return (
+        f"issue_group_count:{project_id}:{version}:{scope}:"
+        f"{group_by or ''}:{sub_group_by or ''}:{filter_hash}"
+    )
+
+
+def get_or_set_group_count(key, compute, timeout=GROUP_COUNT_CACHE_TIMEOUT):
+    """Return the cached counts for the key or compute and cache them"""
+    if not key:
+        return compute()
+
+    counts = cache.get(key)
+    if counts is None:
+        counts = compute()
+        cache.set(key, counts, timeout)
+    return counts
@@ -1,8 +1,5 @@
 # Django imports
-from django.contrib.postgres.aggregates import ArrayAgg
-from django.contrib.postgres.fields import ArrayField
-from django.db.models import Q, UUIDField, Value, QuerySet, OuterRef, Subquery
-from django.db.models.functions import Coalesce
+from django.db.models import Q, QuerySet
 
 # Module imports
 from plane.db.models import (
@@ -14,11 +11,9 @@ from plane.db.models import (
     ProjectMember,
     State,
     WorkspaceMember,
-    IssueAssignee,
-    ModuleIssue,
-    IssueLabel,
 )
-from typing import Optional, Dict, Tuple, Any, Union, List
+from plane.utils.issue_list_projection import issue_array_annotations
+from typing import Optional, Dict, Any, Union, List
 
 
 def issue_queryset_grouper(
@@ -42,45 +37,7 @@ def issue_queryset_grouper(
         if group_key in GROUP_FILTER_MAPPER:
             queryset = queryset.filter(GROUP_FILTER_MAPPER[group_key])
 
-    issue_assignee_subquery = Subquery(
-        IssueAssignee.objects.filter(
-            issue_id=OuterRef("pk"),
-            deleted_at__isnull=True,
-        )
-        .values("issue_id")
-        .annotate(arr=ArrayAgg("assignee_id", distinct=True))
-        .values("arr")
-    )
-
-    issue_module_subquery = Subquery(
-        ModuleIssue.objects.filter(
-            issue_id=OuterRef("pk"),
-            deleted_at__isnull=True,
-            module__archived_at__isnull=True,
-        )
-        .values("issue_id")
-        .annotate(arr=ArrayAgg("module_id", distinct=True))
-        .values("arr")
-    )
-
-    issue_label_subquery = Subquery(
-        IssueLabel.objects.filter(issue_id=OuterRef("pk"), deleted_at__isnull=True)
-        .values("issue_id")
-        .annotate(arr=ArrayAgg("label_id", distinct=True))
-        .values("arr")
-    )
-
-    annotations_map: Dict[str, Tuple[str, Q]] = {
-        "assignee_ids": Coalesce(
-            issue_assignee_subquery, Value([], output_field=ArrayField(UUIDField()))
-        ),
-        "label_ids": Coalesce(
-            issue_label_subquery, Value([], output_field=ArrayField(UUIDField()))
-        ),
-        "module_ids": Coalesce(
-            issue_module_subquery, Value([], output_field=ArrayField(UUIDField()))
-        ),
-    }
+    annotations_map: Dict[str, Any] = issue_array_annotations()
 
     default_annotations: Dict[str, Any] = {}
 
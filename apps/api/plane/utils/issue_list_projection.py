@@ -0,0 +1,154 @@
+# Django imports
+from django.conf import settings
+from django.contrib.postgres.aggregates import ArrayAgg
+from django.contrib.postgres.fields import ArrayField
+from django.db.models import (
+    Case,
+    F,
+    Func,
+    IntegerField,
+    OuterRef,
+    Subquery,
+    UUIDField,
+    Value,
+    When,
+)
+from django.db.models.functions import Coalesce
+
+# Module imports
+from plane.db.models import (
+    CycleIssue,
+    FileAsset,
+    Issue,
+    IssueAssignee,
+    IssueLabel,
+    IssueLink,
+    ModuleIssue,
+)
+
+
+def issue_count_subqueries(active_only=False):
+    """
+    Correlated subqueries for the cycle and the counts of the issue list rows,
+    `active_only` also drops the cycle of a deleted cycle for the projection
+    """
+    cycle_filters = {"cycle__deleted_at__isnull": True} if active_only else {}
+    return {
+        "cycle_id": Subquery(
+            CycleIssue.objects.filter(
+                issue=OuterRef("id"), deleted_at__isnull=True, **cycle_filters
+            ).values("cycle_id")[:1]
+        ),
+        "link_count": IssueLink.objects.filter(issue=OuterRef("id"))
+        .order_by()
+        .annotate(count=Func(F("id"), function="Count"))
+        .values("count"),
+        "attachment_count": FileAsset.objects.filter(
+            issue_id=OuterRef("id"),
+            entity_type=FileAsset.EntityTypeContext.ISSUE_ATTACHMENT,
+        )
+        .order_by()
+        .annotate(count=Func(F("id"), function="Count"))
+        .values("count"),
+        "sub_issues_count": Issue.issue_objects.filter(parent=OuterRef("id"))
+        .order_by()
+        .annotate(count=Func(F("id"), function="Count"))
+        .values("count"),
+    }
+
+
+def issue_array_subqueries(active_only=False):
+    """
+    Correlated subqueries for the label, assignee and module ids of the issues,
+    `active_only` also drops the deleted labels and modules for the projection
+    """
+    label_filters = {"label__deleted_at__isnull": True} if active_only else {}
+    module_filters = {"module__deleted_at__isnull": True} if active_only else {}
+    return {
+        "assignee_ids": Coalesce(
+            Subquery(
+                IssueAssignee.objects.filter(
+                    issue_id=OuterRef("pk"), deleted_at__isnull=True
+                )
+                .values("issue_id")
+                .annotate(arr=ArrayAgg("assignee_id", distinct=True))
+                .values("arr")
+            ),
+            Value([], output_field=ArrayField(UUIDField())),
+        ),
+        "label_ids": Coalesce(
+            Subquery(
+                IssueLabel.objects.filter(
+                    issue_id=OuterRef("pk"), deleted_at__isnull=True, **label_filters
+                )
+                .values("issue_id")
+                .annotate(arr=ArrayAgg("label_id", distinct=True))
+                .values("arr")
+            ),
+            Value([], output_field=ArrayField(UUIDField())),
+        ),
+        "module_ids": Coalesce(
+            Subquery(
+                ModuleIssue.objects.filter(
+                    issue_id=OuterRef("pk"),
+                    deleted_at__isnull=True,
+                    module__archived_at__isnull=True,
+                    **module_filters,
+                )
+                .values("issue_id")
+                .annotate(arr=ArrayAgg("module_id", distinct=True))
+                .values("arr")
+            ),
+            Value([], output_field=ArrayField(UUIDField())),
+        ),
+    }
+
+
+# The output fields of the projected values
+PROJECTION_OUTPUT_FIELDS = {
+    "cycle_id": UUIDField(),
+    "link_count": IntegerField(),
+    "attachment_count": IntegerField(),
+    "sub_issues_count": IntegerField(),
+    "assignee_ids": ArrayField(UUIDField()),
+    "label_ids": ArrayField(UUIDField()),
+    "module_ids": ArrayField(UUIDField()),
+}
+
+
+def projected(live):
+    """
+    Read the values from the issue list projection, the issues without a row
+    yet (created since the last refresh) are computed live
+    """
+    return {
+        key: Case(
+            When(list_projection__isnull=True, then=expression),
+            default=F(f"list_projection__{key}"),
+            output_field=PROJECTION_OUTPUT_FIELDS[key],
+        )
+        for key, expression in live.items()
+    }
+
+
+def issue_count_annotations(*keys):
+    """
+    Annotations for the cycle and the counts of the issue list rows, or for the
+    `keys` of them, read from the issue list projection when it is enabled
+    """
+    annotations = issue_count_subqueries()
+    if keys:
+        annotations = {key: annotations[key] for key in keys}
+    if settings.ENABLE_ISSUE_LIST_PROJECTION:
+        return projected(annotations)
+    return annotations
+
+
+def issue_array_annotations():
+    """
+    Annotations for the label, assignee and module ids of the issue list rows,
+    read from the issue list projection when it is enabled
+    """
+    if settings.ENABLE_ISSUE_LIST_PROJECTION:
+        return projected(issue_array_subqueries())
+    return issue_array_subqueries()
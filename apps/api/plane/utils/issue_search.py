@@ -5,16 +5,33 @@ import re
 from django.db.models import Q
 
 # Module imports
+from plane.db.models import Project
+from plane.utils.full_text_search import (
+    full_text_search,
+    get_search_query,
+    trigram_search,
+)
 
 
-def search_issues(query, queryset):
-    fields = ["name", "sequence_id", "project__identifier"]
-    q = Q()
-    for field in fields:
-        if field == "sequence_id" and len(query) <= 20:
-            sequences = re.findall(r"\b\d+\b", query)
-            for sequence_id in sequences:
-                q |= Q(**{"sequence_id": sequence_id})
-        else:
-            q |= Q(**{f"{field}__icontains": query})
-    return queryset.filter(q).distinct()
+def search_issues(query, queryset, typeahead=False):
+    """
+    Search the issues by the words of their name and description, the project
+    identifier and the sequence id. The word matches are ranked first, the
+    typeahead search ranks the names by their similarity to the partial words
+    """
+    q = Q(
+        project_id__in=Project.objects.filter(identifier__icontains=query).values("id")
+    )
+    if len(query) <= 20:
+        sequences = re.findall(r"\b\d+\b", query)
+        if sequences:
+            q |= Q(sequence_id__in=sequences)
+
+    if typeahead:
+        return trigram_search(queryset, query, ["name"], q).distinct()
+
+    search_query = get_search_query(query)
+    if search_query is None:
+        return queryset.filter(q | Q(name__icontains=query)).distinct()
+
+    return full_text_search(queryset, search_query, q).distinct()
@@ -0,0 +1,79 @@
+# Django imports
+from django.core.cache import cache
+
+# Module imports
+from plane.db.models import ProjectMember, WorkspaceMember
+from plane.utils.exception_logger import log_exception
+
+# Cache the roles for a short time as a safety net for missed invalidations
+MEMBER_ROLE_CACHE_TIMEOUT = 60
+
+
+def get_member_role_version_key(user_id):
+    return f"member_role_version:{user_id}"
+
+
+def member_role_cache_key(user_id, slug, project_id=None):
+    """
+    Generate the role cache key of the user in the workspace or the project,
+    versioned by the memberships of the user
+    """
+    version = cache.get(get_member_role_version_key(user_id)) or 0
+    return f"member_role:{user_id}:{version}:{slug}:{project_id or ''}"
+
+
+def invalidate_member_roles(user_ids):
+    """Invalidate the cached roles of the users by bumping their versions"""
+    for user_id in user_ids:
+        if not user_id:
+            continue
+        key = get_member_role_version_key(user_id)
+        try:
+            try:
+                cache.incr(key)
+            except ValueError:
+                # The version does not exist yet
+                if not cache.add(key, 1, timeout=None):
+                    cache.incr(key)
+        except Exception as e:
+            log_exception(e)
+
+
+def get_member_role(request, slug, project_id=None):
+    """
+    Return the role of the active membership of the requesting user in the
+    workspace, or in the project when the project is given. Returns None when
+    the user is not an active member.
+
+    The roles are resolved once per request and cached across the requests,
+    only the active memberships are cached so new members are never denied
+    """
+    # Share the roles with the django request wrapped by the rest framework
+    http_request = getattr(request, "_request", request)
+    roles = http_request.__dict__.setdefault("_member_roles", {})
+
+    scope = (str(slug), str(project_id) if project_id else None)
+    if scope in roles:
+        return roles[scope]
+
+    user_id = request.user.id
+    key = member_role_cache_key(user_id, slug, project_id)
+    role = cache.get(key)
+    if role is None:
+        if project_id:
+            members = ProjectMember.objects.filter(
+                member_id=user_id,
+                workspace__slug=slug,
+                project_id=project_id,
+                is_active=True,
+            )
+        else:
+            members = WorkspaceMember.objects.filter(
+                member_id=user_id, workspace__slug=slug, is_active=True
+            )
+        role = members.values_list("role", flat=True).first()
+        if role is not None:
+            cache.set(key, role, MEMBER_ROLE_CACHE_TIMEOUT)
+
+    roles[scope] = role
+    return role
@@ -1,10 +1,13 @@
 # Python imports
+import base64
+import json
 import math
 from collections import defaultdict
 from collections.abc import Sequence
 
 # Django imports
-from django.db.models import Count, F, Window
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Count, F, Q, Window
 from django.db.models.functions import RowNumber
 
 # Third party imports
@@ -12,6 +15,7 @@ from rest_framework.exceptions import ParseError
 from rest_framework.response import Response
 
 # Module imports
+from plane.utils.group_count_cache import get_or_set_group_count
 
 
 class Cursor:
@@ -55,6 +59,68 @@ class Cursor:
             raise ValueError(f"Invalid cursor format: {e}")
 
 
+class KeysetCursor:
+    """
+    Cursor for keyset (seek) pagination. It stores the boundary
+    (order_key, created_at, id) tuple for every partition (group / sub group)
+    that still has results, so the page can seek past it instead of using an
+    offset. A next cursor seeks the rows after the last row of the page and a
+    previous cursor the rows before the first row of the page.
+    """
+
+    def __init__(self, positions=None, has_results=None, is_prev=False):
+        # Mapping of partition tuple -> boundary position tuple
+        self.positions = positions or {}
+        self.has_results = has_results
+        self.is_prev = bool(is_prev)
+
+    # Return the cursor value in string format
+    def __str__(self):
+        if not self.positions:
+            return ""
+        payload = json.dumps(
+            {
+                "positions": [
+                    [list(partition), list(position)]
+                    for partition, position in self.positions.items()
+                ],
+                "is_prev": int(self.is_prev),
+            },
+            cls=DjangoJSONEncoder,
+            separators=(",", ":"),
+        )
+        return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+    def __eq__(self, other):
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in ("positions", "has_results", "is_prev")
+        )
+
+    def __repr__(self):
+        return f"{type(self).__name__}: positions={len(self.positions)}"
+
+    def __bool__(self):
+        return bool(self.has_results)
+
+    @classmethod
+    def from_string(cls, value):
+        """Return the keyset cursor from its string format"""
+        if not value:
+            return cls()
+        try:
+            payload = json.loads(
+                base64.urlsafe_b64decode(value + "=" * (-len(value) % 4))
+            )
+            positions = {
+                tuple(partition): tuple(position)
+                for partition, position in payload["positions"]
+            }
+            return cls(positions, is_prev=payload.get("is_prev", 0))
+        except (KeyError, TypeError, ValueError) as e:
+            raise ValueError(f"Invalid cursor format: {e}")
+
+
 class CursorResult(Sequence):
     def __init__(self, results, next, prev, hits=None, max_hits=None):
         self.results = results
@@ -103,6 +169,9 @@ class OffsetPaginator:
         max_offset=None,
         on_results=None,
         total_count_queryset=None,
+        keyset=False,
+        include_total=True,
+        count_cache_key=None,
     ):
         # Key tuple and remove `-` if descending order by
         self.key = (
@@ -117,8 +186,209 @@ class OffsetPaginator:
         self.max_offset = max_offset
         self.on_results = on_results
         self.total_count_queryset = total_count_queryset
+        # Seek on the last seen row instead of using the offset
+        self.keyset = keyset
+        # Count the total results, only computed in keyset mode when asked for
+        self.include_total = include_total
+        # Cache key for the totals, the totals are computed on every page without it
+        self.count_cache_key = count_cache_key
+
+    def get_cached_count(self, name, compute):
+        # Return the cached total or compute it
+        return get_or_set_group_count(
+            f"{self.count_cache_key}:{name}" if self.count_cache_key else None,
+            compute,
+        )
+
+    # Partition fields for the keyset pagination, overridden by the grouped paginators
+    keyset_partition_fields = ()
+
+    def get_keyset_order(self, reverse=False):
+        # Order by the key, and use created_at and id as tie breakers
+        ordering = []
+        if self.key:
+            # Nulls are ordered last, so first when reading backwards
+            nulls = {"nulls_first": True} if reverse else {"nulls_last": True}
+            ordering.append(
+                F(*self.key).desc(**nulls)
+                if self.desc != reverse
+                else F(*self.key).asc(**nulls)
+            )
+        if reverse:
+            ordering.extend([F("created_at").asc(), F("id").asc()])
+        else:
+            ordering.extend([F("created_at").desc(), F("id").desc()])
+        return ordering
+
+    def get_keyset_fields(self):
+        # Fields that make up the position of a row
+        return [*self.key[:1], "created_at", "id"] if self.key else ["created_at", "id"]
+
+    def get_keyset_filter(self, position, reverse=False):
+        """
+        Return the filter for the rows that come after the position, or before
+        it when reverse is set
+        """
+        created_at, pk = position[-2:]
+        if reverse:
+            tie_breaker = Q(created_at__gt=created_at) | Q(
+                created_at=created_at, id__gt=pk
+            )
+        else:
+            tie_breaker = Q(created_at__lt=created_at) | Q(
+                created_at=created_at, id__lt=pk
+            )
+        if not self.key:
+            return tie_breaker
+
+        field, value = self.key[0], position[0]
+        # Nulls are ordered last so only nulls can come after a null, and every
+        # non null key comes before it
+        if value is None:
+            if reverse:
+                return Q(**{f"{field}__isnull": False}) | (
+                    Q(**{f"{field}__isnull": True}) & tie_breaker
+                )
+            return Q(**{f"{field}__isnull": True}) & tie_breaker
+
+        lookup = f"{field}__lt" if self.desc != reverse else f"{field}__gt"
+        if reverse:
+            return Q(**{lookup: value}) | (Q(**{field: value}) & tie_breaker)
+        return (
+            Q(**{lookup: value})
+            | Q(**{f"{field}__isnull": True})
+            | (Q(**{field: value}) & tie_breaker)
+        )
+
+    def get_partition_filter(self, partition):
+        # Filter the rows of a single partition
+        partition_filter = Q()
+        for field, value in zip(self.keyset_partition_fields, partition):
+            partition_filter &= (
+                Q(**{f"{field}__isnull": True})
+                if value is None
+                else Q(**{field: value})
+            )
+        return partition_filter
+
+    def get_keyset_queryset(self):
+        return self.queryset
+
+    def get_keyset_result(self, limit=1000, cursor=None):
+        """
+        Seek pagination, the rows after the position of every partition of the
+        cursor, or before it for a previous cursor, are fetched in one query
+        with `limit + 1` rows per partition. Going back only returns the
+        partitions that had a position in the cursor of the current page.
+        """
+        if cursor is None:
+            cursor = KeysetCursor()
+
+        limit = min(limit, self.max_limit)
+        if limit <= 0:
+            raise BadPaginationError("Pagination limit must be positive")
+
+        queryset = self.get_keyset_queryset()
+        ordering = self.get_keyset_order()
+        # A previous page seeks backwards from the first row of the current page
+        seek_ordering = self.get_keyset_order(reverse=cursor.is_prev)
+        fields = self.get_keyset_fields()
+        partition_fields = list(self.keyset_partition_fields)
+
+        probe = queryset
+        if cursor.positions:
+            seek_filter = Q()
+            for partition, position in cursor.positions.items():
+                seek_filter |= self.get_partition_filter(
+                    partition
+                ) & self.get_keyset_filter(position, reverse=cursor.is_prev)
+            probe = probe.filter(seek_filter)
+        elif cursor.has_results is False or cursor.is_prev:
+            probe = probe.none()
+
+        if partition_fields:
+            # Number the rows of every partition
+            probe = (
+                probe.annotate(
+                    row_number=Window(
+                        expression=RowNumber(),
+                        partition_by=[F(field) for field in partition_fields],
+                        order_by=seek_ordering,
+                    )
+                )
+                .filter(row_number__lte=limit + 1)
+                .order_by(*seek_ordering)
+                .values_list(*partition_fields, *fields, "row_number")
+            )
+        else:
+            probe = probe.order_by(*seek_ordering).values_list(*fields)[: limit + 1]
+
+        # Collect the page rows and the first and last seek position of every
+        # partition, the rows are in the seek order
+        page_ids = defaultdict(list)
+        positions = {}
+        seek_positions = {}
+        back_positions = {}
+        for row in probe:
+            partition = tuple(row[: len(partition_fields)])
+            position = tuple(
+                row[len(partition_fields) : len(partition_fields) + len(fields)]
+            )
+            if len(page_ids[partition]) < limit:
+                # Rows on the other side exist when the cursor seeked past them
+                if not page_ids[partition] and partition in cursor.positions:
+                    back_positions[partition] = position
+                page_ids[partition].append(position[-1])
+                positions[partition] = position
+            else:
+                seek_positions[partition] = positions[partition]
+
+        # Fetch the page rows
+        if page_ids:
+            page_filter = Q()
+            for partition, ids in page_ids.items():
+                page_filter |= self.get_partition_filter(partition) & Q(id__in=ids)
+            results = queryset.filter(page_filter).order_by(*ordering)
+        else:
+            results = queryset.none()
+
+        if cursor.is_prev:
+            next_cursor = KeysetCursor(back_positions, bool(back_positions))
+            prev_cursor = KeysetCursor(seek_positions, bool(seek_positions), True)
+        else:
+            next_cursor = KeysetCursor(seek_positions, bool(seek_positions))
+            prev_cursor = KeysetCursor(back_positions, bool(back_positions), True)
+
+        if self.on_results:
+            results = self.on_results(results)
+
+        # Only count when the client asks for it
+        count = None
+        max_hits = None
+        if self.include_total:
+            count = self.get_cached_count(
+                "total",
+                lambda: (
+                    self.total_count_queryset.count()
+                    if self.total_count_queryset
+                    else self.queryset.count()
+                ),
+            )
+            max_hits = math.ceil(count / limit)
+
+        return CursorResult(
+            results=results,
+            next=next_cursor,
+            prev=prev_cursor,
+            hits=count,
+            max_hits=max_hits,
+        )
 
     def get_result(self, limit=1000, cursor=None):
+        # Use the seek pagination when enabled
+        if self.keyset:
+            return self.get_keyset_result(limit=limit, cursor=cursor)
+
         # offset is page #
         # value is page limit
         if cursor is None:
@@ -157,10 +427,13 @@ class OffsetPaginator:
         if cursor.value != limit and cursor.is_prev:
             results = results[-(limit + 1) :]
 
-        total_count = (
-            self.total_count_queryset.count()
-            if self.total_count_queryset
-            else queryset.count()
+        total_count = self.get_cached_count(
+            "total",
+            lambda: (
+                self.total_count_queryset.count()
+                if self.total_count_queryset
+                else queryset.count()
+            ),
         )
 
         # Check if there are more results available after the current page
@@ -224,7 +497,18 @@ class GroupedOffsetPaginator(OffsetPaginator):
         # Set the count filter - this are extra filters that need to be passed to calculate the counts with the filters
         self.count_filter = count_filter
 
+    # Partition the keyset pagination by the group
+    keyset_partition_fields = ("keyset_group",)
+
+    def get_keyset_queryset(self):
+        # Alias the group so the seek filters reuse the existing m2m joins
+        return self.queryset.annotate(keyset_group=F(self.group_by_field_name))
+
     def get_result(self, limit=50, cursor=None):
+        # Use the seek pagination when enabled
+        if self.keyset:
+            return self.get_keyset_result(limit=limit, cursor=cursor)
+
         # offset is page #
         # value is page limit
         if cursor is None:
@@ -285,15 +569,16 @@ class GroupedOffsetPaginator(OffsetPaginator):
         prev_cursor = Cursor(limit, page - 1, True, page > 0)
 
         # Count the queryset
-        count = queryset.count()
+        count = self.get_cached_count("hits", queryset.count)
 
         # Optionally, calculate the total count and max_hits if needed
         # This might require adjustments based on specific use cases
         if results:
             max_hits = math.ceil(
-                queryset.values(self.group_by_field_name)
-                .annotate(count=Count("id", filter=self.count_filter, distinct=True))
-                .order_by("-count")[0]["count"]
+                max(
+                    (group["count"] for group in self.get_group_totals()),
+                    default=0,
+                )
                 / limit
             )
         else:
@@ -314,10 +599,19 @@ class GroupedOffsetPaginator(OffsetPaginator):
             .order_by()
         )
 
+    def get_group_totals(self):
+        # Get the group totals from the cache, these are shared across the pages
+        return self.get_cached_count(
+            "groups", lambda: list(self.__get_total_queryset())
+        )
+
     def __get_total_dict(self):
         # Convert the total into dictionary of keys as group name and value as the total
         total_group_dict = {}
-        for group in self.__get_total_queryset():
+        # The totals are skipped when the client did not ask for them
+        if not self.include_total:
+            return total_group_dict
+        for group in self.get_group_totals():
             total_group_dict[str(group.get(self.group_by_field_name))] = (
                 total_group_dict.get(str(group.get(self.group_by_field_name)), 0)
                 + (1 if group.get("count") == 0 else group.get("count"))
@@ -330,7 +624,9 @@ class GroupedOffsetPaginator(OffsetPaginator):
         return {
             str(field): {
                 "results": [],
-                "total_results": total_group_dict.get(str(field), 0),
+                "total_results": (
+                    total_group_dict.get(str(field), 0) if self.include_total else None
+                ),
             }
             for field in self.group_by_fields
         }
@@ -437,7 +733,21 @@ class SubGroupedOffsetPaginator(OffsetPaginator):
         # Set the count filter - this are extra filters that need to be passed to calculate the counts with the filters
         self.count_filter = count_filter
 
+    # Partition the keyset pagination by the group and the sub group
+    keyset_partition_fields = ("keyset_group", "keyset_sub_group")
+
+    def get_keyset_queryset(self):
+        # Alias the group and sub group so the seek filters reuse the existing m2m joins
+        return self.queryset.annotate(
+            keyset_group=F(self.group_by_field_name),
+            keyset_sub_group=F(self.sub_group_by_field_name),
+        )
+
     def get_result(self, limit=30, cursor=None):
+        # Use the seek pagination when enabled
+        if self.keyset:
+            return self.get_keyset_result(limit=limit, cursor=cursor)
+
         # offset is page #
         # value is page limit
         if cursor is None:
@@ -504,15 +814,16 @@ class SubGroupedOffsetPaginator(OffsetPaginator):
         prev_cursor = Cursor(limit, page - 1, True, page > 0)
 
         # Count the queryset
-        count = queryset.count()
+        count = self.get_cached_count("hits", queryset.count)
 
         # Optionally, calculate the total count and max_hits if needed
         # This might require adjustments based on specific use cases
         if results:
             max_hits = math.ceil(
-                queryset.values(self.group_by_field_name)
-                .annotate(count=Count("id", filter=self.count_filter, distinct=True))
-                .order_by("-count")[0]["count"]
+                max(
+                    (group["count"] for group in self.get_group_totals()),
+                    default=0,
+                )
                 / limit
             )
         else:
@@ -543,18 +854,33 @@ class SubGroupedOffsetPaginator(OffsetPaginator):
             .values(self.group_by_field_name, self.sub_group_by_field_name, "count")
         )
 
+    def get_group_totals(self):
+        # Get the group totals from the cache, these are shared across the pages
+        return self.get_cached_count(
+            "groups", lambda: list(self.__get_group_total_queryset())
+        )
+
+    def get_sub_group_totals(self):
+        # Get the sub group totals from the cache, these are shared across the pages
+        return self.get_cached_count(
+            "sub_groups", lambda: list(self.__get_subgroup_total_queryset())
+        )
+
     def __get_total_dict(self):
         # Use the above to convert to dictionary of 2D objects
         total_group_dict = {}
         total_sub_group_dict = {}
-        for group in self.__get_group_total_queryset():
+        # The totals are skipped when the client did not ask for them
+        if not self.include_total:
+            return total_group_dict, total_sub_group_dict
+        for group in self.get_group_totals():
             total_group_dict[str(group.get(self.group_by_field_name))] = (
                 total_group_dict.get(str(group.get(self.group_by_field_name)), 0)
                 + (1 if group.get("count") == 0 else group.get("count"))
             )
 
         # Sub group total values
-        for item in self.__get_subgroup_total_queryset():
+        for item in self.get_sub_group_totals():
             group = str(item[self.group_by_field_name])
             subgroup = str(item[self.sub_group_by_field_name])
             count = item["count"]
@@ -588,11 +914,25 @@ class SubGroupedOffsetPaginator(OffsetPaginator):
                     }
                     for sub_group in total_sub_group_dict.get(str(group), [])
                 },
-                "total_results": total_group_dict.get(str(group), 0),
+                "total_results": (
+                    total_group_dict.get(str(group), 0) if self.include_total else None
+                ),
             }
             for group in self.group_by_fields
         }
 
+    def __get_sub_group(self, processed_results, group_value, sub_group_value):
+        # Return the sub group of the result, the sub groups are known from the
+        # totals so they are added as the results come when the totals are skipped
+        sub_groups = processed_results.get(group_value, {}).get("results")
+        if sub_groups is None:
+            return None
+        if not self.include_total:
+            sub_groups.setdefault(
+                sub_group_value, {"results": [], "total_results": None}
+            )
+        return sub_groups.get(sub_group_value)
+
     def __query_multi_grouper(self, results):
         # Multi grouper
         processed_results = self.__get_field_dict()
@@ -622,10 +962,10 @@ class SubGroupedOffsetPaginator(OffsetPaginator):
             # Check if the group value is in the processed results
             result_id = result["id"]
 
-            if (
-                group_value in processed_results
-                and sub_group_value in processed_results[str(group_value)]["results"]
-            ):
+            sub_group = self.__get_sub_group(
+                processed_results, group_value, sub_group_value
+            )
+            if sub_group is not None:
                 if self.group_by_field_name in self.FIELD_MAPPER:
                     # for multi grouper
                     group_ids = list(result_group_mapping[str(result_id)])
@@ -639,9 +979,7 @@ class SubGroupedOffsetPaginator(OffsetPaginator):
                         [] if "None" in sub_group_ids else sub_group_ids
                     )
                 # If a result belongs to multiple groups, add it to each group
-                processed_results[str(group_value)]["results"][str(sub_group_value)][
-                    "results"
-                ].append(result)
+                sub_group["results"].append(result)
 
         return processed_results
 
@@ -651,9 +989,11 @@ class SubGroupedOffsetPaginator(OffsetPaginator):
         for result in results:
             group_value = str(result.get(self.group_by_field_name))
             sub_group_value = str(result.get(self.sub_group_by_field_name))
-            processed_results[group_value]["results"][sub_group_value][
-                "results"
-            ].append(result)
+            sub_group = self.__get_sub_group(
+                processed_results, group_value, sub_group_value
+            )
+            if sub_group is not None:
+                sub_group["results"].append(result)
 
         return processed_results
 
@@ -715,12 +1055,19 @@ class BasePaginator:
     ):
         """Paginate the request"""
         per_page = self.get_per_page(request, default_per_page, max_per_page)
+        # Seek pagination is opted into with `pagination=keyset`
+        keyset = request.GET.get("pagination") == "keyset"
         # Convert the cursor value to integer and float from string
         input_cursor = None
         try:
-            input_cursor = cursor_cls.from_string(
-                request.GET.get(self.cursor_name, f"{per_page}:0:0")
-            )
+            if keyset:
+                input_cursor = KeysetCursor.from_string(
+                    request.GET.get(self.cursor_name, "")
+                )
+            else:
+                input_cursor = cursor_cls.from_string(
+                    request.GET.get(self.cursor_name, f"{per_page}:0:0")
+                )
         except ValueError:
             raise ParseError(detail="Invalid cursor parameter.")
 
@@ -738,6 +1085,13 @@ class BasePaginator:
 
             paginator_kwargs["total_count_queryset"] = total_count_queryset
 
+            if keyset:
+                paginator_kwargs["keyset"] = True
+                # The total is only computed when the client asks for it
+                paginator_kwargs["include_total"] = (
+                    request.GET.get("include_total", "false").lower() == "true"
+                )
+
             paginator = paginator_cls(**paginator_kwargs)
 
         try:
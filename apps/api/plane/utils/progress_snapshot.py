@@ -0,0 +1,292 @@
+# Python imports
+from datetime import timedelta
+
+# Django imports
+from django.conf import settings
+from django.db import models
+from django.db.models import Case, Count, F, FloatField, Q, Sum, Value, When
+from django.db.models.functions import Cast, Concat
+from django.utils import timezone
+
+# Module imports
+from plane.db.models import Issue, ProgressSnapshot, Project
+from plane.utils.analytics_plot import burndown_plot
+from plane.utils.exception_logger import log_exception
+from plane.utils.group_count_cache import (
+    get_group_count_version,
+    invalidate_group_counts,
+)
+
+STATE_GROUPS = ["backlog", "unstarted", "started", "cancelled", "completed"]
+
+# The snapshots are kept for the running cycles and the open modules
+ACTIVE_MODULE_STATUSES = ["planned", "in-progress", "paused"]
+
+COMPLETED = Q(completed_at__isnull=False, archived_at__isnull=True, is_draft=False)
+PENDING = Q(completed_at__isnull=True, archived_at__isnull=True, is_draft=False)
+
+
+def is_active_cycle(cycle):
+    now = timezone.now()
+    return bool(
+        cycle.start_date
+        and cycle.end_date
+        and cycle.start_date <= now <= cycle.end_date
+        and cycle.archived_at is None
+    )
+
+
+def is_active_module(module):
+    return module.archived_at is None and module.status in ACTIVE_MODULE_STATUSES
+
+
+def cycle_issues(slug, project_id, cycle_id):
+    return Issue.issue_objects.filter(
+        issue_cycle__cycle_id=cycle_id,
+        issue_cycle__deleted_at__isnull=True,
+        workspace__slug=slug,
+        project_id=project_id,
+    )
+
+
+def module_issues(slug, project_id, module_id):
+    return Issue.issue_objects.filter(
+        issue_module__module_id=module_id,
+        issue_module__deleted_at__isnull=True,
+        workspace__slug=slug,
+        project_id=project_id,
+    )
+
+
+def has_point_estimates(slug, project_id):
+    return Project.objects.filter(
+        workspace__slug=slug,
+        pk=project_id,
+        estimate__isnull=False,
+        estimate__type="points",
+    ).exists()
+
+
+def avatar_url():
+    return Case(
+        # If `avatar_asset` exists, use it to generate the asset URL
+        When(
+            assignees__avatar_asset__isnull=False,
+            then=Concat(
+                Value("/api/assets/v2/static/"), "assignees__avatar_asset", Value("/")
+            ),
+        ),
+        # If `avatar_asset` is None, fall back to using `avatar` field directly
+        When(assignees__avatar_asset__isnull=True, then="assignees__avatar"),
+        default=Value(None),
+        output_field=models.CharField(),
+    )
+
+
+def issue_aggregates(field):
+    return {
+        "total_issues": Count(
+            field, filter=Q(archived_at__isnull=True, is_draft=False)
+        ),
+        "completed_issues": Count(field, filter=COMPLETED),
+        "pending_issues": Count(field, filter=PENDING),
+    }
+
+
+def estimate_aggregates():
+    value = Cast("estimate_point__value", FloatField())
+    return {
+        "total_estimates": Sum(value),
+        "completed_estimates": Sum(value, filter=COMPLETED),
+        "pending_estimates": Sum(value, filter=PENDING),
+    }
+
+
+def assignee_distribution(issues, fields, aggregates, ordering):
+    return list(
+        issues.annotate(
+            first_name=F("assignees__first_name"),
+            last_name=F("assignees__last_name"),
+            display_name=F("assignees__display_name"),
+            assignee_id=F("assignees__id"),
+            avatar_url=avatar_url(),
+        )
+        .values(*fields)
+        .annotate(**aggregates)
+        .order_by(*ordering)
+    )
+
+
+def label_distribution(issues, aggregates):
+    return list(
+        issues.annotate(
+            label_name=F("labels__name"),
+            color=F("labels__color"),
+            label_id=F("labels__id"),
+        )
+        .values("label_name", "color", "label_id")
+        .annotate(**aggregates)
+        .order_by("label_name")
+    )
+
+
+def get_cycle_progress(slug, project_id, cycle_id):
+    """Return the issues and the estimate points of the cycle by state group"""
+    issues = cycle_issues(slug, project_id, cycle_id)
+
+    value = Cast("estimate_point__value", FloatField())
+    estimates = issues.filter(estimate_point__estimate__type="points").aggregate(
+        **{
+            f"{group}_estimate_points": Sum(
+                Case(
+                    When(state__group=group, then=value),
+                    default=Value(0),
+                    output_field=FloatField(),
+                )
+            )
+            for group in STATE_GROUPS
+        },
+        total_estimate_points=Sum(value, default=Value(0), output_field=FloatField()),
+    )
+    counts = issues.aggregate(
+        **{
+            f"{group}_issues": Count("id", filter=Q(state__group=group))
+            for group in STATE_GROUPS
+        },
+        total_issues=Count("id"),
+    )
+
+    progress = {
+        f"{group}_estimate_points": estimates[f"{group}_estimate_points"] or 0
+        for group in STATE_GROUPS
+    }
+    progress["total_estimate_points"] = estimates["total_estimate_points"]
+    progress.update(counts)
+    return progress
+
+
+def get_cycle_analytics(slug, project_id, cycle, analytic_type):
+    """
+    Return the assignee and the label distributions with the burndown of the
+    cycle, counted in issues or in estimate points
+    """
+    issues = cycle_issues(slug, project_id, cycle.id)
+    fields = ["display_name", "assignee_id", "avatar_url"]
+
+    if analytic_type == "points" and has_point_estimates(slug, project_id):
+        return {
+            "assignees": assignee_distribution(
+                issues, fields, estimate_aggregates(), ["display_name"]
+            ),
+            "labels": label_distribution(issues, estimate_aggregates()),
+            "completion_chart": burndown_plot(
+                queryset=cycle,
+                slug=slug,
+                project_id=project_id,
+                plot_type="points",
+                cycle_id=cycle.id,
+            ),
+        }
+
+    if analytic_type == "issues":
+        return {
+            "assignees": assignee_distribution(
+                issues, fields, issue_aggregates("assignee_id"), ["display_name"]
+            ),
+            "labels": label_distribution(issues, issue_aggregates("label_id")),
+            "completion_chart": burndown_plot(
+                queryset=cycle,
+                slug=slug,
+                project_id=project_id,
+                plot_type="issues",
+                cycle_id=cycle.id,
+            ),
+        }
+
+    return {"assignees": [], "labels": [], "completion_chart": {}}
+
+
+def get_module_distribution(slug, project_id, module):
+    """
+    Return the issue and the estimate point distributions of the module, the
+    module is annotated with its `total_issues`
+    """
+    issues = module_issues(slug, project_id, module.id)
+    fields = ["first_name", "last_name", "assignee_id", "avatar_url", "display_name"]
+    ordering = ["first_name", "last_name"]
+    has_dates = module.start_date and module.target_date
+
+    estimate_distribution = {}
+    if has_point_estimates(slug, project_id):
+        estimate_distribution = {
+            "assignees": assignee_distribution(
+                issues, fields, estimate_aggregates(), ordering
+            ),
+            "labels": label_distribution(issues, estimate_aggregates()),
+        }
+        if has_dates:
+            estimate_distribution["completion_chart"] = burndown_plot(
+                queryset=module,
+                slug=slug,
+                project_id=project_id,
+                plot_type="points",
+                module_id=module.id,
+            )
+
+    distribution = {
+        "assignees": assignee_distribution(
+            issues, fields, issue_aggregates("id"), ordering
+        ),
+        "labels": label_distribution(issues, issue_aggregates("id")),
+        "completion_chart": {},
+    }
+    if has_dates and module.total_issues > 0:
+        distribution["completion_chart"] = burndown_plot(
+            queryset=module,
+            slug=slug,
+            project_id=project_id,
+            plot_type="issues",
+            module_id=module.id,
+        )
+
+    return {
+        "estimate_distribution": estimate_distribution,
+        "distribution": distribution,
+    }
+
+
+def invalidate_progress_snapshots(project_id):
+    """
+    Invalidate the progress snapshots of the project, the snapshots are taken
+    at the version of the group counts
+    """
+    invalidate_group_counts(project_id)
+
+
+def get_progress_snapshot(project_id, cycle_id=None, module_id=None):
+    """
+    Return the data of today's progress snapshot of the cycle or the module,
+    None when there is no snapshot or the issues, the cycle and module dates or
+    the state groups of the project were written after it was taken
+    """
+    try:
+        snapshot = (
+            ProgressSnapshot.objects.filter(
+                project_id=project_id,
+                cycle_id=cycle_id,
+                module_id=module_id,
+                date=timezone.now().date(),
+                updated_at__gte=timezone.now()
+                - timedelta(seconds=settings.PROGRESS_SNAPSHOT_MAX_AGE),
+            )
+            .values("version", "data")
+            .first()
+        )
+        if snapshot is None:
+            return None
+        if snapshot["version"] != get_group_count_version(project_id):
+            return None
+        return snapshot["data"]
+    except Exception as e:
+        log_exception(e)
+        return None
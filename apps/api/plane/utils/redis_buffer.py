@@ -0,0 +1,127 @@
+# Python imports
+import json
+import logging
+from typing import Any, Callable, Dict, List, Optional
+
+# Django imports
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+# Module imports
+from plane.settings.redis import redis_instance
+from plane.utils.exception_logger import log_exception
+
+logger = logging.getLogger("plane.worker")
+
+# A crashed flush releases its lock after this many seconds
+BUFFER_FLUSH_LOCK_TIMEOUT = 60 * 5
+
+
+def push_buffer(key: str, item: Dict[str, Any]) -> None:
+    """Append the item to the redis list buffer, raises if redis is not reachable"""
+    redis_instance().rpush(key, json.dumps(item, cls=DjangoJSONEncoder))
+
+
+def _write_items(
+    items: List[Dict[str, Any]],
+    write: Callable[[List[Dict[str, Any]]], Any],
+    retry_items: bool = True,
+) -> None:
+    """
+    Write the batch, retrying item by item when the batch fails so a single bad
+    item is dropped instead of blocking the buffer. The batch is kept when no
+    item can be written, the database is most likely unavailable.
+    """
+    try:
+        write(items)
+        return
+    except Exception as e:
+        if len(items) == 1 or not retry_items:
+            raise
+        log_exception(e)
+
+    failed = 0
+    for item in items:
+        try:
+            write([item])
+        except Exception as e:
+            failed += 1
+            last_error = e
+    if failed == len(items):
+        raise last_error
+    if failed:
+        logger.error(f"Dropped {failed} buffered items that could not be written")
+
+
+def flush_buffer(
+    key: str,
+    batch_size: int,
+    write: Callable[[List[Dict[str, Any]]], Any],
+    max_batches: Optional[int] = None,
+    retry_items: bool = True,
+) -> Optional[int]:
+    """
+    Write the items buffered in the redis list in batches of batch_size.
+
+    A batch is removed from the list only after it was written, so the items
+    survive a failed write and are delivered at least once. A failed batch is
+    written item by item unless retry_items is False, for the writes that are
+    not idempotent. Concurrent flushes of the same buffer are serialized with a
+    lock that is extended after every batch, None is returned without flushing
+    when the lock is held, the number of items read otherwise.
+    """
+    ri = redis_instance()
+    lock_key = f"{key}:flush"
+    if not ri.set(lock_key, 1, nx=True, ex=BUFFER_FLUSH_LOCK_TIMEOUT):
+        return None
+
+    flushed = 0
+    batches = 0
+    try:
+        while max_batches is None or batches < max_batches:
+            raw_items = ri.lrange(key, 0, batch_size - 1)
+            if not raw_items:
+                break
+
+            items = []
+            for raw_item in raw_items:
+                try:
+                    items.append(json.loads(raw_item))
+                except ValueError as e:
+                    log_exception(e)
+
+            if items:
+                _write_items(items, write, retry_items)
+            ri.ltrim(key, len(raw_items), -1)
+            # Keep the lock for the next batch of a large backlog
+            ri.expire(lock_key, BUFFER_FLUSH_LOCK_TIMEOUT)
+
+            flushed += len(raw_items)
+            batches += 1
+            if len(raw_items) < batch_size:
+                break
+    finally:
+        ri.delete(lock_key)
+    return flushed
+
+
+def bulk_create_buffered(model, rows: List[Dict[str, Any]], batch_size: int) -> None:
+    """
+    Insert the buffered rows of the model keeping the time each row was buffered
+    at, auto_now_add overwrites the created_at given to the insert so it is set
+    by an update in the same transaction
+    """
+    created_at = [
+        parse_datetime(row.get("created_at") or "") or timezone.now() for row in rows
+    ]
+    objs = [
+        model(**{field: value for field, value in row.items() if field != "created_at"})
+        for row in rows
+    ]
+    with transaction.atomic():
+        model.objects.bulk_create(objs, batch_size=batch_size)
+        for obj, timestamp in zip(objs, created_at):
+            obj.created_at = timestamp
+        model.objects.bulk_update(objs, ["created_at"], batch_size=batch_size)